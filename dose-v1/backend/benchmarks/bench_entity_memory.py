@@ -0,0 +1,123 @@
+"""
+Benchmark: memory and construction cost of slotted entities and DTOs
+
+Entities and DTOs are declared with @dataclass(slots=True). The "dict"
+column rebuilds each class as a plain dataclass with the same fields, which
+is what they were before, so both layouts are measured on the same data.
+
+Bytes per object are what tracemalloc sees allocated for the instances
+themselves; the field values are built up front and shared by both layouts.
+
+Run from backend/:
+    python -m benchmarks.bench_entity_memory
+"""
+
+import dataclasses
+import gc
+import timeit
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from src.modules.spark.application.dto.spark_dto import SparkSessionDTO
+from src.modules.spark.domain.entities.spark_session import SparkSession
+from src.modules.spark.domain.value_objects.session_status import SessionStatus as SparkStatus
+from src.modules.wave.application.dto.wave_dto import WaveSessionDTO
+from src.modules.wave.domain.entities.wave_session import WaveSession
+from src.modules.wave.domain.value_objects.session_status import SessionStatus as WaveStatus
+
+SESSIONS = 10_000
+TEXT = "I felt overwhelmed when my manager asked for the weekly report this morning."
+
+
+def unslotted(cls: type) -> type:
+    """Same fields, defaults and field options as `cls`, stored in an instance __dict__."""
+    spec = []
+    for f in dataclasses.fields(cls):
+        kwargs: Dict[str, Any] = dict(init=f.init, repr=f.repr, compare=f.compare, kw_only=f.kw_only)
+        if f.default is not dataclasses.MISSING:
+            kwargs["default"] = f.default
+        if f.default_factory is not dataclasses.MISSING:
+            kwargs["default_factory"] = f.default_factory
+        spec.append((f.name, f.type, dataclasses.field(**kwargs)))
+    return dataclasses.make_dataclass(cls.__name__, spec)
+
+
+def spark_kwargs() -> Dict[str, Any]:
+    now = datetime.utcnow()
+    return dict(
+        id=uuid4(), user_id=uuid4(), status=SparkStatus.COMPLETED, current_step=5,
+        created_at=now, updated_at=now, completed_at=now,
+        situation_response=TEXT, perception_response=TEXT, affect_response=TEXT,
+        response_response=TEXT, key_result_response=TEXT,
+    )
+
+
+def wave_kwargs() -> Dict[str, Any]:
+    now = datetime.utcnow()
+    return dict(
+        id=uuid4(), user_id=uuid4(), status=WaveStatus.COMPLETED, current_step=4,
+        situation=TEXT, emotion="anxious", intensity=7, acceptance_statement=TEXT,
+        action_type="breathing", action_completed=True, actual_duration=300, action_notes=TEXT,
+        created_at=now, updated_at=now, completed_at=now,
+    )
+
+
+def dto_kwargs(cls: type, entity_kwargs: Callable[[], Dict[str, Any]]) -> Callable[[], Dict[str, Any]]:
+    names = {f.name for f in dataclasses.fields(cls)}
+
+    def build() -> Dict[str, Any]:
+        kwargs = {k: v for k, v in entity_kwargs().items() if k in names}
+        if "status" in names:
+            kwargs["status"] = kwargs["status"].value
+        for f in dataclasses.fields(cls):
+            if f.name not in kwargs and f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING:
+                kwargs[f.name] = None
+        return kwargs
+
+    return build
+
+
+def bytes_per_object(cls: type, values: List[Dict[str, Any]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [cls(**kwargs) for kwargs in values]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Discount the list holding the objects
+    size = after - before - (len(objects) * 8 + 56)
+    del objects
+    return size / len(values)
+
+
+def construction_ms(cls: type, values: List[Dict[str, Any]]) -> float:
+    return min(timeit.repeat(lambda: [cls(**kwargs) for kwargs in values], number=1, repeat=5)) * 1e3
+
+
+def cases() -> List[Tuple[str, type, Callable[[], Dict[str, Any]]]]:
+    """(label, slotted class, keyword arguments builder) per measured class."""
+    return [
+        ("SparkSession", SparkSession, spark_kwargs),
+        ("WaveSession", WaveSession, wave_kwargs),
+        ("SparkSessionDTO", SparkSessionDTO, dto_kwargs(SparkSessionDTO, spark_kwargs)),
+        ("WaveSessionDTO", WaveSessionDTO, dto_kwargs(WaveSessionDTO, wave_kwargs)),
+    ]
+
+
+def main() -> None:
+    print(f"{SESSIONS} objects per class")
+    print(f"  {'class':<18} {'dict B/obj':>11} {'slots B/obj':>12} {'dict ms':>9} {'slots ms':>9}")
+    for label, cls, make in cases():
+        values = [make() for _ in range(SESSIONS)]
+        plain = unslotted(cls)
+        print(
+            f"  {label:<18} "
+            f"{bytes_per_object(plain, values):11.0f} {bytes_per_object(cls, values):12.0f} "
+            f"{construction_ms(plain, values):9.1f} {construction_ms(cls, values):9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark: LoggingMiddleware, BaseHTTPMiddleware vs pure ASGI
+
+Both middlewares wrap the same Starlette app: a small JSON route and a
+streaming route sending 20 chunks. Requests are driven straight through
+the ASGI interface, so the numbers are the middleware stack's own cost
+(no server, socket or HTTP parsing). Log records are created as in
+production but discarded by a NullHandler.
+
+Run from backend/:
+    python -m benchmarks.bench_logging_middleware
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+
+from fastapi import Request
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from src.api.middleware.logging_middleware import LoggingMiddleware, logger
+
+REQUESTS = 5000
+CHUNKS = 20
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous implementation, kept for comparison (error path omitted)."""
+
+    async def dispatch(self, request: Request, call_next):
+        request_id = str(uuid.uuid4())
+        request.state.request_id = request_id
+        client_host = request.client.host if request.client else "unknown"
+        start_time = time.time()
+        logger.info(
+            f"Request started: {request.method} {request.url.path}",
+            extra={
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.url.path,
+                "query_params": str(request.query_params),
+                "client_host": client_host,
+                "user_agent": request.headers.get("user-agent", "unknown")
+            }
+        )
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        logger.info(
+            f"Request completed: {request.method} {request.url.path} - {response.status_code}",
+            extra={
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": response.status_code,
+                "process_time_ms": round(process_time * 1000, 2),
+                "client_host": client_host
+            }
+        )
+        response.headers["X-Request-ID"] = request_id
+        response.headers["X-Process-Time"] = f"{round(process_time * 1000, 2)}ms"
+        return response
+
+
+async def json_route(request):
+    return JSONResponse({"status": "ok", "request_id": request.state.request_id})
+
+
+async def stream_route(request):
+    async def chunks():
+        for _ in range(CHUNKS):
+            yield b"x" * 512
+    return StreamingResponse(chunks(), media_type="application/octet-stream")
+
+
+def make_app(middleware_class) -> Starlette:
+    routes = [Route("/json", json_route), Route("/stream", stream_route)]
+    return Starlette(routes=routes, middleware=[Middleware(middleware_class)])
+
+
+def make_scope(path: str) -> dict:
+    return {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"limit=50",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"bench")],
+        "client": ("127.0.0.1", 5000), "server": ("bench", 80),
+    }
+
+
+async def run(app, path: str, number: int) -> float:
+    """Requests per second through `app`."""
+    scope = make_scope(path)
+    never = asyncio.Event()
+
+    def receiver():
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await never.wait()  # client stays connected
+        return receive
+
+    async def send(message):
+        pass
+
+    await app(dict(scope), receiver(), send)  # warm up (builds the middleware stack)
+    started = time.perf_counter()
+    for _ in range(number):
+        await app(dict(scope), receiver(), send)
+    return number / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    logger.handlers[:] = [logging.NullHandler()]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    before = make_app(BaseHTTPLoggingMiddleware)
+    after = make_app(LoggingMiddleware)
+    for path in ("/json", "/stream"):
+        print(f"GET {path}")
+        slow = max([await run(before, path, REQUESTS) for _ in range(3)])
+        fast = max([await run(after, path, REQUESTS) for _ in range(3)])
+        print(f"  {'BaseHTTP':<12} {slow:10.0f} req/s")
+        print(f"  {'pure ASGI':<12} {fast:10.0f} req/s")
+        print(f"  speedup      {fast / slow:10.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
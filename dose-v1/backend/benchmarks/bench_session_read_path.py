@@ -0,0 +1,89 @@
+"""
+Benchmark: SPARK GET serialization, validated path vs direct read path
+
+Validated path: ORM row -> entity (_to_entity) -> DTO (_to_dto) ->
+SessionResponse (from_attributes) -> JSON.
+Direct path: Core row mapping -> orjson.
+
+Database time is excluded; both paths start from an already-fetched row.
+
+Run from backend/:
+    python -m benchmarks.bench_session_read_path
+"""
+
+import timeit
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi.responses import ORJSONResponse
+
+from src.modules.spark.api.schemas.spark_schemas import SessionResponse, SessionSummaryResponse
+from src.modules.spark.application.services.spark_service import SparkService
+from src.modules.spark.infrastructure.persistence.models import SparkSession as SparkSessionModel
+from src.modules.spark.infrastructure.queries.session_read_queries import SESSION_FIELDS, SUMMARY_FIELDS
+from src.modules.spark.infrastructure.repositories.spark_session_repository import SparkSessionRepository
+import src.modules.auth.infrastructure.persistence.models  # noqa: F401
+import src.modules.wave.infrastructure.persistence.models  # noqa: F401
+
+LIST_SIZE = 50
+TEXT = "I felt overwhelmed when my manager asked for the weekly report this morning. " * 4
+
+
+def make_row() -> SparkSessionModel:
+    now = datetime.utcnow()
+    return SparkSessionModel(
+        id=uuid4(), user_id=uuid4(), status="completed", current_step=5,
+        situation_response=TEXT, perception_response=TEXT, affect_response=TEXT,
+        response_response=TEXT, key_result_response=TEXT,
+        created_at=now, updated_at=now, completed_at=now,
+    )
+
+
+def validated_single(row) -> bytes:
+    dto = SparkService._to_dto(SparkSessionRepository._to_entity(row))
+    return SessionResponse.model_validate(dto, from_attributes=True).model_dump_json().encode()
+
+
+def direct_single(mapping) -> bytes:
+    return ORJSONResponse(mapping).body
+
+
+def validated_list(rows) -> bytes:
+    items = [
+        SessionSummaryResponse.model_validate(
+            SparkService._to_summary_dto(SparkSessionRepository._to_entity(row)), from_attributes=True
+        )
+        for row in rows
+    ]
+    return b"".join(item.model_dump_json().encode() for item in items)
+
+
+def direct_list(mappings) -> bytes:
+    return ORJSONResponse({"sessions": mappings, "total": len(mappings), "offset": 0, "limit": LIST_SIZE}).body
+
+
+def measure(label: str, fn, *args, number: int) -> float:
+    seconds = min(timeit.repeat(lambda: fn(*args), number=number, repeat=5)) / number
+    print(f"  {label:<12} {seconds * 1e6:10.1f} us/op")
+    return seconds
+
+
+def main() -> None:
+    row = make_row()
+    mapping = {f: getattr(row, f) for f in SESSION_FIELDS}
+    rows = [make_row() for _ in range(LIST_SIZE)]
+    mappings = [{f: getattr(r, f) for f in SUMMARY_FIELDS} for r in rows]
+
+    print("GET /spark/sessions/{id}")
+    slow = measure("validated", validated_single, row, number=20000)
+    fast = measure("direct", direct_single, mapping, number=20000)
+    print(f"  speedup      {slow / fast:10.1f}x")
+
+    print(f"GET /spark/sessions ({LIST_SIZE} items)")
+    slow = measure("validated", validated_list, rows, number=1000)
+    fast = measure("direct", direct_list, mappings, number=1000)
+    print(f"  speedup      {slow / fast:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Dependencies shared by every API route."""
+
+from fastapi import Request
+
+from src.infrastructure.logging import bind_log_context
+
+
+async def bind_route_log_context(request: Request) -> None:
+    """Add the matched route's path template (e.g. /sessions/{session_id}) to the log context."""
+    route = request.scope.get("route")
+    bind_log_context(route=getattr(route, "path", request.scope["path"]))
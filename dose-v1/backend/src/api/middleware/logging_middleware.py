@@ -5,91 +5,113 @@ Captures all API requests and responses for audit and debugging
 
 import time
 import uuid
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from src.infrastructure.logging import get_logger
+from typing import Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.api.middleware.request_log_sampler import RequestLogSampler
+from src.infrastructure.logging import close_log_context, get_logger, open_log_context
 
 logger = get_logger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware to log all HTTP requests and responses.
+
+    Written against raw ASGI rather than BaseHTTPMiddleware: the response is
+    passed through message by message, so there is no extra task or memory
+    stream per request and streaming responses are not buffered. Request
+    IDs and timing headers are added to the `http.response.start` message;
+    X-Process-Time is the time until the response started, and the
+    completion log's process_time_ms runs until the last body chunk.
+
+    With a `sampler`, only sampled requests are logged, plus failed and slow
+    ones; for those the start line is written at completion, next to the
+    completion line. Completion lines carry the `sample_rate` they were
+    sampled at.
     """
 
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, sampler: Optional[RequestLogSampler] = None):
+        self.app = app
+        self.sampler = sampler
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and log details.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/route handler
-
-        Returns:
-            Response from the application
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Extract client info
-        client_host = request.client.host if request.client else "unknown"
+        # Generate unique request ID (read back as request.state.request_id),
+        # and put it on every record logged while handling the request
+        request_id = str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+        context_token = open_log_context(request_id=request_id)
+
+        # Extract request info
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
+        user_agent = "unknown"
+        for name, value in scope["headers"]:
+            if name == b"user-agent":
+                user_agent = value.decode("latin-1")
+                break
 
         # Start timer
-        start_time = time.time()
-
-        # Log incoming request
-        logger.info(
-            f"Request started: {request.method} {request.url.path}",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "client_host": client_host,
-                "user_agent": request.headers.get("user-agent", "unknown")
-            }
-        )
-
-        # Process request
-        try:
-            response = await call_next(request)
-
-            # Calculate processing time
-            process_time = time.time() - start_time
+        start_time = time.perf_counter()
 
-            # Log response
+        # Log incoming request (unsampled requests hold it back until they end)
+        def log_started() -> None:
             logger.info(
-                f"Request completed: {request.method} {request.url.path} - {response.status_code}",
+                f"Request started: {method} {path}",
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "process_time_ms": round(process_time * 1000, 2),
-                    "client_host": client_host
+                    "method": method,
+                    "path": path,
+                    "query_params": scope.get("query_string", b"").decode("latin-1"),
+                    "client_host": client_host,
+                    "user_agent": user_agent
                 }
             )
 
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Process-Time"] = f"{round(process_time * 1000, 2)}ms"
+        sampled, sample_rate = self.sampler.sample(request_id, path) if self.sampler else (True, 1.0)
+        if sampled:
+            log_started()
+
+        status_code = 500
 
-            return response
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Process-Time"] = f"{round((time.perf_counter() - start_time) * 1000, 2)}ms"
+            await send(message)
 
+        # Process request
+        try:
+            await self.app(scope, receive, send_with_headers)
         except Exception as e:
-            # Log error
-            process_time = time.time() - start_time
+            # Log error (always, whether sampled or not)
+            process_time = time.perf_counter() - start_time
+            if not sampled:
+                log_started()
             logger.error(
-                f"Request failed: {request.method} {request.url.path} - {str(e)}",
+                f"Request failed: {method} {path} - {str(e)}",
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "error": str(e),
                     "error_type": type(e).__name__,
                     "process_time_ms": round(process_time * 1000, 2),
@@ -98,3 +120,24 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 exc_info=True
             )
             raise
+        else:
+            # Log response
+            process_time_ms = round((time.perf_counter() - start_time) * 1000, 2)
+            if not sampled:
+                if not self.sampler.keep(status_code, process_time_ms):
+                    return
+                log_started()
+            logger.info(
+                f"Request completed: {method} {path} - {status_code}",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
+                    "process_time_ms": process_time_ms,
+                    "client_host": client_host,
+                    "sample_rate": sample_rate
+                }
+            )
+        finally:
+            close_log_context(context_token)
@@ -0,0 +1,99 @@
+"""
+Request Log Sampler
+Decides which requests get their started/completed log lines written
+"""
+
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+
+class RequestLogSampler:
+    """
+    Head-based sampling of request logs, keyed on the request ID.
+
+    The decision is made once when the request starts, from the first 32
+    bits of its request_id, so both log lines of a request are kept or
+    dropped together (and anything else keyed on the same ID can reproduce
+    it). Rates are per path prefix, longest match first, e.g.
+    {"/api/v1/spark/sessions": 0.1, "/health": 0.0}.
+
+    Requests that fail (an exception, or a status of at least
+    `keep_status`) or take at least `slow_ms` are always logged; the
+    middleware holds back their start line until it knows.
+
+    Adaptive mode: with `budget_per_second` set, the lines the configured
+    rates would write are measured every `window_seconds`, and every rate is
+    scaled down by the factor that brings them under the budget (smoothed,
+    and back up to 1.0 as traffic falls). Kept failures and slow requests
+    are not scaled.
+    """
+
+    def __init__(
+        self,
+        default_rate: float = 1.0,
+        route_rates: Optional[Mapping[str, float]] = None,
+        slow_ms: float = 1000.0,
+        keep_status: int = 500,
+        budget_per_second: float = 0.0,
+        window_seconds: float = 1.0
+    ):
+        self.default_rate = default_rate
+        self.route_rates = sorted((route_rates or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.slow_ms = slow_ms
+        self.keep_status = keep_status
+        self.budget_per_second = budget_per_second
+        self.window_seconds = window_seconds
+        self.factor = 1.0
+        self._window_start = time.monotonic()
+        self._wanted_lines = 0.0
+        self._rates: Dict[str, float] = {}
+        self.sampled = 0
+        self.dropped = 0
+        self.kept = 0
+
+    def rate_for(self, path: str) -> float:
+        """Configured rate of a path, before the adaptive factor."""
+        rate = self._rates.get(path)
+        if rate is None:
+            rate = next((r for prefix, r in self.route_rates if path.startswith(prefix)), self.default_rate)
+            if len(self._rates) < 10000:  # Paths carry IDs; stop remembering past this
+                self._rates[path] = rate
+        return rate
+
+    def sample(self, request_id: str, path: str) -> Tuple[bool, float]:
+        """Head decision for a request: (sampled, effective rate)."""
+        rate = self.rate_for(path)
+        if self.budget_per_second > 0:
+            self._observe(rate)
+            rate *= self.factor
+        sampled = rate >= 1.0 or int(request_id[:8], 16) < rate * 0x100000000
+        if sampled:
+            self.sampled += 1
+        return sampled, rate
+
+    def keep(self, status_code: int, process_time_ms: float) -> bool:
+        """Whether an unsampled request must be logged anyway."""
+        if status_code >= self.keep_status or process_time_ms >= self.slow_ms:
+            self.kept += 1
+            return True
+        self.dropped += 1
+        return False
+
+    def _observe(self, rate: float) -> None:
+        # Two lines per request at the configured rate
+        self._wanted_lines += 2 * rate
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= self.window_seconds:
+            wanted_per_second = self._wanted_lines / elapsed
+            target = min(1.0, self.budget_per_second / wanted_per_second) if wanted_per_second else 1.0
+            self.factor = (self.factor + target) / 2
+            self._window_start, self._wanted_lines = now, 0.0
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            "factor": round(self.factor, 4),
+            "sampled": self.sampled,
+            "kept": self.kept,
+            "dropped": self.dropped,
+        }
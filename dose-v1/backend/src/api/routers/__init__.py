@@ -3,14 +3,24 @@ API Router Configuration
 Registers all module routers with prefixes and tags
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from src.api.dependencies import bind_route_log_context
 # Use enhanced auth endpoints with OAuth, logout, password reset
 from src.modules.auth.api.endpoints.auth_endpoints_enhanced import router as auth_router
 from src.modules.spark.api.endpoints import router as spark_router
 from src.modules.wave.api.endpoints import router as wave_router
+from src.modules.sync.api.endpoints import router as sync_router
+from src.modules.search.api.endpoints import router as search_router
+from src.modules.analytics.api.endpoints import router as analytics_router
+from src.modules.popcorn.api.endpoints import router as popcorn_router
 
-api_router = APIRouter()
+# Every route's log lines carry its path template
+api_router = APIRouter(dependencies=[Depends(bind_route_log_context)])
 
 api_router.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(spark_router, prefix="/spark", tags=["SPARK Module"])
-api_router.include_router(wave_router, prefix="/wave", tags=["WAVE Module"])
\ No newline at end of file
+api_router.include_router(wave_router, prefix="/wave", tags=["WAVE Module"])
+api_router.include_router(sync_router, prefix="/sync", tags=["Sync"])
+api_router.include_router(search_router, prefix="/search", tags=["Search"])
+api_router.include_router(analytics_router, prefix="/analytics", tags=["Analytics"])
+api_router.include_router(popcorn_router, prefix="/popcorn", tags=["POPCORN Module"])
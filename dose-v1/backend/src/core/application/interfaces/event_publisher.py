@@ -0,0 +1,18 @@
+"""
+Event Publisher Interface - Application Layer
+Contract for handing recorded domain events to subscribers
+"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from src.core.domain.events import DomainEvent
+
+
+class IEventPublisher(ABC):
+    """Interface for publishing domain events."""
+
+    @abstractmethod
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        """Publish events; implementations must not block the caller."""
+        pass
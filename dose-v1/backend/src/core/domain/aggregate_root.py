@@ -0,0 +1,30 @@
+"""
+Aggregate Root - Shared Kernel
+Base for entities that record domain events
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from src.core.domain.events import DomainEvent
+
+
+@dataclass(slots=True)
+class AggregateRoot:
+    """
+    Records domain events until the application layer collects them.
+
+    Events are kept in a tuple so a shallow copy of the aggregate (used by
+    batch sync to try an operation) never shares pending events with the
+    original.
+    """
+    _events: Tuple[DomainEvent, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def record_event(self, event: DomainEvent) -> None:
+        """Record an event to be published after the change is committed."""
+        self._events += (event,)
+
+    def pull_events(self) -> List[DomainEvent]:
+        """Return and clear the recorded events."""
+        events, self._events = list(self._events), ()
+        return events
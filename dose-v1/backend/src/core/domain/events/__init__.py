@@ -0,0 +1,41 @@
+"""
+Domain Events - Shared Kernel
+Facts recorded by aggregates and published once the transaction commits
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import ClassVar
+from uuid import UUID, uuid4
+
+
+@dataclass(frozen=True, slots=True)
+class DomainEvent:
+    """Base class of every domain event."""
+    event_id: UUID = field(default_factory=uuid4, kw_only=True)
+    occurred_at: datetime = field(default_factory=datetime.utcnow, kw_only=True)
+
+
+@dataclass(frozen=True, slots=True)
+class SessionEvent(DomainEvent):
+    """Lifecycle event of a SPARK or WAVE session."""
+    session_type: ClassVar[str] = ""
+
+    session_id: UUID
+    user_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class SessionStarted(SessionEvent):
+    """A session was created."""
+
+
+@dataclass(frozen=True, slots=True)
+class StepCompleted(SessionEvent):
+    """A step of a session was answered."""
+    step_number: int
+
+
+@dataclass(frozen=True, slots=True)
+class SessionCompleted(SessionEvent):
+    """A session was completed."""
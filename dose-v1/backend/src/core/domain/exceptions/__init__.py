@@ -0,0 +1,5 @@
+"""Domain exceptions shared across modules."""
+
+
+class SessionArchivedError(ValueError):
+    """Raised when writing to a session that has been moved to the archive."""
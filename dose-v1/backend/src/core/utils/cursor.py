@@ -0,0 +1,31 @@
+"""
+Opaque pagination cursors
+Encodes keyset positions as URL-safe tokens that clients pass back unchanged
+"""
+
+import base64
+import json
+from typing import Any, Dict
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """Encode a JSON-serializable position into an opaque URL-safe token."""
+    raw = json.dumps(position, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """
+    Decode a token produced by encode_cursor.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor") from None
+    if not isinstance(position, dict):
+        raise ValueError("Invalid cursor")
+    return position
@@ -0,0 +1,14 @@
+"""Cold-storage archive for old completed sessions."""
+
+from src.infrastructure.config.settings import settings
+from .session_archive import SessionArchive, to_record, from_record
+
+# Shared by the repositories' read-through and the archiver job
+session_archive = SessionArchive(settings.ARCHIVE_DIR)
+
+__all__ = [
+    "SessionArchive",
+    "session_archive",
+    "to_record",
+    "from_record",
+]
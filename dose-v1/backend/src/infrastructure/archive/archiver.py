@@ -0,0 +1,134 @@
+"""
+Session Archiver Job
+Moves completed sessions older than ARCHIVE_AFTER_DAYS into cold storage.
+
+Run once by hand with:
+    python -m src.infrastructure.archive.archiver
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.archive.session_archive import SessionArchive, to_record
+from src.infrastructure.drafts import DraftBuffer, draft_buffer
+from src.infrastructure.logging import get_logger
+from src.modules.spark.infrastructure.persistence.models import SparkSession
+from src.modules.wave.infrastructure.persistence.models import WaveSession
+
+logger = get_logger(__name__)
+
+ARCHIVED_MODELS: Dict[str, Any] = {
+    "spark": SparkSession,
+    "wave": WaveSession,
+}
+
+
+class SessionArchiver:
+    """
+    Archives completed sessions in batches.
+
+    Each batch is written to its segment files first, then the index rows
+    are inserted and the hot rows deleted in one transaction. If the process
+    dies in between, the hot rows stay and the next run archives them again;
+    readers ignore the duplicate records. Batches are claimed with
+    FOR UPDATE SKIP LOCKED, so every process can run the job without two of
+    them archiving the same session. Archived sessions are read-only, so
+    their unsaved step drafts are deleted with them.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        archive: SessionArchive,
+        archive_after_days: int,
+        batch_size: int = 500,
+        interval_seconds: float = 24 * 60 * 60,
+        drafts: Optional[DraftBuffer] = None
+    ):
+        self.session_factory = session_factory
+        self.archive = archive
+        self.archive_after_days = archive_after_days
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.drafts = drafts or draft_buffer
+
+    async def run(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Archive everything currently eligible. Returns sessions archived per type."""
+        if self.archive_after_days <= 0:
+            return {}
+
+        cutoff = (now or datetime.utcnow()) - timedelta(days=self.archive_after_days)
+        report = {}
+        for session_type, model in ARCHIVED_MODELS.items():
+            total = 0
+            while True:
+                archived = await self._archive_batch(session_type, model, cutoff)
+                total += archived
+                if archived < self.batch_size:
+                    break
+            report[session_type] = total
+        return report
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Run the job every `interval_seconds` until `stop` is set."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                report = await self.run()
+                if any(report.values()):
+                    logger.info(f"Sessions archived: {report}")
+            except Exception as e:
+                logger.error(f"Session archiving failed: {e}")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _archive_batch(self, session_type: str, model: Any, cutoff: datetime) -> int:
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(model)
+                .where(model.status == "completed", model.completed_at < cutoff)
+                .order_by(model.user_id, model.created_at)
+                .limit(self.batch_size)
+                # Concurrent archivers (one per app process) take disjoint batches
+                .with_for_update(skip_locked=True)
+            )
+            rows = result.scalars().all()
+            if not rows:
+                return 0
+
+            session_ids = [row.id for row in rows]
+            await self.archive.append(db, session_type, [to_record(row) for row in rows])
+            await db.execute(
+                delete(model)
+                .where(model.id.in_(session_ids))
+                .execution_options(synchronize_session=False)
+            )
+            await self.drafts.discard(db, session_ids)
+            await db.commit()
+            return len(rows)
+
+
+async def main() -> None:
+    from src.infrastructure.archive import session_archive
+    from src.infrastructure.config.settings import settings
+    from src.infrastructure.database.session import AsyncSessionLocal, engine
+
+    archiver = SessionArchiver(
+        AsyncSessionLocal,
+        session_archive,
+        archive_after_days=settings.ARCHIVE_AFTER_DAYS,
+        batch_size=settings.ARCHIVE_BATCH_SIZE,
+    )
+    report = await archiver.run()
+    print(f"Sessions archived: {report or 'disabled (ARCHIVE_AFTER_DAYS=0)'}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,28 @@
+"""
+Archived Session Index Model
+Maps archived session ids to the cold-storage segment holding them
+"""
+
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import String, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from src.infrastructure.database.session import Base
+
+
+class ArchivedSession(Base):
+    """One row per session moved out of the hot tables."""
+    __tablename__ = "archived_sessions"
+
+    session_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    session_type: Mapped[str] = mapped_column(String(20), nullable=False)  # 'spark', 'wave'
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    segment: Mapped[str] = mapped_column(String(255), nullable=False)  # Path relative to ARCHIVE_DIR
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)  # Of the session
+    archived_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # History pages continue into the archive ordered by created_at
+        Index("ix_archived_sessions_user_type_created", "user_id", "session_type", "created_at"),
+    )
@@ -0,0 +1,319 @@
+"""
+Session Archive - Cold Storage Tier
+Completed sessions moved out of the hot tables live in compressed segment
+files, one per session type, user and month:
+
+    <ARCHIVE_DIR>/<session_type>/<user_id>/<YYYY-MM>.ndjson.gz
+
+The archived_sessions table indexes every archived session id to its segment.
+Writers hold an exclusive flock on the segment's `.lock` file and readers a
+shared one, so processes sharing ARCHIVE_DIR never interleave appends or
+lose an append to a concurrent rewrite.
+
+The index is the source of truth: a session is archived while its index row
+exists. Removals delete the index rows in the caller's transaction and only
+rewrite (or delete) segment files once it commits, so readers skip records
+that are no longer indexed.
+"""
+
+import asyncio
+import fcntl
+import gzip
+import json
+import os
+import shutil
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, delete, func, literal, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.archive.models import ArchivedSession
+from src.infrastructure.database.session import after_commit
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def to_record(model: Any) -> Dict[str, Any]:
+    """Serialize an ORM row into a JSON-safe dict keyed by column name."""
+    record = {}
+    for column in model.__table__.columns:
+        value = getattr(model, column.key)
+        if isinstance(value, UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        record[column.key] = value
+    return record
+
+
+def from_record(model_class: Any, record: Dict[str, Any]) -> Any:
+    """Rebuild a transient (never added to a session) ORM row from a record."""
+    values = {}
+    for column in model_class.__table__.columns:
+        value = record.get(column.key)
+        if value is not None:
+            python_type = column.type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is UUID:
+                value = UUID(value)
+        values[column.key] = value
+    return model_class(**values)
+
+
+class SessionArchive:
+    """Reads and writes archived sessions; file I/O runs in a worker thread."""
+
+    def __init__(self, base_dir: str):
+        self.base_dir = Path(base_dir)
+        self._cleanups: Set[asyncio.Task] = set()
+
+    # ========== Segment Files ==========
+
+    @staticmethod
+    def segment_for(session_type: str, user_id: UUID, created_at: datetime) -> str:
+        """Relative segment path for a session."""
+        return f"{session_type}/{user_id}/{created_at:%Y-%m}.ndjson.gz"
+
+    @contextmanager
+    def _locked(self, segment: str, exclusive: bool) -> Iterator[Path]:
+        """Hold the segment's lock; the lock file outlives rewrites of the segment itself."""
+        path = self.base_dir / segment
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_name(path.name + ".lock"), "a") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield path
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _append(self, segment: str, records: List[Dict[str, Any]]) -> None:
+        payload = "".join(json.dumps(record) + "\n" for record in records).encode()
+        with self._locked(segment, exclusive=True) as path:
+            # Each append is a complete gzip member; readers see all members as one stream
+            with open(path, "ab") as f:
+                f.write(gzip.compress(payload))
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _read(self, segment: str) -> Dict[str, Dict[str, Any]]:
+        if not (self.base_dir / segment).exists():
+            return {}
+        with self._locked(segment, exclusive=False) as path:
+            return self._read_unlocked(path)
+
+    @staticmethod
+    def _read_unlocked(path: Path) -> Dict[str, Dict[str, Any]]:
+        if not path.exists():
+            return {}
+        records = {}
+        with gzip.open(path, "rt") as f:
+            for line in f:
+                record = json.loads(line)
+                records[record["id"]] = record  # A retried archive run may repeat a record; last wins
+        return records
+
+    def _rewrite(self, segment: str, exclude: Iterable[str]) -> None:
+        with self._locked(segment, exclusive=True) as path:
+            records = self._read_unlocked(path)
+            for session_id in exclude:
+                records.pop(session_id, None)
+            if not records:
+                path.unlink(missing_ok=True)
+                return
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                f.write(gzip.compress("".join(json.dumps(r) + "\n" for r in records.values()).encode()))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+
+    def _remove_user_files(self, user_id: UUID) -> None:
+        for session_dir in self.base_dir.glob(f"*/{user_id}"):
+            shutil.rmtree(session_dir, ignore_errors=True)
+
+    def _after_commit_cleanup(self, db: AsyncSession, cleanup: Callable[..., None], *args: Any) -> None:
+        """Run blocking file cleanup in a worker thread once `db` commits."""
+        def start() -> None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                cleanup(*args)
+                return
+            task = loop.create_task(asyncio.to_thread(cleanup, *args))
+            self._cleanups.add(task)
+            task.add_done_callback(self._cleanup_done)
+
+        after_commit(db, start)
+
+    def _cleanup_done(self, task: asyncio.Task) -> None:
+        self._cleanups.discard(task)
+        if not task.cancelled() and task.exception():
+            # The index rows are gone, so the leftover records are never read
+            logger.error(f"Archive cleanup failed: {task.exception()}")
+
+    async def wait_for_cleanups(self) -> None:
+        """Wait for segment rewrites and deletes started by committed removals."""
+        while self._cleanups:
+            await asyncio.gather(*self._cleanups, return_exceptions=True)
+
+    # ========== Archive Operations ==========
+
+    async def append(self, db: AsyncSession, session_type: str, records: List[Dict[str, Any]]) -> int:
+        """
+        Write records to their segments and add index rows to `db`.
+
+        Segments are written (and fsynced) before the index rows are
+        committed, so an index row never points at missing data. The caller
+        deletes the hot rows in the same transaction as the index rows.
+        """
+        by_segment: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for record in records:
+            created_at = datetime.fromisoformat(record["created_at"])
+            by_segment[self.segment_for(session_type, record["user_id"], created_at)].append(record)
+
+        for segment, segment_records in by_segment.items():
+            await asyncio.to_thread(self._append, segment, segment_records)
+            for record in segment_records:
+                db.add(ArchivedSession(
+                    session_id=UUID(record["id"]),
+                    session_type=session_type,
+                    user_id=UUID(record["user_id"]),
+                    segment=segment,
+                    created_at=datetime.fromisoformat(record["created_at"]),
+                ))
+        await db.flush()
+        return len(records)
+
+    def read_segment(self, segment: str) -> Dict[str, Dict[str, Any]]:
+        """Every record of a segment by id (blocking; for batch jobs outside the event loop)."""
+        return self._read(segment)
+
+    async def get(self, db: AsyncSession, session_type: str, session_id: UUID) -> Optional[Dict[str, Any]]:
+        """Get one archived session record, or None if it is not archived."""
+        segment = await db.scalar(
+            select(ArchivedSession.segment).where(
+                ArchivedSession.session_id == session_id,
+                ArchivedSession.session_type == session_type
+            )
+        )
+        if not segment:
+            return None
+        records = await asyncio.to_thread(self._read, segment)
+        return records.get(str(session_id))
+
+    async def count_for_user(self, db: AsyncSession, session_type: str, user_id: UUID) -> int:
+        """Number of archived sessions for a user."""
+        return await db.scalar(
+            select(func.count()).select_from(ArchivedSession).where(
+                ArchivedSession.user_id == user_id,
+                ArchivedSession.session_type == session_type
+            )
+        )
+
+    async def page_for_user(
+        self,
+        db: AsyncSession,
+        session_type: str,
+        hot_model: Any,
+        user_id: UUID,
+        offset: int = 0,
+        limit: int = 50
+    ) -> List[Tuple[UUID, bool]]:
+        """
+        Get one page of a user's sessions across the hot table and the archive.
+
+        The two tiers are merged on created_at (newest first) in one query,
+        since an archived session is not necessarily older than every hot
+        one: sessions are archived by completion date. Returns
+        (session_id, archived) pairs in page order.
+        """
+        hot = select(
+            hot_model.created_at, hot_model.id, literal(False).label("archived")
+        ).where(hot_model.user_id == user_id)
+        archived = select(
+            ArchivedSession.created_at, ArchivedSession.session_id, literal(True)
+        ).where(ArchivedSession.user_id == user_id, ArchivedSession.session_type == session_type)
+        merged = union_all(hot, archived).subquery()
+        result = await db.execute(
+            select(merged.c.id, merged.c.archived)
+            .order_by(merged.c.created_at.desc(), merged.c.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return [(row.id, row.archived) for row in result]
+
+    async def get_many(
+        self,
+        db: AsyncSession,
+        session_type: str,
+        session_ids: List[UUID]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get archived session records by id (as strings), reading each segment once."""
+        if not session_ids:
+            return {}
+        result = await db.execute(
+            select(ArchivedSession.session_id, ArchivedSession.segment).where(
+                ArchivedSession.session_id.in_(session_ids),
+                ArchivedSession.session_type == session_type
+            )
+        )
+        index = result.all()
+        records = {}
+        for segment in {row.segment for row in index}:
+            segment_records = await asyncio.to_thread(self._read, segment)
+            for row in index:
+                if row.segment == segment and str(row.session_id) in segment_records:
+                    records[str(row.session_id)] = segment_records[str(row.session_id)]
+        return records
+
+    async def stream_for_user(
+        self,
+        db: AsyncSession,
+        session_type: str,
+        user_id: UUID
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every archived session for a user, one segment in memory at a time."""
+        result = await db.execute(
+            select(ArchivedSession.segment, ArchivedSession.session_id)
+            .where(ArchivedSession.user_id == user_id, ArchivedSession.session_type == session_type)
+            .order_by(ArchivedSession.segment)
+        )
+        indexed: Dict[str, Set[str]] = defaultdict(set)
+        for row in result:
+            indexed[row.segment].add(str(row.session_id))
+        for segment, session_ids in indexed.items():
+            records = await asyncio.to_thread(self._read, segment)
+            kept = [record for session_id, record in records.items() if session_id in session_ids]
+            for record in sorted(kept, key=lambda r: r["created_at"]):
+                yield record
+
+    async def remove(self, db: AsyncSession, session_type: str, session_id: UUID) -> bool:
+        """
+        Remove one archived session from the index, and from its segment once `db` commits.
+
+        If the transaction rolls back the session stays archived, untouched.
+        """
+        segment = await db.scalar(
+            select(ArchivedSession.segment).where(
+                ArchivedSession.session_id == session_id,
+                ArchivedSession.session_type == session_type
+            )
+        )
+        if not segment:
+            return False
+        await db.execute(delete(ArchivedSession).where(ArchivedSession.session_id == session_id))
+        self._after_commit_cleanup(db, self._rewrite, segment, [str(session_id)])
+        return True
+
+    async def remove_user(self, db: AsyncSession, user_id: UUID) -> int:
+        """Remove every archived session of a user (account erasure); files go once `db` commits."""
+        result = await db.execute(delete(ArchivedSession).where(ArchivedSession.user_id == user_id))
+        self._after_commit_cleanup(db, self._remove_user_files, user_id)
+        return result.rowcount
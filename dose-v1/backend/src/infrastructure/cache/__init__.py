@@ -0,0 +1,18 @@
+"""Per-process caches shared across modules."""
+
+from src.infrastructure.config.settings import settings
+from .generational_lru import GenerationalLRU
+from .response_cache import CachedResponse, ResponseCache
+
+# Shared by the cached GET endpoints; invalidated by session events at commit
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_ENTRIES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS
+)
+
+__all__ = [
+    "CachedResponse",
+    "GenerationalLRU",
+    "ResponseCache",
+    "response_cache",
+]
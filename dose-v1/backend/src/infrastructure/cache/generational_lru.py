@@ -0,0 +1,80 @@
+"""
+Generational LRU
+Bounded per-user cache whose loads lose to writes that race them
+"""
+
+import itertools
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+from uuid import UUID
+
+
+class GenerationalLRU:
+    """
+    Bounded LRU of per-user values, expiring after `ttl_seconds`.
+
+    Every user has a generation; a write bumps it. Callers take
+    `generation(user_id)` before loading a value and pass it to `put`, which
+    drops the value if a write was made in between, so a load racing a
+    write never caches what the write replaced. Generations come from one
+    counter. Users never bumped (or whose bump was pruned, once more than
+    2 x max_users are tracked) share a base generation, raised past every
+    generation issued at each prune, so a load in flight across a prune is
+    not kept either.
+    """
+
+    def __init__(self, max_users: int = 10000, ttl_seconds: float = 300.0):
+        self.max_users = max_users
+        self.ttl_seconds = ttl_seconds
+        self._counter = itertools.count(1)
+        self._base = 0
+        self._generations: Dict[UUID, int] = {}
+        self._entries: "OrderedDict[UUID, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: UUID) -> Optional[Any]:
+        entry = self._entries.get(user_id)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def peek(self, user_id: UUID) -> Optional[Any]:
+        """The user's value, even if expired, without touching recency or counters."""
+        entry = self._entries.get(user_id)
+        return entry[1] if entry is not None else None
+
+    def generation(self, user_id: UUID) -> int:
+        return self._generations.get(user_id, self._base)
+
+    def put(self, user_id: UUID, value: Any, generation: int) -> bool:
+        """Cache a value loaded at `generation`. False if a write has made it stale."""
+        if generation != self.generation(user_id):
+            return False
+        self._entries[user_id] = (time.monotonic(), value)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+        return True
+
+    def bump(self, user_id: UUID) -> None:
+        """Record a write: loads started before it are not kept. The entry stays."""
+        self._generations[user_id] = next(self._counter)
+        if len(self._generations) > 2 * self.max_users:
+            self._base = next(self._counter)
+            self._generations = {u: g for u, g in self._generations.items() if u in self._entries}
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop the user's entry and any load in flight."""
+        self._entries.pop(user_id, None)
+        self.bump(user_id)
+
+    def values(self) -> Iterator[Any]:
+        return (value for _, value in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
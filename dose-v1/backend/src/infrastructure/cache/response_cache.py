@@ -0,0 +1,137 @@
+"""
+Response Cache
+Per-user cache of encoded GET responses with versioned keys and ETags
+"""
+
+import itertools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from uuid import UUID, uuid4
+
+import orjson
+from fastapi import Response, status
+
+from src.core.domain.events import SessionEvent
+
+CacheKey = Tuple[UUID, Hashable]  # (user_id, (route, *params))
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    version: int
+    stored_at: float
+    body: bytes
+    etag: str
+
+
+class ResponseCache:
+    """
+    Bounded LRU of JSON response bodies keyed by (user_id, route, params).
+
+    Every user has a version; an entry is served only while it was built at
+    the user's current version. Writes bump the version when they commit
+    (the cache is an inline event bus subscriber, and every mutating service
+    method publishes events after commit), so all of the user's entries go
+    stale at once without being found and deleted. Versions come from one
+    process-wide counter, and the ETag is the process epoch plus the version
+    the body was built at.
+
+    Conditional requests get a 304 only against a fresh entry of the current
+    version. Writes handled by other processes are not seen, so entries also
+    expire after `ttl_seconds`; a different process never matches another's
+    ETag and simply answers in full.
+    """
+
+    def __init__(self, max_entries: int = 50000, ttl_seconds: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._epoch = uuid4().hex[:12]
+        self._counter = itertools.count(1)
+        # Version of users never bumped (or whose bump was pruned)
+        self._base = 0
+        self._versions: Dict[UUID, int] = {}
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.not_modified = 0
+        self.misses = 0
+        self.bumps = 0
+
+    def version(self, user_id: UUID) -> int:
+        return self._versions.get(user_id, self._base)
+
+    def bump(self, user_id: UUID) -> None:
+        """Invalidate every cached response of the user."""
+        self._versions[user_id] = next(self._counter)
+        self.bumps += 1
+        if len(self._versions) > 2 * self.max_entries:
+            # Forgotten users fall back to a new base, past every version issued
+            self._base = next(self._counter)
+            cached = {user_id for user_id, _ in self._entries}
+            self._versions = {u: v for u, v in self._versions.items() if u in cached}
+
+    def on_session_event(self, event: SessionEvent) -> None:
+        """Inline event bus subscriber: runs as the write commits."""
+        self.bump(event.user_id)
+
+    def get(self, user_id: UUID, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get((user_id, key))
+        if (
+            entry is None
+            or entry.version != self.version(user_id)
+            or time.monotonic() - entry.stored_at > self.ttl_seconds
+        ):
+            return None
+        self._entries.move_to_end((user_id, key))
+        return entry
+
+    def put(self, user_id: UUID, key: Hashable, version: int, body: bytes) -> CachedResponse:
+        """Cache a body built at `version`. Returns the entry even when it is already stale."""
+        entry = CachedResponse(version, time.monotonic(), body, f'"{self._epoch}.{version}"')
+        if version != self.version(user_id):
+            return entry
+        self._entries[(user_id, key)] = entry
+        self._entries.move_to_end((user_id, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    async def respond(
+        self,
+        user_id: UUID,
+        key: Hashable,
+        if_none_match: Optional[str],
+        load: Callable[[], Awaitable[Any]]
+    ) -> Response:
+        """
+        The cached response for (user_id, key), 304 if the client has it, or
+        else `load()` encoded like ORJSONResponse and cached.
+
+        `load` raises HTTPException for errors; those are never cached.
+        """
+        entry = self.get(user_id, key)
+        if entry is not None:
+            if if_none_match and entry.etag in (tag.strip() for tag in if_none_match.split(",")):
+                self.not_modified += 1
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self._headers(entry))
+            self.hits += 1
+        else:
+            self.misses += 1
+            version = self.version(user_id)
+            entry = self.put(user_id, key, version, orjson.dumps(await load(), option=orjson.OPT_NON_STR_KEYS))
+        return Response(content=entry.body, media_type="application/json", headers=self._headers(entry))
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "not_modified": self.not_modified,
+            "misses": self.misses,
+            "bumps": self.bumps,
+        }
+
+    @staticmethod
+    def _headers(entry: CachedResponse) -> Dict[str, str]:
+        # Clients may keep the body but must revalidate before using it
+        return {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
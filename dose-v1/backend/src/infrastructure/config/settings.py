@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -48,6 +48,17 @@ class Settings(BaseSettings):
 
     # Logging level
     LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = False  # One JSON object per line, with the request's log context
+    LOG_QUEUE_SIZE: int = 10000  # Records waiting for the writer thread; 0 logs synchronously
+    LOG_QUEUE_DEBUG_FILL: float = 0.5  # DEBUG records are dropped once the queue is this full
+    LOG_QUEUE_KEEP_LEVEL: str = "ERROR"  # Never dropped, even with the queue full
+
+    # Request log sampling (failed and slow requests are always logged)
+    LOG_REQUEST_SAMPLE_RATE: float = 1.0  # Share of requests whose started/completed lines are written
+    LOG_REQUEST_ROUTE_RATES: Dict[str, float] = {}  # Path prefix -> rate, e.g. {"/health": 0.01}
+    LOG_REQUEST_SLOW_MS: int = 1000
+    LOG_REQUEST_KEEP_STATUS: int = 500  # Responses with this status or higher are always logged
+    LOG_REQUEST_BUDGET_PER_SECOND: int = 0  # Request log lines per second to scale rates down to; 0 disables
 
     # OAuth - Google
     GOOGLE_CLIENT_ID: str = ""
@@ -73,6 +84,63 @@ class Settings(BaseSettings):
     PASSWORD_RESET_TOKEN_EXPIRE_HOURS: int = 1
     PASSWORD_RESET_URL: str = "http://localhost:3000/reset-password"
 
+    # Delta sync
+    SYNC_SETTLE_SECONDS: int = 5  # Hide changes younger than this so late commits are not skipped
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30  # Cursors older than this get 410; tombstones are purged after it
+    SYNC_MAX_BACKFILL_DAYS: int = 14  # Offline start/completion times older than this are clamped
+
+    # Draft autosave (write-behind)
+    DRAFT_FLUSH_SECONDS: float = 5.0  # Longest a draft waits in memory before it is stored
+    DRAFT_BATCH_SIZE: int = 500  # Pending steps that trigger an early flush
+    DRAFT_MAX_PENDING: int = 50000  # Pending steps held in memory; the oldest are dropped beyond this
+    DRAFT_OWNER_CACHE_SESSIONS: int = 10000  # Sessions whose owner is remembered, per process
+
+    # Account erasure
+    ERASURE_BATCH_SIZE: int = 500  # Rows deleted per transaction
+    ERASURE_POLL_SECONDS: int = 10
+
+    # Monthly partitions of spark_sessions / wave_sessions
+    SESSION_PARTITION_MONTHS_AHEAD: int = 3
+    SESSION_PARTITION_RETENTION_MONTHS: int = 0  # Drop emptied (fully archived) partitions older than this; 0 keeps all
+
+    # Cold-storage archive of completed sessions
+    ARCHIVE_DIR: str = "data/archive"
+    ARCHIVE_AFTER_DAYS: int = 0  # Archive sessions completed longer ago than this; 0 disables the job
+    ARCHIVE_BATCH_SIZE: int = 500
+
+    # Domain event bus
+    EVENT_BUS_QUEUE_SIZE: int = 1000  # Events beyond this are dropped rather than slowing requests
+    EVENT_BUS_WORKERS: int = 2
+
+    # Event store
+    EVENT_STORE_BATCH_SIZE: int = 500  # Events per INSERT / commit
+    EVENT_STORE_FLUSH_SECONDS: float = 1.0
+    EVENT_STORE_OUTBOX_GRACE_SECONDS: int = 60  # Outbox rows older than this are recovered
+
+    # Read-model projections
+    PROJECTION_BATCH_SIZE: int = 500  # Users per rebuild batch / events per live batch
+    PROJECTION_SETTLE_SECONDS: int = 5  # Leave event_store rows younger than this for the next poll
+    PROJECTION_POLL_SECONDS: float = 1.0
+    PROJECTION_REBUILD_PARTITIONS: int = 4  # Worker processes per rebuild
+
+    # Per-user GET response cache
+    RESPONSE_CACHE_ENTRIES: int = 50000  # Per process
+    RESPONSE_CACHE_TTL_SECONDS: int = 30  # Bounds staleness from writes in other processes
+
+    # Analytics
+    ANALYTICS_PATTERN_CACHE_USERS: int = 10000  # Per process
+    ANALYTICS_PATTERN_CACHE_TTL_SECONDS: int = 300  # Bounds staleness from writes in other processes
+
+    # Cohort analytics batch job
+    ANALYTICS_REPLICA_URL: str = ""  # Session tables are read from here; empty reads the primary
+    COHORT_REPORT_WORKERS: int = 4  # Aggregating processes
+    COHORT_REPORT_CHUNKS: int = 64  # id ranges per table; more than workers so slow chunks even out
+    COHORT_REPORT_FETCH_SIZE: int = 5000  # Rows held in memory per worker
+
+    # POPCORN
+    POPCORN_TAG_INDEX_USERS: int = 10000  # Users whose tag autocomplete index is kept, per process
+    POPCORN_TAG_INDEX_TTL_SECONDS: int = 300  # Bounds staleness from writes in other processes
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
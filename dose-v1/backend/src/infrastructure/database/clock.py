@@ -0,0 +1,31 @@
+"""
+Database Clock
+The database server's current time, in UTC, as a SQL expression
+"""
+
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class db_utc_now(FunctionElement):
+    """
+    Wall-clock time on the database server, in UTC, for naive DateTime columns.
+
+    On PostgreSQL this is clock_timestamp(), which keeps moving inside a
+    transaction (now() is frozen at its start), converted to UTC whatever
+    the session's TimeZone. Comparing against it rather than the app's
+    clock keeps one clock on both sides of a comparison.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(db_utc_now)
+def _compile_default(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(db_utc_now, "postgresql")
+def _compile_postgresql(element, compiler, **kw) -> str:
+    return "(clock_timestamp() AT TIME ZONE 'UTC')"
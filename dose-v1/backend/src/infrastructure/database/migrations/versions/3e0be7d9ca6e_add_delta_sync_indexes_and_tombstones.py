@@ -0,0 +1,42 @@
+"""add delta sync indexes and session tombstones
+
+Revision ID: 3e0be7d9ca6e
+Revises: 57382b9151e6
+Create Date: 2026-10-19 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e0be7d9ca6e'
+down_revision: Union[str, Sequence[str], None] = '57382b9151e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_spark_sessions_user_updated', 'spark_sessions', ['user_id', 'updated_at', 'id'])
+    op.create_index('ix_wave_sessions_user_updated', 'wave_sessions', ['user_id', 'updated_at', 'id'])
+
+    op.create_table('session_tombstones',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('session_type', sa.String(length=20), nullable=False),
+    sa.Column('session_id', sa.UUID(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_session_tombstones_user_deleted', 'session_tombstones', ['user_id', 'deleted_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_session_tombstones_user_deleted', table_name='session_tombstones')
+    op.drop_table('session_tombstones')
+    op.drop_index('ix_wave_sessions_user_updated', table_name='wave_sessions')
+    op.drop_index('ix_spark_sessions_user_updated', table_name='spark_sessions')
@@ -0,0 +1,38 @@
+"""add session_drafts
+
+Revision ID: a4c81e5f9d23
+Revises: f3a9d2c07b16
+Create Date: 2026-10-19 22:41:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c81e5f9d23'
+down_revision: Union[str, Sequence[str], None] = 'f3a9d2c07b16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('session_drafts',
+    sa.Column('session_id', sa.UUID(), nullable=False),
+    sa.Column('step', sa.SmallInteger(), nullable=False),
+    sa.Column('session_type', sa.String(length=20), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('session_id', 'step')
+    )
+    op.create_index('ix_session_drafts_user', 'session_drafts', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_session_drafts_user', table_name='session_drafts')
+    op.drop_table('session_drafts')
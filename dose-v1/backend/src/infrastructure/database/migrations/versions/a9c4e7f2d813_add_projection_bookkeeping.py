@@ -0,0 +1,61 @@
+"""add projection bookkeeping and event_store.stored_at
+
+Revision ID: a9c4e7f2d813
+Revises: f3b8d20c6e51
+Create Date: 2026-10-19 16:47:12.093318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c4e7f2d813'
+down_revision: Union[str, Sequence[str], None] = 'f3b8d20c6e51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('event_store', sa.Column('stored_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False))
+    op.create_index('ix_event_store_stored', 'event_store', ['stored_at', 'id'])
+
+    op.create_table('projection_positions',
+    sa.Column('projection', sa.String(length=100), nullable=False),
+    sa.Column('stored_at', sa.DateTime(), nullable=False),
+    sa.Column('event_id', sa.UUID(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('projection')
+    )
+    op.create_table('projection_rebuilds',
+    sa.Column('projection', sa.String(length=100), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('partitions', sa.Integer(), nullable=False),
+    sa.Column('watermark', sa.DateTime(), nullable=False),
+    sa.Column('stored_at', sa.DateTime(), nullable=False),
+    sa.Column('event_id', sa.UUID(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('projection')
+    )
+    op.create_table('projection_rebuild_partitions',
+    sa.Column('projection', sa.String(length=100), nullable=False),
+    sa.Column('partition', sa.Integer(), nullable=False),
+    sa.Column('last_user_id', sa.UUID(), nullable=True),
+    sa.Column('users_done', sa.Integer(), nullable=False),
+    sa.Column('completed', sa.Boolean(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('projection', 'partition')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('projection_rebuild_partitions')
+    op.drop_table('projection_rebuilds')
+    op.drop_table('projection_positions')
+    op.drop_index('ix_event_store_stored', table_name='event_store')
+    op.drop_column('event_store', 'stored_at')
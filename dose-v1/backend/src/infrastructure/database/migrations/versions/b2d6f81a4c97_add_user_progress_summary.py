@@ -0,0 +1,47 @@
+"""add user_progress_summary
+
+Revision ID: b2d6f81a4c97
+Revises: a9c4e7f2d813
+Create Date: 2026-10-19 18:05:51.730264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d6f81a4c97'
+down_revision: Union[str, Sequence[str], None] = 'a9c4e7f2d813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_progress_summary',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('spark_started', sa.Integer(), nullable=False),
+    sa.Column('spark_completed', sa.Integer(), nullable=False),
+    sa.Column('spark_last_completed_at', sa.DateTime(), nullable=True),
+    sa.Column('wave_started', sa.Integer(), nullable=False),
+    sa.Column('wave_completed', sa.Integer(), nullable=False),
+    sa.Column('wave_last_completed_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    # Apply new events from now on; history is backfilled with
+    # python -m src.infrastructure.projections.rebuild user_progress_summary
+    op.execute(
+        "INSERT INTO projection_positions (projection, stored_at, event_id, updated_at) "
+        "VALUES ('user_progress_summary', now(), '00000000-0000-0000-0000-000000000000', now())"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM projection_rebuild_partitions WHERE projection = 'user_progress_summary'")
+    op.execute("DELETE FROM projection_rebuilds WHERE projection = 'user_progress_summary'")
+    op.execute("DELETE FROM projection_positions WHERE projection = 'user_progress_summary'")
+    op.drop_table('user_progress_summary')
@@ -0,0 +1,47 @@
+"""add session_ids
+
+Revision ID: b5e3f9a07c42
+Revises: a4c81e5f9d23
+Create Date: 2026-10-20 09:12:48.331507
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e3f9a07c42'
+down_revision: Union[str, Sequence[str], None] = 'a4c81e5f9d23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('session_ids',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('session_type', sa.String(length=20), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_session_ids_user', 'session_ids', ['user_id'], unique=False)
+
+    # Claim every id already in use, hot or archived
+    op.execute("""
+        INSERT INTO session_ids (id, session_type, user_id, created_at)
+        SELECT id, 'spark', user_id, created_at FROM spark_sessions
+        UNION ALL
+        SELECT id, 'wave', user_id, created_at FROM wave_sessions
+        UNION ALL
+        SELECT session_id, session_type, user_id, created_at FROM archived_sessions
+        ON CONFLICT (id) DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_session_ids_user', table_name='session_ids')
+    op.drop_table('session_ids')
@@ -0,0 +1,42 @@
+"""add users.deleted_at and account_erasures
+
+Revision ID: b81f4c2a9d37
+Revises: 3e0be7d9ca6e
+Create Date: 2026-10-19 10:02:15.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81f4c2a9d37'
+down_revision: Union[str, Sequence[str], None] = '3e0be7d9ca6e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+
+    op.create_table('account_erasures',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('current_step', sa.String(length=50), nullable=True),
+    sa.Column('rows_deleted', sa.Integer(), nullable=False),
+    sa.Column('requested_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index(op.f('ix_account_erasures_status'), 'account_erasures', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_account_erasures_status'), table_name='account_erasures')
+    op.drop_table('account_erasures')
+    op.drop_column('users', 'deleted_at')
@@ -0,0 +1,127 @@
+"""partition spark_sessions and wave_sessions by month
+
+Revision ID: c4d2e8a1f690
+Revises: b81f4c2a9d37
+Create Date: 2026-10-19 11:20:48.204671
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.infrastructure.database.partitions import add_months, create_partition_sql, month_start
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d2e8a1f690'
+down_revision: Union[str, Sequence[str], None] = 'b81f4c2a9d37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MONTHS_AHEAD = 3
+
+COLUMNS = {
+    'spark_sessions': """
+        id UUID NOT NULL,
+        user_id UUID NOT NULL REFERENCES users (id),
+        status VARCHAR(50) NOT NULL,
+        current_step INTEGER NOT NULL,
+        situation_response TEXT,
+        perception_response TEXT,
+        affect_response TEXT,
+        response_response TEXT,
+        key_result_response TEXT,
+        created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        completed_at TIMESTAMP WITHOUT TIME ZONE
+    """,
+    'wave_sessions': """
+        id UUID NOT NULL,
+        user_id UUID NOT NULL REFERENCES users (id),
+        status VARCHAR(50) NOT NULL,
+        current_step INTEGER NOT NULL,
+        situation TEXT,
+        emotion VARCHAR(100),
+        intensity INTEGER,
+        acceptance_statement TEXT,
+        action_type VARCHAR(50),
+        action_completed BOOLEAN NOT NULL,
+        actual_duration INTEGER,
+        action_notes TEXT,
+        created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        completed_at TIMESTAMP WITHOUT TIME ZONE
+    """,
+}
+
+
+def _column_names(table: str) -> str:
+    return ', '.join(line.split()[0] for line in COLUMNS[table].strip().splitlines())
+
+
+def _indexes(table: str) -> list:
+    return [
+        (f'ix_{table}_user_id', ['user_id']),
+        (f'ix_{table}_status', ['status']),
+        (f'ix_{table}_user_created', ['user_id', 'created_at']),
+        (f'ix_{table}_user_updated', ['user_id', 'updated_at', 'id']),
+    ]
+
+
+def _partition(table: str) -> None:
+    legacy = f'{table}_unpartitioned'
+    op.execute(f'ALTER TABLE {table} RENAME TO {legacy}')
+    op.execute(f'ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey')
+
+    # Partition key must be part of the primary key
+    op.execute(
+        f'CREATE TABLE {table} ({COLUMNS[table]}, PRIMARY KEY (id, created_at)) '
+        f'PARTITION BY RANGE (created_at)'
+    )
+
+    oldest = op.get_bind().execute(sa.text(f'SELECT min(created_at) FROM {legacy}')).scalar()
+    this_month = month_start(datetime.utcnow().date())
+    month = month_start(oldest.date()) if oldest else this_month
+    while month <= add_months(this_month, MONTHS_AHEAD):
+        op.execute(create_partition_sql(table, month))
+        month = add_months(month, 1)
+
+    columns = _column_names(table)
+    op.execute(f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {legacy}')
+    op.execute(f'DROP TABLE {legacy}')
+
+    # Indexes on the parent are created on every partition, current and future
+    for name, index_columns in _indexes(table):
+        op.create_index(name, table, index_columns)
+
+
+def _unpartition(table: str) -> None:
+    partitioned = f'{table}_partitioned'
+    op.execute(f'ALTER TABLE {table} RENAME TO {partitioned}')
+    op.execute(f'ALTER TABLE {partitioned} RENAME CONSTRAINT {table}_pkey TO {partitioned}_pkey')
+    for name, _ in _indexes(table):
+        op.execute(f'ALTER INDEX {name} RENAME TO {name}_partitioned')
+
+    op.execute(f'CREATE TABLE {table} ({COLUMNS[table]}, PRIMARY KEY (id))')
+    columns = _column_names(table)
+    op.execute(f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {partitioned}')
+    op.execute(f'DROP TABLE {partitioned}')
+
+    op.create_index(f'ix_{table}_user_id', table, ['user_id'])
+    op.create_index(f'ix_{table}_status', table, ['status'])
+    op.create_index(f'ix_{table}_user_updated', table, ['user_id', 'updated_at', 'id'])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in COLUMNS:
+        _partition(table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in COLUMNS:
+        _unpartition(table)
@@ -0,0 +1,35 @@
+"""add projection_rebuild_batches
+
+Revision ID: c6a1d84e2b35
+Revises: b5e3f9a07c42
+Create Date: 2026-10-20 11:03:27.518846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6a1d84e2b35'
+down_revision: Union[str, Sequence[str], None] = 'b5e3f9a07c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('projection_rebuild_batches',
+    sa.Column('projection', sa.String(length=100), nullable=False),
+    sa.Column('partition', sa.Integer(), nullable=False),
+    sa.Column('last_user_id', sa.UUID(), nullable=False),
+    sa.Column('loaded_at', sa.DateTime(), nullable=False),
+    sa.Column('pending_event_ids', sa.JSON(), nullable=False),
+    sa.PrimaryKeyConstraint('projection', 'partition', 'last_user_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('projection_rebuild_batches')
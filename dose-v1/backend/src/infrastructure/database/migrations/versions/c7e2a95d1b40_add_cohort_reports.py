@@ -0,0 +1,39 @@
+"""add cohort_reports
+
+Revision ID: c7e2a95d1b40
+Revises: b2d6f81a4c97
+Create Date: 2026-10-19 19:12:08.415907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a95d1b40'
+down_revision: Union[str, Sequence[str], None] = 'b2d6f81a4c97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cohort_reports',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('source', sa.String(length=20), nullable=False),
+    sa.Column('chunks', sa.Integer(), nullable=False),
+    sa.Column('rows_scanned', sa.BigInteger(), nullable=False),
+    sa.Column('report', sa.JSON(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cohort_reports_completed_at'), 'cohort_reports', ['completed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_cohort_reports_completed_at'), table_name='cohort_reports')
+    op.drop_table('cohort_reports')
@@ -0,0 +1,53 @@
+"""add activity_rollups and users.timezone
+
+Revision ID: d1f7a3c85e02
+Revises: c7e2a95d1b40
+Create Date: 2026-10-19 20:41:37.092514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f7a3c85e02'
+down_revision: Union[str, Sequence[str], None] = 'c7e2a95d1b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('timezone', sa.String(length=64), server_default='UTC', nullable=False))
+    op.create_table('activity_rollups',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('granularity', sa.String(length=10), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('spark_started', sa.Integer(), nullable=False),
+    sa.Column('spark_completed', sa.Integer(), nullable=False),
+    sa.Column('wave_started', sa.Integer(), nullable=False),
+    sa.Column('wave_completed', sa.Integer(), nullable=False),
+    sa.Column('intensity_sum', sa.Integer(), nullable=False),
+    sa.Column('intensity_count', sa.Integer(), nullable=False),
+    sa.Column('intensity_max', sa.Integer(), nullable=True),
+    sa.Column('action_counts', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('user_id', 'granularity', 'bucket_start')
+    )
+    # Apply new events from now on; history is backfilled with
+    # python -m src.infrastructure.projections.rebuild activity_rollups
+    op.execute(
+        "INSERT INTO projection_positions (projection, stored_at, event_id, updated_at) "
+        "VALUES ('activity_rollups', now(), '00000000-0000-0000-0000-000000000000', now())"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM projection_rebuild_partitions WHERE projection = 'activity_rollups'")
+    op.execute("DELETE FROM projection_rebuilds WHERE projection = 'activity_rollups'")
+    op.execute("DELETE FROM projection_positions WHERE projection = 'activity_rollups'")
+    op.drop_table('activity_rollups')
+    op.drop_column('users', 'timezone')
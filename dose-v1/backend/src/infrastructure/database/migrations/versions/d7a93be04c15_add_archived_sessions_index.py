@@ -0,0 +1,38 @@
+"""add archived_sessions index table
+
+Revision ID: d7a93be04c15
+Revises: c4d2e8a1f690
+Create Date: 2026-10-19 12:41:07.661352
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a93be04c15'
+down_revision: Union[str, Sequence[str], None] = 'c4d2e8a1f690'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('archived_sessions',
+    sa.Column('session_id', sa.UUID(), nullable=False),
+    sa.Column('session_type', sa.String(length=20), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('segment', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('session_id')
+    )
+    op.create_index('ix_archived_sessions_user_type_created', 'archived_sessions', ['user_id', 'session_type', 'created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_archived_sessions_user_type_created', table_name='archived_sessions')
+    op.drop_table('archived_sessions')
@@ -0,0 +1,59 @@
+"""stamp event_store.stored_at with clock_timestamp in UTC, add projection_dead_letters
+
+Revision ID: d8b2f6a4c913
+Revises: c6a1d84e2b35
+Create Date: 2026-10-21 09:12:44.203517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b2f6a4c913'
+down_revision: Union[str, Sequence[str], None] = 'c6a1d84e2b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns holding event_store.stored_at values, converted together so positions keep matching
+_STORED_AT_COLUMNS = (
+    ('event_store', 'stored_at'),
+    ('projection_positions', 'stored_at'),
+    ('projection_rebuilds', 'stored_at'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # now() is the transaction start in the server's TimeZone; stamp with the
+    # UTC wall clock instead, and convert earlier stamps if they were local
+    timezone = op.get_bind().execute(sa.text("SHOW TimeZone")).scalar()
+    if timezone not in ('UTC', 'Etc/UTC', 'GMT', 'Etc/GMT'):
+        for table, column in _STORED_AT_COLUMNS:
+            op.execute(
+                f"UPDATE {table} SET {column} = ({column} AT TIME ZONE current_setting('TimeZone')) AT TIME ZONE 'UTC'"
+            )
+    op.alter_column(
+        'event_store', 'stored_at',
+        server_default=sa.text("(clock_timestamp() AT TIME ZONE 'UTC')"),
+    )
+
+    op.create_table('projection_dead_letters',
+    sa.Column('projection', sa.String(length=100), nullable=False),
+    sa.Column('event_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('stored_at', sa.DateTime(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=False),
+    sa.Column('failed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('projection', 'event_id')
+    )
+    op.create_index('ix_projection_dead_letters_user', 'projection_dead_letters', ['user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projection_dead_letters_user', table_name='projection_dead_letters')
+    op.drop_table('projection_dead_letters')
+    op.alter_column('event_store', 'stored_at', server_default=sa.text('now()'))
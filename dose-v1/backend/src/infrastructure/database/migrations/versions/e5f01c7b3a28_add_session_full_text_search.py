@@ -0,0 +1,56 @@
+"""add full-text search vectors to session tables
+
+Revision ID: e5f01c7b3a28
+Revises: d7a93be04c15
+Create Date: 2026-10-19 13:55:31.092847
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f01c7b3a28'
+down_revision: Union[str, Sequence[str], None] = 'd7a93be04c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keep in sync with SEARCHABLE / SEARCH_CONFIG in search_repository.py
+SEARCHABLE = {
+    'spark_sessions': [
+        'situation_response', 'perception_response', 'affect_response',
+        'response_response', 'key_result_response',
+    ],
+    'wave_sessions': ['situation', 'acceptance_statement', 'action_notes'],
+}
+
+
+def _vector_expression(columns: list) -> str:
+    text = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+    return f"to_tsvector('english', {text})"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lets user_id share the GIN index, so searches never touch other users' entries
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gin')
+
+    for table, columns in SEARCHABLE.items():
+        op.add_column(table, sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(_vector_expression(columns), persisted=True),
+            nullable=True
+        ))
+        op.create_index(f'ix_{table}_search', table, ['user_id', 'search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SEARCHABLE:
+        op.drop_index(f'ix_{table}_search', table_name=table)
+        op.drop_column(table, 'search_vector')
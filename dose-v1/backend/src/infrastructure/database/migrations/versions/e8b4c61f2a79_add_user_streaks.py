@@ -0,0 +1,45 @@
+"""add user_streaks
+
+Revision ID: e8b4c61f2a79
+Revises: d1f7a3c85e02
+Create Date: 2026-10-19 21:26:54.310872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b4c61f2a79'
+down_revision: Union[str, Sequence[str], None] = 'd1f7a3c85e02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_streaks',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('current_streak', sa.Integer(), nullable=False),
+    sa.Column('longest_streak', sa.Integer(), nullable=False),
+    sa.Column('last_active_date', sa.Date(), nullable=True),
+    sa.Column('active_days', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    # Apply new events from now on; history is backfilled with
+    # python -m src.infrastructure.projections.rebuild user_streaks
+    op.execute(
+        "INSERT INTO projection_positions (projection, stored_at, event_id, updated_at) "
+        "VALUES ('user_streaks', now(), '00000000-0000-0000-0000-000000000000', now())"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM projection_rebuild_partitions WHERE projection = 'user_streaks'")
+    op.execute("DELETE FROM projection_rebuilds WHERE projection = 'user_streaks'")
+    op.execute("DELETE FROM projection_positions WHERE projection = 'user_streaks'")
+    op.drop_table('user_streaks')
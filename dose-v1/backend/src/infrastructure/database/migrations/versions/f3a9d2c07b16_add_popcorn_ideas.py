@@ -0,0 +1,50 @@
+"""add popcorn_ideas and popcorn_tags
+
+Revision ID: f3a9d2c07b16
+Revises: e8b4c61f2a79
+Create Date: 2026-10-19 22:05:13.481520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d2c07b16'
+down_revision: Union[str, Sequence[str], None] = 'e8b4c61f2a79'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('popcorn_ideas',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('tags', postgresql.ARRAY(sa.String(length=50)), server_default='{}', nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_popcorn_ideas_user_created', 'popcorn_ideas', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_popcorn_ideas_tags', 'popcorn_ideas', ['tags'], unique=False, postgresql_using='gin')
+    op.create_table('popcorn_tags',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('tag', sa.String(length=50), nullable=False),
+    sa.Column('idea_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'tag')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('popcorn_tags')
+    op.drop_index('ix_popcorn_ideas_tags', table_name='popcorn_ideas', postgresql_using='gin')
+    op.drop_index('ix_popcorn_ideas_user_created', table_name='popcorn_ideas')
+    op.drop_table('popcorn_ideas')
@@ -0,0 +1,52 @@
+"""add event_store and event_outbox
+
+Revision ID: f3b8d20c6e51
+Revises: e5f01c7b3a28
+Create Date: 2026-10-19 15:02:36.418920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d20c6e51'
+down_revision: Union[str, Sequence[str], None] = 'e5f01c7b3a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _columns() -> list:
+    return [
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('event_type', sa.String(length=100), nullable=False),
+        sa.Column('aggregate_type', sa.String(length=20), nullable=False),
+        sa.Column('aggregate_id', sa.UUID(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('event_store', *_columns())
+    op.create_index('ix_event_store_aggregate_created', 'event_store', ['aggregate_id', 'created_at'])
+    op.create_index('ix_event_store_user_created', 'event_store', ['user_id', 'created_at'])
+    op.create_index('ix_event_store_type_created', 'event_store', ['event_type', 'created_at'])
+
+    op.create_table('event_outbox', *_columns())
+    op.create_index(op.f('ix_event_outbox_created_at'), 'event_outbox', ['created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_event_outbox_created_at'), table_name='event_outbox')
+    op.drop_table('event_outbox')
+    op.drop_index('ix_event_store_type_created', table_name='event_store')
+    op.drop_index('ix_event_store_user_created', table_name='event_store')
+    op.drop_index('ix_event_store_aggregate_created', table_name='event_store')
+    op.drop_table('event_store')
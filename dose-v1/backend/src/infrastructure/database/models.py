@@ -1,7 +1,11 @@
 from src.infrastructure.database.session import Base
 
 from src.modules.auth.infrastructure.persistence.models import User
+from src.modules.auth.infrastructure.persistence.account_erasure_model import AccountErasure
 from src.modules.spark.infrastructure.persistence.models import SparkSession
 from src.modules.wave.infrastructure.persistence.models import WaveSession
+from src.modules.sync.infrastructure.persistence.models import SessionTombstone
+from src.infrastructure.archive.models import ArchivedSession
+from src.infrastructure.database.session_ids import SessionId
 
-__all__ = ["Base", "User", "SparkSession", "WaveSession"]
+__all__ = ["Base", "User", "AccountErasure", "SparkSession", "WaveSession", "SessionTombstone", "ArchivedSession", "SessionId"]
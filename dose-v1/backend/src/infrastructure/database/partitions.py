@@ -0,0 +1,199 @@
+"""
+Session Table Partition Manager
+Keeps monthly range partitions of spark_sessions / wave_sessions in step with time.
+
+Run once by hand with:
+    python -m src.infrastructure.database.partitions
+"""
+
+import asyncio
+import re
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Tables range-partitioned by month on created_at
+PARTITIONED_TABLES = ("spark_sessions", "wave_sessions")
+
+_PARTITION_SUFFIX = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+def month_start(value: date) -> date:
+    """First day of the month containing `value`."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """First day of the month `months` after (or before) the month of `value`."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the partition holding `month`, e.g. spark_sessions_y2026m10."""
+    return f"{table}_y{month.year}m{month.month:02d}"
+
+
+def partition_month(table: str, name: str) -> Optional[date]:
+    """Inverse of partition_name; None for tables not following the convention."""
+    if not name.startswith(f"{table}_"):
+        return None
+    match = _PARTITION_SUFFIX.search(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def create_partition_sql(table: str, month: date) -> str:
+    """DDL for one monthly partition."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+class PartitionManager:
+    """
+    Creates future monthly partitions and drops emptied old ones.
+
+    Inserts fail if no partition covers `created_at`, so partitions are created
+    `months_ahead` months in advance. Ageing sessions out is the archiver's
+    job (SessionArchiver moves them to cold storage, still readable); a
+    partition whose month ended more than `retention_months` ago is only
+    detached and dropped once it holds no rows, so nothing still live (an
+    in-progress session, or one not yet archived) ever disappears with it.
+    `retention_months=0` disables detaching.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        tables: Tuple[str, ...] = PARTITIONED_TABLES,
+        months_ahead: int = 3,
+        retention_months: int = 0,
+        interval_seconds: float = 24 * 60 * 60
+    ):
+        self.engine = engine
+        self.tables = tables
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.interval_seconds = interval_seconds
+
+    async def run(self, today: Optional[date] = None) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Bring partitions for every table up to date.
+
+        Returns:
+            Per table, the partitions created and detached.
+        """
+        if self.engine.dialect.name != "postgresql":
+            logger.debug("Partition maintenance skipped: database is not PostgreSQL")
+            return {}
+
+        today = today or datetime.utcnow().date()
+        report = {}
+        async with self.engine.begin() as conn:
+            for table in self.tables:
+                if not await self._is_partitioned(conn, table):
+                    logger.warning(f"Partition maintenance skipped: {table} is not partitioned")
+                    continue
+                existing = await self._partitions(conn, table)
+                report[table] = {
+                    "created": await self._create_ahead(conn, table, existing, today),
+                    "detached": await self._detach_expired(conn, table, existing, today),
+                }
+        return report
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Run maintenance every `interval_seconds` until `stop` is set."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                report = await self.run()
+                for table, changes in report.items():
+                    if changes["created"] or changes["detached"]:
+                        logger.info(f"Partitions for {table}: created {changes['created']}, detached {changes['detached']}")
+            except Exception as e:
+                logger.error(f"Partition maintenance failed: {e}")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _create_ahead(self, conn: AsyncConnection, table: str, existing: List[str], today: date) -> List[str]:
+        created = []
+        for offset in range(self.months_ahead + 1):
+            month = add_months(today, offset)
+            name = partition_name(table, month)
+            if name not in existing:
+                await conn.execute(text(create_partition_sql(table, month)))
+                created.append(name)
+        return created
+
+    async def _detach_expired(self, conn: AsyncConnection, table: str, existing: List[str], today: date) -> List[str]:
+        if self.retention_months <= 0:
+            return []
+        cutoff = add_months(today, -self.retention_months)
+        detached = []
+        for name in existing:
+            month = partition_month(table, name)
+            if not month or month >= cutoff:
+                continue
+            # DETACH takes this lock anyway; taking it first keeps the partition empty until then
+            await conn.execute(text(f"LOCK TABLE {name} IN ACCESS EXCLUSIVE MODE"))
+            if await self._has_rows(conn, name):
+                logger.info(f"Partition {name} kept: it still holds sessions that are not archived")
+                continue
+            await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            await conn.execute(text(f"DROP TABLE {name}"))
+            detached.append(name)
+        return detached
+
+    @staticmethod
+    async def _has_rows(conn: AsyncConnection, name: str) -> bool:
+        result = await conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM {name})"))
+        return bool(result.scalar())
+
+    @staticmethod
+    async def _is_partitioned(conn: AsyncConnection, table: str) -> bool:
+        result = await conn.execute(
+            text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"),
+            {"table": table},
+        )
+        return result.scalar() is not None
+
+    @staticmethod
+    async def _partitions(conn: AsyncConnection, table: str) -> List[str]:
+        result = await conn.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(:table) ORDER BY c.relname"
+            ),
+            {"table": table},
+        )
+        return list(result.scalars().all())
+
+
+async def main() -> None:
+    from src.infrastructure.config.settings import settings
+    from src.infrastructure.database.session import engine
+
+    manager = PartitionManager(
+        engine,
+        months_ahead=settings.SESSION_PARTITION_MONTHS_AHEAD,
+        retention_months=settings.SESSION_PARTITION_RETENTION_MONTHS,
+    )
+    report = await manager.run()
+    for table, changes in report.items():
+        print(f"{table}: created {changes['created'] or 'none'}, detached {changes['detached'] or 'none'}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
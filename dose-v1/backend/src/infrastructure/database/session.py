@@ -1,4 +1,5 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable
+from sqlalchemy import event as sa_event
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 from src.infrastructure.config.settings import settings
@@ -19,6 +20,30 @@ async def get_db():
             await session.rollback()
             raise
 
+_AFTER_COMMIT = "after_commit_callbacks"
+
+
+def after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run `callback` once the session's transaction commits; a rollback drops it."""
+    session = db.sync_session
+    callbacks = session.info.get(_AFTER_COMMIT)
+    if callbacks is None:
+        callbacks = session.info[_AFTER_COMMIT] = []
+        sa_event.listen(session, "after_commit", _run_after_commit)
+        sa_event.listen(session, "after_rollback", _drop_after_commit)
+    callbacks.append(callback)
+
+
+def _run_after_commit(session) -> None:
+    callbacks, session.info[_AFTER_COMMIT] = session.info.get(_AFTER_COMMIT) or [], []
+    for callback in callbacks:
+        callback()
+
+
+def _drop_after_commit(session) -> None:
+    session.info[_AFTER_COMMIT] = []
+
+
 async def init_db() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -0,0 +1,46 @@
+"""
+Session ID Registry
+One row per SPARK/WAVE session id, wherever the session now lives
+"""
+
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import String, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+from src.infrastructure.database.session import Base
+
+
+class SessionId(Base):
+    """
+    Claimed session ids.
+
+    The session tables are partitioned by created_at, and Postgres only
+    enforces a primary key on a partitioned table if it includes the
+    partition column, so their key is (id, created_at) and the same id
+    could land in two months. Repositories claim the id here, in the same
+    transaction, before inserting the session. Rows are kept when a session
+    is archived or deleted, so an id is never handed out twice.
+    """
+    __tablename__ = "session_ids"
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    session_type: Mapped[str] = mapped_column(String(20), nullable=False)  # 'spark', 'wave'
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_session_ids_user", "user_id"),
+    )
+
+
+async def claim_session_id(db: AsyncSession, session_type: str, session_id: UUID, user_id: UUID) -> bool:
+    """Claim an id for a new session. False if it is already taken."""
+    result = await db.execute(
+        insert(SessionId)
+        .values(id=session_id, session_type=session_type, user_id=user_id, created_at=datetime.utcnow())
+        .on_conflict_do_nothing(index_elements=["id"])
+        .returning(SessionId.id)
+    )
+    return result.scalar_one_or_none() is not None
@@ -0,0 +1,21 @@
+"""Write-behind autosave of session step drafts."""
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.session import AsyncSessionLocal
+from .buffer import DraftBuffer
+from .models import SessionDraft
+
+# Shared by the draft endpoints and the flush worker started at startup
+draft_buffer = DraftBuffer(
+    AsyncSessionLocal,
+    batch_size=settings.DRAFT_BATCH_SIZE,
+    max_pending=settings.DRAFT_MAX_PENDING,
+    flush_seconds=settings.DRAFT_FLUSH_SECONDS,
+    max_sessions=settings.DRAFT_OWNER_CACHE_SESSIONS
+)
+
+__all__ = [
+    "DraftBuffer",
+    "SessionDraft",
+    "draft_buffer",
+]
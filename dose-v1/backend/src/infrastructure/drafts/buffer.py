@@ -0,0 +1,275 @@
+"""
+Draft Buffer
+Write-behind buffer coalescing autosaved step drafts before they are stored.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncIterator, Collection, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.session import after_commit
+from src.infrastructure.drafts.models import SessionDraft
+from src.infrastructure.logging import get_logger
+from src.modules.auth.infrastructure.persistence.models import User
+from src.modules.spark.infrastructure.persistence.models import SparkSession
+from src.modules.wave.infrastructure.persistence.models import WaveSession
+
+logger = get_logger(__name__)
+
+DraftKey = Tuple[UUID, int]  # (session_id, step)
+
+_SESSION_MODELS = {"spark": SparkSession, "wave": WaveSession}
+
+
+class DraftBuffer:
+    """
+    Holds the latest draft per (session_id, step) in memory.
+
+    A draft replaces any draft of the same step still in memory, so a burst
+    of autosaves costs one row write. The worker (`run_forever`) flushes
+    every `flush_seconds`, as soon as `batch_size` steps are pending, and
+    once more on shutdown; `put` only wakes it, so an autosave request never
+    waits on the database. A flush upserts `batch_size` drafts per
+    statement. An upsert never overwrites a newer draft, so processes
+    flushing the same step in any order keep the latest.
+
+    A batch that fails to write goes back into the buffer behind any newer
+    drafts and is retried on the next flush. Drafts still in memory when a
+    process dies are lost; that is at most `flush_seconds` of typing. While
+    the database is down the buffer holds at most `max_pending` steps; past
+    that the oldest drafts are dropped and counted in `dropped`.
+
+    The owner of each session drafted recently is remembered (up to
+    `max_sessions`), so repeated autosaves skip the ownership lookup.
+
+    Drafts only live as long as their session. Deleting or archiving a
+    session deletes its drafts (`discard`), and erasing an account deletes
+    the user's drafts. A flush drops drafts whose session is no longer in
+    the hot tables or whose user is marked deleted, and it holds share locks
+    on those rows until it commits. So drafts buffered in any process before
+    a delete cannot be written after it.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = 500,
+        flush_seconds: float = 5.0,
+        max_sessions: int = 10000,
+        max_pending: int = 50000
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.flush_seconds = flush_seconds
+        self.max_sessions = max_sessions
+        # key -> (row, monotonic time of the oldest unstored draft for the key),
+        # oldest first
+        self._pending: Dict[DraftKey, Tuple[Dict[str, Any], float]] = {}
+        self._owners: "OrderedDict[UUID, UUID]" = OrderedDict()
+        self._flush_lock = asyncio.Lock()
+        self._batch_full = asyncio.Event()
+        self.received = 0
+        self.stored = 0
+        self.dropped = 0
+        self.failed_flushes = 0
+        self.last_flush_lag = 0.0
+        self.max_flush_lag = 0.0
+
+    def owner(self, session_id: UUID) -> Optional[UUID]:
+        """The session's user, if known without a lookup."""
+        user_id = self._owners.get(session_id)
+        if user_id is not None:
+            self._owners.move_to_end(session_id)
+        return user_id
+
+    def remember_owner(self, session_id: UUID, user_id: UUID) -> None:
+        self._owners[session_id] = user_id
+        self._owners.move_to_end(session_id)
+        while len(self._owners) > self.max_sessions:
+            self._owners.popitem(last=False)
+
+    def forget_sessions(self, session_ids: Collection[UUID]) -> None:
+        """Drop buffered drafts and cached owners of sessions that are gone."""
+        session_ids = set(session_ids)
+        for session_id in session_ids:
+            self._owners.pop(session_id, None)
+        self._pending = {key: entry for key, entry in self._pending.items() if key[0] not in session_ids}
+
+    def forget_user(self, user_id: UUID) -> None:
+        """Drop buffered drafts and cached session owners of an erased account."""
+        self._pending = {key: entry for key, entry in self._pending.items() if entry[0]["user_id"] != user_id}
+        for session_id in [s for s, owner in self._owners.items() if owner == user_id]:
+            del self._owners[session_id]
+
+    async def discard(self, db: AsyncSession, session_ids: Collection[UUID]) -> None:
+        """Delete sessions' stored drafts in `db`'s transaction, and their buffered ones once it commits."""
+        if not session_ids:
+            return
+        await db.execute(
+            delete(SessionDraft)
+            .where(SessionDraft.session_id.in_(list(session_ids)))
+            .execution_options(synchronize_session=False)
+        )
+        after_commit(db, partial(self.forget_sessions, list(session_ids)))
+
+    async def put(self, session_type: str, session_id: UUID, user_id: UUID, step: int, text: str) -> datetime:
+        """Buffer a draft, waking the worker once a batch is full. Returns the draft's timestamp."""
+        key = (session_id, step)
+        row = {
+            "session_id": session_id, "step": step, "session_type": session_type,
+            "user_id": user_id, "text": text, "updated_at": datetime.utcnow(),
+        }
+        pending = self._pending.get(key)
+        self._pending[key] = (row, pending[1] if pending else time.monotonic())
+        self.received += 1
+        if not pending:
+            self._trim()
+        if len(self._pending) >= self.batch_size:
+            self._batch_full.set()
+        return row["updated_at"]
+
+    async def drafts(self, db: AsyncSession, session_id: UUID) -> List[Dict[str, Any]]:
+        """A session's drafts by step: stored ones overlaid with those still in memory."""
+        result = await db.execute(
+            select(SessionDraft.step, SessionDraft.text, SessionDraft.updated_at)
+            .where(SessionDraft.session_id == session_id)
+        )
+        drafts = {row["step"]: dict(row) for row in result.mappings()}
+        for (pending_session, step), (row, _) in self._pending.items():
+            if pending_session == session_id and (step not in drafts or drafts[step]["updated_at"] <= row["updated_at"]):
+                drafts[step] = {"step": step, "text": row["text"], "updated_at": row["updated_at"]}
+        return [drafts[step] for step in sorted(drafts)]
+
+    async def stream_for_user(self, db: AsyncSession, user_id: UUID, batch_size: int = 500) -> AsyncIterator[SessionDraft]:
+        """Every draft of a user (data export): stored ones, replaced by newer ones still in memory."""
+        pending = {
+            key: row for key, (row, _) in self._pending.items() if row["user_id"] == user_id
+        }
+        result = await db.stream(
+            select(SessionDraft)
+            .where(SessionDraft.user_id == user_id)
+            .order_by(SessionDraft.session_id, SessionDraft.step)
+            .execution_options(yield_per=batch_size)
+        )
+        async for draft in result.scalars():
+            row = pending.pop((draft.session_id, draft.step), None)
+            yield SessionDraft(**row) if row and row["updated_at"] >= draft.updated_at else draft
+        for row in pending.values():
+            yield SessionDraft(**row)
+
+    async def flush(self) -> int:
+        """Store every buffered draft, `batch_size` per statement. Returns drafts stored."""
+        async with self._flush_lock:
+            batch, self._pending = list(self._pending.items()), {}
+            stored = 0
+            for start in range(0, len(batch), self.batch_size):
+                chunk = batch[start:start + self.batch_size]
+                try:
+                    await self._write([row for _, (row, _) in chunk])
+                except Exception as e:
+                    self.failed_flushes += 1
+                    logger.error(f"Draft flush of {len(batch) - start} drafts failed, will retry: {e}")
+                    self._restore(batch[start:])
+                    break
+                lag = time.monotonic() - min(buffered for _, (_, buffered) in chunk)
+                self.last_flush_lag = lag
+                self.max_flush_lag = max(self.max_flush_lag, lag)
+                stored += len(chunk)
+            self.stored += stored
+            return stored
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Flush every `flush_seconds` and whenever a batch fills, until `stop` is set; then flush once more."""
+        stop = stop or asyncio.Event()
+        stopped = asyncio.ensure_future(stop.wait())
+        try:
+            while not stop.is_set():
+                batch_full = asyncio.ensure_future(self._batch_full.wait())
+                await asyncio.wait({stopped, batch_full}, timeout=self.flush_seconds, return_when=asyncio.FIRST_COMPLETED)
+                batch_full.cancel()
+                self._batch_full.clear()
+                await self.flush()
+        finally:
+            stopped.cancel()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Buffer depth and flush lag.
+
+        Lag is how long the oldest draft of a batch waited in memory before
+        it was stored, i.e. how much typing a crash would have lost.
+        """
+        oldest = min((buffered for _, buffered in self._pending.values()), default=None)
+        return {
+            "pending": len(self._pending),
+            "oldest_pending_seconds": round(time.monotonic() - oldest, 3) if oldest is not None else 0.0,
+            "received": self.received,
+            "stored": self.stored,
+            "coalesced": self.received - self.stored - self.dropped - len(self._pending),
+            "failed_flushes": self.failed_flushes,
+            "dropped": self.dropped,
+            "last_flush_lag_seconds": round(self.last_flush_lag, 3),
+            "max_flush_lag_seconds": round(self.max_flush_lag, 3),
+        }
+
+    def _restore(self, entries: List[Tuple[DraftKey, Tuple[Dict[str, Any], float]]]) -> None:
+        """Put unstored drafts back in front of those buffered since, then enforce the cap."""
+        restored = {}
+        for key, (row, buffered) in entries:
+            # Newer drafts buffered during the write win; keep the older lag start
+            newer = self._pending.pop(key, None)
+            restored[key] = (newer[0], buffered) if newer else (row, buffered)
+        restored.update(self._pending)
+        self._pending = restored
+        self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest drafts beyond `max_pending`."""
+        while len(self._pending) > self.max_pending:
+            del self._pending[next(iter(self._pending))]
+            self.dropped += 1
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> None:
+        async with self.session_factory() as db:
+            live = await self._live_session_ids(db, rows)
+            rows = [row for row in rows if row["session_id"] in live]
+            if not rows:
+                return
+            statement = insert(SessionDraft).values(rows)
+            await db.execute(statement.on_conflict_do_update(
+                index_elements=["session_id", "step"],
+                set_={"text": statement.excluded.text, "updated_at": statement.excluded.updated_at},
+                where=SessionDraft.updated_at <= statement.excluded.updated_at,
+            ))
+            await db.commit()
+
+    @staticmethod
+    async def _live_session_ids(db: AsyncSession, rows: List[Dict[str, Any]]) -> Set[UUID]:
+        """
+        Sessions of `rows` that are still hot and whose user is not deleted.
+
+        The rows found are share-locked, so a concurrent delete, archive run
+        or account deletion waits for this flush and then removes its drafts.
+        """
+        live: Set[UUID] = set()
+        for session_type, model in _SESSION_MODELS.items():
+            session_ids = list({row["session_id"] for row in rows if row["session_type"] == session_type})
+            if not session_ids:
+                continue
+            result = await db.execute(
+                select(model.id)
+                .join(User, User.id == model.user_id)
+                .where(model.id.in_(session_ids), User.deleted_at.is_(None))
+                .with_for_update(read=True)
+            )
+            live.update(result.scalars().all())
+        return live
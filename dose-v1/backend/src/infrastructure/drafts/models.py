@@ -0,0 +1,33 @@
+"""
+Draft Models
+Latest autosaved, uncommitted text per session step
+"""
+
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import String, DateTime, Index, SmallInteger, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from src.infrastructure.database.session import Base
+
+
+class SessionDraft(Base):
+    """
+    What the user was typing for a step before submitting it.
+
+    Kept apart from the sessions' response columns: a draft is never
+    validated, never raises events and never counts as progress.
+    """
+    __tablename__ = "session_drafts"
+
+    session_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    step: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    session_type: Mapped[str] = mapped_column(String(20), nullable=False)  # 'spark', 'wave'
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    # When the server received the draft; later drafts win across processes
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_session_drafts_user", "user_id"),
+    )
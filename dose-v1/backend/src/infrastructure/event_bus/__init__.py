@@ -0,0 +1,14 @@
+"""In-process domain event bus."""
+
+from src.infrastructure.config.settings import settings
+from .event_bus import AfterCommitPublisher, EventBus, LatencyStats
+
+# Shared by the services publishing events and the subscribers registered at startup
+event_bus = EventBus(queue_size=settings.EVENT_BUS_QUEUE_SIZE, workers=settings.EVENT_BUS_WORKERS)
+
+__all__ = [
+    "AfterCommitPublisher",
+    "EventBus",
+    "LatencyStats",
+    "event_bus",
+]
@@ -0,0 +1,246 @@
+"""
+In-Process Event Bus
+Delivers domain events to async subscribers on a bounded worker queue.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.application.interfaces.event_publisher import IEventPublisher
+from src.core.domain.events import DomainEvent
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+Handler = Callable[[Any], Awaitable[None]]
+InlineHandler = Callable[[Any], None]
+
+
+@dataclass(slots=True)
+class LatencyStats:
+    """Call count, failures and timings of one subscriber (or of the queue wait)."""
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def observe(self, seconds: float, failed: bool = False) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_seconds / self.calls * 1000, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3),
+        }
+
+
+class EventBus:
+    """
+    Typed publish/subscribe for domain events.
+
+    A subscriber registered for an event class receives that class and its
+    subclasses, so a handler for SessionCompleted sees both SPARK and WAVE
+    completions. Events are queued and handled by `workers` tasks; publishing
+    never waits for a subscriber.
+
+    The queue is bounded. `publish_nowait` (used on the request path) rejects
+    events when it is full and counts them instead of growing memory or
+    slowing requests; `publish` waits for room, for background producers that
+    can afford to be slowed down.
+
+    Inline subscribers are plain functions called by the publisher itself,
+    before the event is queued. They are for cheap in-memory bookkeeping
+    that must not lag the write, such as cache invalidation.
+    """
+
+    def __init__(self, queue_size: int = 1000, workers: int = 2, slow_handler_seconds: float = 1.0):
+        self.workers = workers
+        self.slow_handler_seconds = slow_handler_seconds
+        self._queue: asyncio.Queue[Tuple[DomainEvent, float]] = asyncio.Queue(maxsize=queue_size)
+        self._subscribers: Dict[Type[DomainEvent], List[Tuple[str, Handler]]] = {}
+        self._dispatch_cache: Dict[Type[DomainEvent], List[Tuple[str, Handler]]] = {}
+        self._inline: Dict[Type[DomainEvent], List[Tuple[str, InlineHandler]]] = {}
+        self._inline_cache: Dict[Type[DomainEvent], List[Tuple[str, InlineHandler]]] = {}
+        self._stats: Dict[str, LatencyStats] = {}
+        self._queue_wait = LatencyStats()
+        self.published = 0
+        self.rejected = 0
+
+    # ========== Subscriptions ==========
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: Handler, name: Optional[str] = None) -> None:
+        """Register `handler` for `event_type` and its subclasses."""
+        name = name or getattr(handler, "__qualname__", repr(handler))
+        self._subscribers.setdefault(event_type, []).append((name, handler))
+        self._stats.setdefault(name, LatencyStats())
+        self._dispatch_cache.clear()
+
+    def subscribe_inline(
+        self,
+        event_type: Type[DomainEvent],
+        handler: InlineHandler,
+        name: Optional[str] = None
+    ) -> None:
+        """Register a synchronous `handler` called on publish, before queueing."""
+        name = name or getattr(handler, "__qualname__", repr(handler))
+        self._inline.setdefault(event_type, []).append((name, handler))
+        self._stats.setdefault(name, LatencyStats())
+        self._inline_cache.clear()
+
+    def handlers_for(self, event_type: Type[DomainEvent]) -> List[Tuple[str, Handler]]:
+        """Subscribers of an event class, resolved once per class through its MRO."""
+        handlers = self._dispatch_cache.get(event_type)
+        if handlers is None:
+            handlers = [
+                handler
+                for cls in event_type.__mro__
+                for handler in self._subscribers.get(cls, ())
+            ]
+            self._dispatch_cache[event_type] = handlers
+        return handlers
+
+    def _inline_for(self, event_type: Type[DomainEvent]) -> List[Tuple[str, InlineHandler]]:
+        handlers = self._inline_cache.get(event_type)
+        if handlers is None:
+            handlers = [
+                handler
+                for cls in event_type.__mro__
+                for handler in self._inline.get(cls, ())
+            ]
+            self._inline_cache[event_type] = handlers
+        return handlers
+
+    # ========== Publishing ==========
+
+    def publish_nowait(self, event: DomainEvent) -> bool:
+        """Queue an event without waiting. Returns False if the queue is full."""
+        self._call_inline(event)
+        if not self.handlers_for(type(event)):
+            return True
+        try:
+            self._queue.put_nowait((event, time.perf_counter()))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            logger.warning(f"Event bus queue full, dropped {type(event).__name__}")
+            return False
+        self.published += 1
+        return True
+
+    async def publish(self, event: DomainEvent) -> None:
+        """Queue an event, waiting for room if the queue is full."""
+        self._call_inline(event)
+        if not self.handlers_for(type(event)):
+            return
+        await self._queue.put((event, time.perf_counter()))
+        self.published += 1
+
+    def _call_inline(self, event: DomainEvent) -> None:
+        for name, handler in self._inline_for(type(event)):
+            failed = False
+            started = time.perf_counter()
+            try:
+                handler(event)
+            except Exception as e:
+                failed = True
+                logger.error(f"Inline event subscriber {name} failed on {type(event).__name__}: {e}")
+            self._stats[name].observe(time.perf_counter() - started, failed)
+
+    # ========== Workers ==========
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Handle events until `stop` is set, then deliver what is still queued."""
+        stop = stop or asyncio.Event()
+        tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        await stop.wait()
+        await self.drain()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled."""
+        await self._queue.join()
+
+    async def _work(self) -> None:
+        while True:
+            event, queued_at = await self._queue.get()
+            try:
+                await self._dispatch(event, queued_at)
+            finally:
+                self._queue.task_done()
+
+    async def _dispatch(self, event: DomainEvent, queued_at: float) -> None:
+        started = time.perf_counter()
+        self._queue_wait.observe(started - queued_at)
+        for name, handler in self.handlers_for(type(event)):
+            failed = False
+            started = time.perf_counter()
+            try:
+                await handler(event)
+            except Exception as e:
+                failed = True
+                logger.error(f"Event subscriber {name} failed on {type(event).__name__}: {e}")
+            elapsed = time.perf_counter() - started
+            self._stats[name].observe(elapsed, failed)
+            if elapsed > self.slow_handler_seconds:
+                logger.warning(f"Slow event subscriber {name}: {elapsed * 1000:.0f}ms on {type(event).__name__}")
+
+    # ========== Metrics ==========
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, publish counters, queue wait and per-subscriber latency."""
+        return {
+            "queued": self._queue.qsize(),
+            "capacity": self._queue.maxsize,
+            "published": self.published,
+            "rejected": self.rejected,
+            "queue_wait": self._queue_wait.as_dict(),
+            "subscribers": {name: stats.as_dict() for name, stats in self._stats.items()},
+        }
+
+
+class AfterCommitPublisher(IEventPublisher):
+    """
+    Publishes events only once the database transaction commits.
+
+    Events are staged on the session; the first commit hands them to the bus
+    and a rollback discards them, so subscribers never see a change that was
+    not persisted.
+    """
+
+    _PENDING = "pending_domain_events"
+
+    def __init__(self, db: AsyncSession, bus: EventBus):
+        self.session = db.sync_session
+        self.bus = bus
+
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        pending = self.session.info.get(self._PENDING)
+        if pending is None:
+            pending = self.session.info[self._PENDING] = []
+            sa_event.listen(self.session, "after_commit", self._after_commit)
+            sa_event.listen(self.session, "after_rollback", self._after_rollback)
+        pending.extend((self.bus, event) for event in events)
+
+    @classmethod
+    def _after_commit(cls, session) -> None:
+        pending = session.info.get(cls._PENDING)
+        if pending:
+            session.info[cls._PENDING] = []
+            for bus, event in pending:
+                bus.publish_nowait(event)
+
+    @classmethod
+    def _after_rollback(cls, session) -> None:
+        if session.info.get(cls._PENDING):
+            session.info[cls._PENDING] = []
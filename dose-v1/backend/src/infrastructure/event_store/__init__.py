@@ -0,0 +1,16 @@
+"""Append-only store of domain events."""
+
+from .models import OutboxEvent, StoredEvent
+from .outbox import OutboxPublisher
+from .records import EVENT_TYPES, event_from_row, event_row
+from .writer import EventStoreWriter
+
+__all__ = [
+    "EVENT_TYPES",
+    "EventStoreWriter",
+    "OutboxEvent",
+    "OutboxPublisher",
+    "StoredEvent",
+    "event_from_row",
+    "event_row",
+]
@@ -0,0 +1,52 @@
+"""
+Event Store Models
+Append-only log of domain events, and the outbox feeding it
+"""
+
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID
+from sqlalchemy import String, DateTime, Index, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from src.infrastructure.database.clock import db_utc_now
+from src.infrastructure.database.session import Base
+
+
+class StoredEvent(Base):
+    """One row per domain event; rows are never updated."""
+    __tablename__ = "event_store"
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)  # DomainEvent.event_id
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)  # e.g. 'SparkStepCompleted'
+    aggregate_type: Mapped[str] = mapped_column(String(20), nullable=False)  # 'spark', 'wave'
+    aggregate_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)  # When the event occurred
+    # When the row was inserted (database clock, UTC); projections tail the store in this order
+    stored_at: Mapped[datetime] = mapped_column(DateTime, server_default=db_utc_now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_event_store_aggregate_created", "aggregate_id", "created_at"),
+        Index("ix_event_store_stored", "stored_at", "id"),
+        Index("ix_event_store_user_created", "user_id", "created_at"),
+        Index("ix_event_store_type_created", "event_type", "created_at"),
+    )
+
+
+class OutboxEvent(Base):
+    """
+    Event committed with the change that produced it, not yet in event_store.
+
+    Same columns as StoredEvent; rows are deleted when the writer stores them.
+    """
+    __tablename__ = "event_outbox"
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    aggregate_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    aggregate_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
@@ -0,0 +1,27 @@
+"""
+Transactional Outbox
+Writes events in the same transaction as the change that produced them
+"""
+
+from typing import Iterable
+
+from src.core.domain.events import SessionEvent
+from src.infrastructure.event_bus import AfterCommitPublisher
+from src.infrastructure.event_store.models import OutboxEvent
+from src.infrastructure.event_store.records import event_row
+
+
+class OutboxPublisher(AfterCommitPublisher):
+    """
+    AfterCommitPublisher that also adds an event_outbox row per event.
+
+    The rows are flushed with the rest of the unit of work at commit, so an
+    event exists durably exactly when its change does. The bus still gets the
+    event after commit; EventStoreWriter stores it from there and recovers
+    outbox rows the bus never delivered (dropped, or lost in a restart).
+    """
+
+    def publish(self, events: Iterable[SessionEvent]) -> None:
+        events = list(events)
+        self.session.add_all([OutboxEvent(**event_row(event)) for event in events])
+        super().publish(events)
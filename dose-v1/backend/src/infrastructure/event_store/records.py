@@ -0,0 +1,58 @@
+"""
+Event Records
+Flatten domain events into event_store / event_outbox rows, and back
+"""
+
+import dataclasses
+from datetime import datetime
+from typing import Any, Dict, Mapping, Type
+from uuid import UUID
+
+from src.core.domain.events import SessionEvent
+from src.modules.spark.domain import events as spark_events
+from src.modules.wave.domain import events as wave_events
+
+# event_type column -> event class
+EVENT_TYPES: Dict[str, Type[SessionEvent]] = {
+    cls.__name__: cls
+    for module in (spark_events, wave_events)
+    for cls in vars(module).values()
+    if isinstance(cls, type) and issubclass(cls, SessionEvent) and cls.session_type
+}
+
+# Fields stored in their own columns rather than in the payload
+_COLUMN_FIELDS = {"event_id", "occurred_at", "session_id", "user_id"}
+
+
+def event_row(event: SessionEvent) -> Dict[str, Any]:
+    """Column values for one event; remaining fields go into the JSON payload."""
+    payload = {}
+    for f in dataclasses.fields(event):
+        if f.name in _COLUMN_FIELDS:
+            continue
+        value = getattr(event, f.name)
+        if isinstance(value, UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        payload[f.name] = value
+    return {
+        "id": event.event_id,
+        "event_type": type(event).__name__,
+        "aggregate_type": event.session_type,
+        "aggregate_id": event.session_id,
+        "user_id": event.user_id,
+        "payload": payload,
+        "created_at": event.occurred_at,
+    }
+
+
+def event_from_row(row: Mapping[str, Any]) -> SessionEvent:
+    """Rebuild the event stored in an event_store row."""
+    return EVENT_TYPES[row["event_type"]](
+        event_id=row["id"],
+        occurred_at=row["created_at"],
+        session_id=row["aggregate_id"],
+        user_id=row["user_id"],
+        **row["payload"],
+    )
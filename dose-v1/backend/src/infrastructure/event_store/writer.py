@@ -0,0 +1,141 @@
+"""
+Event Store Writer
+Buffers published events and stores them in batches (group commit).
+
+Recover outbox rows once by hand with:
+    python -m src.infrastructure.event_store.writer
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.domain.events import SessionEvent
+from src.infrastructure.event_store.models import OutboxEvent, StoredEvent
+from src.infrastructure.event_store.records import event_row
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_ROW_COLUMNS = ("id", "event_type", "aggregate_type", "aggregate_id", "user_id", "payload", "created_at")
+
+
+class EventStoreWriter:
+    """
+    Appends domain events to event_store.
+
+    Subscribed to the event bus, so it only ever runs off the request path.
+    Events collect in memory and are written with one multi-row INSERT per
+    `batch_size` events or every `flush_seconds`, whichever comes first; the
+    same transaction deletes their outbox rows. A batch that fails to write is
+    dropped from memory: its outbox rows remain and are recovered later.
+
+    Outbox rows older than `outbox_grace_seconds` were never flushed from the
+    buffer (the bus dropped the event, or the process stopped) and are moved
+    into event_store by `recover_outbox`. Inserts ignore ids already stored,
+    so recovering an event that was also flushed is harmless.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = 500,
+        flush_seconds: float = 1.0,
+        outbox_grace_seconds: float = 60.0
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.outbox_grace_seconds = outbox_grace_seconds
+        self._buffer: List[Dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+
+    async def append(self, event: SessionEvent) -> None:
+        """Event bus subscriber: buffer an event, flushing once a batch is full."""
+        self._buffer.append(event_row(event))
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write everything buffered in one transaction. Returns events written."""
+        async with self._flush_lock:
+            rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+            try:
+                await self._write(rows)
+            except Exception as e:
+                logger.error(f"Event store flush of {len(rows)} events failed, left in outbox: {e}")
+                return 0
+            return len(rows)
+
+    async def recover_outbox(self, now: Optional[datetime] = None) -> int:
+        """Store outbox rows older than the grace period. Returns events recovered."""
+        cutoff = (now or datetime.utcnow()) - timedelta(seconds=self.outbox_grace_seconds)
+        recovered = 0
+        while True:
+            async with self.session_factory() as db:
+                result = await db.execute(
+                    select(OutboxEvent)
+                    .where(OutboxEvent.created_at < cutoff)
+                    .order_by(OutboxEvent.created_at)
+                    .limit(self.batch_size)
+                )
+                rows = [{c: getattr(row, c) for c in _ROW_COLUMNS} for row in result.scalars().all()]
+            if not rows:
+                return recovered
+            await self._write(rows)
+            recovered += len(rows)
+            if len(rows) < self.batch_size:
+                return recovered
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None, recover_every: int = 60) -> None:
+        """
+        Flush every `flush_seconds` until `stop` is set, then flush once more.
+
+        The outbox is recovered at start (events left by the previous process)
+        and then every `recover_every` flushes.
+        """
+        stop = stop or asyncio.Event()
+        ticks = 0
+        while not stop.is_set():
+            if ticks % recover_every == 0:
+                try:
+                    recovered = await self.recover_outbox()
+                    if recovered:
+                        logger.info(f"Events recovered from outbox: {recovered}")
+                except Exception as e:
+                    logger.error(f"Event outbox recovery failed: {e}")
+            ticks += 1
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> None:
+        async with self.session_factory() as db:
+            await db.execute(insert(StoredEvent).values(rows).on_conflict_do_nothing(index_elements=["id"]))
+            await db.execute(
+                delete(OutboxEvent)
+                .where(OutboxEvent.id.in_([row["id"] for row in rows]))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+
+async def main() -> None:
+    from src.infrastructure.config.settings import settings
+    from src.infrastructure.database.session import AsyncSessionLocal, engine
+
+    writer = EventStoreWriter(AsyncSessionLocal, batch_size=settings.EVENT_STORE_BATCH_SIZE, outbox_grace_seconds=0)
+    print(f"Events recovered from outbox: {await writer.recover_outbox()}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
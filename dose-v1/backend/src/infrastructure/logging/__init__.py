@@ -1,17 +1,35 @@
 """Logging infrastructure exports."""
 
+from .context import (
+    LogContextFilter,
+    bind_log_context,
+    close_log_context,
+    get_log_context,
+    open_log_context,
+)
 from .logger import (
     setup_logging,
+    shutdown_logging,
+    logging_metrics,
     get_logger,
     get_request_logger,
+    BoundedQueueHandler,
     JSONFormatter,
     LoggerAdapter,
 )
 
 __all__ = [
     "setup_logging",
+    "shutdown_logging",
+    "logging_metrics",
     "get_logger",
     "get_request_logger",
+    "BoundedQueueHandler",
     "JSONFormatter",
     "LoggerAdapter",
+    "LogContextFilter",
+    "bind_log_context",
+    "close_log_context",
+    "get_log_context",
+    "open_log_context",
 ]
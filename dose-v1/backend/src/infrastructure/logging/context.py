@@ -0,0 +1,54 @@
+"""
+Log Context
+Per-request fields (request_id, user_id, route) added to every log record
+"""
+
+import logging
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional
+
+# The current request's fields. Opened by LoggingMiddleware, which resets it
+# when the request ends. bind_log_context updates the dict in place, so fields
+# bound in a copied context (a child task or thread) still reach the
+# middleware's own log lines.
+_log_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar("log_context", default=None)
+
+
+def open_log_context(**fields: Any) -> Token:
+    """Start a new context holding `fields`. Pass the token to `close_log_context`."""
+    return _log_context.set(dict(fields))
+
+
+def close_log_context(token: Token) -> None:
+    _log_context.reset(token)
+
+
+def bind_log_context(**fields: Any) -> None:
+    """Add fields to the current context, opening one if there is none."""
+    context = _log_context.get()
+    if context is None:
+        _log_context.set(dict(fields))
+    else:
+        context.update(fields)
+
+
+def get_log_context() -> Dict[str, Any]:
+    return dict(_log_context.get() or {})
+
+
+class LogContextFilter(logging.Filter):
+    """
+    Copies the log context onto each record, on the thread that logged it.
+
+    Fields passed with `extra=` win over the context. Attach it to handlers
+    (not loggers) so records propagated from every module logger get it.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _log_context.get()
+        if context:
+            attributes = record.__dict__
+            for key, value in context.items():
+                if key not in attributes:
+                    attributes[key] = value
+        return True
@@ -3,61 +3,182 @@ Enhanced Logging Infrastructure
 Provides structured logging with file rotation and multiple handlers
 """
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+import time
+from collections import Counter
 from pathlib import Path
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
-from datetime import datetime
-from typing import Optional
-import json
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+
+from .context import LogContextFilter
 
 
 class JSONFormatter(logging.Formatter):
     """
     Custom JSON formatter for structured logging.
     Outputs logs in JSON format for easier parsing and analysis.
+
+    Encoded with orjson. The fields fixed for a call site (level, logger,
+    module, function, line) are encoded once per site, the timestamp
+    (the record's creation time, UTC) once per second, and a record
+    formatted by several handlers in a row is encoded only once.
     """
 
+    # Optional record attributes, usually from the log context
+    CONTEXT_FIELDS = ("request_id", "user_id", "session_id", "route")
+    _MAX_CALL_SITES = 4096
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._call_sites: Dict[tuple, Tuple[bytes, bytes]] = {}
+        self._context_keys = [(field, b',"%s":' % field.encode()) for field in self.CONTEXT_FIELDS]
+        # Replaced as tuples so handlers on other threads never see half an update
+        self._second: Tuple[int, bytes] = (-1, b"")
+        self._last: Tuple[Optional[logging.LogRecord], str] = (None, "")
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
-        log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-        }
-
-        # Add exception info if present
+        last_record, last_text = self._last
+        if record is last_record:
+            return last_text
+
+        site = (record.name, record.levelno, record.module, record.funcName, record.lineno)
+        fixed = self._call_sites.get(site)
+        if fixed is None:
+            if len(self._call_sites) >= self._MAX_CALL_SITES:
+                self._call_sites.clear()
+            head = orjson.dumps({"level": record.levelname, "logger": record.name})
+            tail = orjson.dumps({"module": record.module, "function": record.funcName, "line": record.lineno})
+            fixed = self._call_sites[site] = (head[1:-1], tail[1:-1])
+
+        parts = [
+            b'{"timestamp":"', self._timestamp(record.created), b'",', fixed[0],
+            b',"message":', orjson.dumps(record.getMessage()), b",", fixed[1],
+        ]
+
+        # Add exception info if present (pre-rendered when it came through the queue)
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            parts += (b',"exception":', orjson.dumps(self.formatException(record.exc_info)))
+        elif record.exc_text:
+            parts += (b',"exception":', orjson.dumps(record.exc_text))
 
         # Add extra fields if present
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-        if hasattr(record, "session_id"):
-            log_data["session_id"] = record.session_id
+        attributes = record.__dict__
+        for field, key in self._context_keys:
+            if field in attributes:
+                parts += (key, orjson.dumps(attributes[field], default=str))
+
+        parts.append(b"}")
+        text = b"".join(parts).decode()
+        self._last = (record, text)
+        return text
+
+    def _timestamp(self, created: float) -> bytes:
+        second = int(created)
+        cached_second, text = self._second
+        if second != cached_second:
+            text = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)).encode()
+            self._second = (second, text)
+        return b"%s.%06d" % (text, int((created - second) * 1_000_000))
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Hands records to a queue drained by a listener thread, never blocking.
 
-        return json.dumps(log_data)
+    Overflow policy: DEBUG records are dropped once the queue is
+    `debug_fill` full, other records once it is at `capacity`, and records
+    at `keep_level` or above are always queued, past the capacity if need
+    be. Dropped records are counted per level.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        capacity: int = 10000,
+        debug_fill: float = 0.5,
+        keep_level: int = logging.ERROR
+    ):
+        super().__init__(log_queue)
+        self.capacity = capacity
+        self.debug_limit = int(capacity * debug_fill)
+        self.keep_level = keep_level
+        self.dropped: Counter = Counter()
+        self._exception_formatter = logging.Formatter()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Called under the handler lock, so the check and the counter are consistent
+        if record.levelno < self.keep_level:
+            limit = self.debug_limit if record.levelno <= logging.DEBUG else self.capacity
+            if self.queue.qsize() >= limit:
+                self.dropped[record.levelname] += 1
+                return
+        self.queue.put_nowait(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Render the message and traceback now, while the arguments are current.
+
+        Unlike QueueHandler.prepare, the message is not formatted with this
+        handler's formatter, so the listener's handlers still apply theirs.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def metrics(self) -> Dict[str, object]:
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self.capacity,
+            "dropped": dict(self.dropped),
+        }
+
+
+# Set by setup_logging when records go through the queue
+_queue_handler: Optional[BoundedQueueHandler] = None
+_listener: Optional[QueueListener] = None
+_handlers: List[logging.Handler] = []
 
 
 def setup_logging(
     log_level: str = "INFO",
     log_dir: Optional[str] = None,
-    enable_json: bool = False
+    enable_json: bool = False,
+    queue_size: int = 10000,
+    queue_debug_fill: float = 0.5,
+    queue_keep_level: str = "ERROR"
 ) -> None:
     """
     Set up application-wide logging configuration.
 
+    Stream and file handlers are owned by a listener thread; loggers only
+    put records on a bounded queue, so no file I/O or rotation happens on
+    the caller's thread (the event loop). Call `shutdown_logging` to write
+    out what is still queued.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: Directory for log files (default: logs/ in backend root)
         enable_json: Use JSON formatting instead of standard format
+        queue_size: Records held for the listener; 0 writes synchronously
+        queue_debug_fill: Fraction of the queue past which DEBUG records are dropped
+        queue_keep_level: Records at this level and above are never dropped
     """
+    global _queue_handler, _listener, _handlers
+
+    # Write out and stop a previous configuration's listener
+    shutdown_logging()
+
     # Create logs directory if it doesn't exist
     if log_dir is None:
         log_dir = Path(__file__).parent.parent.parent.parent / "logs"
@@ -121,10 +242,26 @@ def setup_logging(
     # Remove existing handlers to avoid duplicates
     root_logger.handlers.clear()
 
-    # Add all handlers
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(error_handler)
+    # Add all handlers, behind the queue unless it is disabled. The context
+    # filter runs on the logging thread, where the request's context is set.
+    _handlers = [console_handler, file_handler, error_handler]
+    context_filter = LogContextFilter()
+    for handler in _handlers:
+        handler.addFilter(context_filter)
+    if queue_size > 0:
+        _queue_handler = BoundedQueueHandler(
+            queue.Queue(),
+            capacity=queue_size,
+            debug_fill=queue_debug_fill,
+            keep_level=getattr(logging, queue_keep_level.upper(), logging.ERROR)
+        )
+        _queue_handler.addFilter(context_filter)
+        _listener = QueueListener(_queue_handler.queue, *_handlers, respect_handler_level=True)
+        _listener.start()
+        root_logger.addHandler(_queue_handler)
+    else:
+        for handler in _handlers:
+            root_logger.addHandler(handler)
 
     # Configure module-specific loggers
     configure_module_loggers(level)
@@ -134,6 +271,36 @@ def setup_logging(
     logger.info(f"Logging initialized - Level: {log_level}, Directory: {log_dir}")
 
 
+def shutdown_logging() -> None:
+    """
+    Write out every queued record and stop the listener thread.
+
+    The handlers are then attached to the root logger directly, so records
+    logged after shutdown are still written (synchronously).
+    """
+    global _queue_handler, _listener
+    if _listener is None:
+        return
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(_queue_handler)
+    _listener.stop()  # Handles everything queued before returning
+    for handler in _handlers:
+        handler.flush()
+        root_logger.addHandler(handler)
+    dropped = sum(_queue_handler.dropped.values())
+    _queue_handler = _listener = None
+    if dropped:
+        logging.getLogger(__name__).warning(f"Logging queue dropped {dropped} records")
+
+
+atexit.register(shutdown_logging)
+
+
+def logging_metrics() -> Dict[str, object]:
+    """Depth and drop counts of the logging queue (empty if it is disabled)."""
+    return _queue_handler.metrics() if _queue_handler else {}
+
+
 def configure_module_loggers(level: int) -> None:
     """Configure logging levels for specific modules."""
 
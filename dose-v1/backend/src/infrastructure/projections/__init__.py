@@ -0,0 +1,12 @@
+"""Read-model projections folded from session events."""
+
+from .projection import PROJECTIONS, Projection, Rows, load_projection
+from .runner import ProjectionRunner
+
+__all__ = [
+    "PROJECTIONS",
+    "Projection",
+    "ProjectionRunner",
+    "Rows",
+    "load_projection",
+]
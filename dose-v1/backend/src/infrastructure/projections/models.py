@@ -0,0 +1,89 @@
+"""
+Projection Bookkeeping Models
+Live event_store positions, rebuild checkpoints and set-aside events of read-model projections
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import Boolean, String, Integer, DateTime, JSON, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from src.infrastructure.database.session import Base
+
+
+class ProjectionPosition(Base):
+    """Last event_store row (by stored_at, id) applied to a live projection."""
+    __tablename__ = "projection_positions"
+
+    projection: Mapped[str] = mapped_column(String(100), primary_key=True)
+    stored_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    event_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ProjectionRebuild(Base):
+    """State of a projection rebuild into its shadow table."""
+    __tablename__ = "projection_rebuilds"
+
+    projection: Mapped[str] = mapped_column(String(100), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)  # 'building', 'catching_up', 'completed'
+    partitions: Mapped[int] = mapped_column(Integer, nullable=False)
+    # When the rebuild started; catch-up reads event_store from (just before) here
+    watermark: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Catch-up position of the shadow table in event_store
+    stored_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    event_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class ProjectionRebuildPartition(Base):
+    """Checkpoint of one user_id partition of a rebuild."""
+    __tablename__ = "projection_rebuild_partitions"
+
+    projection: Mapped[str] = mapped_column(String(100), primary_key=True)
+    partition: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_user_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
+    users_done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ProjectionRebuildBatch(Base):
+    """
+    When one batch of a rebuild partition read its users' session history.
+
+    Catch-up skips a user's events that batch already replayed: those stored
+    before loaded_at, and those still in the outbox then (committed with the
+    session rows, not yet in event_store). The batch of a user is the one
+    of its partition with the smallest last_user_id at or above its id.
+    """
+    __tablename__ = "projection_rebuild_batches"
+
+    projection: Mapped[str] = mapped_column(String(100), primary_key=True)
+    partition: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    loaded_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)  # Database clock, UTC
+    pending_event_ids: Mapped[List[str]] = mapped_column(JSON, nullable=False)
+
+
+class ProjectionDeadLetter(Base):
+    """
+    An event_store row a live projection could not apply, set aside.
+
+    The runner records it and moves its position past it, so one bad event
+    does not stall the projection. The event itself stays in event_store.
+    """
+    __tablename__ = "projection_dead_letters"
+
+    projection: Mapped[str] = mapped_column(String(100), primary_key=True)
+    event_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    stored_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    error: Mapped[str] = mapped_column(Text, nullable=False)
+    failed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_projection_dead_letters_user", "user_id"),
+    )
@@ -0,0 +1,125 @@
+"""
+Projection Base
+A read model folded from session events, one or more rows per user
+"""
+
+import importlib
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.domain.events import SessionEvent
+from src.infrastructure.database.session import Base
+
+Rows = Dict[Tuple[Any, ...], Dict[str, Any]]
+
+# Projection name -> "module:attribute" of its instance. Registered by path so
+# rebuild worker processes can import projections by name; each one gets a
+# live ProjectionRunner at startup.
+PROJECTIONS: Dict[str, str] = {
+    "user_progress_summary": (
+        "src.modules.analytics.infrastructure.projections.progress_summary_projection:progress_summary_projection"
+    ),
+    "activity_rollups": (
+        "src.modules.analytics.infrastructure.projections.activity_rollup_projection:activity_rollup_projection"
+    ),
+    "user_streaks": "src.modules.analytics.infrastructure.projections.streak_projection:streak_projection",
+}
+
+
+def load_projection(name: str) -> "Projection":
+    """Import a registered projection instance."""
+    if name not in PROJECTIONS:
+        raise ValueError(f"Unknown projection: {name}")
+    module, attribute = PROJECTIONS[name].split(":")
+    return getattr(importlib.import_module(module), attribute)
+
+
+class Projection(ABC):
+    """
+    Declares the events a read model consumes and how each one changes it.
+
+    `apply` is pure: it folds one event into the user's rows (keyed by the
+    values of `key_columns`), so the same code serves live updates, full
+    rebuilds from history and catch-up. Rows are read and written through
+    `load` / `save`, optionally against the rebuild's shadow table.
+
+    Projections that need per-user inputs besides the events (such as the
+    user's time zone) return them from `load_context`; `apply` receives the
+    user's entry. Projections with many rows per user name the rows a batch
+    of events touches in `touched_keys` so only those are loaded.
+    """
+
+    name: ClassVar[str]
+    table: ClassVar[str]
+    columns: ClassVar[Tuple[str, ...]]
+    key_columns: ClassVar[Tuple[str, ...]] = ("user_id",)
+    event_types: ClassVar[Tuple[Type[SessionEvent], ...]]
+
+    def handles(self, event: SessionEvent) -> bool:
+        return isinstance(event, self.event_types)
+
+    @abstractmethod
+    def apply(self, rows: Rows, event: SessionEvent, context: Any = None) -> None:
+        """Fold one event into the user's rows."""
+
+    async def load_context(self, db: AsyncSession, user_ids: Sequence[UUID]) -> Dict[UUID, Any]:
+        """Per-user context passed to `apply`. None by default."""
+        return {}
+
+    def touched_keys(
+        self,
+        events: Mapping[UUID, Sequence[SessionEvent]],
+        context: Mapping[UUID, Any]
+    ) -> Optional[List[Tuple[Any, ...]]]:
+        """Keys of the rows these events change, or None to load every row of the users."""
+        return None
+
+    def key(self, row: Dict[str, Any]) -> Tuple[Any, ...]:
+        return tuple(row[column] for column in self.key_columns)
+
+    def target(self, table: Optional[str] = None) -> sa.Table:
+        """Core table for the live table or a shadow copy of it, typed like the mapped model."""
+        mapped = Base.metadata.tables.get(self.table)
+        return sa.Table(table or self.table, sa.MetaData(), *(
+            sa.Column(c, mapped.c[c].type) if mapped is not None else sa.Column(c)
+            for c in self.columns
+        ))
+
+    async def load(
+        self,
+        db: AsyncSession,
+        user_ids: Iterable[UUID],
+        table: Optional[str] = None,
+        for_update: bool = False,
+        keys: Optional[List[Tuple[Any, ...]]] = None
+    ) -> Dict[UUID, Rows]:
+        """Current rows of each user, or only the rows with the given keys."""
+        target = self.target(table)
+        query = sa.select(target).where(target.c.user_id.in_(list(user_ids)))
+        if keys is not None:
+            query = query.where(sa.tuple_(*(target.c[c] for c in self.key_columns)).in_(keys))
+        if for_update:
+            query = query.with_for_update()
+        result = await db.execute(query)
+        rows: Dict[UUID, Rows] = {}
+        for row in result.mappings():
+            rows.setdefault(row["user_id"], {})[self.key(row)] = dict(row)
+        return rows
+
+    async def save(self, db: AsyncSession, rows: Iterable[Dict[str, Any]], table: Optional[str] = None) -> None:
+        """Upsert rows on their key columns."""
+        rows = list(rows)
+        target = self.target(table)
+        # Stay under PostgreSQL's 32767 bind parameters per statement
+        chunk = 32000 // len(self.columns)
+        for start in range(0, len(rows), chunk):
+            statement = insert(target).values(rows[start:start + chunk])
+            await db.execute(statement.on_conflict_do_update(
+                index_elements=list(self.key_columns),
+                set_={c: statement.excluded[c] for c in self.columns if c not in self.key_columns},
+            ))
@@ -0,0 +1,328 @@
+"""
+Projection Rebuild
+Recomputes a projection from full history into a shadow table, catches it up
+with live events and swaps it in.
+
+Run with:
+    python -m src.infrastructure.projections.rebuild <projection> [--partitions N]
+
+An interrupted rebuild resumes from its checkpoints when run again.
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.infrastructure.archive import SessionArchive
+from src.infrastructure.database.clock import db_utc_now
+from src.infrastructure.event_store.models import OutboxEvent
+from src.infrastructure.logging import get_logger
+from src.infrastructure.projections.history import load_history
+from src.infrastructure.projections.models import (
+    ProjectionPosition,
+    ProjectionRebuild,
+    ProjectionRebuildBatch,
+    ProjectionRebuildPartition,
+)
+from src.infrastructure.projections.projection import Projection, Rows, load_projection
+from src.infrastructure.projections.runner import apply_stored_events, read_events, settled_until
+
+logger = get_logger(__name__)
+
+_NIL_UUID = UUID(int=0)
+
+# Catch-up starts this far before the watermark, so events stamped before it
+# but committed after are not missed. Events the build already replayed are
+# skipped by their user's ProjectionRebuildBatch.
+_COMMIT_MARGIN = timedelta(minutes=1)
+
+# The batch (and so the load time) each user was built in
+_USER_BATCHES = text(
+    "SELECT DISTINCT ON (u.id) u.id AS user_id, b.loaded_at, b.pending_event_ids "
+    "FROM unnest(CAST(:user_ids AS uuid[])) AS u(id) "
+    "JOIN projection_rebuild_batches b ON b.projection = :projection "
+    "AND b.partition = mod(abs(hashtext(u.id::text)), :partitions) AND b.last_user_id >= u.id "
+    "ORDER BY u.id, b.last_user_id"
+)
+
+
+def shadow_table(projection: Projection) -> str:
+    return f"{projection.table}_rebuild"
+
+
+def rebuild_partition(
+    name: str,
+    database_url: str,
+    partition: int,
+    partitions: int,
+    batch_size: int,
+    archive_dir: Optional[str]
+) -> int:
+    """Process pool entry point: build one user_id partition. Returns users built."""
+    return asyncio.run(_rebuild_partition(
+        load_projection(name), database_url, partition, partitions, batch_size, archive_dir
+    ))
+
+
+async def _rebuild_partition(
+    projection: Projection,
+    database_url: str,
+    partition: int,
+    partitions: int,
+    batch_size: int,
+    archive_dir: Optional[str]
+) -> int:
+    engine = create_async_engine(database_url, poolclass=NullPool)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    archive = SessionArchive(archive_dir) if archive_dir else None
+    shadow = shadow_table(projection)
+    built = 0
+    try:
+        while True:
+            async with session_factory() as db:
+                # One snapshot for the batch, so its load time and outbox match the history it reads
+                await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+                loaded_at = await db.scalar(select(db_utc_now()))
+                checkpoint = await db.get(ProjectionRebuildPartition, (projection.name, partition))
+                if checkpoint.completed:
+                    return built
+                query = "SELECT id FROM users WHERE mod(abs(hashtext(id::text)), :partitions) = :partition"
+                if checkpoint.last_user_id:
+                    query += " AND id > :after"
+                result = await db.execute(
+                    text(f"{query} ORDER BY id LIMIT :limit"),
+                    {"partitions": partitions, "partition": partition,
+                     "after": checkpoint.last_user_id, "limit": batch_size},
+                )
+                user_ids = list(result.scalars().all())
+                if user_ids:
+                    history = await load_history(db, user_ids, archive=archive)
+                    pending = await db.scalars(select(OutboxEvent.id).where(OutboxEvent.user_id.in_(user_ids)))
+                    context = await projection.load_context(db, user_ids)
+                    rows = []
+                    for user_id in user_ids:
+                        user_rows: Rows = {}
+                        for event in history.get(user_id, ()):
+                            if projection.handles(event):
+                                projection.apply(user_rows, event, context.get(user_id))
+                        rows.extend(user_rows.values())
+                    await projection.save(db, rows, table=shadow)
+                    db.add(ProjectionRebuildBatch(
+                        projection=projection.name, partition=partition, last_user_id=user_ids[-1],
+                        loaded_at=loaded_at, pending_event_ids=[str(event_id) for event_id in pending],
+                    ))
+                    checkpoint.last_user_id = user_ids[-1]
+                    checkpoint.users_done += len(user_ids)
+                    built += len(user_ids)
+                # The checkpoint commits with the rows it covers
+                checkpoint.completed = len(user_ids) < batch_size
+                checkpoint.updated_at = datetime.utcnow()
+                await db.commit()
+    finally:
+        await engine.dispose()
+
+
+class ProjectionRebuilder:
+    """
+    Rebuilds one projection without stopping its live updates.
+
+    1. Build: users are split into `partitions` by hash of user_id, each built
+       in its own process from the session rows as they are when its batch
+       reads them. Every batch commits its rows together with the partition
+       checkpoint and its load time, so a rerun continues where it stopped.
+    2. Catch-up: event_store rows stored since the watermark are applied to
+       the shadow table until it is within `settle_seconds` of now (rows
+       stored more recently may still be committing). A user's events that
+       their batch already replayed are skipped, whenever they occurred:
+       offline sessions synced late are backdated, so occurred_at cannot
+       tell built events from new ones.
+    3. Cutover: with the live position locked (pausing ProjectionRunner), the
+       last events are applied, the shadow table replaces the live one and
+       the live position moves to the shadow's.
+    """
+
+    def __init__(
+        self,
+        projection: Projection,
+        database_url: str,
+        partitions: int = 4,
+        batch_size: int = 500,
+        settle_seconds: float = 5.0,
+        archive_dir: Optional[str] = None
+    ):
+        self.projection = projection
+        self.database_url = database_url
+        self.partitions = partitions
+        self.batch_size = batch_size
+        self.settle_seconds = settle_seconds
+        self.archive_dir = archive_dir
+
+    async def run(self) -> Dict[str, int]:
+        """Run (or resume) the rebuild to completion. Returns users built and events caught up."""
+        engine = create_async_engine(self.database_url, poolclass=NullPool)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        try:
+            rebuild = await self._start(session_factory)
+            built = 0
+            if rebuild.status == "building":
+                built = await self._build(rebuild)
+                await self._set_status(session_factory, "catching_up")
+            caught_up = await self._catch_up(session_factory)
+            caught_up += await self._cut_over(session_factory)
+            return {"users": built, "events": caught_up}
+        finally:
+            await engine.dispose()
+
+    async def _start(self, session_factory: async_sessionmaker[AsyncSession]) -> ProjectionRebuild:
+        name, shadow = self.projection.name, shadow_table(self.projection)
+        async with session_factory() as db:
+            rebuild = await db.get(ProjectionRebuild, name)
+            if rebuild and rebuild.status != "completed":
+                logger.info(f"Resuming rebuild of {name} ({rebuild.status})")
+                self.partitions = rebuild.partitions
+                return rebuild
+
+            watermark = await db.scalar(select(db_utc_now()))
+            if rebuild:
+                await db.delete(rebuild)
+                for model in (ProjectionRebuildPartition, ProjectionRebuildBatch):
+                    await db.execute(model.__table__.delete().where(model.projection == name))
+                await db.flush()
+            rebuild = ProjectionRebuild(
+                projection=name, status="building", partitions=self.partitions,
+                watermark=watermark, stored_at=watermark - _COMMIT_MARGIN, event_id=_NIL_UUID,
+            )
+            db.add(rebuild)
+            db.add_all([
+                ProjectionRebuildPartition(projection=name, partition=p)
+                for p in range(self.partitions)
+            ])
+            await db.execute(text(f"DROP TABLE IF EXISTS {shadow}"))
+            await db.execute(text(f"CREATE TABLE {shadow} (LIKE {self.projection.table} INCLUDING ALL)"))
+            await db.commit()
+            return rebuild
+
+    async def _build(self, rebuild: ProjectionRebuild) -> int:
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.partitions) as pool:
+            built = await asyncio.gather(*(
+                loop.run_in_executor(
+                    pool, rebuild_partition, self.projection.name, self.database_url,
+                    partition, self.partitions, self.batch_size, self.archive_dir,
+                )
+                for partition in range(self.partitions)
+            ))
+        logger.info(f"Rebuild of {self.projection.name}: built {sum(built)} users in {self.partitions} partitions")
+        return sum(built)
+
+    async def _catch_up(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        applied = 0
+        while True:
+            async with session_factory() as db:
+                consumed = await self._catch_up_batch(db, await settled_until(db, self.settle_seconds))
+                await db.commit()
+            applied += consumed
+            if consumed < self.batch_size:
+                return applied
+
+    async def _catch_up_batch(self, db: AsyncSession, until: datetime) -> int:
+        """Apply one batch of events to the shadow table. Returns rows consumed."""
+        rebuild = await db.get(ProjectionRebuild, self.projection.name, with_for_update=True)
+        rows = await read_events(db, (rebuild.stored_at, rebuild.event_id), until, self.batch_size)
+        if rows:
+            batches = await self._user_batches(db, {row["user_id"] for row in rows})
+            await apply_stored_events(
+                db, self.projection, [row for row in rows if not self._built(row, batches)],
+                table=shadow_table(self.projection),
+            )
+            rebuild.stored_at, rebuild.event_id = rows[-1]["stored_at"], rows[-1]["id"]
+        return len(rows)
+
+    async def _user_batches(
+        self,
+        db: AsyncSession,
+        user_ids: Iterable[UUID]
+    ) -> Dict[UUID, Tuple[datetime, Set[str]]]:
+        """Load time and pending outbox ids of the batch each user was built in."""
+        result = await db.execute(_USER_BATCHES, {
+            "user_ids": list(user_ids), "projection": self.projection.name, "partitions": self.partitions,
+        })
+        return {row.user_id: (row.loaded_at, set(row.pending_event_ids)) for row in result}
+
+    @staticmethod
+    def _built(row: Dict[str, Any], batches: Dict[UUID, Tuple[datetime, Set[str]]]) -> bool:
+        """Whether the build already replayed an event (users created since were not built)."""
+        batch = batches.get(row["user_id"])
+        if batch is None:
+            return False
+        loaded_at, pending = batch
+        return row["stored_at"] < loaded_at or str(row["id"]) in pending
+
+    async def _cut_over(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        name, table, shadow = self.projection.name, self.projection.table, shadow_table(self.projection)
+        applied = 0
+        async with session_factory() as db:
+            position = await db.get(ProjectionPosition, name, with_for_update=True)
+            if position is None:
+                position = ProjectionPosition(projection=name, stored_at=datetime.min, event_id=_NIL_UUID)
+                db.add(position)
+            # Live writers are paused from here to commit; drain what is left
+            until = await settled_until(db, self.settle_seconds)
+            while True:
+                consumed = await self._catch_up_batch(db, until)
+                applied += consumed
+                if consumed < self.batch_size:
+                    break
+
+            await db.execute(text(f"ALTER TABLE {table} RENAME TO {table}_old"))
+            await db.execute(text(f"ALTER TABLE {shadow} RENAME TO {table}"))
+            await db.execute(text(f"DROP TABLE {table}_old"))
+
+            rebuild = await db.get(ProjectionRebuild, name)
+            position.stored_at, position.event_id = rebuild.stored_at, rebuild.event_id
+            position.updated_at = datetime.utcnow()
+            rebuild.status = "completed"
+            rebuild.completed_at = datetime.utcnow()
+            await db.commit()
+        logger.info(f"Rebuild of {name} cut over")
+        return applied
+
+    async def _set_status(self, session_factory: async_sessionmaker[AsyncSession], status: str) -> None:
+        async with session_factory() as db:
+            await db.execute(
+                update(ProjectionRebuild)
+                .where(ProjectionRebuild.projection == self.projection.name)
+                .values(status=status)
+            )
+            await db.commit()
+
+
+async def main(argv: Optional[List[str]] = None) -> None:
+    from src.infrastructure.config.settings import settings
+
+    parser = argparse.ArgumentParser(description="Rebuild a projection from history")
+    parser.add_argument("projection")
+    parser.add_argument("--partitions", type=int, default=settings.PROJECTION_REBUILD_PARTITIONS)
+    args = parser.parse_args(argv)
+
+    rebuilder = ProjectionRebuilder(
+        load_projection(args.projection),
+        settings.DATABASE_URL,
+        partitions=args.partitions,
+        batch_size=settings.PROJECTION_BATCH_SIZE,
+        settle_seconds=settings.PROJECTION_SETTLE_SECONDS,
+        archive_dir=settings.ARCHIVE_DIR,
+    )
+    report = await rebuilder.run()
+    print(f"Rebuilt {args.projection}: {report['users']} users, {report['events']} events caught up")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,195 @@
+"""
+Projection Runner
+Keeps a live projection up to date by tailing event_store.
+"""
+
+import asyncio
+import copy
+from collections import defaultdict
+from functools import partial
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.clock import db_utc_now
+from src.infrastructure.event_store.models import StoredEvent
+from src.infrastructure.event_store.records import event_from_row
+from src.infrastructure.logging import get_logger
+from src.infrastructure.projections.models import ProjectionDeadLetter, ProjectionPosition
+from src.infrastructure.projections.projection import Projection
+
+logger = get_logger(__name__)
+
+_EVENT_COLUMNS = [
+    StoredEvent.id, StoredEvent.event_type, StoredEvent.aggregate_id, StoredEvent.user_id,
+    StoredEvent.payload, StoredEvent.created_at, StoredEvent.stored_at,
+]
+
+
+async def settled_until(db: AsyncSession, settle_seconds: float) -> datetime:
+    """Upper bound for read_events: the database clock, which stamps stored_at, minus the settle window."""
+    return await db.scalar(select(db_utc_now())) - timedelta(seconds=settle_seconds)
+
+
+async def read_events(
+    db: AsyncSession,
+    position: Tuple[datetime, UUID],
+    until: datetime,
+    limit: int
+) -> List[Dict[str, Any]]:
+    """event_store rows after `position` in (stored_at, id) order, stored before `until`."""
+    result = await db.execute(
+        select(*_EVENT_COLUMNS)
+        .where(
+            tuple_(StoredEvent.stored_at, StoredEvent.id) > tuple_(*position),
+            StoredEvent.stored_at < until,
+        )
+        .order_by(StoredEvent.stored_at, StoredEvent.id)
+        .limit(limit)
+    )
+    return [dict(row) for row in result.mappings()]
+
+
+async def apply_stored_events(
+    db: AsyncSession,
+    projection: Projection,
+    rows: List[Dict[str, Any]],
+    table: Optional[str] = None,
+    on_error: Optional[Callable[[Dict[str, Any], Exception], None]] = None
+) -> None:
+    """
+    Fold event_store rows into the projection's rows, locking the rows touched.
+
+    With `on_error`, a row that cannot be decoded or applied is passed to it
+    and skipped, and its user's rows stay as they were before it. Errors
+    loading or saving rows always propagate.
+    """
+    by_user: Dict[UUID, List[Tuple[Dict[str, Any], Any]]] = defaultdict(list)
+    for row in rows:
+        try:
+            event = event_from_row(row)
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(row, e)
+            continue
+        if projection.handles(event):
+            by_user[event.user_id].append((row, event))
+    if not by_user:
+        return
+
+    context = await projection.load_context(db, list(by_user))
+    keys = projection.touched_keys(by_user, context)
+    current = await projection.load(db, by_user, table=table, for_update=True, keys=keys)
+    changed = []
+    for user_id, events in by_user.items():
+        user_rows = current.get(user_id, {})
+        for row, event in events:
+            if on_error is None:
+                projection.apply(user_rows, event, context.get(user_id))
+                continue
+            attempt = copy.deepcopy(user_rows)
+            try:
+                projection.apply(attempt, event, context.get(user_id))
+            except Exception as e:
+                on_error(row, e)
+            else:
+                user_rows = attempt
+        changed.extend(user_rows.values())
+    await projection.save(db, changed, table=table)
+
+
+class ProjectionRunner:
+    """
+    Applies new event_store rows to a projection's live table.
+
+    Each batch is applied in one transaction that also advances the
+    projection's position, with the position row locked: concurrent runners
+    (one per app process) take turns, and a rebuild's cutover holds the same
+    lock while it swaps tables. Rows stored in the last `settle_seconds` are
+    left for the next poll so a batch still committing is not skipped; that
+    window is measured on the database clock, which also stamps stored_at,
+    so app server clock skew cannot shrink it.
+
+    If a batch fails in the projection's code (not the database), it is
+    applied again event by event: events that still fail are set aside in
+    projection_dead_letters and the position moves past them.
+
+    A projection has no position until its first rebuild sets one; until
+    then the runner waits.
+    """
+
+    def __init__(
+        self,
+        projection: Projection,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = 500,
+        settle_seconds: float = 5.0,
+        poll_seconds: float = 1.0
+    ):
+        self.projection = projection
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.settle_seconds = settle_seconds
+        self.poll_seconds = poll_seconds
+
+    async def run_once(self, now: Optional[datetime] = None) -> int:
+        """Apply one batch. Returns the number of event_store rows consumed."""
+        try:
+            return await self._run_batch(now, isolate=False)
+        except SQLAlchemyError:
+            raise
+        except Exception as e:
+            logger.warning(f"Projection {self.projection.name} batch failed, applying it event by event: {e}")
+            return await self._run_batch(now, isolate=True)
+
+    async def _run_batch(self, now: Optional[datetime], isolate: bool) -> int:
+        async with self.session_factory() as db:
+            position = await db.scalar(
+                select(ProjectionPosition)
+                .where(ProjectionPosition.projection == self.projection.name)
+                .with_for_update()
+            )
+            if position is None:
+                return 0
+            if now is None:
+                until = await settled_until(db, self.settle_seconds)
+            else:
+                until = now - timedelta(seconds=self.settle_seconds)
+            rows = await read_events(db, (position.stored_at, position.event_id), until, self.batch_size)
+            if not rows:
+                return 0
+            await apply_stored_events(
+                db, self.projection, rows, on_error=partial(self._set_aside, db) if isolate else None,
+            )
+            position.stored_at, position.event_id = rows[-1]["stored_at"], rows[-1]["id"]
+            position.updated_at = datetime.utcnow()
+            await db.commit()
+            return len(rows)
+
+    def _set_aside(self, db: AsyncSession, row: Dict[str, Any], error: Exception) -> None:
+        logger.error(f"Projection {self.projection.name} set aside event {row['id']}: {error}")
+        db.add(ProjectionDeadLetter(
+            projection=self.projection.name, event_id=row["id"], user_id=row["user_id"],
+            stored_at=row["stored_at"], error=f"{type(error).__name__}: {error}",
+        ))
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Poll every `poll_seconds` (immediately again after a full batch) until `stop` is set."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            consumed = 0
+            try:
+                consumed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Projection {self.projection.name} update failed: {e}")
+            if consumed >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
@@ -3,17 +3,39 @@ Main FastAPI Application
 Entry point for DOSE backend
 """
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from src.infrastructure.config.settings import settings
-from src.infrastructure.logging import setup_logging, get_logger
+from src.infrastructure.logging import setup_logging, shutdown_logging, logging_metrics, get_logger
 from src.api.middleware.logging_middleware import LoggingMiddleware
+from src.api.middleware.request_log_sampler import RequestLogSampler
 from src.api.routers import api_router
+from src.infrastructure.database.session import AsyncSessionLocal, engine
+from src.infrastructure.database.partitions import PartitionManager
+from src.infrastructure.archive import session_archive
+from src.infrastructure.archive.archiver import SessionArchiver
+from src.infrastructure.cache import response_cache
+from src.infrastructure.drafts import draft_buffer
+from src.core.domain.events import SessionEvent
+from src.infrastructure.event_bus import event_bus
+from src.infrastructure.event_store import EventStoreWriter
+from src.infrastructure.projections import PROJECTIONS, ProjectionRunner, load_projection
+from src.modules.analytics.infrastructure.cache import pattern_cache
+from src.modules.auth.application.services.account_erasure_service import AccountErasureService
+from src.modules.sync.application.services.tombstone_purger import TombstonePurger
 
 # Initialize logging
-setup_logging(log_level=settings.LOG_LEVEL)
+setup_logging(
+    log_level=settings.LOG_LEVEL,
+    enable_json=settings.LOG_JSON,
+    queue_size=settings.LOG_QUEUE_SIZE,
+    queue_debug_fill=settings.LOG_QUEUE_DEBUG_FILL,
+    queue_keep_level=settings.LOG_QUEUE_KEEP_LEVEL
+)
 logger = get_logger(__name__)
 
 app = FastAPI(
@@ -33,7 +55,14 @@ app.add_middleware(
 )
 
 # Add logging middleware (first to capture all requests)
-app.add_middleware(LoggingMiddleware)
+request_log_sampler = RequestLogSampler(
+    default_rate=settings.LOG_REQUEST_SAMPLE_RATE,
+    route_rates=settings.LOG_REQUEST_ROUTE_RATES,
+    slow_ms=settings.LOG_REQUEST_SLOW_MS,
+    keep_status=settings.LOG_REQUEST_KEEP_STATUS,
+    budget_per_second=settings.LOG_REQUEST_BUDGET_PER_SECOND
+)
+app.add_middleware(LoggingMiddleware, sampler=request_log_sampler)
 
 # Add CORS middleware
 app.add_middleware(
@@ -47,6 +76,50 @@ app.add_middleware(
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
+# Background workers, started on startup and stopped on shutdown
+erasure_service = AccountErasureService(
+    AsyncSessionLocal,
+    batch_size=settings.ERASURE_BATCH_SIZE,
+    poll_seconds=settings.ERASURE_POLL_SECONDS
+)
+partition_manager = PartitionManager(
+    engine,
+    months_ahead=settings.SESSION_PARTITION_MONTHS_AHEAD,
+    retention_months=settings.SESSION_PARTITION_RETENTION_MONTHS
+)
+session_archiver = SessionArchiver(
+    AsyncSessionLocal,
+    session_archive,
+    archive_after_days=settings.ARCHIVE_AFTER_DAYS,
+    batch_size=settings.ARCHIVE_BATCH_SIZE
+)
+tombstone_purger = TombstonePurger(
+    AsyncSessionLocal,
+    retention_days=settings.SYNC_TOMBSTONE_RETENTION_DAYS,
+    settle_seconds=settings.SYNC_SETTLE_SECONDS
+)
+event_store_writer = EventStoreWriter(
+    AsyncSessionLocal,
+    batch_size=settings.EVENT_STORE_BATCH_SIZE,
+    flush_seconds=settings.EVENT_STORE_FLUSH_SECONDS,
+    outbox_grace_seconds=settings.EVENT_STORE_OUTBOX_GRACE_SECONDS
+)
+event_bus.subscribe(SessionEvent, event_store_writer.append, name="event_store")
+event_bus.subscribe(SessionEvent, pattern_cache.on_session_event, name="analytics_pattern_cache")
+event_bus.subscribe_inline(SessionEvent, response_cache.on_session_event, name="response_cache")
+projection_runners = [
+    ProjectionRunner(
+        load_projection(name),
+        AsyncSessionLocal,
+        batch_size=settings.PROJECTION_BATCH_SIZE,
+        settle_seconds=settings.PROJECTION_SETTLE_SECONDS,
+        poll_seconds=settings.PROJECTION_POLL_SECONDS
+    )
+    for name in PROJECTIONS
+]
+workers_stop = asyncio.Event()
+worker_tasks: list[asyncio.Task] = []
+
 # Log application startup
 logger.info(f"{settings.APP_NAME} v{settings.APP_VERSION} starting up...")
 
@@ -61,14 +134,47 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "version": settings.APP_VERSION}
 
+@app.get("/health/events")
+async def event_bus_metrics():
+    """Event bus queue depth and per-subscriber latency."""
+    return event_bus.metrics()
+
+@app.get("/health/drafts")
+async def draft_buffer_metrics():
+    """Draft autosave buffer depth and flush lag."""
+    return draft_buffer.metrics()
+
+@app.get("/health/logging")
+async def logging_queue_metrics():
+    """Logging queue depth, records dropped on overflow and request log sampling."""
+    return {**logging_metrics(), "request_sampling": request_log_sampler.metrics()}
+
+@app.get("/health/response-cache")
+async def response_cache_metrics():
+    """Per-user GET response cache hits, 304s and invalidations."""
+    return response_cache.metrics()
+
 @app.on_event("startup")
 async def startup_event():
     """Run on application startup."""
     logger.info(f"🚀 {settings.APP_NAME} v{settings.APP_VERSION} started successfully")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
+    worker_tasks.append(asyncio.create_task(event_bus.run_forever(workers_stop)))
+    worker_tasks.append(asyncio.create_task(event_store_writer.run_forever(workers_stop)))
+    worker_tasks.append(asyncio.create_task(draft_buffer.run_forever(workers_stop)))
+    for runner in projection_runners:
+        worker_tasks.append(asyncio.create_task(runner.run_forever(workers_stop)))
+    worker_tasks.append(asyncio.create_task(erasure_service.run_forever(workers_stop)))
+    worker_tasks.append(asyncio.create_task(partition_manager.run_forever(workers_stop)))
+    worker_tasks.append(asyncio.create_task(tombstone_purger.run_forever(workers_stop)))
+    if settings.ARCHIVE_AFTER_DAYS > 0:
+        worker_tasks.append(asyncio.create_task(session_archiver.run_forever(workers_stop)))
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown."""
-    logger.info(f"👋 {settings.APP_NAME} shutting down...")
\ No newline at end of file
+    logger.info(f"👋 {settings.APP_NAME} shutting down...")
+    workers_stop.set()
+    await asyncio.gather(*worker_tasks, return_exceptions=True)
+    shutdown_logging()
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Analytics API Endpoints
+"""
+
+from datetime import date
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.session import get_db
+from src.modules.auth.application.services.auth_service import AuthService
+from src.modules.auth.infrastructure.repositories.user_repository import UserRepository
+from src.modules.analytics.api.schemas.analytics_schemas import (
+    ActivityResponse,
+    ProgressSummaryResponse,
+    StreakResponse,
+    WavePatternsResponse,
+)
+from src.modules.analytics.application.services.analytics_service import AnalyticsService
+from src.modules.analytics.application.services.pattern_service import PatternService
+from src.modules.analytics.infrastructure.cache import pattern_cache
+from src.modules.analytics.infrastructure.queries.wave_pattern_query import WavePatternQuery
+from src.modules.analytics.infrastructure.repositories.activity_rollup_repository import ActivityRollupRepository
+from src.modules.analytics.infrastructure.repositories.progress_summary_repository import ProgressSummaryRepository
+from src.modules.analytics.infrastructure.repositories.streak_repository import StreakRepository
+
+router = APIRouter()
+security = HTTPBearer()
+
+
+def get_analytics_service(db: AsyncSession = Depends(get_db)) -> AnalyticsService:
+    """Dependency to get the analytics service."""
+    return AnalyticsService(ProgressSummaryRepository(db), ActivityRollupRepository(db), StreakRepository(db))
+
+
+def get_pattern_service(db: AsyncSession = Depends(get_db)) -> PatternService:
+    """Dependency to get the pattern service."""
+    return PatternService(WavePatternQuery(db), pattern_cache)
+
+
+async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security), db: AsyncSession = Depends(get_db)) -> UUID:
+    """Dependency to get current user ID from token."""
+    user_repository = UserRepository(db)
+    auth_service = AuthService(user_repository)
+
+    user = await auth_service.get_current_user(credentials.credentials)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials"
+        )
+
+    return user.id
+
+
+@router.get("/summary", response_model=ProgressSummaryResponse)
+async def get_progress_summary(
+    user_id: UUID = Depends(get_current_user_id),
+    analytics_service: AnalyticsService = Depends(get_analytics_service)
+):
+    """
+    Get the current user's SPARK and WAVE progress.
+
+    Counts are maintained as sessions start and complete; they trail the
+    sessions by a few seconds.
+    """
+    return await analytics_service.get_summary(user_id)
+
+
+@router.get("/patterns", response_model=WavePatternsResponse)
+async def get_wave_patterns(
+    user_id: UUID = Depends(get_current_user_id),
+    pattern_service: PatternService = Depends(get_pattern_service)
+):
+    """
+    Get trends across the current user's WAVE check-ins.
+
+    Rolling intensity means, hour-of-day and weekday distributions (UTC),
+    emotions and quick-action effectiveness. Cached per user until their
+    next WAVE session event.
+    """
+    return await pattern_service.get_patterns(user_id)
+
+
+@router.get("/activity", response_model=ActivityResponse)
+async def get_activity(
+    granularity: str = Query("day", description="hour, day or week"),
+    start: date = Query(..., description="First local date"),
+    end: date = Query(..., description="Last local date (inclusive)"),
+    user_id: UUID = Depends(get_current_user_id),
+    analytics_service: AnalyticsService = Depends(get_analytics_service)
+):
+    """
+    Get the current user's activity per local hour, day or week, for
+    heatmaps and charts.
+
+    Buckets are in the user's time zone (PUT /auth/me/timezone) and read
+    from pre-aggregated rollups; buckets without activity are omitted.
+    """
+    try:
+        return await analytics_service.get_activity(user_id, granularity, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/streak", response_model=StreakResponse)
+async def get_streak(
+    user_id: UUID = Depends(get_current_user_id),
+    analytics_service: AnalyticsService = Depends(get_analytics_service)
+):
+    """
+    Get the current user's days-in-a-row streak across SPARK and WAVE.
+
+    A day counts once any session is completed on it, in the user's time
+    zone. Updated a few seconds after each completion.
+    """
+    return await analytics_service.get_streak(user_id)
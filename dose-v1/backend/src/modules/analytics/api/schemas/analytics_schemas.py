@@ -0,0 +1,116 @@
+"""
+Analytics API Schemas - Response validation
+"""
+
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+
+class ProgressSummaryResponse(BaseModel):
+    """A user's SPARK and WAVE progress."""
+    user_id: UUID
+    spark_started: int
+    spark_completed: int
+    spark_last_completed_at: Optional[datetime]
+    wave_started: int
+    wave_completed: int
+    wave_last_completed_at: Optional[datetime]
+    total_completed: int
+    updated_at: Optional[datetime] = Field(None, description="When the summary last changed; null if the user has no sessions")
+
+    model_config = {"from_attributes": True}
+
+
+class IntensityPointResponse(BaseModel):
+    """One check-in on the intensity trend."""
+    at: datetime
+    intensity: int
+    rolling_mean: float
+
+    model_config = {"from_attributes": True}
+
+
+class TimeBucketResponse(BaseModel):
+    """Check-ins in one hour of the day or weekday."""
+    bucket: int = Field(..., description="Hour 0-23 or weekday 0-6 (Monday = 0), UTC")
+    sessions: int
+    average_intensity: Optional[float]
+
+    model_config = {"from_attributes": True}
+
+
+class EmotionStatResponse(BaseModel):
+    """Frequency and intensity of one emotion."""
+    emotion: str
+    sessions: int
+    average_intensity: float
+
+    model_config = {"from_attributes": True}
+
+
+class ActionStatResponse(BaseModel):
+    """Outcomes of one quick action."""
+    action_type: str
+    sessions: int
+    completion_rate: float
+    average_duration: Optional[float] = Field(None, description="Seconds, over completed actions")
+    average_intensity_change: Optional[float] = Field(
+        None, description="Intensity at the next check-in minus intensity at this one; negative is better"
+    )
+
+    model_config = {"from_attributes": True}
+
+
+class WavePatternsResponse(BaseModel):
+    """Trends across the user's WAVE check-ins."""
+    user_id: UUID
+    sessions: int
+    average_intensity: Optional[float]
+    intensity_trend_per_week: Optional[float] = Field(None, description="Least-squares change in intensity per week")
+    rolling_window: int
+    intensity: List[IntensityPointResponse]
+    by_hour: List[TimeBucketResponse]
+    by_weekday: List[TimeBucketResponse]
+    emotions: List[EmotionStatResponse]
+    actions: List[ActionStatResponse] = Field(..., description="Most effective first")
+    computed_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ActivityBucketResponse(BaseModel):
+    """Activity in one local hour, day or week."""
+    bucket_start: datetime = Field(..., description="Local time, without offset")
+    spark_started: int
+    spark_completed: int
+    wave_started: int
+    wave_completed: int
+    wave_intensity_mean: Optional[float] = Field(None, description="Over completed WAVE sessions")
+    wave_intensity_max: Optional[int]
+    action_counts: Dict[str, int] = Field(..., description="Completed WAVE sessions per quick action")
+
+    model_config = {"from_attributes": True}
+
+
+class ActivityResponse(BaseModel):
+    """The user's activity buckets; buckets without activity are omitted."""
+    user_id: UUID
+    granularity: str
+    timezone: str
+    buckets: List[ActivityBucketResponse]
+
+    model_config = {"from_attributes": True}
+
+
+class StreakResponse(BaseModel):
+    """The user's daily practice streak."""
+    user_id: UUID
+    current_streak: int = Field(..., description="Days in a row up to today, or yesterday if today has no session yet")
+    longest_streak: int
+    last_active_date: Optional[date] = Field(None, description="Last local date with a completed session")
+    active_today: bool
+    timezone: str
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,105 @@
+"""
+Analytics Data Transfer Objects
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class ProgressSummaryDTO:
+    """DTO for a user's SPARK/WAVE progress counts."""
+    user_id: UUID
+    spark_started: int
+    spark_completed: int
+    spark_last_completed_at: Optional[datetime]
+    wave_started: int
+    wave_completed: int
+    wave_last_completed_at: Optional[datetime]
+    total_completed: int
+    updated_at: Optional[datetime]  # None until the user's first session event is applied
+
+
+@dataclass(slots=True)
+class IntensityPointDTO:
+    """One check-in with the rolling mean ending at it."""
+    at: datetime
+    intensity: int
+    rolling_mean: float
+
+
+@dataclass(slots=True)
+class TimeBucketDTO:
+    """Check-ins in one hour of the day (0-23) or weekday (0 = Monday)."""
+    bucket: int
+    sessions: int
+    average_intensity: Optional[float]
+
+
+@dataclass(slots=True)
+class EmotionStatDTO:
+    """How often an emotion was named and how intense it was."""
+    emotion: str
+    sessions: int
+    average_intensity: float
+
+
+@dataclass(slots=True)
+class ActionStatDTO:
+    """Outcomes of one quick action."""
+    action_type: str
+    sessions: int
+    completion_rate: float
+    average_duration: Optional[float]  # Seconds, over completed actions with a duration
+    average_intensity_change: Optional[float]  # Next check-in's intensity minus this one's
+
+
+@dataclass(slots=True)
+class WavePatternsDTO:
+    """Trends across a user's WAVE check-ins."""
+    user_id: UUID
+    sessions: int
+    average_intensity: Optional[float]
+    intensity_trend_per_week: Optional[float]
+    rolling_window: int
+    intensity: List[IntensityPointDTO]
+    by_hour: List[TimeBucketDTO]
+    by_weekday: List[TimeBucketDTO]
+    emotions: List[EmotionStatDTO]
+    actions: List[ActionStatDTO]
+    computed_at: datetime
+
+
+@dataclass(slots=True)
+class ActivityBucketDTO:
+    """SPARK/WAVE activity in one local hour, day or week."""
+    bucket_start: datetime
+    spark_started: int
+    spark_completed: int
+    wave_started: int
+    wave_completed: int
+    wave_intensity_mean: Optional[float]
+    wave_intensity_max: Optional[int]
+    action_counts: Dict[str, int]
+
+
+@dataclass(slots=True)
+class ActivityDTO:
+    """A user's activity buckets over a local date range."""
+    user_id: UUID
+    granularity: str
+    timezone: str
+    buckets: List[ActivityBucketDTO]
+
+
+@dataclass(slots=True)
+class StreakDTO:
+    """A user's days-in-a-row of SPARK/WAVE practice."""
+    user_id: UUID
+    current_streak: int
+    longest_streak: int
+    last_active_date: Optional[date]
+    active_today: bool
+    timezone: str
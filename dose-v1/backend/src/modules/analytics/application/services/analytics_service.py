@@ -0,0 +1,133 @@
+"""
+Analytics Service - Application Layer
+Per-user progress read from precomputed read models
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from uuid import UUID
+
+from src.modules.analytics.application.dto.analytics_dto import (
+    ActivityBucketDTO,
+    ActivityDTO,
+    ProgressSummaryDTO,
+    StreakDTO,
+)
+from src.modules.analytics.infrastructure.persistence.models import ActivityRollup
+from src.modules.analytics.infrastructure.projections.activity_rollup_projection import GRANULARITIES
+from src.modules.analytics.infrastructure.repositories.activity_rollup_repository import ActivityRollupRepository
+from src.modules.analytics.infrastructure.projections.time_zones import local_today, user_zone
+from src.modules.analytics.infrastructure.repositories.progress_summary_repository import ProgressSummaryRepository
+from src.modules.analytics.infrastructure.repositories.streak_repository import StreakRepository
+
+# Most buckets one chart request may span
+MAX_BUCKETS = 400
+
+_BUCKET_LENGTH = {"hour": timedelta(hours=1), "day": timedelta(days=1), "week": timedelta(weeks=1)}
+
+
+class AnalyticsService:
+    """Service for user progress analytics."""
+
+    def __init__(
+        self,
+        summary_repository: ProgressSummaryRepository,
+        rollup_repository: Optional[ActivityRollupRepository] = None,
+        streak_repository: Optional[StreakRepository] = None
+    ):
+        self.summary_repository = summary_repository
+        self.rollup_repository = rollup_repository
+        self.streak_repository = streak_repository
+
+    async def get_summary(self, user_id: UUID) -> ProgressSummaryDTO:
+        """
+        Get a user's progress summary.
+
+        A single primary-key read of user_progress_summary; users without any
+        sessions yet get zero counts.
+        """
+        summary = await self.summary_repository.get(user_id)
+        if not summary:
+            return ProgressSummaryDTO(
+                user_id=user_id,
+                spark_started=0,
+                spark_completed=0,
+                spark_last_completed_at=None,
+                wave_started=0,
+                wave_completed=0,
+                wave_last_completed_at=None,
+                total_completed=0,
+                updated_at=None,
+            )
+        return ProgressSummaryDTO(
+            user_id=user_id,
+            spark_started=summary.spark_started,
+            spark_completed=summary.spark_completed,
+            spark_last_completed_at=summary.spark_last_completed_at,
+            wave_started=summary.wave_started,
+            wave_completed=summary.wave_completed,
+            wave_last_completed_at=summary.wave_last_completed_at,
+            total_completed=summary.spark_completed + summary.wave_completed,
+            updated_at=summary.updated_at,
+        )
+
+    async def get_activity(self, user_id: UUID, granularity: str, start: date, end: date) -> ActivityDTO:
+        """
+        Get a user's activity buckets between two local dates (inclusive).
+
+        Reads one pre-aggregated row per non-empty bucket.
+
+        Raises:
+            ValueError: If the granularity is unknown or the range is empty or too long
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Granularity must be one of: {', '.join(GRANULARITIES)}")
+        first, last = datetime.combine(start, time()), datetime.combine(end + timedelta(days=1), time())
+        if granularity == "week":
+            first -= timedelta(days=start.weekday())  # Include the week start falls in
+        if last <= first:
+            raise ValueError("end must not be before start")
+        if (last - first) / _BUCKET_LENGTH[granularity] > MAX_BUCKETS:
+            raise ValueError(f"Range spans more than {MAX_BUCKETS} {granularity} buckets")
+
+        rows = await self.rollup_repository.get_range(user_id, granularity, first, last)
+        timezone = await self.rollup_repository.get_timezone(user_id) or "UTC"
+        return ActivityDTO(
+            user_id=user_id,
+            granularity=granularity,
+            timezone=timezone,
+            buckets=[self._to_bucket_dto(row) for row in rows],
+        )
+
+    async def get_streak(self, user_id: UUID, now: Optional[datetime] = None) -> StreakDTO:
+        """
+        Get a user's daily practice streak.
+
+        One read of the precomputed streak row; the stored run still counts
+        if it ended today or yesterday in the user's time zone.
+        """
+        streak, timezone = await self.streak_repository.get_with_timezone(user_id)
+        today = local_today(user_zone(timezone), now)
+        last_active = streak.last_active_date if streak else None
+        ongoing = last_active is not None and last_active >= today - timedelta(days=1)
+        return StreakDTO(
+            user_id=user_id,
+            current_streak=streak.current_streak if ongoing else 0,
+            longest_streak=streak.longest_streak if streak else 0,
+            last_active_date=last_active,
+            active_today=last_active == today,
+            timezone=timezone,
+        )
+
+    @staticmethod
+    def _to_bucket_dto(row: ActivityRollup) -> ActivityBucketDTO:
+        return ActivityBucketDTO(
+            bucket_start=row.bucket_start,
+            spark_started=row.spark_started,
+            spark_completed=row.spark_completed,
+            wave_started=row.wave_started,
+            wave_completed=row.wave_completed,
+            wave_intensity_mean=round(row.intensity_sum / row.intensity_count, 2) if row.intensity_count else None,
+            wave_intensity_max=row.intensity_max,
+            action_counts=row.action_counts,
+        )
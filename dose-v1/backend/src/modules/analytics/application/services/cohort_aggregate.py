@@ -0,0 +1,162 @@
+"""
+Cohort Aggregate
+Mergeable SPARK/WAVE statistics over any subset of sessions
+"""
+
+from collections import Counter
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+SPARK_STEPS = ("situation", "perception", "affect", "response", "key_result")
+WAVE_STEPS = ("checkin", "acceptance", "action", "action_completed")
+
+TOP_EMOTIONS = 20
+# Emotions are free text; a partial counts at most this many distinct ones
+MAX_EMOTIONS = 1000
+
+
+def _rate(part: float, whole: float) -> Optional[float]:
+    return round(part / whole, 4) if whole else None
+
+
+class CohortAggregate:
+    """
+    Partial cohort statistics.
+
+    Built one fetched batch of rows at a time with array operations, so its
+    size depends only on the number of distinct actions (a fixed catalog)
+    and emotions, never on the rows seen. Emotions are typed by users, so
+    only the `MAX_EMOTIONS` most frequent are kept; the sessions of the rest
+    are counted in `other_emotions`. Top emotion counts are exact while a
+    partial sees no more than that many distinct emotions, and a lower bound
+    beyond. Partials of disjoint chunks `merge` into the total.
+    """
+
+    def __init__(self):
+        self.spark_sessions = 0
+        self.spark_completed = 0
+        self.spark_steps = np.zeros(len(SPARK_STEPS), dtype=np.int64)
+        self.wave_sessions = 0
+        self.wave_completed = 0
+        self.wave_steps = np.zeros(len(WAVE_STEPS), dtype=np.int64)
+        self.intensity = np.zeros(11, dtype=np.int64)  # Index = intensity 1-10
+        self.emotions: Counter = Counter()
+        self.other_emotions = 0
+        self.actions_chosen: Counter = Counter()
+        self.actions_completed: Counter = Counter()
+        self.action_seconds: Counter = Counter()
+        self.actions_timed: Counter = Counter()
+
+    def add_spark(self, status: np.ndarray, steps: np.ndarray) -> None:
+        """Add a batch of SPARK sessions; `steps` is (sessions, 5) answered flags."""
+        self.spark_sessions += len(status)
+        self.spark_completed += int(np.count_nonzero(status == "completed"))
+        self.spark_steps += steps.sum(axis=0, dtype=np.int64)
+
+    def add_wave(
+        self,
+        status: np.ndarray,
+        steps: np.ndarray,
+        intensity: np.ndarray,
+        emotion: np.ndarray,
+        action_type: np.ndarray,
+        action_completed: np.ndarray,
+        actual_duration: np.ndarray
+    ) -> None:
+        """Add a batch of WAVE sessions; `steps` is (sessions, 4) reached flags, missing values are NaN/None."""
+        self.wave_sessions += len(status)
+        self.wave_completed += int(np.count_nonzero(status == "completed"))
+        self.wave_steps += steps.sum(axis=0, dtype=np.int64)
+
+        rated = ~np.isnan(intensity)
+        self.intensity += np.bincount(intensity[rated].astype(np.int64), minlength=11)[:11]
+
+        named = emotion != None  # noqa: E711 - elementwise on an object array
+        self._count(self.emotions, emotion[named].astype(str))
+        self._trim_emotions()
+
+        chosen = action_type != None  # noqa: E711
+        actions = action_type[chosen].astype(str)
+        completed = action_completed[chosen]
+        self._count(self.actions_chosen, actions)
+        self._count(self.actions_completed, actions[completed])
+
+        duration = actual_duration[chosen]
+        timed = completed & ~np.isnan(duration)
+        names, groups = np.unique(actions[timed], return_inverse=True)
+        seconds = np.bincount(groups, weights=duration[timed], minlength=len(names))
+        self.action_seconds.update(dict(zip(names.tolist(), seconds.tolist())))
+        self._count(self.actions_timed, actions[timed])
+
+    @staticmethod
+    def _count(counter: Counter, values: np.ndarray) -> None:
+        names, counts = np.unique(values, return_counts=True)
+        counter.update(dict(zip(names.tolist(), counts.tolist())))
+
+    def _trim_emotions(self) -> None:
+        if len(self.emotions) <= MAX_EMOTIONS:
+            return
+        kept = Counter(dict(self.emotions.most_common(MAX_EMOTIONS)))
+        self.other_emotions += sum(self.emotions.values()) - sum(kept.values())
+        self.emotions = kept
+
+    def merge(self, other: "CohortAggregate") -> None:
+        """Add another chunk's partial into this one."""
+        self.spark_sessions += other.spark_sessions
+        self.spark_completed += other.spark_completed
+        self.spark_steps += other.spark_steps
+        self.wave_sessions += other.wave_sessions
+        self.wave_completed += other.wave_completed
+        self.wave_steps += other.wave_steps
+        self.intensity += other.intensity
+        for name in ("emotions", "actions_chosen", "actions_completed", "action_seconds", "actions_timed"):
+            getattr(self, name).update(getattr(other, name))
+        self.other_emotions += other.other_emotions
+        self._trim_emotions()
+
+    def as_report(self) -> Dict[str, Any]:
+        """JSON-serialisable report."""
+        rated = int(self.intensity.sum())
+        return {
+            "spark": {
+                "sessions": self.spark_sessions,
+                "completed": self.spark_completed,
+                "completion_rate": _rate(self.spark_completed, self.spark_sessions),
+                "steps": [
+                    {"step": name, "answered": int(count), "rate": _rate(count, self.spark_sessions)}
+                    for name, count in zip(SPARK_STEPS, self.spark_steps)
+                ],
+            },
+            "wave": {
+                "sessions": self.wave_sessions,
+                "completed": self.wave_completed,
+                "completion_rate": _rate(self.wave_completed, self.wave_sessions),
+                "steps": [
+                    {"step": name, "reached": int(count), "rate": _rate(count, self.wave_sessions)}
+                    for name, count in zip(WAVE_STEPS, self.wave_steps)
+                ],
+                "intensity": {
+                    "average": round(float(np.dot(np.arange(11), self.intensity)) / rated, 2) if rated else None,
+                    "distribution": {str(level): int(self.intensity[level]) for level in range(1, 11)},
+                },
+                "emotions": [
+                    {"emotion": emotion, "sessions": count}
+                    for emotion, count in self.emotions.most_common(TOP_EMOTIONS)
+                ],
+                "other_emotions": self.other_emotions,
+                "actions": [
+                    {
+                        "action_type": action,
+                        "chosen": chosen,
+                        "completed": self.actions_completed[action],
+                        "completion_rate": _rate(self.actions_completed[action], chosen),
+                        "average_duration": (
+                            round(self.action_seconds[action] / self.actions_timed[action], 1)
+                            if self.actions_timed[action] else None
+                        ),
+                    }
+                    for action, chosen in self.actions_chosen.most_common()
+                ],
+            },
+        }
@@ -0,0 +1,327 @@
+"""
+Cohort Report Job
+Aggregates every SPARK/WAVE session, hot or archived, into a cohort_reports row.
+
+Run with:
+    python -m src.modules.analytics.application.services.cohort_report_job [--workers N] [--chunks N]
+
+Set ANALYTICS_REPLICA_URL to read the session tables from a replica.
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.infrastructure.archive import SessionArchive
+from src.infrastructure.archive.models import ArchivedSession
+from src.infrastructure.logging import get_logger
+from src.modules.analytics.application.services.cohort_aggregate import CohortAggregate
+from src.modules.analytics.infrastructure.persistence.models import CohortReport
+from src.modules.spark.infrastructure.persistence.models import SparkSession
+from src.modules.wave.infrastructure.persistence.models import WaveSession
+
+logger = get_logger(__name__)
+
+KeyRange = Tuple[Optional[UUID], Optional[UUID]]
+
+# Projected columns only: step flags are computed by the database, so the
+# only free text read is the emotion label (at most 100 characters)
+_QUERIES = {
+    "spark": select(
+        SparkSession.status,
+        SparkSession.situation_response.is_not(None),
+        SparkSession.perception_response.is_not(None),
+        SparkSession.affect_response.is_not(None),
+        SparkSession.response_response.is_not(None),
+        SparkSession.key_result_response.is_not(None),
+    ),
+    "wave": select(
+        WaveSession.status,
+        WaveSession.intensity.is_not(None),
+        WaveSession.acceptance_statement.is_not(None),
+        WaveSession.action_type.is_not(None),
+        WaveSession.action_completed,
+        WaveSession.intensity,
+        func.lower(func.trim(WaveSession.emotion)),
+        WaveSession.action_type,
+        WaveSession.actual_duration,
+    ),
+}
+_MODELS = {"spark": SparkSession, "wave": WaveSession}
+_SPARK_ANSWERS = (
+    "situation_response", "perception_response", "affect_response", "response_response", "key_result_response",
+)
+
+
+def _archived_row(session_type: str, record: Dict[str, Any]) -> Tuple[Any, ...]:
+    """An archived record projected like a row of _QUERIES[session_type]."""
+    if session_type == "spark":
+        return (record["status"], *(record[name] is not None for name in _SPARK_ANSWERS))
+    emotion = record["emotion"]
+    return (
+        record["status"],
+        record["intensity"] is not None,
+        record["acceptance_statement"] is not None,
+        record["action_type"] is not None,
+        record["action_completed"],
+        record["intensity"],
+        emotion.strip().lower() if emotion is not None else None,
+        record["action_type"],
+        record["actual_duration"],
+    )
+
+
+def key_ranges(chunks: int) -> List[KeyRange]:
+    """Split the UUID space into `chunks` equal [low, high) ranges; ids are random, so rows split evenly."""
+    bounds = [UUID(int=(i << 128) // chunks) for i in range(1, chunks)]
+    return list(zip([None] + bounds, bounds + [None]))
+
+
+def aggregate_chunk(
+    database_url: str,
+    snapshot: Optional[str],
+    session_type: str,
+    key_range: KeyRange,
+    fetch_size: int,
+    archive_dir: Optional[str] = None
+) -> Tuple[CohortAggregate, int]:
+    """Process pool entry point: aggregate one id range of one table. Returns the partial and rows read."""
+    return asyncio.run(_aggregate_chunk(database_url, snapshot, session_type, key_range, fetch_size, archive_dir))
+
+
+async def _aggregate_chunk(
+    database_url: str,
+    snapshot: Optional[str],
+    session_type: str,
+    key_range: KeyRange,
+    fetch_size: int,
+    archive_dir: Optional[str] = None
+) -> Tuple[CohortAggregate, int]:
+    model = _MODELS[session_type]
+    query = _QUERIES[session_type]
+    low, high = key_range
+    if low is not None:
+        query = query.where(model.id >= low)
+    if high is not None:
+        query = query.where(model.id < high)
+
+    aggregate = CohortAggregate()
+    rows_read = 0
+    engine = create_async_engine(database_url, poolclass=NullPool)
+    try:
+        async with engine.connect() as conn:
+            if snapshot:
+                await conn.execution_options(isolation_level="REPEATABLE READ")
+            async with conn.begin():
+                if snapshot:
+                    # Every chunk reads the coordinator's snapshot, so the report is consistent
+                    await conn.execute(text(f"SET TRANSACTION SNAPSHOT '{snapshot}'"))
+                result = await conn.stream(query.execution_options(yield_per=fetch_size))
+                async for rows in result.partitions(fetch_size):
+                    rows_read += len(rows)
+                    _add_rows(aggregate, session_type, rows)
+                if archive_dir:
+                    rows_read += await _aggregate_archived(
+                        conn, SessionArchive(archive_dir), aggregate, session_type, key_range, fetch_size,
+                    )
+    finally:
+        await engine.dispose()
+    return aggregate, rows_read
+
+
+async def _aggregate_archived(
+    conn,
+    archive: SessionArchive,
+    aggregate: CohortAggregate,
+    session_type: str,
+    key_range: KeyRange,
+    fetch_size: int
+) -> int:
+    """
+    Add the archived sessions of users in `key_range`.
+
+    Archived sessions are split by user id rather than session id: a segment
+    holds one user's month, so every segment is read by exactly one chunk,
+    once. Only sessions in the index (as of the snapshot) are counted, so a
+    session is never counted both hot and archived.
+    """
+    low, high = key_range
+    query = select(ArchivedSession.segment, ArchivedSession.session_id).where(
+        ArchivedSession.session_type == session_type
+    )
+    if low is not None:
+        query = query.where(ArchivedSession.user_id >= low)
+    if high is not None:
+        query = query.where(ArchivedSession.user_id < high)
+    result = await conn.stream(query.order_by(ArchivedSession.segment).execution_options(yield_per=fetch_size))
+
+    rows_read = 0
+    batch: List[Tuple[Any, ...]] = []
+    async for segment, session_ids in _by_segment(result):
+        records = await asyncio.to_thread(archive.read_segment, segment)
+        for session_id in session_ids:
+            record = records.get(str(session_id))
+            if record is not None:
+                batch.append(_archived_row(session_type, record))
+            if len(batch) >= fetch_size:
+                _add_rows(aggregate, session_type, batch)
+                rows_read, batch = rows_read + len(batch), []
+    if batch:
+        _add_rows(aggregate, session_type, batch)
+        rows_read += len(batch)
+    return rows_read
+
+
+async def _by_segment(result) -> AsyncIterator[Tuple[str, List[UUID]]]:
+    """Group (segment, session_id) rows ordered by segment."""
+    segment, session_ids = None, []
+    async for row in result:
+        if row.segment != segment and session_ids:
+            yield segment, session_ids
+            session_ids = []
+        segment = row.segment
+        session_ids.append(row.session_id)
+    if session_ids:
+        yield segment, session_ids
+
+
+def _add_rows(aggregate: CohortAggregate, session_type: str, rows) -> None:
+    columns = list(zip(*rows))
+    status = np.array(columns[0], dtype=str)
+    if session_type == "spark":
+        aggregate.add_spark(status, np.array(columns[1:6], dtype=bool).T)
+        return
+    aggregate.add_wave(
+        status,
+        np.array(columns[1:5], dtype=bool).T,
+        intensity=np.array(columns[5], dtype=np.float64),
+        emotion=np.array(columns[6], dtype=object),
+        action_type=np.array(columns[7], dtype=object),
+        action_completed=np.array(columns[4], dtype=bool),
+        actual_duration=np.array(columns[8], dtype=np.float64),
+    )
+
+
+class CohortReportJob:
+    """
+    Computes cohort statistics across the whole user base.
+
+    Both session tables are split into `chunks` id ranges, aggregated by a
+    pool of `workers` processes and merged as chunks finish. Each worker
+    streams its range `fetch_size` rows at a time and keeps only a partial
+    aggregate, so memory per worker is fetch_size rows, one archive segment
+    and a partial capped at MAX_EMOTIONS emotion counts, however large the
+    tables grow. Throughput scales with cores up to what the database can
+    stream.
+
+    With `archive_dir`, each chunk also reads the archived sessions of its
+    range of users from the segment files, so the job must run where the
+    archive is mounted. On PostgreSQL all chunks read one exported snapshot,
+    held open by the coordinator for the run, which covers the archive
+    index as well. Reads go to `replica_url` when given; the report row is
+    written to the primary.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        replica_url: Optional[str] = None,
+        workers: int = 4,
+        chunks: int = 64,
+        fetch_size: int = 5000,
+        archive_dir: Optional[str] = None
+    ):
+        self.database_url = database_url
+        self.replica_url = replica_url
+        self.workers = workers
+        self.chunks = chunks
+        self.fetch_size = fetch_size
+        self.archive_dir = archive_dir
+
+    async def run(self) -> CohortReport:
+        """Aggregate, store and return the report."""
+        started_at = datetime.utcnow()
+        source_url = self.replica_url or self.database_url
+        source = create_async_engine(source_url, poolclass=NullPool)
+        try:
+            async with source.connect() as conn:
+                snapshot = None
+                if source.dialect.name == "postgresql":
+                    await conn.execution_options(isolation_level="REPEATABLE READ")
+                    await conn.begin()
+                    snapshot = await conn.scalar(text("SELECT pg_export_snapshot()"))
+                total, rows_scanned = await self._aggregate(source_url, snapshot)
+        finally:
+            await source.dispose()
+
+        report = CohortReport(
+            source="replica" if self.replica_url else "primary",
+            chunks=self.chunks,
+            rows_scanned=rows_scanned,
+            report=total.as_report(),
+            started_at=started_at,
+            completed_at=datetime.utcnow(),
+        )
+        target = create_async_engine(self.database_url, poolclass=NullPool)
+        try:
+            async with async_sessionmaker(target, class_=AsyncSession, expire_on_commit=False)() as db:
+                db.add(report)
+                await db.commit()
+        finally:
+            await target.dispose()
+        logger.info(
+            f"Cohort report {report.id}: {rows_scanned} rows in {self.chunks} chunks x 2 tables, "
+            f"{(report.completed_at - started_at).total_seconds():.1f}s"
+        )
+        return report
+
+    async def _aggregate(self, source_url: str, snapshot: Optional[str]) -> Tuple[CohortAggregate, int]:
+        loop = asyncio.get_running_loop()
+        total = CohortAggregate()
+        rows_scanned = 0
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            chunks = [
+                loop.run_in_executor(
+                    pool, aggregate_chunk, source_url, snapshot, session_type, key_range, self.fetch_size,
+                    self.archive_dir,
+                )
+                for session_type in _QUERIES
+                for key_range in key_ranges(self.chunks)
+            ]
+            for chunk in asyncio.as_completed(chunks):
+                partial, rows = await chunk
+                total.merge(partial)
+                rows_scanned += rows
+        return total, rows_scanned
+
+
+async def main(argv: Optional[List[str]] = None) -> None:
+    from src.infrastructure.config.settings import settings
+
+    parser = argparse.ArgumentParser(description="Aggregate cohort statistics into cohort_reports")
+    parser.add_argument("--workers", type=int, default=settings.COHORT_REPORT_WORKERS)
+    parser.add_argument("--chunks", type=int, default=settings.COHORT_REPORT_CHUNKS)
+    args = parser.parse_args(argv)
+
+    job = CohortReportJob(
+        settings.DATABASE_URL,
+        replica_url=settings.ANALYTICS_REPLICA_URL or None,
+        workers=args.workers,
+        chunks=args.chunks,
+        fetch_size=settings.COHORT_REPORT_FETCH_SIZE,
+        archive_dir=settings.ARCHIVE_DIR,
+    )
+    report = await job.run()
+    print(f"Cohort report {report.id}: {report.rows_scanned} sessions")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
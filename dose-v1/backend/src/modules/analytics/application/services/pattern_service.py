@@ -0,0 +1,162 @@
+"""
+Pattern Service - Application Layer
+Vectorized trends over a user's WAVE check-ins
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+import numpy as np
+
+from src.modules.analytics.application.dto.analytics_dto import (
+    ActionStatDTO,
+    EmotionStatDTO,
+    IntensityPointDTO,
+    TimeBucketDTO,
+    WavePatternsDTO,
+)
+from src.modules.analytics.infrastructure.cache import PatternCache
+from src.modules.analytics.infrastructure.queries.wave_pattern_query import WaveColumns, WavePatternQuery
+
+ROLLING_WINDOW = 7  # Check-ins per rolling intensity mean
+
+_SECONDS_PER_WEEK = 7 * 24 * 3600
+
+
+def _round(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def _group_means(groups: np.ndarray, values: np.ndarray, size: int):
+    """Counts and means of `values` per group index (NaN means for empty groups)."""
+    counts = np.bincount(groups, minlength=size)
+    sums = np.bincount(groups, weights=values, minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return counts, sums / counts
+
+
+def rolling_means(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean of the last `window` values at each position (fewer at the start)."""
+    sums = np.cumsum(np.concatenate(([0.0], values)))
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - window, 0)
+    return (sums[ends] - sums[starts]) / (ends - starts)
+
+
+def weekly_trend(created_at: np.ndarray, intensity: np.ndarray) -> Optional[float]:
+    """Least-squares slope of intensity over time, per week."""
+    seconds = created_at.astype(np.int64).astype(np.float64)
+    if len(seconds) < 2 or np.ptp(seconds) == 0:
+        return None
+    slope = np.polyfit(seconds - seconds[0], intensity, 1)[0]
+    return round(float(slope * _SECONDS_PER_WEEK), 3)
+
+
+def _time_buckets(buckets: np.ndarray, intensity: np.ndarray, size: int) -> List[TimeBucketDTO]:
+    counts, means = _group_means(buckets, intensity, size)
+    return [
+        TimeBucketDTO(bucket=b, sessions=int(counts[b]), average_intensity=_round(means[b]))
+        for b in range(size)
+    ]
+
+
+def _emotion_stats(columns: WaveColumns) -> List[EmotionStatDTO]:
+    named = columns.emotion != ""
+    emotions, groups = np.unique(np.char.lower(columns.emotion[named]), return_inverse=True)
+    counts, means = _group_means(groups, columns.intensity[named], len(emotions))
+    order = np.argsort(-counts, kind="stable")
+    return [
+        EmotionStatDTO(emotion=str(emotions[i]), sessions=int(counts[i]), average_intensity=_round(means[i]))
+        for i in order
+    ]
+
+
+def _action_stats(columns: WaveColumns) -> List[ActionStatDTO]:
+    # Change to the following check-in; the last one has none yet
+    change = np.full(len(columns), np.nan)
+    change[:-1] = np.diff(columns.intensity)
+
+    chosen = columns.action_type != None  # noqa: E711 - elementwise on an object array
+    actions, groups = np.unique(columns.action_type[chosen].astype(str), return_inverse=True)
+    size = len(actions)
+    completed = columns.action_completed[chosen]
+    counts, completion = _group_means(groups, completed.astype(np.float64), size)
+
+    duration = columns.actual_duration[chosen]
+    timed = completed & ~np.isnan(duration)
+    _, durations = _group_means(groups[timed], duration[timed], size)
+
+    change = change[chosen]
+    followed = ~np.isnan(change)
+    _, changes = _group_means(groups[followed], change[followed], size)
+
+    order = np.lexsort((-counts, np.nan_to_num(changes, nan=np.inf)))
+    return [
+        ActionStatDTO(
+            action_type=str(actions[i]),
+            sessions=int(counts[i]),
+            completion_rate=round(float(completion[i]), 3),
+            average_duration=_round(durations[i]),
+            average_intensity_change=_round(changes[i]),
+        )
+        for i in order
+    ]
+
+
+def compute_patterns(user_id: UUID, columns: WaveColumns, now: Optional[datetime] = None) -> WavePatternsDTO:
+    """
+    Fold a user's WAVE columns into trends with array operations.
+
+    Times are bucketed in UTC. Actions are ordered most effective first:
+    by the average change in intensity at the next check-in (most negative
+    first), then by how often they were used.
+    """
+    intensity = columns.intensity
+    rolling = rolling_means(intensity, ROLLING_WINDOW)
+
+    days = columns.created_at.astype("datetime64[D]")
+    hours = (columns.created_at.astype("datetime64[h]") - days).astype(np.int64)
+    weekdays = (days.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+
+    return WavePatternsDTO(
+        user_id=user_id,
+        sessions=len(columns),
+        average_intensity=_round(intensity.mean()) if len(columns) else None,
+        intensity_trend_per_week=weekly_trend(columns.created_at, intensity),
+        rolling_window=ROLLING_WINDOW,
+        intensity=[
+            IntensityPointDTO(at=at, intensity=int(value), rolling_mean=round(float(mean), 2))
+            for at, value, mean in zip(columns.created_at.tolist(), intensity, rolling)
+        ],
+        by_hour=_time_buckets(hours, intensity, 24),
+        by_weekday=_time_buckets(weekdays, intensity, 7),
+        emotions=_emotion_stats(columns),
+        actions=_action_stats(columns),
+        computed_at=now or datetime.utcnow(),
+    )
+
+
+class PatternService:
+    """Service for WAVE pattern analytics."""
+
+    def __init__(self, query: WavePatternQuery, cache: Optional[PatternCache] = None):
+        self.query = query
+        self.cache = cache
+
+    async def get_patterns(self, user_id: UUID) -> WavePatternsDTO:
+        """
+        Get a user's WAVE patterns.
+
+        Served from the per-user cache when the user has not had a WAVE
+        session event since it was computed.
+        """
+        if self.cache is None:
+            return compute_patterns(user_id, await self.query.load(user_id))
+
+        patterns = self.cache.get(user_id)
+        if patterns is None:
+            generation = self.cache.generation(user_id)
+            patterns = compute_patterns(user_id, await self.query.load(user_id))
+            self.cache.put(user_id, patterns, generation)
+        return patterns
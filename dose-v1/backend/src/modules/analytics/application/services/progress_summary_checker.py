@@ -0,0 +1,121 @@
+"""
+Progress Summary Consistency Checker
+Compares user_progress_summary with a replay of every user's session history.
+
+Run by hand with:
+    python -m src.modules.analytics.application.services.progress_summary_checker [--repair]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.archive import SessionArchive
+from src.infrastructure.logging import get_logger
+from src.infrastructure.projections.history import load_history
+from src.modules.analytics.infrastructure.projections.progress_summary_projection import (
+    ProgressSummaryProjection,
+    progress_summary_projection,
+)
+from src.modules.analytics.infrastructure.repositories.progress_summary_repository import ProgressSummaryRepository
+
+logger = get_logger(__name__)
+
+# Columns derived from history; updated_at is bookkeeping
+COMPARED_COLUMNS = tuple(
+    column for column in ProgressSummaryProjection.columns if column not in ("user_id", "updated_at")
+)
+
+
+class ProgressSummaryChecker:
+    """
+    Finds (and optionally repairs) summaries that drifted from the sessions.
+
+    Drift comes from changes that emit no events, such as deleted sessions,
+    or from events lost before they reached event_store. Users with events
+    stored in the last `quiet_seconds` (or still in the outbox) are skipped:
+    the projection may not have applied them yet. This goes by stored_at,
+    not occurred_at, since offline sessions synced late are backdated. Each batch locks the summary rows it checks, so a
+    repair cannot overwrite an update applied meanwhile.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = 500,
+        quiet_seconds: float = 300,
+        archive: Optional[SessionArchive] = None
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.quiet_seconds = quiet_seconds
+        self.archive = archive
+        self.projection = progress_summary_projection
+
+    async def run(self, repair: bool = False, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Check every user. Returns users checked, skipped, mismatched and repaired."""
+        cutoff = (now or datetime.utcnow()) - timedelta(seconds=self.quiet_seconds)
+        report = {"checked": 0, "skipped": 0, "mismatched": 0, "repaired": 0}
+        after = None
+        while True:
+            async with self.session_factory() as db:
+                user_ids = await ProgressSummaryRepository(db).get_user_ids_after(after, self.batch_size)
+                if not user_ids:
+                    return report
+                after = user_ids[-1]
+
+                recent = await ProgressSummaryRepository(db).get_user_ids_with_events_since(user_ids, cutoff)
+                history = await load_history(db, user_ids, archive=self.archive)
+                stored = await self.projection.load(db, user_ids, for_update=repair)
+                repairs: List[dict] = []
+                for user_id in user_ids:
+                    if user_id in recent:
+                        report["skipped"] += 1
+                        continue
+                    report["checked"] += 1
+
+                    expected_rows = {}
+                    for event in history.get(user_id, []):
+                        if self.projection.handles(event):
+                            self.projection.apply(expected_rows, event)
+                    expected = expected_rows.get((user_id,))
+                    actual = stored.get(user_id, {}).get((user_id,))
+                    if self._matches(user_id, expected, actual):
+                        continue
+
+                    report["mismatched"] += 1
+                    logger.warning(f"Progress summary of user {user_id} is stale: stored {actual}, expected {expected}")
+                    if repair:
+                        repairs.append(expected or self.projection.empty_row(user_id))
+
+                if repairs:
+                    await self.projection.save(db, repairs)
+                    report["repaired"] += len(repairs)
+                await db.commit()
+
+    def _matches(self, user_id, expected: Optional[dict], actual: Optional[dict]) -> bool:
+        empty = self.projection.empty_row(user_id)
+        expected, actual = expected or empty, actual or empty
+        return all(expected[column] == actual[column] for column in COMPARED_COLUMNS)
+
+
+async def main() -> None:
+    from src.infrastructure.archive import session_archive
+    from src.infrastructure.config.settings import settings
+    from src.infrastructure.database.session import AsyncSessionLocal, engine
+
+    parser = argparse.ArgumentParser(description="Check user_progress_summary against session history")
+    parser.add_argument("--repair", action="store_true", help="Overwrite stale summaries")
+    args = parser.parse_args()
+
+    checker = ProgressSummaryChecker(AsyncSessionLocal, batch_size=settings.PROJECTION_BATCH_SIZE, archive=session_archive)
+    report = await checker.run(repair=args.repair)
+    print(f"Progress summaries: {report}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
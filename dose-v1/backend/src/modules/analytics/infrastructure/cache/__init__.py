@@ -0,0 +1,15 @@
+"""Per-process caches of analytics results."""
+
+from src.infrastructure.config.settings import settings
+from .pattern_cache import PatternCache
+
+# Shared by the /analytics/patterns endpoint and its event bus subscription
+pattern_cache = PatternCache(
+    max_users=settings.ANALYTICS_PATTERN_CACHE_USERS,
+    ttl_seconds=settings.ANALYTICS_PATTERN_CACHE_TTL_SECONDS
+)
+
+__all__ = [
+    "PatternCache",
+    "pattern_cache",
+]
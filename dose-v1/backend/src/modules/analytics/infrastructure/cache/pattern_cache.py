@@ -0,0 +1,43 @@
+"""
+Pattern Cache
+Per-user cache of computed WAVE patterns, invalidated by session events
+"""
+
+from typing import Dict
+from uuid import UUID
+
+from src.core.domain.events import SessionEvent
+from src.infrastructure.cache import GenerationalLRU
+
+
+class PatternCache(GenerationalLRU):
+    """
+    Bounded LRU of pattern results keyed by user.
+
+    Entries are dropped when one of the user's WAVE sessions starts, advances
+    or completes (the cache subscribes to session events on the event bus).
+    Events only reach the process that handled the write, and deletes emit
+    none, so entries also expire after `ttl_seconds`. A result computed while
+    an invalidation arrived is not stored.
+    """
+
+    def __init__(self, max_users: int = 10000, ttl_seconds: float = 300.0):
+        super().__init__(max_users, ttl_seconds)
+        self.invalidations = 0
+
+    def invalidate(self, user_id: UUID) -> None:
+        super().invalidate(user_id)
+        self.invalidations += 1
+
+    async def on_session_event(self, event: SessionEvent) -> None:
+        """Event bus subscriber."""
+        if event.session_type == "wave":
+            self.invalidate(event.user_id)
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "users": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,74 @@
+"""
+Analytics SQLAlchemy Models - Infrastructure Layer
+Read models maintained from session events, and batch reports
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import BigInteger, Date, Integer, DateTime, JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from src.infrastructure.database.session import Base
+
+
+class UserProgressSummary(Base):
+    """Per-user SPARK/WAVE counts, kept current by the user_progress_summary projection."""
+    __tablename__ = "user_progress_summary"
+
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    spark_started: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    spark_completed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    spark_last_completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    wave_started: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    wave_completed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    wave_last_completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ActivityRollup(Base):
+    """
+    SPARK/WAVE activity of one user in one local hour, day or week, kept
+    current by the activity_rollups projection.
+    """
+    __tablename__ = "activity_rollups"
+
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    granularity: Mapped[str] = mapped_column(String(10), primary_key=True)  # "hour", "day" or "week"
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)  # User's local time
+    spark_started: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    spark_completed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    wave_started: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    wave_completed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Over completed WAVE sessions; the mean is intensity_sum / intensity_count
+    intensity_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    intensity_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    intensity_max: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    action_counts: Mapped[Dict[str, int]] = mapped_column(JSON, default=dict, nullable=False)  # action_type -> completions
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class UserStreak(Base):
+    """Daily practice streak of a user, kept current by the user_streaks projection."""
+    __tablename__ = "user_streaks"
+
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    current_streak: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # Run ending on last_active_date
+    longest_streak: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_active_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)  # User's local date
+    active_days: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)  # Bit k: active k days before it
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class CohortReport(Base):
+    """One run of the cohort analytics batch job over all SPARK/WAVE sessions."""
+    __tablename__ = "cohort_reports"
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    source: Mapped[str] = mapped_column(String(20), nullable=False)  # "replica" or "primary"
+    chunks: Mapped[int] = mapped_column(Integer, nullable=False)
+    rows_scanned: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    report: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    completed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
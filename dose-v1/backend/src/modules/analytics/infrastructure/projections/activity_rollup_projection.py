@@ -0,0 +1,95 @@
+"""
+Activity Rollup Projection
+Folds session starts and completions into hourly, daily and weekly buckets
+in each user's local time
+"""
+
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.domain.events import SessionCompleted, SessionEvent, SessionStarted
+from src.infrastructure.projections import Projection, Rows
+from src.modules.analytics.infrastructure.projections.time_zones import load_user_zones, to_local
+
+GRANULARITIES = ("hour", "day", "week")
+
+
+def local_buckets(occurred_at: datetime, zone: tzinfo) -> List[Tuple[str, datetime]]:
+    """Start of the local hour, day and week (from Monday) containing a UTC instant."""
+    hour = to_local(occurred_at, zone).replace(minute=0, second=0, microsecond=0)
+    day = hour.replace(hour=0)
+    return [("hour", hour), ("day", day), ("week", day - timedelta(days=day.weekday()))]
+
+
+class ActivityRollupProjection(Projection):
+    """
+    One row per user, granularity and local bucket start.
+
+    The context of a user is their time zone, read from users when a batch
+    is applied; a zone change re-buckets only later activity until the
+    projection is rebuilt. Every event touches exactly three rows, and only
+    those are loaded.
+    """
+
+    name = "activity_rollups"
+    table = "activity_rollups"
+    columns = (
+        "user_id", "granularity", "bucket_start",
+        "spark_started", "spark_completed", "wave_started", "wave_completed",
+        "intensity_sum", "intensity_count", "intensity_max", "action_counts",
+        "updated_at",
+    )
+    key_columns = ("user_id", "granularity", "bucket_start")
+    event_types = (SessionStarted, SessionCompleted)
+
+    @staticmethod
+    def empty_row(user_id: UUID, granularity: str, bucket_start: datetime) -> Dict[str, Any]:
+        return {
+            "user_id": user_id, "granularity": granularity, "bucket_start": bucket_start,
+            "spark_started": 0, "spark_completed": 0, "wave_started": 0, "wave_completed": 0,
+            "intensity_sum": 0, "intensity_count": 0, "intensity_max": None, "action_counts": {},
+            "updated_at": datetime.utcnow(),
+        }
+
+    async def load_context(self, db: AsyncSession, user_ids: Sequence[UUID]) -> Dict[UUID, Any]:
+        return await load_user_zones(db, user_ids)
+
+    def touched_keys(
+        self,
+        events: Mapping[UUID, Sequence[SessionEvent]],
+        context: Mapping[UUID, Any]
+    ) -> List[Tuple[Any, ...]]:
+        return list({
+            (user_id, granularity, start)
+            for user_id, user_events in events.items()
+            for event in user_events
+            for granularity, start in local_buckets(event.occurred_at, context.get(user_id) or timezone.utc)
+        })
+
+    def apply(self, rows: Rows, event: SessionEvent, context: Any = None) -> None:
+        prefix = event.session_type
+        for granularity, start in local_buckets(event.occurred_at, context or timezone.utc):
+            key = (event.user_id, granularity, start)
+            row = rows.setdefault(key, self.empty_row(*key))
+            if isinstance(event, SessionStarted):
+                row[f"{prefix}_started"] += 1
+            else:
+                row[f"{prefix}_completed"] += 1
+                intensity = getattr(event, "intensity", None)
+                if intensity is not None:
+                    row["intensity_sum"] += intensity
+                    row["intensity_count"] += 1
+                    row["intensity_max"] = max(row["intensity_max"] or 0, intensity)
+                action_type = getattr(event, "action_type", None)
+                if action_type:
+                    counts = dict(row["action_counts"])
+                    counts[action_type] = counts.get(action_type, 0) + 1
+                    row["action_counts"] = counts
+            row["updated_at"] = datetime.utcnow()
+
+
+# Registered in src.infrastructure.projections.projection.PROJECTIONS
+activity_rollup_projection = ActivityRollupProjection()
@@ -0,0 +1,49 @@
+"""
+User Progress Summary Projection
+Folds session starts and completions into user_progress_summary
+"""
+
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID
+
+from src.core.domain.events import SessionCompleted, SessionEvent, SessionStarted
+from src.infrastructure.projections import Projection, Rows
+
+
+class ProgressSummaryProjection(Projection):
+    """One row per user with started/completed counts per session type."""
+
+    name = "user_progress_summary"
+    table = "user_progress_summary"
+    columns = (
+        "user_id",
+        "spark_started", "spark_completed", "spark_last_completed_at",
+        "wave_started", "wave_completed", "wave_last_completed_at",
+        "updated_at",
+    )
+    event_types = (SessionStarted, SessionCompleted)
+
+    @staticmethod
+    def empty_row(user_id: UUID) -> Dict[str, Any]:
+        return {
+            "user_id": user_id,
+            "spark_started": 0, "spark_completed": 0, "spark_last_completed_at": None,
+            "wave_started": 0, "wave_completed": 0, "wave_last_completed_at": None,
+            "updated_at": datetime.utcnow(),
+        }
+
+    def apply(self, rows: Rows, event: SessionEvent, context: Any = None) -> None:
+        row = rows.setdefault((event.user_id,), self.empty_row(event.user_id))
+        prefix = event.session_type
+        if isinstance(event, SessionStarted):
+            row[f"{prefix}_started"] += 1
+        else:
+            row[f"{prefix}_completed"] += 1
+            last = row[f"{prefix}_last_completed_at"]
+            row[f"{prefix}_last_completed_at"] = max(last, event.occurred_at) if last else event.occurred_at
+        row["updated_at"] = datetime.utcnow()
+
+
+# Registered in src.infrastructure.projections.projection.PROJECTIONS
+progress_summary_projection = ProgressSummaryProjection()
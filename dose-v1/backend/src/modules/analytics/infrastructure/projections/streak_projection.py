@@ -0,0 +1,93 @@
+"""
+Streak Projection
+Folds session completions into each user's daily practice streak
+"""
+
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.domain.events import SessionCompleted, SessionEvent
+from src.infrastructure.projections import Projection, Rows
+from src.modules.analytics.infrastructure.projections.time_zones import load_user_zones, to_local
+
+# Days remembered in active_days, bit k = k days before last_active_date.
+# 63 keeps the mask a positive BIGINT.
+WINDOW = 63
+_FULL = (1 << WINDOW) - 1
+
+
+def trailing_ones(mask: int) -> int:
+    return (mask ^ (mask + 1)).bit_length() - 1
+
+
+def add_active_day(row: Dict[str, Any], day: date) -> None:
+    """
+    Mark a local date active, updating the streak in O(1).
+
+    Dates after last_active_date shift the window; earlier ones (sessions
+    synced late) set their bit and, when that closes the gap before the
+    current run, extend it. Runs reaching past the window are counted up to
+    its edge, and dates before it are ignored; the rebuild is exact.
+    """
+    last = row["last_active_date"]
+    if last is None:
+        row.update(last_active_date=day, active_days=1, current_streak=1)
+    elif day > last:
+        gap = (day - last).days
+        row["active_days"] = ((row["active_days"] << gap) | 1) & _FULL if gap < WINDOW else 1
+        row["current_streak"] = row["current_streak"] + 1 if gap == 1 else 1
+        row["last_active_date"] = day
+    else:
+        k = (last - day).days
+        mask = row["active_days"]
+        if k >= WINDOW or mask >> k & 1:
+            return
+        mask |= 1 << k
+        row["active_days"] = mask
+        older = trailing_ones(mask >> (k + 1))
+        below = ~mask & ((1 << k) - 1)
+        newer = k - below.bit_length() if below else k
+        run = older + 1 + newer
+        if newer == k:  # The gap was right before the current run
+            row["current_streak"] = max(row["current_streak"], run)
+        row["longest_streak"] = max(row["longest_streak"], run)
+    row["longest_streak"] = max(row["longest_streak"], row["current_streak"])
+
+
+class StreakProjection(Projection):
+    """
+    One row per user: current and longest run of local days with at least
+    one completed SPARK or WAVE session, the last such day and a bitmask of
+    the days before it.
+
+    The stored current_streak is the run ending on last_active_date; it is
+    broken once a whole local day passes without activity, which readers
+    check against the user's today.
+    """
+
+    name = "user_streaks"
+    table = "user_streaks"
+    columns = ("user_id", "current_streak", "longest_streak", "last_active_date", "active_days", "updated_at")
+    event_types = (SessionCompleted,)
+
+    @staticmethod
+    def empty_row(user_id: UUID) -> Dict[str, Any]:
+        return {
+            "user_id": user_id, "current_streak": 0, "longest_streak": 0,
+            "last_active_date": None, "active_days": 0, "updated_at": datetime.utcnow(),
+        }
+
+    async def load_context(self, db: AsyncSession, user_ids: Sequence[UUID]) -> Dict[UUID, Any]:
+        return await load_user_zones(db, user_ids)
+
+    def apply(self, rows: Rows, event: SessionEvent, context: Any = None) -> None:
+        row = rows.setdefault((event.user_id,), self.empty_row(event.user_id))
+        add_active_day(row, to_local(event.occurred_at, context or timezone.utc).date())
+        row["updated_at"] = datetime.utcnow()
+
+
+# Registered in src.infrastructure.projections.projection.PROJECTIONS
+streak_projection = StreakProjection()
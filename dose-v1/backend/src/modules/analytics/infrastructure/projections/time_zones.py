@@ -0,0 +1,36 @@
+"""
+User Time Zones
+Projection context for read models kept in the user's local time
+"""
+
+from datetime import date, datetime, timezone, tzinfo
+from typing import Dict, Optional, Sequence
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.auth.infrastructure.persistence.models import User
+
+
+def user_zone(name: str) -> tzinfo:
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.utc
+
+
+def to_local(occurred_at: datetime, zone: tzinfo) -> datetime:
+    """Naive UTC instant as naive local time."""
+    return occurred_at.replace(tzinfo=timezone.utc).astimezone(zone).replace(tzinfo=None)
+
+
+def local_today(zone: tzinfo, now: Optional[datetime] = None) -> date:
+    return to_local(now or datetime.utcnow(), zone).date()
+
+
+async def load_user_zones(db: AsyncSession, user_ids: Sequence[UUID]) -> Dict[UUID, tzinfo]:
+    """Time zone of each user."""
+    result = await db.execute(select(User.id, User.timezone).where(User.id.in_(list(user_ids))))
+    return {user_id: user_zone(name) for user_id, name in result.all()}
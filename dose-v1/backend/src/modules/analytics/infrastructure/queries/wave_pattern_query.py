@@ -0,0 +1,67 @@
+"""
+WAVE Pattern Query - Infrastructure Layer
+Loads a user's WAVE check-ins as columnar NumPy arrays
+"""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.wave.infrastructure.persistence.models import WaveSession
+
+_COLUMNS = (
+    WaveSession.created_at,
+    WaveSession.intensity,
+    WaveSession.emotion,
+    WaveSession.action_type,
+    WaveSession.action_completed,
+    WaveSession.actual_duration,
+)
+
+
+@dataclass(slots=True)
+class WaveColumns:
+    """One array per column, one element per checked-in session, in created_at order."""
+    created_at: np.ndarray        # datetime64[s]
+    intensity: np.ndarray         # float64
+    emotion: np.ndarray           # str
+    action_type: np.ndarray       # object, None where no action was chosen
+    action_completed: np.ndarray  # bool
+    actual_duration: np.ndarray   # float64 seconds, NaN where not recorded
+
+    def __len__(self) -> int:
+        return len(self.intensity)
+
+
+class WavePatternQuery:
+    """Projected read of the WAVE columns pattern analysis needs."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def load(self, user_id: UUID) -> WaveColumns:
+        """
+        Every WAVE session of the user that got past check-in.
+
+        Only the six analysed columns are selected (no free text) and rows
+        are transposed straight into arrays, without ORM objects. Archived
+        sessions are not included.
+        """
+        result = await self.session.execute(
+            select(*_COLUMNS)
+            .where(WaveSession.user_id == user_id, WaveSession.intensity.is_not(None))
+            .order_by(WaveSession.created_at)
+        )
+        columns = list(zip(*result.all())) or [()] * len(_COLUMNS)
+        created_at, intensity, emotion, action_type, action_completed, actual_duration = columns
+        return WaveColumns(
+            created_at=np.array(created_at, dtype="datetime64[s]"),
+            intensity=np.array(intensity, dtype=np.float64),
+            emotion=np.array([e or "" for e in emotion], dtype=str),
+            action_type=np.array(action_type, dtype=object),
+            action_completed=np.array(action_completed, dtype=bool),
+            actual_duration=np.array(actual_duration, dtype=np.float64),  # None -> NaN
+        )
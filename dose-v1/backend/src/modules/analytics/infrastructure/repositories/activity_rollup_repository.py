@@ -0,0 +1,43 @@
+"""
+Activity Rollup Repository - Infrastructure Layer
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.analytics.infrastructure.persistence.models import ActivityRollup
+from src.modules.auth.infrastructure.persistence.models import User
+
+
+class ActivityRollupRepository:
+    """Reads activity_rollups rows (written by its projection)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_range(
+        self,
+        user_id: UUID,
+        granularity: str,
+        start: datetime,
+        end: datetime
+    ) -> List[ActivityRollup]:
+        """Buckets starting in [start, end), oldest first; a primary-key range scan."""
+        result = await self.session.execute(
+            select(ActivityRollup)
+            .where(
+                ActivityRollup.user_id == user_id,
+                ActivityRollup.granularity == granularity,
+                ActivityRollup.bucket_start >= start,
+                ActivityRollup.bucket_start < end,
+            )
+            .order_by(ActivityRollup.bucket_start)
+        )
+        return list(result.scalars().all())
+
+    async def get_timezone(self, user_id: UUID) -> Optional[str]:
+        """The user's IANA time zone."""
+        return await self.session.scalar(select(User.timezone).where(User.id == user_id))
@@ -0,0 +1,40 @@
+"""
+Progress Summary Repository - Infrastructure Layer
+"""
+
+from datetime import datetime
+from typing import List, Optional, Sequence, Set
+from uuid import UUID
+from sqlalchemy import select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.event_store.models import OutboxEvent, StoredEvent
+from src.modules.analytics.infrastructure.persistence.models import UserProgressSummary
+from src.modules.auth.infrastructure.persistence.models import User
+
+
+class ProgressSummaryRepository:
+    """Reads user_progress_summary rows (written by its projection)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, user_id: UUID) -> Optional[UserProgressSummary]:
+        """Primary-key lookup of one user's summary."""
+        return await self.session.get(UserProgressSummary, user_id)
+
+    async def get_user_ids_after(self, after: Optional[UUID], limit: int) -> List[UUID]:
+        """Keyset page of all user ids (with or without a summary), in id order."""
+        query = select(User.id).order_by(User.id).limit(limit)
+        if after:
+            query = query.where(User.id > after)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_user_ids_with_events_since(self, user_ids: Sequence[UUID], since: datetime) -> Set[UUID]:
+        """Users among `user_ids` with events stored since `since`, or still in the outbox."""
+        result = await self.session.execute(union(
+            select(StoredEvent.user_id).where(StoredEvent.user_id.in_(user_ids), StoredEvent.stored_at >= since),
+            select(OutboxEvent.user_id).where(OutboxEvent.user_id.in_(user_ids)),
+        ))
+        return set(result.scalars().all())
@@ -0,0 +1,29 @@
+"""
+Streak Repository - Infrastructure Layer
+"""
+
+from typing import Optional, Tuple
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.analytics.infrastructure.persistence.models import UserStreak
+from src.modules.auth.infrastructure.persistence.models import User
+
+
+class StreakRepository:
+    """Reads user_streaks rows (written by its projection)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_with_timezone(self, user_id: UUID) -> Tuple[Optional[UserStreak], str]:
+        """The user's streak row (None before their first completion) and time zone, in one query."""
+        result = await self.session.execute(
+            select(UserStreak, User.timezone)
+            .select_from(User)
+            .outerjoin(UserStreak, UserStreak.user_id == User.id)
+            .where(User.id == user_id)
+        )
+        row = result.first()
+        return (row[0], row[1]) if row else (None, "UTC")
@@ -2,13 +2,15 @@
 Enhanced Auth API Endpoints with Logout, Password Reset, and OAuth
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
+from functools import partial
 
-from src.infrastructure.database.session import get_db
+from src.infrastructure.database.session import get_db, AsyncSessionLocal, after_commit
+from src.infrastructure.drafts import draft_buffer
 from src.infrastructure.logging import get_logger
 from src.modules.auth.api.schemas.auth_schemas import (
     RegisterRequest,
@@ -19,14 +21,17 @@ from src.modules.auth.api.schemas.auth_schemas import (
     ForgotPasswordRequest,
     ResetPasswordRequest,
     MessageResponse,
-    PasswordResetResponse
+    PasswordResetResponse,
+    UpdateTimezoneRequest
 )
 from src.modules.auth.application.dto.auth_dto import RegisterUserDTO, LoginDTO
 from src.modules.auth.application.services.auth_service_enhanced import AuthServiceEnhanced
+from src.modules.auth.application.services.data_export_service import DataExportService, ExportFormat
 from src.modules.auth.infrastructure.repositories.user_repository import UserRepository
 from src.modules.auth.infrastructure.repositories.token_blacklist_repository import TokenBlacklistRepository
 from src.modules.auth.infrastructure.repositories.password_reset_repository import PasswordResetRepository
 from src.modules.auth.infrastructure.repositories.oauth_repository import OAuthAccountRepository
+from src.modules.auth.infrastructure.repositories.account_erasure_repository import AccountErasureRepository
 from src.modules.auth.infrastructure.oauth.oauth_service import OAuthService, oauth
 from src.infrastructure.config.settings import settings
 
@@ -41,7 +46,8 @@ def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthServiceEnhanced:
     token_blacklist_repo = TokenBlacklistRepository(db)
     password_reset_repo = PasswordResetRepository(db)
     oauth_repo = OAuthAccountRepository(db)
-    return AuthServiceEnhanced(user_repository, token_blacklist_repo, password_reset_repo, oauth_repo)
+    erasure_repo = AccountErasureRepository(db)
+    return AuthServiceEnhanced(user_repository, token_blacklist_repo, password_reset_repo, oauth_repo, erasure_repo)
 
 
 async def get_current_user_id(
@@ -105,6 +111,43 @@ async def get_current_user(
     return user
 
 
+@router.put("/me/timezone", response_model=UserResponse)
+async def update_timezone(
+    request: UpdateTimezoneRequest,
+    user_id: UUID = Depends(get_current_user_id),
+    auth_service: AuthServiceEnhanced = Depends(get_auth_service)
+):
+    """Set the time zone that activity charts use for hours and days."""
+    try:
+        return await auth_service.update_timezone(user_id, request.timezone)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/me/export")
+async def export_my_data(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    Export all personal data for the current user.
+
+    Streams the account record, linked OAuth accounts, every SPARK and WAVE
+    session (archived ones included), unsaved step drafts and POPCORN ideas
+    as NDJSON (one record per line) or CSV. Each record carries a
+    `record_type` field.
+    """
+    export_service = DataExportService(AsyncSessionLocal)
+    logger.info(f"Data export requested: {user_id} ({export_format.value})")
+    return StreamingResponse(
+        export_service.stream(user_id, export_format),
+        media_type=export_format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="dose-export-{user_id}.{export_format.value}"'
+        }
+    )
+
+
 # ========== New Endpoints: Logout ==========
 
 @router.post("/logout", response_model=MessageResponse)
@@ -130,15 +173,20 @@ async def logout(
 async def delete_account(
     request: DeleteAccountRequest,
     user_id: UUID = Depends(get_current_user_id),
-    auth_service: AuthServiceEnhanced = Depends(get_auth_service)
+    auth_service: AuthServiceEnhanced = Depends(get_auth_service),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete user account permanently.
     Requires password confirmation for security.
+
+    Access is revoked immediately; stored data is erased in the background.
+    Drafts still buffered in memory are dropped once the deletion commits.
     """
     try:
         await auth_service.delete_account(user_id, request.password)
-        logger.info(f"User account deleted: {user_id}")
+        after_commit(db, partial(draft_buffer.forget_user, user_id))
+        logger.info(f"User account marked for erasure: {user_id}")
         return MessageResponse(message="Account successfully deleted")
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
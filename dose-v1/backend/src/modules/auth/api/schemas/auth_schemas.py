@@ -30,6 +30,7 @@ class UserResponse(BaseModel):
     full_name: Optional[str]
     is_active: bool
     is_verified: bool
+    timezone: str = "UTC"
 
     class Config:
         from_attributes = True
@@ -53,6 +54,11 @@ class ResetPasswordRequest(BaseModel):
     new_password: str = Field(..., min_length=8, description="New password (min 8 characters)")
 
 
+class UpdateTimezoneRequest(BaseModel):
+    """Request schema for setting the user's time zone."""
+    timezone: str = Field(..., min_length=1, max_length=64, description="IANA time zone, e.g. Europe/Berlin")
+
+
 class MessageResponse(BaseModel):
     """Generic message response."""
     message: str
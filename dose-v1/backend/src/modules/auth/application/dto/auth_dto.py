@@ -6,31 +6,32 @@ from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
 
-@dataclass
+@dataclass(slots=True)
 class RegisterUserDTO:
     """DTO for user registration."""
     email: str
     password: str
     full_name: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class LoginDTO:
     """DTO for user login."""
     email: str
     password: str
 
-@dataclass
+@dataclass(slots=True)
 class TokenDTO:
     """DTO for token response."""
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
 
-@dataclass
+@dataclass(slots=True)
 class UserDTO:
     """DTO for user response."""
     id: UUID
     email: str
     full_name: Optional[str]
     is_active: bool
-    is_verified: bool
\ No newline at end of file
+    is_verified: bool
+    timezone: str = "UTC"
@@ -0,0 +1,117 @@
+"""
+Account Erasure Service - Application Layer
+Removes a deleted account's data in bounded batches outside the request.
+"""
+
+import asyncio
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.archive import SessionArchive, session_archive
+from src.infrastructure.logging import get_logger
+from src.modules.auth.infrastructure.repositories.account_erasure_repository import (
+    AccountErasureRepository,
+    ERASURE_STEPS,
+)
+
+logger = get_logger(__name__)
+
+
+class AccountErasureService:
+    """
+    Background worker for account erasure.
+
+    `AuthServiceEnhanced.delete_account` only marks the user deleted (which
+    revokes their tokens) and records a pending erasure. This service then
+    deletes the user's rows table by table, at most `batch_size` rows per
+    transaction, recording progress after each batch. Pending erasures are
+    picked up by polling, so work interrupted by a restart resumes on its own.
+
+    Every app process runs this worker. Each erasure is claimed first (a
+    transaction-scoped advisory lock, held for as long as it runs), so two
+    processes never erase the same account at once. The claim goes away with
+    its process, and the erasure is then picked up again.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = 500,
+        poll_seconds: float = 10.0,
+        archive: Optional[SessionArchive] = None
+    ):
+        self.session_factory = session_factory
+        self.archive = archive or session_archive
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+
+    async def erase(self, user_id: UUID) -> int:
+        """
+        Erase all data for one user.
+
+        Args:
+            user_id: UUID of the user marked for deletion.
+
+        Returns:
+            Number of rows deleted.
+        """
+        total = 0
+        for step in ERASURE_STEPS:
+            while True:
+                async with self.session_factory() as session:
+                    repo = AccountErasureRepository(session)
+                    deleted = await repo.delete_batch(step, user_id, self.batch_size)
+                    await repo.record_progress(user_id, step, deleted)
+                    await session.commit()
+                total += deleted
+                if deleted < self.batch_size:
+                    break
+
+        async with self.session_factory() as session:
+            repo = AccountErasureRepository(session)
+            archived = await self.archive.remove_user(session, user_id)
+            await repo.record_progress(user_id, "archived_sessions", archived)
+            total += archived
+            deleted = await repo.delete_user(user_id)
+            await repo.record_progress(user_id, "users", deleted)
+            await repo.mark_completed(user_id)
+            await session.commit()
+        # The archive deletes the user's segment files once the index rows are gone
+        await self.archive.wait_for_cleanups()
+        total += deleted
+
+        logger.info(f"Account erasure completed for {user_id}: {total} rows deleted")
+        return total
+
+    async def run_pending(self) -> int:
+        """Erase every pending account not claimed elsewhere. Returns the number of accounts processed."""
+        processed = 0
+        while True:
+            async with self.session_factory() as session:
+                user_ids = await AccountErasureRepository(session).get_pending_user_ids()
+            claimed = 0
+            for user_id in user_ids:
+                async with self.session_factory() as claim:
+                    if not await AccountErasureRepository(claim).claim(user_id):
+                        continue  # Being erased by another process
+                    await self.erase(user_id)
+                    await claim.rollback()  # Release the claim
+                claimed += 1
+            processed += claimed
+            if not claimed:
+                return processed
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Poll for pending erasures until `stop` is set or the task is cancelled."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                await self.run_pending()
+            except Exception as e:
+                logger.error(f"Account erasure batch failed, will retry: {e}")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
@@ -11,6 +11,7 @@ from src.modules.auth.infrastructure.repositories.user_repository import IUserRe
 from src.modules.auth.application.dto.auth_dto import RegisterUserDTO, LoginDTO, TokenDTO, UserDTO
 from src.core.utils.security.password import hash_password, verify_password
 from src.modules.auth.infrastructure.jwt.token_service import TokenService
+from src.infrastructure.logging import bind_log_context
 
 class AuthService:
     """Service handling authentication business logic."""
@@ -73,13 +74,17 @@ class AuthService:
             return None
 
         user = await self.user_repository.get_by_id(user_id)
-        return self._to_dto(user) if user else None
+        if not user or user.is_deleted():
+            return None
+        # Every later log line of this request carries the user
+        bind_log_context(user_id=str(user.id))
+        return self._to_dto(user)
 
     @staticmethod
     def _to_dto(user: User) -> UserDTO:
         """Convert entity to DTO."""
         return UserDTO(id=user.id, email=user.email, full_name=user.full_name,
-            is_active=user.is_active, is_verified=user.is_verified)
+            is_active=user.is_active, is_verified=user.is_verified, timezone=user.timezone)
 
     
 
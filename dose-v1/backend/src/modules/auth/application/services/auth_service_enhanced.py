@@ -13,6 +13,7 @@ from src.modules.auth.infrastructure.repositories.user_repository import IUserRe
 from src.modules.auth.infrastructure.repositories.token_blacklist_repository import TokenBlacklistRepository
 from src.modules.auth.infrastructure.repositories.password_reset_repository import PasswordResetRepository
 from src.modules.auth.infrastructure.repositories.oauth_repository import OAuthAccountRepository
+from src.modules.auth.infrastructure.repositories.account_erasure_repository import AccountErasureRepository
 from src.modules.auth.application.dto.auth_dto import (
     RegisterUserDTO,
     LoginDTO,
@@ -21,6 +22,7 @@ from src.modules.auth.application.dto.auth_dto import (
 )
 from src.core.utils.security.password import hash_password, verify_password
 from src.modules.auth.infrastructure.jwt.token_service import TokenService
+from src.infrastructure.logging import bind_log_context
 
 
 class AuthServiceEnhanced:
@@ -31,12 +33,14 @@ class AuthServiceEnhanced:
         user_repository: IUserRepository,
         token_blacklist_repo: TokenBlacklistRepository,
         password_reset_repo: PasswordResetRepository,
-        oauth_repo: OAuthAccountRepository
+        oauth_repo: OAuthAccountRepository,
+        erasure_repo: AccountErasureRepository
     ):
         self.user_repository = user_repository
         self.token_blacklist_repo = token_blacklist_repo
         self.password_reset_repo = password_reset_repo
         self.oauth_repo = oauth_repo
+        self.erasure_repo = erasure_repo
         self.token_service = TokenService()
 
     # ========== Original Methods ==========
@@ -93,7 +97,11 @@ class AuthServiceEnhanced:
             return None
 
         user = await self.user_repository.get_by_id(user_id)
-        return self._to_dto(user) if user else None
+        if not user or user.is_deleted():
+            return None
+        # Every later log line of this request carries the user
+        bind_log_context(user_id=str(user.id))
+        return self._to_dto(user)
 
     # ========== New Methods: Logout ==========
 
@@ -131,18 +139,37 @@ class AuthServiceEnhanced:
 
         return True
 
+    # ========== New Methods: Profile ==========
+
+    async def update_timezone(self, user_id: UUID, timezone: str) -> UserDTO:
+        """
+        Set the IANA time zone activity is bucketed in.
+
+        Only activity recorded afterwards uses the new zone; rebuild the
+        activity rollups to re-bucket history.
+        """
+        user = await self.user_repository.get_by_id(user_id)
+        if not user:
+            raise ValueError("User not found")
+        user.set_timezone(timezone)
+        return self._to_dto(await self.user_repository.update(user))
+
     # ========== New Methods: Account Deletion ==========
 
     async def delete_account(self, user_id: UUID, password: str) -> bool:
         """
         Delete user account (requires password confirmation).
 
+        The account is marked deleted at once, which invalidates every token
+        issued for it. Its data is removed afterwards in batches by
+        AccountErasureService.
+
         Args:
             user_id: User's UUID
             password: User's password for confirmation
 
         Returns:
-            True if successfully deleted
+            True if the account was marked for erasure
         """
         user = await self.user_repository.get_by_id(str(user_id))
         if not user:
@@ -152,8 +179,9 @@ class AuthServiceEnhanced:
         if not verify_password(password, user.hashed_password):
             raise ValueError("Invalid password")
 
-        # Delete user (cascade will delete related data)
-        await self.user_repository.delete(user_id)
+        user.mark_deleted()
+        await self.user_repository.update(user)
+        await self.erasure_repo.create(user.id)
 
         return True
 
@@ -170,7 +198,7 @@ class AuthServiceEnhanced:
             Reset token (in production, this would be emailed, not returned)
         """
         user = await self.user_repository.get_by_email(email)
-        if not user:
+        if not user or user.is_deleted():
             # Don't reveal if email exists (security best practice)
             return None
 
@@ -259,11 +287,15 @@ class AuthServiceEnhanced:
             user = await self.user_repository.get_by_id(str(oauth_account.user_id))
             if not user:
                 raise ValueError("User not found")
+            if not user.is_active:
+                raise ValueError("User account is deactivated")
 
         else:
             # New OAuth account
             # Check if user exists by email
             user = await self.user_repository.get_by_email(email)
+            if user and user.is_deleted():
+                raise ValueError("User account is being deleted")
 
             if not user:
                 # Create new user
@@ -304,5 +336,6 @@ class AuthServiceEnhanced:
             email=user.email,
             full_name=user.full_name,
             is_active=user.is_active,
-            is_verified=user.is_verified
+            is_verified=user.is_verified,
+            timezone=user.timezone
         )
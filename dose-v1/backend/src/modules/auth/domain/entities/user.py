@@ -7,8 +7,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-@dataclass 
+@dataclass(slots=True)
 class User:
     """
     User domain entity representing an ADHD app user.
@@ -30,6 +31,10 @@ class User:
     created_at: datetime
     # Last Update
     updated_at: datetime
+    # Set when erasure was requested; data is removed in the background
+    deleted_at: Optional[datetime] = None
+    # IANA name; days and hours in activity charts are the user's local ones
+    timezone: str = "UTC"
 
     def deactivate(self) -> None:
         self.is_active = False
@@ -37,9 +42,25 @@ class User:
     def activate(self) -> None:
         self.is_active = True
 
+    def mark_deleted(self) -> None:
+        self.is_active = False
+        self.deleted_at = datetime.utcnow()
+        self.updated_at = self.deleted_at
+
+    def is_deleted(self) -> bool:
+        return self.deleted_at is not None
+
     def verify_email(self) -> None:
         self.is_verified = True
     
+    def set_timezone(self, timezone: str) -> None:
+        try:
+            ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown time zone: {timezone}") from None
+        self.timezone = timezone
+        self.updated_at = datetime.utcnow()
+
     def update_profile(self, full_name: Optional[str] = None):
         if full_name:
             self.full_name = full_name
@@ -0,0 +1,25 @@
+"""
+Account Erasure Model for Background Account Deletion
+"""
+
+from sqlalchemy import Column, String, DateTime, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from src.infrastructure.database.session import Base
+
+
+class AccountErasure(Base):
+    """
+    Tracks an account deletion while its data is removed in batches.
+    Kept after the user row is gone as a record that erasure completed.
+    """
+    __tablename__ = "account_erasures"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)  # No FK: outlives the user row
+    status = Column(String(20), nullable=False, default="pending", index=True)  # 'pending', 'completed'
+    current_step = Column(String(50), nullable=True)  # Table currently being cleared
+    rows_deleted = Column(Integer, nullable=False, default=0)
+    requested_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)
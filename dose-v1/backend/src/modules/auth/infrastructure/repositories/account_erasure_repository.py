@@ -0,0 +1,143 @@
+"""
+Account Erasure Repository
+"""
+
+from typing import List, Optional
+from uuid import UUID
+from datetime import datetime
+from sqlalchemy import select, delete, inspect, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.auth.infrastructure.persistence.account_erasure_model import AccountErasure
+from src.modules.auth.infrastructure.persistence.models import User
+from src.modules.auth.infrastructure.persistence.oauth_account_model import OAuthAccount
+from src.modules.auth.infrastructure.persistence.password_reset_model import PasswordResetToken
+from src.modules.auth.infrastructure.persistence.token_blacklist_model import TokenBlacklist
+from src.modules.spark.infrastructure.persistence.models import SparkSession
+from src.modules.wave.infrastructure.persistence.models import WaveSession
+from src.modules.sync.infrastructure.persistence.models import SessionTombstone
+from src.infrastructure.event_store.models import OutboxEvent, StoredEvent
+from src.infrastructure.projections.models import ProjectionDeadLetter
+from src.infrastructure.drafts.models import SessionDraft
+from src.infrastructure.database.session_ids import SessionId
+from src.modules.analytics.infrastructure.persistence.models import ActivityRollup, UserProgressSummary, UserStreak
+from src.modules.popcorn.infrastructure.persistence.models import PopcornIdea, PopcornTag
+
+# Tables holding a user's rows, cleared in this order before the user row itself
+ERASURE_STEPS = {
+    "spark_sessions": SparkSession,
+    "wave_sessions": WaveSession,
+    "popcorn_ideas": PopcornIdea,
+    "popcorn_tags": PopcornTag,
+    "session_tombstones": SessionTombstone,
+    "session_drafts": SessionDraft,
+    "session_ids": SessionId,
+    "event_outbox": OutboxEvent,
+    "event_store": StoredEvent,
+    "projection_dead_letters": ProjectionDeadLetter,
+    "user_progress_summary": UserProgressSummary,
+    "activity_rollups": ActivityRollup,
+    "user_streaks": UserStreak,
+    "oauth_accounts": OAuthAccount,
+    "password_reset_tokens": PasswordResetToken,
+    "token_blacklist": TokenBlacklist,
+}
+
+# First key of the erasure advisory locks (the second is the user id's hash)
+_ERASURE_LOCK_NAMESPACE = 7301
+
+
+class AccountErasureRepository:
+    """Repository for account erasure tracking and batched data removal."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, user_id: UUID) -> AccountErasure:
+        """Record a pending erasure (no-op if one already exists)."""
+        erasure = await self.get(user_id)
+        if erasure:
+            return erasure
+        erasure = AccountErasure(user_id=user_id, status="pending")
+        self.session.add(erasure)
+        await self.session.flush()
+        return erasure
+
+    async def get(self, user_id: UUID) -> Optional[AccountErasure]:
+        """Get erasure record for a user."""
+        result = await self.session.execute(
+            select(AccountErasure).where(AccountErasure.user_id == user_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_pending_user_ids(self, limit: int = 10) -> List[UUID]:
+        """Get users whose erasure has not finished, oldest request first."""
+        result = await self.session.execute(
+            select(AccountErasure.user_id)
+            .where(AccountErasure.status == "pending")
+            .order_by(AccountErasure.requested_at)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def claim(self, user_id: UUID) -> bool:
+        """
+        Claim a pending erasure for the rest of this session's transaction.
+
+        Takes a transaction-scoped advisory lock, so the claim ends with the
+        transaction (or the connection) and never blocks the erasure's own
+        progress updates on the account_erasures row. False if another
+        worker holds the claim or the erasure has completed since it was
+        listed.
+        """
+        claimed = await self.session.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:namespace, hashtext(:user_id))"),
+            {"namespace": _ERASURE_LOCK_NAMESPACE, "user_id": str(user_id)},
+        )
+        if not claimed:
+            return False
+        status = await self.session.scalar(select(AccountErasure.status).where(AccountErasure.user_id == user_id))
+        return status == "pending"
+
+    async def delete_batch(self, step: str, user_id: UUID, batch_size: int) -> int:
+        """
+        Delete up to batch_size of the user's rows from one table.
+
+        Returns the number of rows deleted; fewer than batch_size means the
+        table is clear for this user.
+        """
+        model = ERASURE_STEPS[step]
+        keys = inspect(model).primary_key
+        batch = select(*keys).where(model.user_id == user_id).limit(batch_size)
+        result = await self.session.execute(
+            delete(model)
+            .where(tuple_(*keys).in_(batch))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def delete_user(self, user_id: UUID) -> int:
+        """Delete the user row once all dependent rows are gone."""
+        result = await self.session.execute(
+            delete(User).where(User.id == user_id).execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def record_progress(self, user_id: UUID, step: str, rows_deleted: int) -> None:
+        """Record the current step and add to the running row count."""
+        erasure = await self.get(user_id)
+        if erasure:
+            erasure.current_step = step
+            erasure.rows_deleted += rows_deleted
+            erasure.updated_at = datetime.utcnow()
+            await self.session.flush()
+
+    async def mark_completed(self, user_id: UUID) -> None:
+        """Mark erasure as finished."""
+        erasure = await self.get(user_id)
+        if erasure:
+            erasure.status = "completed"
+            erasure.current_step = None
+            erasure.completed_at = datetime.utcnow()
+            erasure.updated_at = erasure.completed_at
+            await self.session.flush()
@@ -2,7 +2,7 @@
 OAuth Account Repository
 """
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy import select
@@ -71,6 +71,16 @@ class OAuthAccountRepository:
         )
         return result.scalar_one_or_none()
 
+    async def stream_by_user(self, user_id: UUID) -> AsyncIterator[OAuthAccount]:
+        """Stream every OAuth account linked to a user."""
+        result = await self.session.stream_scalars(
+            select(OAuthAccount)
+            .where(OAuthAccount.user_id == user_id)
+            .order_by(OAuthAccount.created_at.asc())
+        )
+        async for account in result:
+            yield account
+
     async def update_tokens(
         self,
         oauth_account_id: UUID,
@@ -25,7 +25,8 @@ class UserRepository(IUserRepository):
             is_active=user.is_active,
             is_verified=user.is_verified,
             created_at=user.created_at,
-            updated_at=user.created_at
+            updated_at=user.created_at,
+            timezone=user.timezone
         )
         
         self.session.add(db_user)
@@ -63,6 +64,8 @@ class UserRepository(IUserRepository):
         db_user.is_verified = user.is_verified
         db_user.created_at = user.created_at
         db_user.updated_at = user.updated_at
+        db_user.deleted_at = user.deleted_at
+        db_user.timezone = user.timezone
                 
         await self.session.flush()
         await self.session.refresh(db_user)
@@ -94,5 +97,7 @@ class UserRepository(IUserRepository):
             is_verified=model.is_verified,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            deleted_at=model.deleted_at,
+            timezone=model.timezone,
         )
     
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+POPCORN API Endpoints
+"""
+
+from functools import partial
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.session import after_commit, get_db
+from src.modules.auth.application.services.auth_service import AuthService
+from src.modules.auth.infrastructure.repositories.user_repository import UserRepository
+from src.modules.popcorn.api.schemas.popcorn_schemas import (
+    IdeaListResponse,
+    IdeaRequest,
+    IdeaResponse,
+    TagResponse,
+)
+from src.modules.popcorn.application.dto.popcorn_dto import CreateIdeaDTO, UpdateIdeaDTO
+from src.modules.popcorn.application.services.popcorn_service import PopcornService
+from src.modules.popcorn.infrastructure.cache import tag_index
+from src.modules.popcorn.infrastructure.repositories.idea_repository import IdeaRepository
+
+router = APIRouter()
+security = HTTPBearer()
+
+
+def get_popcorn_service(db: AsyncSession = Depends(get_db)) -> PopcornService:
+    """Dependency to get the POPCORN service."""
+    return PopcornService(IdeaRepository(db), tag_index, after_commit=partial(after_commit, db))
+
+
+async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security), db: AsyncSession = Depends(get_db)) -> UUID:
+    """Dependency to get current user ID from token."""
+    user_repository = UserRepository(db)
+    auth_service = AuthService(user_repository)
+
+    user = await auth_service.get_current_user(credentials.credentials)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials"
+        )
+
+    return user.id
+
+
+async def _owned_idea(popcorn_service: PopcornService, idea_id: UUID, user_id: UUID):
+    """The idea, if it exists and belongs to the user."""
+    try:
+        idea = await popcorn_service.get_idea(idea_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    if idea.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this idea"
+        )
+    return idea
+
+
+@router.post("/ideas", response_model=IdeaResponse, status_code=status.HTTP_201_CREATED)
+async def create_idea(
+    request: IdeaRequest,
+    user_id: UUID = Depends(get_current_user_id),
+    popcorn_service: PopcornService = Depends(get_popcorn_service)
+):
+    """Capture a new idea."""
+    try:
+        return await popcorn_service.create_idea(CreateIdeaDTO(user_id=user_id, content=request.content, tags=request.tags))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/ideas", response_model=IdeaListResponse)
+async def list_ideas(
+    tags: Optional[List[str]] = Query(default=None, description="Only ideas with all of these tags"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=20, ge=1, le=100),
+    user_id: UUID = Depends(get_current_user_id),
+    popcorn_service: PopcornService = Depends(get_popcorn_service)
+):
+    """
+    List the current user's ideas, newest first.
+
+    Repeat `tags` to require several (e.g. `?tags=work&tags=urgent`).
+    """
+    try:
+        return await popcorn_service.list_ideas(user_id, tags, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/ideas/{idea_id}", response_model=IdeaResponse)
+async def get_idea(
+    idea_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    popcorn_service: PopcornService = Depends(get_popcorn_service)
+):
+    """Get a specific idea."""
+    return await _owned_idea(popcorn_service, idea_id, user_id)
+
+
+@router.put("/ideas/{idea_id}", response_model=IdeaResponse)
+async def update_idea(
+    idea_id: UUID,
+    request: IdeaRequest,
+    user_id: UUID = Depends(get_current_user_id),
+    popcorn_service: PopcornService = Depends(get_popcorn_service)
+):
+    """Replace an idea's content and tags."""
+    await _owned_idea(popcorn_service, idea_id, user_id)
+    try:
+        return await popcorn_service.update_idea(UpdateIdeaDTO(idea_id=idea_id, content=request.content, tags=request.tags))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.delete("/ideas/{idea_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_idea(
+    idea_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    popcorn_service: PopcornService = Depends(get_popcorn_service)
+):
+    """Delete an idea."""
+    await _owned_idea(popcorn_service, idea_id, user_id)
+    await popcorn_service.delete_idea(idea_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/tags", response_model=List[TagResponse])
+async def get_tags(
+    prefix: str = Query(default="", max_length=50, description="Only tags starting with this (autocomplete)"),
+    limit: int = Query(default=20, ge=1, le=100),
+    user_id: UUID = Depends(get_current_user_id),
+    popcorn_service: PopcornService = Depends(get_popcorn_service)
+):
+    """
+    Get the current user's tags, most used first.
+
+    With `prefix`, only the tags it completes. Served from an in-memory
+    index kept current by idea writes.
+    """
+    return await popcorn_service.get_tags(user_id, prefix, limit)
@@ -0,0 +1,54 @@
+"""
+POPCORN API Schemas - Request/Response validation
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field, field_validator
+
+from src.modules.popcorn.domain.entities.idea import MAX_CONTENT_LENGTH, MAX_TAGS, MAX_TAG_LENGTH
+
+class IdeaRequest(BaseModel):
+    """Request to capture or replace an idea."""
+    content: str = Field(..., min_length=1, max_length=MAX_CONTENT_LENGTH, description="The idea")
+    tags: List[str] = Field(default_factory=list, max_length=MAX_TAGS, description="Tags; matched case-insensitively")
+
+    @field_validator('content')
+    @classmethod
+    def validate_not_empty(cls, v: str) -> str:
+        if not v or v.strip() == '':
+            raise ValueError('Idea cannot be empty')
+        return v.strip()
+
+    @field_validator('tags')
+    @classmethod
+    def validate_tag_length(cls, v: List[str]) -> List[str]:
+        if any(len(tag.strip()) > MAX_TAG_LENGTH for tag in v):
+            raise ValueError(f'Tags must be at most {MAX_TAG_LENGTH} characters')
+        return v
+
+class IdeaResponse(BaseModel):
+    """Response with idea data."""
+    id: UUID
+    user_id: UUID
+    content: str
+    tags: List[str]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+class IdeaListResponse(BaseModel):
+    """One page of ideas, newest first."""
+    ideas: List[IdeaResponse]
+    cursor: Optional[str] = Field(None, description="Pass to get the next page; null when there are no more ideas")
+
+    model_config = {"from_attributes": True}
+
+class TagResponse(BaseModel):
+    """One of the user's tags."""
+    tag: str
+    idea_count: int = Field(..., description="Number of the user's ideas with this tag")
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,45 @@
+"""
+POPCORN Module DTOs - Application Layer
+Data transfer objects for ideas and tags
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+@dataclass(slots=True)
+class CreateIdeaDTO:
+    """DTO for capturing a new idea."""
+    user_id: UUID
+    content: str
+    tags: List[str] = field(default_factory=list)
+
+@dataclass(slots=True)
+class UpdateIdeaDTO:
+    """DTO for replacing an idea's content and tags."""
+    idea_id: UUID
+    content: str
+    tags: List[str] = field(default_factory=list)
+
+@dataclass(slots=True)
+class IdeaDTO:
+    """DTO for full idea data."""
+    id: UUID
+    user_id: UUID
+    content: str
+    tags: List[str]
+    created_at: datetime
+    updated_at: datetime
+
+@dataclass(slots=True)
+class IdeaPageDTO:
+    """DTO for one page of ideas, newest first."""
+    ideas: List[IdeaDTO]
+    cursor: Optional[str]  # None when there are no more ideas
+
+@dataclass(slots=True)
+class TagDTO:
+    """DTO for one of the user's tags."""
+    tag: str
+    idea_count: int
@@ -0,0 +1,160 @@
+"""
+PopcornService - Application Layer
+Orchestrates POPCORN idea capture, tag filtering and tag autocomplete
+"""
+
+from datetime import datetime
+from functools import partial
+from typing import Callable, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from src.core.utils.cursor import decode_cursor, encode_cursor
+from src.modules.popcorn.application.dto.popcorn_dto import (
+    CreateIdeaDTO,
+    IdeaDTO,
+    IdeaPageDTO,
+    TagDTO,
+    UpdateIdeaDTO,
+)
+from src.modules.popcorn.domain.entities.idea import Idea, normalize_tags
+from src.modules.popcorn.domain.repositories.idea_repository import IIdeaRepository
+from src.modules.popcorn.infrastructure.cache import TagIndex, UserTags
+
+class PopcornService:
+    """
+    Service for POPCORN idea operations.
+
+    Every write also updates the process's tag index, so tag listing and
+    autocomplete are served from memory once a user's tags are loaded. The
+    index is changed through `after_commit`, which should defer it until
+    the write commits: a rolled back write must not reach the index, and a
+    load racing the write must not be cached without it. Without a hook
+    the index is updated immediately.
+    """
+
+    def __init__(
+        self,
+        repository: IIdeaRepository,
+        tag_index: TagIndex,
+        after_commit: Optional[Callable[[Callable[[], None]], None]] = None
+    ):
+        self.repository = repository
+        self.tag_index = tag_index
+        self.after_commit = after_commit or (lambda callback: callback())
+
+    async def create_idea(self, dto: CreateIdeaDTO) -> IdeaDTO:
+        """Capture a new idea."""
+        now = datetime.utcnow()
+        idea = Idea(id=uuid4(), user_id=dto.user_id, content=dto.content, tags=dto.tags, created_at=now, updated_at=now)
+
+        created = await self.repository.create(idea)
+        self.after_commit(partial(self.tag_index.apply, created.user_id, added=list(created.tags)))
+        return self._to_dto(created)
+
+    async def get_idea(self, idea_id: UUID) -> IdeaDTO:
+        """Get an idea by ID."""
+        idea = await self.repository.get_by_id(idea_id)
+        if not idea:
+            raise ValueError(f"Idea not found: {idea_id}")
+        return self._to_dto(idea)
+
+    async def update_idea(self, dto: UpdateIdeaDTO) -> IdeaDTO:
+        """Replace an idea's content and tags."""
+        idea = await self.repository.get_by_id(dto.idea_id)
+        if not idea:
+            raise ValueError(f"Idea not found: {dto.idea_id}")
+
+        idea.edit(dto.content, dto.tags)
+        updated, previous = await self.repository.update(idea)
+        self.after_commit(partial(
+            self.tag_index.apply,
+            updated.user_id,
+            added=[t for t in updated.tags if t not in previous],
+            removed=[t for t in previous if t not in updated.tags],
+        ))
+        return self._to_dto(updated)
+
+    async def delete_idea(self, idea_id: UUID) -> bool:
+        """Delete an idea. Returns False if it did not exist."""
+        deleted = await self.repository.delete(idea_id)
+        if not deleted:
+            return False
+        self.after_commit(partial(self.tag_index.apply, deleted.user_id, removed=list(deleted.tags)))
+        return True
+
+    async def list_ideas(
+        self,
+        user_id: UUID,
+        tags: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20
+    ) -> IdeaPageDTO:
+        """
+        List a user's ideas, newest first.
+
+        Args:
+            user_id: UUID of the user.
+            tags: Only ideas carrying all of these tags.
+            cursor: Cursor from the previous page.
+            limit: Maximum number of ideas.
+
+        Raises:
+            ValueError: If a tag is invalid, or the cursor is malformed or
+                belongs to a different filter.
+        """
+        tags = normalize_tags(tags or ())
+
+        after = None
+        if cursor:
+            position = decode_cursor(cursor)
+            if position.get("tags") != tags:
+                raise ValueError("Cursor does not belong to this filter")
+            try:
+                after = (datetime.fromisoformat(position["created_at"]), UUID(position["id"]))
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("Invalid cursor") from None
+
+        ideas = await self.repository.list_by_user(user_id, tags, after, limit + 1)
+
+        next_cursor = None
+        if len(ideas) > limit:
+            ideas = ideas[:limit]
+            last = ideas[-1]
+            next_cursor = encode_cursor({
+                "tags": tags,
+                "created_at": last.created_at.isoformat(),
+                "id": str(last.id),
+            })
+
+        return IdeaPageDTO(ideas=[self._to_dto(idea) for idea in ideas], cursor=next_cursor)
+
+    async def get_tags(self, user_id: UUID, prefix: str = "", limit: int = 20) -> List[TagDTO]:
+        """
+        Get the user's tags starting with `prefix`, most used first.
+
+        Served from the in-memory tag index; only the first call per user
+        (or after the entry expires) reads popcorn_tags.
+        """
+        user_tags = await self._user_tags(user_id)
+        prefix = " ".join(prefix.lower().split())
+        return [TagDTO(tag=tag, idea_count=count) for tag, count in user_tags.complete(prefix, limit)]
+
+    async def _user_tags(self, user_id: UUID) -> UserTags:
+        user_tags = self.tag_index.get(user_id)
+        if user_tags is None:
+            generation = self.tag_index.generation(user_id)
+            counts = await self.repository.get_tag_counts(user_id)
+            user_tags = self.tag_index.put(user_id, counts, generation)
+        return user_tags
+
+    @staticmethod
+    def _to_dto(idea: Idea) -> IdeaDTO:
+        """Convert entity to DTO."""
+        return IdeaDTO(
+            id=idea.id,
+            user_id=idea.user_id,
+            content=idea.content,
+            tags=list(idea.tags),
+            created_at=idea.created_at,
+            updated_at=idea.updated_at,
+        )
@@ -0,0 +1,67 @@
+"""
+Idea Entity - Domain Layer
+A quickly captured thought, optionally tagged for later filtering
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, List
+from uuid import UUID
+
+MAX_CONTENT_LENGTH = 5000
+MAX_TAGS = 10
+MAX_TAG_LENGTH = 50  # popcorn_ideas.tags is VARCHAR(50)[]
+
+
+def normalize_tags(tags: Iterable[str]) -> List[str]:
+    """
+    Trimmed, lower-cased, de-duplicated tags in the order given.
+
+    Raises:
+        ValueError: If a tag is too long or there are too many.
+    """
+    normalized: List[str] = []
+    for tag in tags:
+        tag = " ".join(tag.split()).lower()
+        if not tag or tag in normalized:
+            continue
+        if len(tag) > MAX_TAG_LENGTH:
+            raise ValueError(f"Tags must be at most {MAX_TAG_LENGTH} characters")
+        normalized.append(tag)
+    if len(normalized) > MAX_TAGS:
+        raise ValueError(f"An idea can have at most {MAX_TAGS} tags")
+    return normalized
+
+
+@dataclass(slots=True)
+class Idea:
+    """
+    Idea entity.
+    Content is free text; tags are normalized so filtering and autocomplete
+    are case-insensitive.
+    """
+    id: UUID
+    user_id: UUID
+    content: str
+    created_at: datetime
+    updated_at: datetime
+    tags: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.content = self._validated_content(self.content)
+        self.tags = normalize_tags(self.tags)
+
+    def edit(self, content: str, tags: Iterable[str]) -> None:
+        """Replace the idea's content and tags."""
+        self.content = self._validated_content(content)
+        self.tags = normalize_tags(tags)
+        self.updated_at = datetime.utcnow()
+
+    @staticmethod
+    def _validated_content(content: str) -> str:
+        content = content.strip()
+        if not content:
+            raise ValueError("Idea content must not be empty")
+        if len(content) > MAX_CONTENT_LENGTH:
+            raise ValueError(f"Idea content must be at most {MAX_CONTENT_LENGTH} characters")
+        return content
@@ -0,0 +1,53 @@
+"""
+Idea Repository Interface - Domain Layer
+Defines contract for POPCORN idea data access
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+from src.modules.popcorn.domain.entities.idea import Idea
+
+class IIdeaRepository(ABC):
+    """Interface for POPCORN idea data access."""
+    @abstractmethod
+    async def create(self, idea: Idea) -> Idea:
+        """Create a new idea and count its tags."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, idea_id: UUID) -> Optional[Idea]:
+        """Get idea by ID."""
+        pass
+
+    @abstractmethod
+    async def update(self, idea: Idea) -> Tuple[Idea, List[str]]:
+        """Update an idea. Returns it with its tags before the update."""
+        pass
+
+    @abstractmethod
+    async def delete(self, idea_id: UUID) -> Optional[Idea]:
+        """Delete idea by ID. Returns the deleted idea, or None if it did not exist."""
+        pass
+
+    @abstractmethod
+    async def list_by_user(
+        self,
+        user_id: UUID,
+        tags: Sequence[str],
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int
+    ) -> List[Idea]:
+        """Get ideas having all `tags`, newest first, after a (created_at, id) position."""
+        pass
+
+    @abstractmethod
+    async def get_tag_counts(self, user_id: UUID) -> List[Tuple[str, int]]:
+        """Get each of the user's tags with the number of ideas carrying it."""
+        pass
+
+    @abstractmethod
+    def stream_by_user_id(self, user_id: UUID, batch_size: int = 500) -> AsyncIterator[Idea]:
+        """Stream all of the user's ideas without loading them into memory at once."""
+        pass
@@ -0,0 +1,16 @@
+"""Per-process indexes over POPCORN data."""
+
+from src.infrastructure.config.settings import settings
+from .tag_index import TagIndex, UserTags
+
+# Shared by every POPCORN request in this process
+tag_index = TagIndex(
+    max_users=settings.POPCORN_TAG_INDEX_USERS,
+    ttl_seconds=settings.POPCORN_TAG_INDEX_TTL_SECONDS
+)
+
+__all__ = [
+    "TagIndex",
+    "UserTags",
+    "tag_index",
+]
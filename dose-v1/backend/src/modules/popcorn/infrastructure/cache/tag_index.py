@@ -0,0 +1,91 @@
+"""
+Tag Index
+Per-user, in-memory prefix index over POPCORN tags for autocomplete
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from src.infrastructure.cache import GenerationalLRU
+
+
+class UserTags:
+    """
+    One user's tags with their idea counts, plus the tags in sorted order.
+
+    Tags sharing a prefix are adjacent in the sorted list, so completing a
+    prefix is a binary search followed by a scan of the matches only.
+    """
+
+    __slots__ = ("counts", "_sorted")
+
+    def __init__(self, counts: Iterable[Tuple[str, int]] = ()):
+        self.counts: Dict[str, int] = {tag: count for tag, count in counts if count > 0}
+        self._sorted: List[str] = sorted(self.counts)
+
+    def add(self, tag: str) -> None:
+        if tag not in self.counts:
+            insort(self._sorted, tag)
+            self.counts[tag] = 0
+        self.counts[tag] += 1
+
+    def remove(self, tag: str) -> None:
+        count = self.counts.get(tag)
+        if count is None:
+            return
+        if count > 1:
+            self.counts[tag] = count - 1
+            return
+        del self.counts[tag]
+        del self._sorted[bisect_left(self._sorted, tag)]
+
+    def complete(self, prefix: str, limit: int) -> List[Tuple[str, int]]:
+        """Tags starting with `prefix`, most used first."""
+        matches = []
+        for tag in self._sorted[bisect_left(self._sorted, prefix):]:
+            if not tag.startswith(prefix):
+                break
+            matches.append((tag, self.counts[tag]))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches[:limit]
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
+class TagIndex(GenerationalLRU):
+    """
+    Bounded LRU of UserTags keyed by user.
+
+    A user's entry is loaded once from popcorn_tags and then kept current by
+    the writes this process makes (`apply`), so autocomplete never queries
+    the database while the entry lives. Writes made by other processes are
+    not seen, so entries also expire after `ttl_seconds`. Each write bumps
+    the user's generation, so counts loaded while it was applied are not
+    stored.
+    """
+
+    def put(self, user_id: UUID, counts: Iterable[Tuple[str, int]], generation: int) -> UserTags:
+        """Index a user's tag counts. Returns the index even when it is too stale to keep."""
+        tags = UserTags(counts)
+        super().put(user_id, tags, generation)
+        return tags
+
+    def apply(self, user_id: UUID, added: Iterable[str] = (), removed: Iterable[str] = ()) -> None:
+        """Reflect an idea write in the user's entry, if it has one."""
+        self.bump(user_id)
+        tags = self.peek(user_id)
+        if tags is not None:
+            for tag in added:
+                tags.add(tag)
+            for tag in removed:
+                tags.remove(tag)
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "users": len(self),
+            "tags": sum(len(tags) for tags in self.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,48 @@
+"""
+POPCORN SQLAlchemy Models - Infrastructure Layer
+Database persistence for ideas and their per-user tag counts
+"""
+
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.session import Base
+
+class PopcornIdea(Base):
+    """SQLAlchemy PopcornIdea model."""
+    __tablename__ = "popcorn_ideas"
+
+    id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    tags: Mapped[list] = mapped_column(ARRAY(String(50)), nullable=False, default=list, server_default="{}")
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # Newest-first keyset pages: (user_id, created_at, id) < cursor
+        Index("ix_popcorn_ideas_user_created", "user_id", "created_at", "id"),
+        # tags @> ARRAY[...] containment filters
+        Index("ix_popcorn_ideas_tags", "tags", postgresql_using="gin"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PopcornIdea(id={self.id}, user_id={self.user_id})>"
+
+
+class PopcornTag(Base):
+    """
+    Number of the user's ideas carrying each tag, kept in the same
+    transaction as idea writes so tag lists never scan popcorn_ideas.
+    """
+    __tablename__ = "popcorn_tags"
+
+    user_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    tag: Mapped[str] = mapped_column(String(50), primary_key=True)
+    idea_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<PopcornTag(user_id={self.user_id}, tag={self.tag}, idea_count={self.idea_count})>"
@@ -0,0 +1,145 @@
+"""
+Idea Repository Implementation - Infrastructure Layer
+"""
+
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import delete, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.popcorn.domain.entities.idea import Idea as IdeaEntity
+from src.modules.popcorn.domain.repositories.idea_repository import IIdeaRepository
+from src.modules.popcorn.infrastructure.persistence.models import PopcornIdea as IdeaModel, PopcornTag
+
+class IdeaRepository(IIdeaRepository):
+    """SQLAlchemy implementation of the POPCORN idea repository."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, idea: IdeaEntity) -> IdeaEntity:
+        """Create a new idea and count its tags."""
+        db_idea = IdeaModel(
+            id=idea.id,
+            user_id=idea.user_id,
+            content=idea.content,
+            tags=list(idea.tags),
+            created_at=idea.created_at,
+            updated_at=idea.updated_at,
+        )
+        self.session.add(db_idea)
+        await self.session.flush()
+        await self._count_tags(idea.user_id, added=idea.tags, removed=())
+        return self._to_entity(db_idea)
+
+    async def get_by_id(self, idea_id: UUID) -> Optional[IdeaEntity]:
+        """Get idea by ID."""
+        db_idea = await self.session.get(IdeaModel, idea_id)
+        return self._to_entity(db_idea) if db_idea else None
+
+    async def update(self, idea: IdeaEntity) -> Tuple[IdeaEntity, List[str]]:
+        """Update an idea and its tag counts. Returns it with its tags before the update."""
+        db_idea = await self._get_locked(idea.id)
+        if not db_idea:
+            raise ValueError(f"Idea not found: {idea.id}")
+
+        previous = list(db_idea.tags)
+        db_idea.content = idea.content
+        db_idea.tags = list(idea.tags)
+        db_idea.updated_at = idea.updated_at
+        await self.session.flush()
+        await self._count_tags(
+            idea.user_id,
+            added=[t for t in idea.tags if t not in previous],
+            removed=[t for t in previous if t not in idea.tags],
+        )
+        return self._to_entity(db_idea), previous
+
+    async def delete(self, idea_id: UUID) -> Optional[IdeaEntity]:
+        """Delete idea by ID and uncount its tags."""
+        db_idea = await self._get_locked(idea_id)
+        if not db_idea:
+            return None
+        idea = self._to_entity(db_idea)
+        await self.session.delete(db_idea)
+        await self.session.flush()
+        await self._count_tags(idea.user_id, added=(), removed=idea.tags)
+        return idea
+
+    async def list_by_user(
+        self,
+        user_id: UUID,
+        tags: Sequence[str],
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int
+    ) -> List[IdeaEntity]:
+        """
+        Get ideas having all `tags`, newest first, after a (created_at, id) keyset position.
+
+        Without tags the (user_id, created_at, id) index serves the page
+        directly; with tags the GIN index narrows to ideas containing them.
+        """
+        query = select(IdeaModel).where(IdeaModel.user_id == user_id)
+        if tags:
+            query = query.where(IdeaModel.tags.contains(list(tags)))
+        if after:
+            query = query.where(tuple_(IdeaModel.created_at, IdeaModel.id) < tuple_(*after))
+        result = await self.session.execute(
+            query.order_by(IdeaModel.created_at.desc(), IdeaModel.id.desc()).limit(limit)
+        )
+        return [self._to_entity(db_idea) for db_idea in result.scalars().all()]
+
+    async def get_tag_counts(self, user_id: UUID) -> List[Tuple[str, int]]:
+        """Get each of the user's tags with the number of ideas carrying it."""
+        result = await self.session.execute(
+            select(PopcornTag.tag, PopcornTag.idea_count).where(PopcornTag.user_id == user_id)
+        )
+        return [(row.tag, row.idea_count) for row in result]
+
+    async def stream_by_user_id(self, user_id: UUID, batch_size: int = 500) -> AsyncIterator[IdeaEntity]:
+        """Stream every idea for a user, oldest first, over a server-side cursor."""
+        result = await self.session.stream(
+            select(IdeaModel)
+            .where(IdeaModel.user_id == user_id)
+            .order_by(IdeaModel.created_at.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for db_idea in result.scalars():
+            yield self._to_entity(db_idea)
+
+    async def _get_locked(self, idea_id: UUID) -> Optional[IdeaModel]:
+        # The tag counts are adjusted from the row's current tags, so lock it
+        # and reload it: the idea is usually in the identity map already
+        # (loaded for the ownership check), possibly from before a concurrent
+        # edit committed.
+        return await self.session.get(IdeaModel, idea_id, with_for_update=True, populate_existing=True)
+
+    async def _count_tags(self, user_id: UUID, added: Sequence[str], removed: Sequence[str]) -> None:
+        if added:
+            statement = insert(PopcornTag).values([
+                {"user_id": user_id, "tag": tag, "idea_count": 1} for tag in added
+            ])
+            await self.session.execute(statement.on_conflict_do_update(
+                index_elements=[PopcornTag.user_id, PopcornTag.tag],
+                set_={"idea_count": PopcornTag.idea_count + 1},
+            ))
+        if removed:
+            owned = (PopcornTag.user_id == user_id, PopcornTag.tag.in_(list(removed)))
+            await self.session.execute(
+                update(PopcornTag).where(*owned).values(idea_count=PopcornTag.idea_count - 1)
+            )
+            await self.session.execute(delete(PopcornTag).where(*owned, PopcornTag.idea_count <= 0))
+
+    @staticmethod
+    def _to_entity(model: IdeaModel) -> IdeaEntity:
+        """Convert SQLAlchemy model to domain entity."""
+        return IdeaEntity(
+            id=model.id,
+            user_id=model.user_id,
+            content=model.content,
+            tags=list(model.tags or ()),
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
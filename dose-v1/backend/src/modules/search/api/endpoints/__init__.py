@@ -0,0 +1,60 @@
+"""
+Search API Endpoints
+"""
+
+from typing import List, Literal, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.session import get_db
+from src.modules.auth.application.services.auth_service import AuthService
+from src.modules.auth.infrastructure.repositories.user_repository import UserRepository
+from src.modules.search.api.schemas.search_schemas import SearchResponse
+from src.modules.search.application.services.search_service import SearchService
+from src.modules.search.infrastructure.repositories.search_repository import SearchRepository
+
+router = APIRouter()
+security = HTTPBearer()
+
+
+def get_search_service(db: AsyncSession = Depends(get_db)) -> SearchService:
+    """Dependency to get the search service."""
+    return SearchService(SearchRepository(db))
+
+
+async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security), db: AsyncSession = Depends(get_db)) -> UUID:
+    """Dependency to get current user ID from token."""
+    user_repository = UserRepository(db)
+    auth_service = AuthService(user_repository)
+
+    user = await auth_service.get_current_user(credentials.credentials)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials"
+        )
+
+    return user.id
+
+
+@router.get("", response_model=SearchResponse)
+async def search_sessions(
+    q: str = Query(..., min_length=1, max_length=200, description="Words or \"a phrase\" to find"),
+    type: Optional[List[Literal["spark", "wave"]]] = Query(default=None, description="Restrict to session types"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=20, ge=1, le=50),
+    user_id: UUID = Depends(get_current_user_id),
+    search_service: SearchService = Depends(get_search_service)
+):
+    """
+    Search the current user's SPARK and WAVE entries.
+
+    Results are ranked by relevance and include highlighted snippets.
+    Archived sessions are not searched.
+    """
+    try:
+        return await search_service.search(user_id, q, type, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,28 @@
+"""
+Search API Schemas - Response validation
+"""
+
+from datetime import datetime
+from typing import List, Literal, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+
+class SearchHit(BaseModel):
+    """One matching session."""
+    session_type: Literal["spark", "wave"]
+    session_id: UUID
+    status: str
+    created_at: datetime
+    rank: float
+    snippet: str = Field(..., description="Matching excerpts with terms wrapped in <mark></mark>")
+
+    model_config = {"from_attributes": True}
+
+
+class SearchResponse(BaseModel):
+    """One page of search results, best match first."""
+    hits: List[SearchHit]
+    cursor: Optional[str] = Field(None, description="Pass to get the next page; null when there are no more results")
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,26 @@
+"""
+Search Data Transfer Objects
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class SearchHitDTO:
+    """DTO for one matching session."""
+    session_type: str  # "spark" or "wave"
+    session_id: UUID
+    status: str
+    created_at: datetime
+    rank: float
+    snippet: str  # Matching excerpts, terms wrapped in <mark></mark>
+
+
+@dataclass(slots=True)
+class SearchResultDTO:
+    """DTO for one page of search results."""
+    hits: List[SearchHitDTO]
+    cursor: Optional[str]  # None when there are no more results
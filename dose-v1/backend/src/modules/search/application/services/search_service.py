@@ -0,0 +1,91 @@
+"""
+Search Service - Application Layer
+Ranked full-text search over the caller's own journal entries
+"""
+
+import hashlib
+from typing import Optional, Sequence
+from uuid import UUID
+
+from src.core.utils.cursor import encode_cursor, decode_cursor
+from src.modules.search.application.dto.search_dto import SearchHitDTO, SearchResultDTO
+from src.modules.search.infrastructure.repositories.search_repository import SearchRepository, SEARCHABLE
+
+
+class SearchService:
+    """Service for searching SPARK and WAVE session text."""
+
+    def __init__(self, search_repository: SearchRepository):
+        self.search_repository = search_repository
+
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        session_types: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20
+    ) -> SearchResultDTO:
+        """
+        Search a user's sessions, best match first.
+
+        Args:
+            user_id: UUID of the user; only their sessions are searched.
+            query: Free text; supports "quoted phrases", OR and -exclusions.
+            session_types: Restrict to "spark" and/or "wave" (default both).
+            cursor: Cursor from the previous page.
+            limit: Maximum number of hits.
+
+        Raises:
+            ValueError: If the query is empty, a session type is unknown, or
+                the cursor is malformed or belongs to a different query.
+        """
+        query = query.strip()
+        if not query:
+            raise ValueError("Search query must not be empty")
+
+        session_types = list(session_types or SEARCHABLE)
+        unknown = set(session_types) - set(SEARCHABLE)
+        if unknown:
+            raise ValueError(f"Unknown session type: {', '.join(sorted(unknown))}")
+
+        # Cursors carry a fingerprint of the search they came from
+        fingerprint = hashlib.sha256(query.encode()).hexdigest()[:16]
+
+        after = None
+        if cursor:
+            position = decode_cursor(cursor)
+            if position.get("q") != fingerprint or position.get("types") != session_types:
+                raise ValueError("Cursor does not belong to this search")
+            try:
+                after = (float(position["rank"]), UUID(position["id"]))
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("Invalid cursor") from None
+
+        rows = await self.search_repository.search(user_id, query, session_types, after, limit + 1)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor({
+                "q": fingerprint,
+                "types": session_types,
+                "rank": last.rank,
+                "id": str(last.session_id),
+            })
+
+        return SearchResultDTO(
+            hits=[
+                SearchHitDTO(
+                    session_type=row.session_type,
+                    session_id=row.session_id,
+                    status=row.status,
+                    created_at=row.created_at,
+                    rank=row.rank,
+                    snippet=row.snippet,
+                )
+                for row in rows
+            ],
+            cursor=next_cursor,
+        )
@@ -0,0 +1,85 @@
+"""
+Search Repository Implementation - Infrastructure Layer
+Full-text search over SPARK and WAVE journal text
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import select, func, literal_column, tuple_, union_all
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.spark.infrastructure.persistence.models import SparkSession as SparkSessionModel
+from src.modules.wave.infrastructure.persistence.models import WaveSession as WaveSessionModel
+
+# Must match the text search configuration of the generated search_vector columns
+SEARCH_CONFIG = "english"
+
+# Searchable text columns per session type (the search_vector columns are generated from these)
+SEARCHABLE = {
+    "spark": (SparkSessionModel, [
+        "situation_response", "perception_response", "affect_response",
+        "response_response", "key_result_response",
+    ]),
+    "wave": (WaveSessionModel, ["situation", "acceptance_statement", "action_notes"]),
+}
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=30, MinWords=10"
+
+
+class SearchRepository:
+    """PostgreSQL full-text search over the generated, GIN-indexed search_vector columns."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        session_types: Sequence[str] = tuple(SEARCHABLE),
+        after: Optional[Tuple[float, UUID]] = None,
+        limit: int = 20
+    ) -> List[Any]:
+        """
+        Get the user's best matching sessions after a (rank, session_id) keyset position.
+
+        Rows have session_type, session_id, status, created_at, rank and a
+        highlighted snippet. Snippets are built only for the returned page:
+        ts_headline re-parses the document, so it is by far the most
+        expensive part of the query.
+        """
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+
+        matches = []
+        for session_type in session_types:
+            model, columns = SEARCHABLE[session_type]
+            vector = literal_column(f"{model.__tablename__}.search_vector", TSVECTOR)
+            matches.append(
+                select(
+                    literal_column(f"'{session_type}'").label("session_type"),
+                    model.id.label("session_id"),
+                    model.status,
+                    model.created_at,
+                    func.ts_rank_cd(vector, tsquery).label("rank"),
+                    func.concat_ws(" ", *[getattr(model, column) for column in columns]).label("document"),
+                ).where(model.user_id == user_id, vector.op("@@")(tsquery))
+            )
+        hits = (union_all(*matches) if len(matches) > 1 else matches[0]).subquery("hits")
+
+        page = select(hits)
+        if after:
+            page = page.where(tuple_(hits.c.rank, hits.c.session_id) < tuple_(*after))
+        page = page.order_by(hits.c.rank.desc(), hits.c.session_id.desc()).limit(limit).subquery("page")
+
+        result = await self.session.execute(
+            select(
+                page.c.session_type,
+                page.c.session_id,
+                page.c.status,
+                page.c.created_at,
+                page.c.rank,
+                func.ts_headline(SEARCH_CONFIG, page.c.document, tsquery, HEADLINE_OPTIONS).label("snippet"),
+            ).order_by(page.c.rank.desc(), page.c.session_id.desc())
+        )
+        return list(result.all())
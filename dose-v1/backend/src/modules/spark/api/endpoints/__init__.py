@@ -2,17 +2,25 @@
 SPARK API Endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.cache import response_cache
 from src.infrastructure.database.session import get_db
+from src.infrastructure.drafts import draft_buffer
+from src.infrastructure.event_bus import event_bus
+from src.infrastructure.event_store import OutboxPublisher
 from src.modules.spark.api.schemas.spark_schemas import (
     CreateSessionRequest,
     UpdateStepRequest,
     SessionResponse,
-    SessionListResponse
+    SessionListResponse,
+    DraftRequest,
+    DraftResponse,
+    DraftListResponse
 )
 from src.modules.spark.application.dto.spark_dto import (
     CreateSparkSessionDTO,
@@ -20,6 +28,7 @@ from src.modules.spark.application.dto.spark_dto import (
 )
 from src.modules.spark.application.services.spark_service import SparkService
 from src.modules.spark.infrastructure.repositories.spark_session_repository import SparkSessionRepository
+from src.modules.spark.infrastructure.queries.session_read_queries import SparkSessionReadQueries
 from src.modules.auth.application.services.auth_service import AuthService
 from src.modules.auth.infrastructure.repositories.user_repository import UserRepository
 
@@ -29,7 +38,11 @@ security = HTTPBearer()
 def get_spark_service(db: AsyncSession = Depends(get_db)) -> SparkService:
     """Dependency to get SPARK service."""
     session_repository = SparkSessionRepository(db)
-    return SparkService(session_repository)
+    return SparkService(session_repository, OutboxPublisher(db, event_bus))
+
+def get_spark_read_queries(db: AsyncSession = Depends(get_db)) -> SparkSessionReadQueries:
+    """Dependency to get the SPARK read path."""
+    return SparkSessionReadQueries(db)
 
 async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security), db: AsyncSession = Depends(get_db)) -> UUID:
     """Dependency to get current user ID from token."""
@@ -60,26 +73,41 @@ async def create_session(request: CreateSessionRequest, user_id: UUID = Depends(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/sessions/{session_id}", response_model=SessionResponse)
-async def get_session(session_id: UUID, user_id: UUID = Depends(get_current_user_id), spark_service: SparkService = Depends(get_spark_service)):
-    """Get a specific SPARK session."""
-    # Get session
-    session = await spark_service.get_session(session_id)
-    
-    # Check if exists
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session not found: {session_id}"
-        )
-    
-    # Check ownership (security!)
-    if session.user_id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this session"
-        )
-    
-    return session
+async def get_session(
+    session_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    read_queries: SparkSessionReadQueries = Depends(get_spark_read_queries),
+    if_none_match: Optional[str] = Header(default=None)
+):
+    """
+    Get a specific SPARK session.
+
+    Served from a Core row serialized directly with orjson; the schema is
+    enforced by tests instead of per-request validation. The encoded body
+    is cached per user until their next write, and a matching
+    If-None-Match gets 304 Not Modified.
+    """
+    async def load():
+        # Get session
+        session = await read_queries.get_session(session_id)
+
+        # Check if exists
+        if not session:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session not found: {session_id}"
+            )
+
+        # Check ownership (security!)
+        if session["user_id"] != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have access to this session"
+            )
+
+        return session
+
+    return await response_cache.respond(user_id, ("spark.session", session_id), if_none_match, load)
 
 @router.put("/sessions/{session_id}/steps", response_model=SessionResponse)
 async def update_step(session_id: UUID, request: UpdateStepRequest, user_id: UUID = Depends(get_current_user_id), spark_service: SparkService = Depends(get_spark_service)):
@@ -141,7 +169,8 @@ async def list_sessions(
     limit: int = 50,
     offset: int = 0,
     user_id: UUID = Depends(get_current_user_id),
-    spark_service: SparkService = Depends(get_spark_service)
+    read_queries: SparkSessionReadQueries = Depends(get_spark_read_queries),
+    if_none_match: Optional[str] = Header(default=None)
 ):
     """
     Get all SPARK sessions for the current user with pagination.
@@ -158,12 +187,61 @@ async def list_sessions(
     if offset < 0:
         offset = 0
 
-    # Get user's sessions with pagination
-    sessions, total = await spark_service.get_user_sessions(user_id, limit, offset)
+    async def load():
+        # Get user's sessions with pagination
+        sessions, total = await read_queries.list_sessions(user_id, limit, offset)
+        return {
+            "sessions": sessions,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+        }
 
-    return SessionListResponse(
-        sessions=sessions,
-        total=total,
-        offset=offset,
-        limit=limit
-    )
+    return await response_cache.respond(user_id, ("spark.sessions", limit, offset), if_none_match, load)
+
+async def _check_draft_access(session_id: UUID, user_id: UUID, read_queries: SparkSessionReadQueries) -> None:
+    """Ownership check for drafts; the owner is cached so autosaves skip the lookup."""
+    owner = draft_buffer.owner(session_id)
+    if owner is None:
+        session = await read_queries.get_session(session_id)
+        if not session:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session not found: {session_id}"
+            )
+        owner = session["user_id"]
+        draft_buffer.remember_owner(session_id, owner)
+    if owner != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have access to this session"
+        )
+
+@router.put("/sessions/{session_id}/steps/{step_number}/draft", response_model=DraftResponse, status_code=status.HTTP_202_ACCEPTED)
+async def save_draft(
+    session_id: UUID,
+    request: DraftRequest,
+    step_number: int = Path(..., ge=1, le=5),
+    user_id: UUID = Depends(get_current_user_id),
+    read_queries: SparkSessionReadQueries = Depends(get_spark_read_queries)
+):
+    """
+    Autosave the text being typed for a step.
+
+    Drafts are buffered in memory, coalesced per step and stored within a
+    few seconds; they never change the session's committed responses.
+    """
+    await _check_draft_access(session_id, user_id, read_queries)
+    updated_at = await draft_buffer.put("spark", session_id, user_id, step_number, request.text)
+    return {"step": step_number, "text": request.text, "updated_at": updated_at}
+
+@router.get("/sessions/{session_id}/drafts", response_model=DraftListResponse)
+async def get_drafts(
+    session_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    read_queries: SparkSessionReadQueries = Depends(get_spark_read_queries),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the session's latest drafts, including ones not stored yet."""
+    await _check_draft_access(session_id, user_id, read_queries)
+    return {"drafts": await draft_buffer.drafts(db, session_id)}
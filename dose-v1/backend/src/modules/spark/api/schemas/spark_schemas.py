@@ -55,4 +55,18 @@ class SessionListResponse(BaseModel):
     sessions: List[SessionSummaryResponse]
     total: int
     offset: int = Field(default=0, description="Number of items skipped")
-    limit: int = Field(default=50, description="Number of items returned")
\ No newline at end of file
+    limit: int = Field(default=50, description="Number of items returned")
+
+class DraftRequest(BaseModel):
+    """Request to autosave what the user is typing for a step."""
+    text: str = Field(..., max_length=5000, description="Current text; may be empty")
+
+class DraftResponse(BaseModel):
+    """An autosaved, not yet submitted step text."""
+    step: int
+    text: str
+    updated_at: datetime
+
+class DraftListResponse(BaseModel):
+    """A session's drafts by step."""
+    drafts: List[DraftResponse]
@@ -7,19 +7,19 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-@dataclass
+@dataclass(slots=True)
 class CreateSparkSessionDTO:
     """DTO for creating new SPARK session."""
     user_id: UUID
 
-@dataclass
+@dataclass(slots=True)
 class UpdateStepDTO:
     """DTO for updating a step response."""
     session_id: UUID
     step_number: int
     response: str
 
-@dataclass
+@dataclass(slots=True)
 class SparkSessionDTO:
     """DTO for complete SPARK session data."""
     id: UUID
@@ -35,7 +35,7 @@ class SparkSessionDTO:
     updated_at: datetime
     completed_at: Optional[datetime]
 
-@dataclass
+@dataclass(slots=True)
 class SparkSessionSummaryDTO:
     """DTO for brief session info (for lists)."""
     id: UUID
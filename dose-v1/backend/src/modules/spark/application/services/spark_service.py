@@ -7,7 +7,9 @@ from datetime import datetime
 from uuid import uuid4, UUID
 from typing import List, Optional, Tuple
 
+from src.core.application.interfaces.event_publisher import IEventPublisher
 from src.modules.spark.domain.entities.spark_session import SparkSession
+from src.modules.spark.domain.events import SparkSessionStarted
 from src.modules.spark.domain.repositories.spark_session_repository import ISparkSessionRepository
 from src.modules.spark.domain.value_objects.session_status import SessionStatus
 from src.modules.spark.application.dto.spark_dto import (
@@ -20,8 +22,9 @@ from src.modules.spark.application.dto.spark_dto import (
 class SparkService:
     """Service handling SPARK session business logic."""
     
-    def __init__(self, session_repository: ISparkSessionRepository):
+    def __init__(self, session_repository: ISparkSessionRepository, events: Optional[IEventPublisher] = None):
         self.session_repository = session_repository
+        self.events = events
 
     async def create_session(self, dto: CreateSparkSessionDTO) -> SparkSessionDTO:
         """
@@ -34,24 +37,12 @@ class SparkService:
             SparkSessionDTO with the created session data.
         """
         # Create session entity
-        session = SparkSession(
-            id=uuid4(),
-            user_id=dto.user_id,
-            status=SessionStatus.IN_PROGRESS,
-            current_step=1,
-            situation_response=None,
-            perception_response=None,
-            affect_response=None,
-            response_response=None,
-            key_result_response=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            completed_at=None,
-        )
+        session = self.new_session(dto.user_id)
         
         # Save to database
         created_session = await self.session_repository.create(session)
-        
+        self._publish_events(session)
+
         # Convert to DTO and return
         return self._to_dto(created_session)
 
@@ -73,16 +64,12 @@ class SparkService:
         if not session:
             raise ValueError(f"Session not found: {dto.session_id}")
 
-        # Check if can progress to this step
-        if not session.can_progress_to_step(dto.step_number):
-            raise ValueError(f"Cannot update step {dto.step_number}")
-
         # Update step response (entity method handles logic)
-        session.set_step_response(dto.step_number, dto.response)
-        session.updated_at = datetime.utcnow()
+        self.apply_step(session, dto.step_number, dto.response)
 
         # Save updated session
         updated_session = await self.session_repository.update(session)
+        self._publish_events(session)
 
         return self._to_dto(updated_session)
     
@@ -105,11 +92,11 @@ class SparkService:
             raise ValueError(f"Session not found: {session_id}")
 
         # Complete session (entity validates all steps done)
-        session.complete_session()
-        session.updated_at = datetime.utcnow()
+        self.apply_complete(session)
 
         # Save
         completed_session = await self.session_repository.update(session)
+        self._publish_events(session)
 
         return self._to_dto(completed_session)
 
@@ -146,6 +133,69 @@ class SparkService:
         sessions, total = await self.session_repository.get_by_user_id(user_id, limit, offset)
         return [self._to_summary_dto(session) for session in sessions], total
 
+    @staticmethod
+    def new_session(
+        user_id: UUID,
+        session_id: Optional[UUID] = None,
+        created_at: Optional[datetime] = None
+    ) -> SparkSession:
+        """
+        Build a fresh in-progress session entity.
+
+        Args:
+            user_id: UUID of the owning user.
+            session_id: Client-generated ID (offline sync); a new one is generated if omitted.
+            created_at: When the session was started offline; defaults to now.
+        """
+        now = datetime.utcnow()
+        created_at = created_at or now
+        session = SparkSession(
+            id=session_id or uuid4(),
+            user_id=user_id,
+            status=SessionStatus.IN_PROGRESS,
+            current_step=1,
+            situation_response=None,
+            perception_response=None,
+            affect_response=None,
+            response_response=None,
+            key_result_response=None,
+            created_at=created_at,
+            updated_at=now,
+            completed_at=None,
+        )
+        session.record_event(SparkSessionStarted(session_id=session.id, user_id=user_id, occurred_at=created_at))
+        return session
+
+    @staticmethod
+    def apply_step(session: SparkSession, step_number: int, response: str) -> None:
+        """
+        Apply a step response to a loaded session.
+
+        Raises:
+            ValueError: If the step cannot be updated at this point.
+        """
+        if not session.can_progress_to_step(step_number):
+            raise ValueError(f"Cannot update step {step_number}")
+
+        session.set_step_response(step_number, response)
+        session.updated_at = datetime.utcnow()
+
+    @staticmethod
+    def apply_complete(session: SparkSession, completed_at: Optional[datetime] = None) -> None:
+        """
+        Complete a loaded session, optionally at the time it was completed offline.
+
+        Raises:
+            ValueError: If not all steps are completed.
+        """
+        session.complete_session(completed_at)
+        session.updated_at = datetime.utcnow()
+
+    def _publish_events(self, session: SparkSession) -> None:
+        """Hand the session's recorded events to the publisher (delivered after commit)."""
+        if self.events:
+            self.events.publish(session.pull_events())
+
     @staticmethod
     def _to_dto(session: SparkSession) -> SparkSessionDTO:
         """Convert entity to full DTO."""
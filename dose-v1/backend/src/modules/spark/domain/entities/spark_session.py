@@ -8,6 +8,8 @@ from datetime import datetime
 from enum import IntEnum
 from typing import Optional
 from uuid import UUID
+from src.core.domain.aggregate_root import AggregateRoot
+from src.modules.spark.domain.events import SparkSessionCompleted, SparkStepCompleted
 from src.modules.spark.domain.value_objects.session_status import SessionStatus
 class SparkStep(IntEnum):
     SITUATION = 1
@@ -16,8 +18,8 @@ class SparkStep(IntEnum):
     RESPONSE = 4
     KEY_RESULT = 5
 
-@dataclass
-class SparkSession:
+@dataclass(slots=True)
+class SparkSession(AggregateRoot):
     """
     SparkSession aggregate root.
     Represents a complete cognitive restructuring session.
@@ -92,23 +94,34 @@ class SparkSession:
         # Update current_step and timestamps
         self.current_step = max(self.current_step, step_number)
         self.updated_at = datetime.utcnow()
+        self.record_event(SparkStepCompleted(session_id=self.id, user_id=self.user_id, step_number=step_number))
 
         # If final step, complete the session
         if step_number == SparkStep.KEY_RESULT:
             self.complete_session()
 
         
-    def complete_session(self) -> None:
+    def complete_session(self, completed_at: Optional[datetime] = None) -> None:
         """
         Complete the SPARK session.
 
+        Args:
+            completed_at: When it was completed offline (UTC); clamped to
+                between the session's creation and now. Defaults to now.
+
         Raises:
             ValueError: If all 5 steps are not completed.
         """
         if all(getattr(self, field) is not None for field in self._STEP_FIELDS.values()):
+            now = datetime.utcnow()
+            completed_at = max(min(completed_at or now, now), self.created_at)
+            if not self.is_completed():
+                self.record_event(SparkSessionCompleted(
+                    session_id=self.id, user_id=self.user_id, occurred_at=completed_at
+                ))
             self.status = SessionStatus.COMPLETED
-            self.completed_at = datetime.utcnow()
-            self.updated_at = datetime.utcnow()
+            self.completed_at = completed_at
+            self.updated_at = now
         else:
             raise ValueError("All 5 steps must be completed before finishing the session")
     
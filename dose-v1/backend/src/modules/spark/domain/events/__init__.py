@@ -0,0 +1,23 @@
+"""
+SPARK Domain Events
+"""
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+from src.core.domain.events import SessionCompleted, SessionStarted, StepCompleted
+
+
+@dataclass(frozen=True, slots=True)
+class SparkSessionStarted(SessionStarted):
+    session_type: ClassVar[str] = "spark"
+
+
+@dataclass(frozen=True, slots=True)
+class SparkStepCompleted(StepCompleted):
+    session_type: ClassVar[str] = "spark"
+
+
+@dataclass(frozen=True, slots=True)
+class SparkSessionCompleted(SessionCompleted):
+    session_type: ClassVar[str] = "spark"
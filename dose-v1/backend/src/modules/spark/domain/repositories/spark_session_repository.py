@@ -4,7 +4,8 @@ Defines contract for SPARK session data access
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from datetime import datetime
+from typing import AsyncIterator, Optional, List, Tuple
 from uuid import UUID
 
 from src.modules.spark.domain.entities.spark_session import SparkSession
@@ -39,7 +40,12 @@ class ISparkSessionRepository(ABC):
 
     @abstractmethod
     async def update(self, session: SparkSession) -> SparkSession:
-        """Update existing session. Returns updated entity."""
+        """
+        Update existing session. Returns updated entity.
+
+        Raises SessionArchivedError if the session has been moved to the
+        archive (archived sessions are read-only), ValueError if it does not exist.
+        """
         pass
 
     @abstractmethod
@@ -55,4 +61,20 @@ class ISparkSessionRepository(ABC):
     @abstractmethod
     async def get_in_progress_by_user_id(self, user_id: UUID) -> Optional[SparkSession]:
         """Get the user's current in-progress session (if any)."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def stream_by_user_id(self, user_id: UUID, batch_size: int = 500) -> AsyncIterator[SparkSession]:
+        """Stream all of the user's sessions without loading them into memory at once."""
+        pass
+
+    @abstractmethod
+    async def get_changed_since(
+        self,
+        user_id: UUID,
+        after: Optional[Tuple[datetime, UUID]],
+        updated_before: datetime,
+        limit: int
+    ) -> List[SparkSession]:
+        """Get sessions updated after a (updated_at, id) position, ordered by that key."""
+        pass
@@ -5,7 +5,7 @@ Database persistence for SPARK sessions
 
 from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import Boolean, String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import Boolean, String, Integer, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from src.infrastructure.database.session import Base
@@ -25,13 +25,22 @@ class SparkSession(Base):
     response_response: Mapped[str] = mapped_column(Text, nullable=True)
     key_result_response: Mapped[str] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    # Partition key, so part of the primary key (see partitions.py)
+    created_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     completed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
 
     # Relationship to User model
     user = relationship("User", back_populates="spark_sessions")
 
+    __table_args__ = (
+        # Delta sync: "sessions changed since cursor" keyset scans
+        Index("ix_spark_sessions_user_updated", "user_id", "updated_at", "id"),
+        # Recent-session queries; prunes to the partitions in the created_at window
+        Index("ix_spark_sessions_user_created", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
     def __repr__(self) -> str:
         return f"<SparkSession(id={self.id}, user_id={self.user_id}, status={self.status})>"
         
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+SPARK Session Read Queries - Infrastructure Layer
+Fast read path for GET endpoints: Core rows straight to plain dicts, ready
+for orjson, with no ORM instances, entities, DTOs or pydantic models.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.archive import SessionArchive, session_archive, from_record
+from src.modules.spark.infrastructure.persistence.models import SparkSession as SparkSessionModel
+
+# Field order matches spark_schemas.SessionResponse / SessionSummaryResponse;
+# tests/unit/modules/spark/test_session_read_path.py keeps them in sync.
+SESSION_FIELDS = (
+    "id", "user_id", "status", "current_step",
+    "situation_response", "perception_response", "affect_response",
+    "response_response", "key_result_response",
+    "created_at", "updated_at", "completed_at",
+)
+SUMMARY_FIELDS = ("id", "status", "current_step", "created_at", "completed_at")
+
+
+def _columns(fields: Tuple[str, ...]) -> List[Any]:
+    return [getattr(SparkSessionModel, field) for field in fields]
+
+
+class SparkSessionReadQueries:
+    """Read-only queries returning JSON-ready dicts."""
+
+    def __init__(self, session: AsyncSession, archive: Optional[SessionArchive] = None):
+        self.session = session
+        self.archive = archive or session_archive
+
+    async def get_session(self, session_id: UUID) -> Optional[Dict[str, Any]]:
+        """Get one session as a dict, from the hot table or else the archive."""
+        result = await self.session.execute(
+            select(*_columns(SESSION_FIELDS)).where(SparkSessionModel.id == session_id)
+        )
+        row = result.mappings().first()
+        if row:
+            return dict(row)
+
+        record = await self.archive.get(self.session, "spark", session_id)
+        return self._project(record, SESSION_FIELDS) if record else None
+
+    async def list_sessions(
+        self,
+        user_id: UUID,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of session summaries (newest first) and the total count."""
+        page = await self.archive.page_for_user(
+            self.session, "spark", SparkSessionModel, user_id, offset=offset, limit=limit
+        )
+        hot_ids = [session_id for session_id, archived in page if not archived]
+        hot = {}
+        if hot_ids:
+            result = await self.session.execute(
+                select(*_columns(SUMMARY_FIELDS))
+                .where(SparkSessionModel.user_id == user_id, SparkSessionModel.id.in_(hot_ids))
+            )
+            hot = {row["id"]: dict(row) for row in result.mappings()}
+        records = await self.archive.get_many(
+            self.session, "spark", [session_id for session_id, archived in page if archived]
+        )
+
+        sessions = []
+        for session_id, archived in page:
+            if archived and str(session_id) in records:
+                sessions.append(self._project(records[str(session_id)], SUMMARY_FIELDS))
+            elif not archived and session_id in hot:
+                sessions.append(hot[session_id])
+
+        hot_count = await self.session.scalar(
+            select(func.count(SparkSessionModel.id)).where(SparkSessionModel.user_id == user_id)
+        )
+        archived_count = await self.archive.count_for_user(self.session, "spark", user_id)
+
+        return sessions, hot_count + archived_count
+
+    @staticmethod
+    def _project(record: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+        # Archive records hold strings; rebuild typed values so both tiers serialize alike
+        model = from_record(SparkSessionModel, record)
+        return {field: getattr(model, field) for field in fields}
@@ -2,24 +2,36 @@
 SparkSession Repository Implementation - Infrastructure Layer
 """
 
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.spark.domain.entities.spark_session import SparkSession as SparkSessionEntity
 from src.modules.spark.domain.repositories.spark_session_repository import ISparkSessionRepository
 from src.modules.spark.domain.value_objects.session_status import SessionStatus
 from src.modules.spark.infrastructure.persistence.models import SparkSession as SparkSessionModel
+from src.modules.sync.infrastructure.persistence.models import SessionTombstone
+from src.core.domain.exceptions import SessionArchivedError
+from src.infrastructure.archive import SessionArchive, session_archive, from_record
+from src.infrastructure.database.session_ids import claim_session_id
+from src.infrastructure.drafts import DraftBuffer, draft_buffer
 
 class SparkSessionRepository(ISparkSessionRepository):
     """SQLAlchemy implementation of SPARK session repository."""
     
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, archive: Optional[SessionArchive] = None, drafts: Optional[DraftBuffer] = None):
         self.session = session
+        # Old completed sessions live in cold storage; reads fall through to it
+        self.archive = archive or session_archive
+        self.drafts = drafts or draft_buffer
 
     async def create(self, session: SparkSessionEntity) -> SparkSessionEntity:
         """Create a new SPARK session."""
+        # The partitioned table cannot enforce a unique id on its own
+        if not await claim_session_id(self.session, "spark", session.id, session.user_id):
+            raise ValueError(f"Session already exists: {session.id}")
         db_session = SparkSessionModel(
             id=session.id,
             user_id=session.user_id,
@@ -40,12 +52,16 @@ class SparkSessionRepository(ISparkSessionRepository):
         return self._to_entity(db_session)
     
     async def get_by_id(self, session_id: UUID) -> Optional[SparkSessionEntity]:
-        """Get session by ID."""
+        """Get session by ID, from the hot table or else the archive."""
         result = await self.session.execute(
             select(SparkSessionModel).where(SparkSessionModel.id == session_id)
         )
         db_session = result.scalar_one_or_none()
-        return self._to_entity(db_session) if db_session else None
+        if db_session:
+            return self._to_entity(db_session)
+
+        record = await self.archive.get(self.session, "spark", session_id)
+        return self._to_entity(from_record(SparkSessionModel, record)) if record else None
 
     async def get_by_user_id(
         self,
@@ -64,32 +80,51 @@ class SparkSessionRepository(ISparkSessionRepository):
         Returns:
             Tuple of (sessions list, total count)
         """
-        # Get paginated results
-        result = await self.session.execute(
-            select(SparkSessionModel)
-            .where(SparkSessionModel.user_id == user_id)
-            .order_by(SparkSessionModel.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+        # One page across both tiers; archiving goes by completion date, so
+        # archived sessions can be newer than hot ones
+        page = await self.archive.page_for_user(
+            self.session, "spark", SparkSessionModel, user_id, offset=offset, limit=limit
+        )
+        hot_ids = [session_id for session_id, archived in page if not archived]
+        hot = {}
+        if hot_ids:
+            result = await self.session.execute(
+                select(SparkSessionModel)
+                .where(SparkSessionModel.user_id == user_id, SparkSessionModel.id.in_(hot_ids))
+            )
+            hot = {db_session.id: db_session for db_session in result.scalars().all()}
+        records = await self.archive.get_many(
+            self.session, "spark", [session_id for session_id, archived in page if archived]
         )
-        db_sessions = result.scalars().all()
+
+        sessions = []
+        for session_id, archived in page:
+            # A row moved between the two queries is left out of this page
+            if archived and str(session_id) in records:
+                sessions.append(self._to_entity(from_record(SparkSessionModel, records[str(session_id)])))
+            elif not archived and session_id in hot:
+                sessions.append(self._to_entity(hot[session_id]))
 
         # Get total count
         count_result = await self.session.execute(
             select(func.count(SparkSessionModel.id))
             .where(SparkSessionModel.user_id == user_id)
         )
-        total_count = count_result.scalar()
+        hot_count = count_result.scalar()
+        archived_count = await self.archive.count_for_user(self.session, "spark", user_id)
 
-        return [self._to_entity(db_session) for db_session in db_sessions], total_count
+        return sessions, hot_count + archived_count
     
     async def update(self, session: SparkSessionEntity) -> SparkSessionEntity:
-        """Update existing session."""
+        """Update existing session. Raises SessionArchivedError for archived sessions."""
         result = await self.session.execute(
             select(SparkSessionModel).where(SparkSessionModel.id == session.id)
         )
         db_session = result.scalar_one_or_none()
         if not db_session:
+            # Archived sessions are read-only; they are completed, so no entity change applies anyway
+            if await self.archive.get(self.session, "spark", session.id):
+                raise SessionArchivedError(f"Session is archived and read-only: {session.id}")
             raise ValueError(f"Session not found: {session.id}")
         
         # Update all fields
@@ -115,6 +150,23 @@ class SparkSessionRepository(ISparkSessionRepository):
         db_session = result.scalar_one_or_none()
         if db_session:
             await self.session.delete(db_session)
+            await self.drafts.discard(self.session, [session_id])
+            # Leave a tombstone so other devices pick up the deletion
+            self.session.add(SessionTombstone(
+                user_id=db_session.user_id,
+                session_type="spark",
+                session_id=db_session.id,
+            ))
+            return True
+
+        archived = await self.archive.get(self.session, "spark", session_id)
+        if archived and await self.archive.remove(self.session, "spark", session_id):
+            await self.drafts.discard(self.session, [session_id])
+            self.session.add(SessionTombstone(
+                user_id=UUID(archived["user_id"]),
+                session_type="spark",
+                session_id=session_id,
+            ))
             return True
         return False
 
@@ -143,6 +195,54 @@ class SparkSessionRepository(ISparkSessionRepository):
         db_session = result.scalar_one_or_none()
         return self._to_entity(db_session) if db_session else None
 
+    async def get_changed_since(
+        self,
+        user_id: UUID,
+        after: Optional[Tuple[datetime, UUID]],
+        updated_before: datetime,
+        limit: int
+    ) -> List[SparkSessionEntity]:
+        """
+        Get sessions changed after a (updated_at, id) keyset position, oldest first.
+
+        Served by the (user_id, updated_at, id) index, so cost is proportional
+        to the number of changes rather than the size of the history.
+        """
+        query = select(SparkSessionModel).where(
+            SparkSessionModel.user_id == user_id,
+            SparkSessionModel.updated_at < updated_before
+        )
+        if after:
+            query = query.where(tuple_(SparkSessionModel.updated_at, SparkSessionModel.id) > tuple_(*after))
+        result = await self.session.execute(
+            query.order_by(SparkSessionModel.updated_at, SparkSessionModel.id).limit(limit)
+        )
+        return [self._to_entity(db_session) for db_session in result.scalars().all()]
+
+    async def stream_by_user_id(
+        self,
+        user_id: UUID,
+        batch_size: int = 500
+    ) -> AsyncIterator[SparkSessionEntity]:
+        """
+        Stream every session for a user, oldest first, over a server-side cursor.
+
+        Rows are fetched `batch_size` at a time, so memory stays flat no
+        matter how long the user's history is. Archived sessions come first,
+        one segment at a time.
+        """
+        async for record in self.archive.stream_for_user(self.session, "spark", user_id):
+            yield self._to_entity(from_record(SparkSessionModel, record))
+
+        result = await self.session.stream(
+            select(SparkSessionModel)
+            .where(SparkSessionModel.user_id == user_id)
+            .order_by(SparkSessionModel.created_at.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for db_session in result.scalars():
+            yield self._to_entity(db_session)
+
     @staticmethod
     def _to_entity(model: SparkSessionModel) -> SparkSessionEntity:
         """Convert SQLAlchemy model to domain entity."""
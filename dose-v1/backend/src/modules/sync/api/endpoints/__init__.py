@@ -0,0 +1,116 @@
+"""
+Sync API Endpoints
+"""
+
+from uuid import UUID
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.session import get_db
+from src.infrastructure.event_bus import event_bus
+from src.infrastructure.event_store import OutboxPublisher
+from src.infrastructure.logging import get_logger
+from src.modules.auth.application.services.auth_service import AuthService
+from src.modules.auth.infrastructure.repositories.user_repository import UserRepository
+from src.modules.spark.infrastructure.repositories.spark_session_repository import SparkSessionRepository
+from src.modules.wave.infrastructure.repositories.wave_session_repository import WaveSessionRepository
+from src.modules.sync.api.schemas.sync_schemas import BatchRequest, BatchResponse, ChangesResponse
+from src.modules.sync.application.dto.sync_dto import BatchOperationDTO
+from src.modules.sync.application.services.batch_sync_service import BatchSyncService
+from src.modules.sync.application.services.change_feed_service import ChangeFeedService, CursorExpiredError
+from src.modules.sync.infrastructure.repositories.tombstone_repository import TombstoneRepository
+
+router = APIRouter()
+security = HTTPBearer()
+logger = get_logger(__name__)
+
+
+def get_batch_sync_service(db: AsyncSession = Depends(get_db)) -> BatchSyncService:
+    """Dependency to get the batch sync service."""
+    return BatchSyncService(
+        SparkSessionRepository(db),
+        WaveSessionRepository(db),
+        OutboxPublisher(db, event_bus),
+        max_backfill_days=settings.SYNC_MAX_BACKFILL_DAYS
+    )
+
+
+def get_change_feed_service(db: AsyncSession = Depends(get_db)) -> ChangeFeedService:
+    """Dependency to get the change feed service."""
+    return ChangeFeedService(
+        SparkSessionRepository(db),
+        WaveSessionRepository(db),
+        TombstoneRepository(db),
+        settle_seconds=settings.SYNC_SETTLE_SECONDS,
+        retention_days=settings.SYNC_TOMBSTONE_RETENTION_DAYS,
+    )
+
+
+async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security), db: AsyncSession = Depends(get_db)) -> UUID:
+    """Dependency to get current user ID from token."""
+    user_repository = UserRepository(db)
+    auth_service = AuthService(user_repository)
+
+    user = await auth_service.get_current_user(credentials.credentials)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials"
+        )
+
+    return user.id
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def apply_batch(
+    request: BatchRequest,
+    user_id: UUID = Depends(get_current_user_id),
+    batch_service: BatchSyncService = Depends(get_batch_sync_service)
+):
+    """
+    Apply a batch of offline SPARK/WAVE mutations in one transaction.
+
+    Operations run in order through the same rules as the single-call
+    endpoints. Each one gets its own result (`applied` or `failed` with the
+    status code the single call would have returned); a failed operation does
+    not stop the ones after it.
+    """
+    operations = [
+        BatchOperationDTO(
+            op=operation.op,
+            session_id=operation.session_id,
+            params=operation.model_dump(exclude={"op", "op_id", "session_id"}),
+            op_id=operation.op_id,
+        )
+        for operation in request.operations
+    ]
+    result = await batch_service.apply(user_id, operations)
+
+    failed = sum(1 for r in result.results if r.status == "failed")
+    logger.info(f"Batch sync applied: {len(operations) - failed}/{len(operations)} operations for {user_id}")
+    return result
+
+
+@router.get("/changes", response_model=ChangesResponse)
+async def get_changes(
+    cursor: Optional[str] = Query(default=None, description="Cursor from the previous response; omit for a full sync"),
+    limit: int = Query(default=100, ge=1, le=500),
+    user_id: UUID = Depends(get_current_user_id),
+    change_feed: ChangeFeedService = Depends(get_change_feed_service)
+):
+    """
+    Get SPARK/WAVE sessions created, updated or deleted since `cursor`.
+
+    Store the returned cursor and send it on the next call. While `has_more`
+    is true, keep requesting. A 410 means the cursor is too old to resume
+    from and the client should start over without one.
+    """
+    try:
+        return await change_feed.get_changes(user_id, cursor, limit)
+    except CursorExpiredError as e:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,125 @@
+"""
+Sync API Schemas - Request/Response validation
+"""
+
+from datetime import datetime
+from typing import Annotated, List, Literal, Optional, Union
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+from src.modules.spark.api.schemas.spark_schemas import (
+    UpdateStepRequest,
+    SessionResponse as SparkSessionResponse,
+)
+from src.modules.wave.api.schemas.wave_schemas import (
+    UpdateCheckinRequest,
+    UpdateAcceptanceRequest,
+    UpdateActionRequest,
+    CompleteActionRequest,
+    SessionResponse as WaveSessionResponse,
+)
+
+MAX_BATCH_OPERATIONS = 100
+
+
+class BatchOperationBase(BaseModel):
+    """Fields shared by every batch operation."""
+    op_id: Optional[str] = Field(None, max_length=100, description="Client reference echoed back in the result")
+    session_id: UUID = Field(..., description="Target session (client-generated for create operations)")
+
+
+# Payload fields reuse the single-call request schemas, so validation is identical.
+
+class SparkCreateOperation(BatchOperationBase):
+    op: Literal["spark.create"]
+    created_at: Optional[datetime] = Field(None, description="When the session was started on the device")
+
+class SparkUpdateStepOperation(BatchOperationBase, UpdateStepRequest):
+    op: Literal["spark.update_step"]
+
+class SparkCompleteOperation(BatchOperationBase):
+    op: Literal["spark.complete"]
+    completed_at: Optional[datetime] = Field(None, description="When the session was completed on the device")
+
+class WaveCreateOperation(BatchOperationBase):
+    op: Literal["wave.create"]
+    created_at: Optional[datetime] = Field(None, description="When the session was started on the device")
+
+class WaveCheckinOperation(BatchOperationBase, UpdateCheckinRequest):
+    op: Literal["wave.checkin"]
+
+class WaveAcceptanceOperation(BatchOperationBase, UpdateAcceptanceRequest):
+    op: Literal["wave.acceptance"]
+
+class WaveActionOperation(BatchOperationBase, UpdateActionRequest):
+    op: Literal["wave.action"]
+
+class WaveCompleteActionOperation(BatchOperationBase, CompleteActionRequest):
+    op: Literal["wave.complete_action"]
+
+class WaveCompleteOperation(BatchOperationBase):
+    op: Literal["wave.complete"]
+    completed_at: Optional[datetime] = Field(None, description="When the session was completed on the device")
+
+
+BatchOperation = Annotated[
+    Union[
+        SparkCreateOperation,
+        SparkUpdateStepOperation,
+        SparkCompleteOperation,
+        WaveCreateOperation,
+        WaveCheckinOperation,
+        WaveAcceptanceOperation,
+        WaveActionOperation,
+        WaveCompleteActionOperation,
+        WaveCompleteOperation,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class BatchRequest(BaseModel):
+    """Ordered list of offline operations for one or more sessions."""
+    operations: List[BatchOperation] = Field(..., min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+
+class BatchOperationResult(BaseModel):
+    """Outcome of one operation."""
+    index: int
+    op: str
+    op_id: Optional[str] = None
+    session_id: UUID
+    status: Literal["applied", "failed"]
+    status_code: int
+    error: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+
+class BatchResponse(BaseModel):
+    """Per-operation results plus the final state of every session that changed."""
+    results: List[BatchOperationResult]
+    spark_sessions: List[SparkSessionResponse]
+    wave_sessions: List[WaveSessionResponse]
+
+    model_config = {"from_attributes": True}
+
+
+class DeletedSession(BaseModel):
+    """A session deleted since the previous sync."""
+    session_type: Literal["spark", "wave"]
+    session_id: UUID
+    deleted_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ChangesResponse(BaseModel):
+    """One page of the change feed."""
+    spark_sessions: List[SparkSessionResponse]
+    wave_sessions: List[WaveSessionResponse]
+    deleted: List[DeletedSession]
+    cursor: str = Field(..., description="Opaque cursor to pass on the next request")
+    has_more: bool = Field(..., description="True if more changes are waiting; request again immediately")
+
+    model_config = {"from_attributes": True}
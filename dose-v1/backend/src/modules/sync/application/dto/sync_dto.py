@@ -0,0 +1,58 @@
+"""
+Sync Data Transfer Objects
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from src.modules.spark.application.dto.spark_dto import SparkSessionDTO
+from src.modules.wave.application.dto.wave_dto import WaveSessionDTO
+
+
+@dataclass(slots=True)
+class BatchOperationDTO:
+    """DTO for one queued offline mutation, e.g. op="wave.checkin"."""
+    op: str
+    session_id: UUID
+    params: Dict[str, Any] = field(default_factory=dict)
+    op_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class BatchOperationResultDTO:
+    """DTO for the outcome of a single batch operation."""
+    index: int
+    op: str
+    session_id: UUID
+    status: str  # "applied" or "failed"
+    status_code: int
+    op_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class BatchResultDTO:
+    """DTO for a whole batch: per-operation results plus final session states."""
+    results: List[BatchOperationResultDTO]
+    spark_sessions: List[SparkSessionDTO]
+    wave_sessions: List[WaveSessionDTO]
+
+
+@dataclass(slots=True)
+class DeletedSessionDTO:
+    """DTO for a session deletion seen by the change feed."""
+    session_type: str  # "spark" or "wave"
+    session_id: UUID
+    deleted_at: datetime
+
+
+@dataclass(slots=True)
+class ChangesDTO:
+    """DTO for one page of the change feed."""
+    spark_sessions: List[SparkSessionDTO]
+    wave_sessions: List[WaveSessionDTO]
+    deleted: List[DeletedSessionDTO]
+    cursor: str
+    has_more: bool
@@ -0,0 +1,234 @@
+"""
+Batch Sync Service - Application Layer
+Replays an ordered list of offline SPARK/WAVE mutations in one transaction
+"""
+
+import copy
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.core.application.interfaces.event_publisher import IEventPublisher
+from src.core.domain.exceptions import SessionArchivedError
+from src.modules.spark.application.services.spark_service import SparkService
+from src.modules.spark.domain.repositories.spark_session_repository import ISparkSessionRepository
+from src.modules.wave.application.services.wave_service import WaveService
+from src.modules.wave.domain.repositories.wave_session_repository import IWaveSessionRepository
+from src.modules.sync.application.dto.sync_dto import (
+    BatchOperationDTO,
+    BatchOperationResultDTO,
+    BatchResultDTO,
+)
+
+SPARK = "spark"
+WAVE = "wave"
+
+# op name -> function applying it to a loaded entity (entity methods do the validation)
+_HANDLERS: Dict[str, Callable[[Any, Dict[str, Any]], None]] = {
+    "spark.update_step": lambda s, p: SparkService.apply_step(s, p["step_number"], p["response"]),
+    "spark.complete": lambda s, p: SparkService.apply_complete(s, p.get("completed_at")),
+    "wave.checkin": lambda s, p: WaveService.apply_checkin(s, p["situation"], p["emotion"], p["intensity"]),
+    "wave.acceptance": lambda s, p: WaveService.apply_acceptance(s, p["acceptance_statement"]),
+    "wave.action": lambda s, p: WaveService.apply_action(s, p["action_type"], p.get("action_notes")),
+    "wave.complete_action": lambda s, p: WaveService.apply_complete_action(s, p["duration_seconds"]),
+    "wave.complete": lambda s, p: WaveService.apply_complete(s, p.get("completed_at")),
+}
+
+SUPPORTED_OPS = frozenset(_HANDLERS) | {"spark.create", "wave.create"}
+
+# Device clock readings carried by create/complete operations
+_CLIENT_TIME_PARAMS = ("created_at", "completed_at")
+
+
+class BatchOperationError(Exception):
+    """Raised when a single batch operation cannot be applied."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class BatchSyncService:
+    """
+    Applies queued offline operations through the existing entity methods.
+
+    Every session is loaded at most once and written at most once, however
+    many operations target it. Operations are applied in order; a failed
+    operation leaves its session untouched and does not stop the batch.
+    The caller's unit of work commits everything together.
+
+    Create and complete operations may carry the device time they happened
+    at, so sessions done offline are dated (and counted in streaks and
+    charts) on the right day. Those times are clamped to the last
+    `max_backfill_days` and never lie in the future.
+    """
+
+    def __init__(
+        self,
+        spark_repository: ISparkSessionRepository,
+        wave_repository: IWaveSessionRepository,
+        events: Optional[IEventPublisher] = None,
+        max_backfill_days: int = 14
+    ):
+        self.repositories = {SPARK: spark_repository, WAVE: wave_repository}
+        self.events = events
+        self.max_backfill = timedelta(days=max_backfill_days)
+
+    async def apply(self, user_id: UUID, operations: List[BatchOperationDTO]) -> BatchResultDTO:
+        """
+        Apply operations for the given user.
+
+        Args:
+            user_id: Authenticated user; every touched session must belong to them.
+            operations: Ordered operations as recorded on the device.
+
+        Returns:
+            BatchResultDTO with one result per operation and the final state of
+            every session that was successfully touched.
+        """
+        # (module, session_id) -> entity, or None if known not to exist
+        loaded: Dict[Tuple[str, UUID], Optional[Any]] = {}
+        created: Set[Tuple[str, UUID]] = set()
+        dirty: List[Tuple[str, UUID]] = []
+        results: List[BatchOperationResultDTO] = []
+
+        now = datetime.utcnow()
+        for index, operation in enumerate(operations):
+            module = operation.op.split(".", 1)[0]
+            key = (module, operation.session_id)
+            params = self._with_client_times(operation.params, now)
+            try:
+                if operation.op not in SUPPORTED_OPS:
+                    raise BatchOperationError(f"Unsupported operation: {operation.op}")
+
+                if operation.op.endswith(".create"):
+                    changed = await self._create(key, user_id, loaded, created, params.get("created_at"))
+                else:
+                    session = await self._load(key, user_id, loaded)
+                    # Work on a copy so a rejected operation leaves the session as it was
+                    candidate = copy.copy(session)
+                    try:
+                        _HANDLERS[operation.op](candidate, params)
+                    except ValueError as e:
+                        raise BatchOperationError(str(e)) from None
+                    loaded[key] = candidate
+                    changed = True
+
+                if changed and key not in dirty:
+                    dirty.append(key)
+                results.append(self._result(index, operation, "applied", 200))
+            except BatchOperationError as e:
+                results.append(self._result(index, operation, "failed", e.status_code, str(e)))
+
+        spark_sessions, wave_sessions = [], []
+        for key in dirty:
+            module, _ = key
+            repository = self.repositories[module]
+            entity = loaded[key]
+            try:
+                if key in created:
+                    saved = await repository.create(entity)
+                else:
+                    saved = await repository.update(entity)
+            except SessionArchivedError as e:
+                # Archived after we loaded it; archived sessions are read-only
+                self._fail_session(results, operations, key, str(e), 410)
+                continue
+            except ValueError as e:
+                # Another device took the id or deleted the session after we loaded it
+                self._fail_session(results, operations, key, str(e), 409)
+                continue
+            if self.events:
+                self.events.publish(entity.pull_events())
+            if module == SPARK:
+                spark_sessions.append(SparkService._to_dto(saved))
+            else:
+                wave_sessions.append(WaveService._to_dto(saved))
+
+        return BatchResultDTO(results=results, spark_sessions=spark_sessions, wave_sessions=wave_sessions)
+
+    async def _load(self, key: Tuple[str, UUID], user_id: UUID, loaded: Dict) -> Any:
+        """Load a session once per batch and check ownership."""
+        if key not in loaded:
+            module, session_id = key
+            loaded[key] = await self.repositories[module].get_by_id(session_id)
+
+        session = loaded[key]
+        if session is None:
+            raise BatchOperationError(f"Session not found: {key[1]}", 404)
+        if session.user_id != user_id:
+            raise BatchOperationError("Not authorized to modify this session", 403)
+        return session
+
+    def _fail_session(
+        self,
+        results: List[BatchOperationResultDTO],
+        operations: List[BatchOperationDTO],
+        key: Tuple[str, UUID],
+        error: str,
+        status_code: int
+    ) -> None:
+        """Mark every applied operation on a session that could not be written as failed."""
+        module, session_id = key
+        for position, result in enumerate(results):
+            if result.status == "applied" and result.session_id == session_id and result.op.startswith(f"{module}."):
+                results[position] = self._result(result.index, operations[result.index], "failed", status_code, error)
+
+    def _with_client_times(self, params: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+        """Device times as naive UTC, within the backfill window."""
+        if not any(params.get(name) for name in _CLIENT_TIME_PARAMS):
+            return params
+        params = dict(params)
+        for name in _CLIENT_TIME_PARAMS:
+            value = params.get(name)
+            if value is None:
+                continue
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            params[name] = min(max(value, now - self.max_backfill), now)
+        return params
+
+    async def _create(
+        self,
+        key: Tuple[str, UUID],
+        user_id: UUID,
+        loaded: Dict,
+        created: Set,
+        created_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        Create a session with the client-generated ID.
+
+        Replaying a create for a session the user already owns is a no-op, so
+        a batch can safely be retried after a dropped response.
+        """
+        try:
+            await self._load(key, user_id, loaded)
+            return False
+        except BatchOperationError as e:
+            if e.status_code != 404:
+                raise BatchOperationError("Session already exists", 409) from None
+
+        module, session_id = key
+        service = SparkService if module == SPARK else WaveService
+        loaded[key] = service.new_session(user_id, session_id, created_at)
+        created.add(key)
+        return True
+
+    @staticmethod
+    def _result(
+        index: int,
+        operation: BatchOperationDTO,
+        status: str,
+        status_code: int,
+        error: Optional[str] = None
+    ) -> BatchOperationResultDTO:
+        return BatchOperationResultDTO(
+            index=index,
+            op=operation.op,
+            session_id=operation.session_id,
+            status=status,
+            status_code=status_code,
+            op_id=operation.op_id,
+            error=error,
+        )
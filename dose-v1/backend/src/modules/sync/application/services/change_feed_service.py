@@ -0,0 +1,130 @@
+"""
+Change Feed Service - Application Layer
+"Sessions changed since cursor" for multi-device delta sync
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from src.core.utils.cursor import encode_cursor, decode_cursor
+from src.modules.spark.application.services.spark_service import SparkService
+from src.modules.spark.domain.repositories.spark_session_repository import ISparkSessionRepository
+from src.modules.wave.application.services.wave_service import WaveService
+from src.modules.wave.domain.repositories.wave_session_repository import IWaveSessionRepository
+from src.modules.sync.application.dto.sync_dto import ChangesDTO, DeletedSessionDTO
+from src.modules.sync.infrastructure.repositories.tombstone_repository import TombstoneRepository
+
+CURSOR_VERSION = 1
+
+Position = Optional[Tuple[datetime, UUID]]
+
+
+class CursorExpiredError(ValueError):
+    """Raised when a cursor is older than tombstone retention; the client must resync fully."""
+
+
+class ChangeFeedService:
+    """
+    Serves created, updated and deleted sessions since an opaque cursor.
+
+    The cursor holds an independent (timestamp, id) keyset position for each
+    source (SPARK sessions, WAVE sessions, tombstones), so every page is a
+    handful of index range scans. Changes younger than `settle_seconds` are
+    held back until the next poll: `updated_at` is stamped before commit, and
+    without the delay a slow transaction could commit behind a position the
+    client has already passed.
+    """
+
+    def __init__(
+        self,
+        spark_repository: ISparkSessionRepository,
+        wave_repository: IWaveSessionRepository,
+        tombstone_repository: TombstoneRepository,
+        settle_seconds: int = 5,
+        retention_days: int = 30
+    ):
+        self.spark_repository = spark_repository
+        self.wave_repository = wave_repository
+        self.tombstone_repository = tombstone_repository
+        self.settle_seconds = settle_seconds
+        self.retention_days = retention_days
+
+    async def get_changes(self, user_id: UUID, cursor: Optional[str] = None, limit: int = 100) -> ChangesDTO:
+        """
+        Get the next page of changes for a user.
+
+        Args:
+            user_id: UUID of the user.
+            cursor: Cursor from the previous page, or None for a full initial sync.
+            limit: Maximum number of items per source (SPARK, WAVE, deletions).
+
+        Returns:
+            ChangesDTO with the changes, the cursor to send next time and
+            whether more changes are waiting.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+            CursorExpiredError: If the cursor predates tombstone retention.
+        """
+        now = datetime.utcnow()
+        positions = self._decode(cursor, now)
+        settled = now - timedelta(seconds=self.settle_seconds)
+
+        spark = await self.spark_repository.get_changed_since(user_id, positions["spark"], settled, limit + 1)
+        wave = await self.wave_repository.get_changed_since(user_id, positions["wave"], settled, limit + 1)
+        tombstones = await self.tombstone_repository.get_since(user_id, positions["deleted"], settled, limit + 1)
+
+        has_more = any(len(page) > limit for page in (spark, wave, tombstones))
+        spark, wave, tombstones = spark[:limit], wave[:limit], tombstones[:limit]
+
+        if spark:
+            positions["spark"] = (spark[-1].updated_at, spark[-1].id)
+        if wave:
+            positions["wave"] = (wave[-1].updated_at, wave[-1].id)
+        if tombstones:
+            positions["deleted"] = (tombstones[-1].deleted_at, tombstones[-1].id)
+
+        return ChangesDTO(
+            spark_sessions=[SparkService._to_dto(session) for session in spark],
+            wave_sessions=[WaveService._to_dto(session) for session in wave],
+            deleted=[
+                DeletedSessionDTO(
+                    session_type=tombstone.session_type,
+                    session_id=tombstone.session_id,
+                    deleted_at=tombstone.deleted_at,
+                )
+                for tombstone in tombstones
+            ],
+            cursor=self._encode(positions, now),
+            has_more=has_more,
+        )
+
+    @staticmethod
+    def _encode(positions: Dict[str, Position], issued_at: datetime) -> str:
+        payload: Dict[str, Any] = {"v": CURSOR_VERSION, "issued_at": issued_at.isoformat()}
+        for source, position in positions.items():
+            payload[source] = [position[0].isoformat(), str(position[1])] if position else None
+        return encode_cursor(payload)
+
+    def _decode(self, cursor: Optional[str], now: datetime) -> Dict[str, Position]:
+        positions: Dict[str, Position] = {"spark": None, "wave": None, "deleted": None}
+        if not cursor:
+            return positions
+
+        payload = decode_cursor(cursor)
+        if payload.get("v") != CURSOR_VERSION:
+            raise ValueError("Invalid cursor")
+        try:
+            issued_at = datetime.fromisoformat(payload["issued_at"])
+            for source in positions:
+                position = payload.get(source)
+                if position:
+                    positions[source] = (datetime.fromisoformat(position[0]), UUID(position[1]))
+        except (KeyError, IndexError, TypeError, ValueError):
+            raise ValueError("Invalid cursor") from None
+
+        # Tombstones older than retention are purged, so deletions could be missed
+        if issued_at < now - timedelta(days=self.retention_days):
+            raise CursorExpiredError("Cursor has expired; perform a full sync")
+        return positions
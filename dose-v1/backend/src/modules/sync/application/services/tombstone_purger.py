@@ -0,0 +1,92 @@
+"""
+Tombstone Purger Job
+Deletes session tombstones once no unexpired change feed cursor can need them.
+
+Run once by hand with:
+    python -m src.modules.sync.application.services.tombstone_purger
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.logging import get_logger
+from src.modules.sync.infrastructure.repositories.tombstone_repository import TombstoneRepository
+
+logger = get_logger(__name__)
+
+
+class TombstonePurger:
+    """
+    Purges tombstones older than the change feed's cursor retention.
+
+    ChangeFeedService rejects cursors issued more than `retention_days` ago
+    (410, full resync). A cursor still accepted was issued after that, and
+    it covers deletions up to its settle window before that, so tombstones
+    are kept for `retention_days` plus `settle_seconds`. Rows are deleted
+    `batch_size` per transaction.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        retention_days: int,
+        settle_seconds: int = 5,
+        batch_size: int = 1000,
+        interval_seconds: float = 60 * 60
+    ):
+        self.session_factory = session_factory
+        self.retention_days = retention_days
+        self.settle_seconds = settle_seconds
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+
+    def cutoff(self, now: Optional[datetime] = None) -> datetime:
+        """Tombstones deleted before this are no longer needed."""
+        return (now or datetime.utcnow()) - timedelta(days=self.retention_days, seconds=self.settle_seconds)
+
+    async def run(self, now: Optional[datetime] = None) -> int:
+        """Purge everything currently expired. Returns tombstones deleted."""
+        cutoff = self.cutoff(now)
+        total = 0
+        while True:
+            async with self.session_factory() as db:
+                purged = await TombstoneRepository(db).purge_older_than(cutoff, limit=self.batch_size)
+                await db.commit()
+            total += purged
+            if purged < self.batch_size:
+                return total
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Run the job every `interval_seconds` until `stop` is set."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                purged = await self.run()
+                if purged:
+                    logger.info(f"Session tombstones purged: {purged}")
+            except Exception as e:
+                logger.error(f"Tombstone purge failed: {e}")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+
+async def main() -> None:
+    from src.infrastructure.config.settings import settings
+    from src.infrastructure.database.session import AsyncSessionLocal, engine
+
+    purger = TombstonePurger(
+        AsyncSessionLocal,
+        retention_days=settings.SYNC_TOMBSTONE_RETENTION_DAYS,
+        settle_seconds=settings.SYNC_SETTLE_SECONDS,
+    )
+    print(f"Session tombstones purged: {await purger.run()}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
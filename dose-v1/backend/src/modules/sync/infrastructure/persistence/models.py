@@ -0,0 +1,31 @@
+"""
+SessionTombstone SQLAlchemy Model - Infrastructure Layer
+Records deleted SPARK/WAVE sessions so other devices can sync the deletion
+"""
+
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import String, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.infrastructure.database.session import Base
+
+
+class SessionTombstone(Base):
+    """SQLAlchemy SessionTombstone model."""
+    __tablename__ = "session_tombstones"
+
+    id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    session_type: Mapped[str] = mapped_column(String(20), nullable=False)  # 'spark' or 'wave'
+    session_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # Change feed reads tombstones by (user_id, deleted_at, id) keyset
+        Index("ix_session_tombstones_user_deleted", "user_id", "deleted_at", "id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SessionTombstone(session_type={self.session_type}, session_id={self.session_id})>"
@@ -0,0 +1,49 @@
+"""
+Session Tombstone Repository
+"""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import select, delete, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.sync.infrastructure.persistence.models import SessionTombstone
+
+
+class TombstoneRepository:
+    """Repository for deleted-session markers used by the change feed."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_since(
+        self,
+        user_id: UUID,
+        after: Optional[Tuple[datetime, UUID]],
+        deleted_before: datetime,
+        limit: int
+    ) -> List[SessionTombstone]:
+        """Get the user's tombstones after a (deleted_at, id) keyset position, oldest first."""
+        query = select(SessionTombstone).where(
+            SessionTombstone.user_id == user_id,
+            SessionTombstone.deleted_at < deleted_before
+        )
+        if after:
+            query = query.where(tuple_(SessionTombstone.deleted_at, SessionTombstone.id) > tuple_(*after))
+        result = await self.session.execute(
+            query.order_by(SessionTombstone.deleted_at, SessionTombstone.id).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def purge_older_than(self, cutoff: datetime, limit: Optional[int] = None) -> int:
+        """Delete tombstones older than cutoff, at most `limit` of them. Returns count of deleted."""
+        expired = SessionTombstone.deleted_at < cutoff
+        if limit:
+            expired = SessionTombstone.id.in_(
+                select(SessionTombstone.id).where(expired).limit(limit).scalar_subquery()
+            )
+        result = await self.session.execute(
+            delete(SessionTombstone).where(expired).execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -2,11 +2,15 @@
 WAVE API Endpoints
 """
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Response, status, Query
 
+from src.infrastructure.cache import response_cache
 from src.infrastructure.database.session import get_db
+from src.infrastructure.drafts import draft_buffer
+from src.infrastructure.event_bus import event_bus
+from src.infrastructure.event_store import OutboxPublisher
 from src.modules.auth.application.services.auth_service import AuthService
 from src.modules.wave.application.services.wave_service import WaveService
 from src.modules.wave.application.dto.wave_dto import (
@@ -17,6 +21,7 @@ from src.modules.wave.application.dto.wave_dto import (
     CompleteActionDTO,
 )
 from src.modules.wave.infrastructure.repositories.wave_session_repository import WaveSessionRepository
+from src.modules.wave.infrastructure.queries.session_read_queries import WaveSessionReadQueries
 from src.modules.wave.api.schemas.wave_schemas import (
     CreateSessionRequest,
     UpdateCheckinRequest,
@@ -25,9 +30,12 @@ from src.modules.wave.api.schemas.wave_schemas import (
     CompleteActionRequest,
     SessionResponse,
     SessionListResponse,
+    DraftRequest,
+    DraftResponse,
+    DraftListResponse,
 )
 from src.modules.auth.infrastructure.repositories.user_repository import UserRepository
-from src.modules.wave.domain.value_objects.action_type import ActionType
+from src.modules.wave.application.queries.action_catalog import action_catalog
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -38,7 +46,12 @@ security = HTTPBearer()
 async def get_wave_service(db = Depends(get_db)) -> WaveService:
     """Dependency to get WaveService instance."""
     repository = WaveSessionRepository(db)
-    return WaveService(repository)
+    return WaveService(repository, OutboxPublisher(db, event_bus))
+
+
+async def get_wave_read_queries(db = Depends(get_db)) -> WaveSessionReadQueries:
+    """Dependency to get the WAVE read path."""
+    return WaveSessionReadQueries(db)
 
 
 async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security), db: AsyncSession = Depends(get_db)) -> UUID:
@@ -78,25 +91,38 @@ async def create_session(
 async def get_session(
     session_id: UUID,
     user_id: UUID = Depends(get_current_user_id),
-    wave_service: WaveService = Depends(get_wave_service)
+    read_queries: WaveSessionReadQueries = Depends(get_wave_read_queries),
+    if_none_match: Optional[str] = Header(default=None)
 ):
-    """Get a specific WAVE session."""
-    try:
-        session = await wave_service.get_session(session_id)
-        
+    """
+    Get a specific WAVE session.
+
+    Served from a Core row serialized directly with orjson; the schema is
+    enforced by tests instead of per-request validation. The encoded body
+    is cached per user until their next write, and a matching
+    If-None-Match gets 304 Not Modified.
+    """
+    async def load():
+        session = await read_queries.get_session(session_id)
+        if not session:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session not found: {session_id}"
+            )
+
         # Check ownership
-        if session.user_id != user_id:
+        if session["user_id"] != user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to access this session"
             )
-        
+
         return session
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+
+    try:
+        return await response_cache.respond(user_id, ("wave.session", session_id), if_none_match, load)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -281,17 +307,21 @@ async def list_sessions(
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
     user_id: UUID = Depends(get_current_user_id),
-    wave_service: WaveService = Depends(get_wave_service)
+    read_queries: WaveSessionReadQueries = Depends(get_wave_read_queries),
+    if_none_match: Optional[str] = Header(default=None)
 ):
-    """Get all sessions for the current user with pagination."""
+    """Get all sessions for the current user with pagination; cached per user like get_session."""
+    async def load():
+        sessions, total = await read_queries.list_sessions(user_id, limit, offset)
+        return {
+            "sessions": sessions,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+        }
+
     try:
-        sessions, total = await wave_service.get_user_sessions(user_id, limit, offset)
-        return SessionListResponse(
-            sessions=sessions,
-            total=total,
-            offset=offset,
-            limit=limit
-        )
+        return await response_cache.respond(user_id, ("wave.sessions", limit, offset), if_none_match, load)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -299,16 +329,61 @@ async def list_sessions(
         )
 
 @router.get("/actions")
-async def get_available_actions():
-    """Get all available actions with metadata."""
-    try:
-        actions = ActionType.all_actions()
-        return {
-            "actions": actions,
-            "total": len(actions)
-        }
-    except Exception as e:
+async def get_available_actions(if_none_match: Optional[str] = Header(default=None)):
+    """
+    Get all available actions with metadata.
+
+    The body is encoded once at startup. Responses carry a strong ETag;
+    a matching If-None-Match gets 304 Not Modified without a body.
+    """
+    headers = {"ETag": action_catalog.etag, "Cache-Control": action_catalog.cache_control}
+    if action_catalog.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=action_catalog.body, media_type="application/json", headers=headers)
+
+async def _check_draft_access(session_id: UUID, user_id: UUID, read_queries: WaveSessionReadQueries) -> None:
+    """Ownership check for drafts; the owner is cached so autosaves skip the lookup."""
+    owner = draft_buffer.owner(session_id)
+    if owner is None:
+        session = await read_queries.get_session(session_id)
+        if not session:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session not found: {session_id}"
+            )
+        owner = session["user_id"]
+        draft_buffer.remember_owner(session_id, owner)
+    if owner != user_id:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
\ No newline at end of file
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this session"
+        )
+
+@router.put("/sessions/{session_id}/steps/{step_number}/draft", response_model=DraftResponse, status_code=status.HTTP_202_ACCEPTED)
+async def save_draft(
+    session_id: UUID,
+    request: DraftRequest,
+    step_number: int = Path(..., ge=1, le=3, description="1 situation, 2 acceptance statement, 3 action notes"),
+    user_id: UUID = Depends(get_current_user_id),
+    read_queries: WaveSessionReadQueries = Depends(get_wave_read_queries)
+):
+    """
+    Autosave the text being typed for a step.
+
+    Drafts are buffered in memory, coalesced per step and stored within a
+    few seconds; they never change the session itself.
+    """
+    await _check_draft_access(session_id, user_id, read_queries)
+    updated_at = await draft_buffer.put("wave", session_id, user_id, step_number, request.text)
+    return {"step": step_number, "text": request.text, "updated_at": updated_at}
+
+@router.get("/sessions/{session_id}/drafts", response_model=DraftListResponse)
+async def get_drafts(
+    session_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    read_queries: WaveSessionReadQueries = Depends(get_wave_read_queries),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the session's latest drafts, including ones not stored yet."""
+    await _check_draft_access(session_id, user_id, read_queries)
+    return {"drafts": await draft_buffer.drafts(db, session_id)}
@@ -7,7 +7,9 @@ from typing import List, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field, field_validator
 
-from src.modules.wave.domain.value_objects.action_type import ActionType
+from src.modules.wave.domain.value_objects.action_type import ACTION_VALUES, ActionType
+
+_VALID_ACTIONS_TEXT = ", ".join(action.value for action in ActionType)
 
 class CreateSessionRequest(BaseModel):
     """Request to create a new WAVE session."""
@@ -52,9 +54,8 @@ class UpdateActionRequest(BaseModel):
     @classmethod
     def validate_action_type(cls, v: str) -> str:
         """Validate that action_type is a valid ActionType enum value."""
-        valid_actions = [action.value for action in ActionType]
-        if v not in valid_actions:
-            raise ValueError(f"Invalid action_type. Must be one of: {', '.join(valid_actions)}")
+        if v not in ACTION_VALUES:
+            raise ValueError(f"Invalid action_type. Must be one of: {_VALID_ACTIONS_TEXT}")
         return v
 
 class CompleteActionRequest(BaseModel):
@@ -112,3 +113,17 @@ class SessionListResponse(BaseModel):
     offset: int = Field(default=0)
     limit: int = Field(default=50)
 
+
+class DraftRequest(BaseModel):
+    """Request to autosave what the user is typing for a step."""
+    text: str = Field(..., max_length=5000, description="Current text; may be empty")
+
+class DraftResponse(BaseModel):
+    """An autosaved, not yet submitted step text."""
+    step: int
+    text: str
+    updated_at: datetime
+
+class DraftListResponse(BaseModel):
+    """A session's drafts by step."""
+    drafts: List[DraftResponse]
@@ -8,12 +8,12 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-@dataclass
+@dataclass(slots=True)
 class CreateWaveSessionDTO:
     """DTO for creating a new WAVE session."""
     user_id: UUID
 
-@dataclass
+@dataclass(slots=True)
 class UpdateCheckinDTO:
     """DTO for updating check-in data (step 1)."""
     session_id: UUID
@@ -21,26 +21,26 @@ class UpdateCheckinDTO:
     emotion: str
     intensity: int  # 1-10
 
-@dataclass
+@dataclass(slots=True)
 class UpdateAcceptanceDTO:
     """DTO for updating acceptance statement (step 2)."""
     session_id: UUID
     acceptance_statement: str
 
-@dataclass
+@dataclass(slots=True)
 class UpdateActionDTO:
     """DTO for updating action choice (step 3)."""
     session_id: UUID
     action_type: str
     action_notes: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class CompleteActionDTO:
     """DTO for completing an action."""
     session_id: UUID
     duration_seconds: int
 
-@dataclass
+@dataclass(slots=True)
 class WaveSessionDTO:
     """DTO for full WAVE session data."""
     id: UUID
@@ -70,7 +70,7 @@ class WaveSessionDTO:
     # Computed
     progress_percentage: float
 
-@dataclass
+@dataclass(slots=True)
 class WaveSessionSummaryDTO:
     """DTO for brief WAVE session summary."""
     id: UUID
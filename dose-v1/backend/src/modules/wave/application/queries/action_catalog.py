@@ -0,0 +1,47 @@
+"""
+Action Catalog - Application Layer
+The WAVE quick-action library, serialized once for GET /wave/actions
+"""
+
+import hashlib
+from types import MappingProxyType
+from typing import Any, Optional
+
+import orjson
+
+from src.modules.wave.domain.value_objects.action_type import ActionType
+
+def _plain(value: Any) -> Any:
+    """orjson hook for the catalog's read-only mappings."""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError
+
+
+class ActionCatalog:
+    """
+    Response body and strong ETag of the action library.
+
+    The library only changes with a deploy, so the body is encoded once and
+    the ETag is a hash of it: clients revalidate with If-None-Match and get
+    a 304 until the catalog itself changes.
+    """
+
+    def __init__(self, max_age_seconds: int = 3600):
+        actions = ActionType.all_actions()
+        self.body: bytes = orjson.dumps({"actions": actions, "total": len(actions)}, default=_plain)
+        self.etag: str = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+        self.cache_control = f"public, max-age={max_age_seconds}"
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Whether an If-None-Match header names the current catalog (weak comparison)."""
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or tag.removeprefix("W/") == self.etag:
+                return True
+        return False
+
+
+action_catalog = ActionCatalog()
@@ -4,10 +4,12 @@ Orchestrates WAVE session business logic
 """
 
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 
+from src.core.application.interfaces.event_publisher import IEventPublisher
 from src.modules.wave.domain.entities.wave_session import WaveSession
+from src.modules.wave.domain.events import WaveSessionStarted
 from src.modules.wave.domain.repositories.wave_session_repository import IWaveSessionRepository
 from src.modules.wave.domain.value_objects.session_status import SessionStatus
 from src.modules.wave.application.dto.wave_dto import (
@@ -23,32 +25,18 @@ from src.modules.wave.application.dto.wave_dto import (
 class WaveService:
     """Service for WAVE session operations."""
     
-    def __init__(self, repository: IWaveSessionRepository):
+    def __init__(self, repository: IWaveSessionRepository, events: Optional[IEventPublisher] = None):
         self.repository = repository
+        self.events = events
     
     async def create_session(self, dto: CreateWaveSessionDTO) -> WaveSessionDTO:
         """Create a new WAVE session."""
         # Create domain entity
-        session = WaveSession(
-            id=uuid4(),
-            user_id=dto.user_id,
-            status=SessionStatus.IN_PROGRESS,
-            current_step=1,
-            situation=None,
-            emotion=None,
-            intensity=None,
-            acceptance_statement=None,
-            action_type=None,
-            action_completed=False,
-            actual_duration=None,
-            action_notes=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            completed_at=None,
-        )
+        session = self.new_session(dto.user_id)
         
         # Save to database
         created_session = await self.repository.create(session)
+        self._publish_events(session)
         
         # Return DTO
         return self._to_dto(created_session)
@@ -60,19 +48,12 @@ class WaveService:
         if not session:
             raise ValueError(f"Session not found: {dto.session_id}")
         
-        # Check if can progress
-        if not session.can_progress_to_step(2):
-            raise ValueError("Cannot update check-in at this stage")
-        
         # Update entity
-        session.set_checkin_data(
-            situation=dto.situation,
-            emotion=dto.emotion,
-            intensity=dto.intensity
-        )
+        self.apply_checkin(session, dto.situation, dto.emotion, dto.intensity)
         
         # Save to database
         updated_session = await self.repository.update(session)
+        self._publish_events(session)
         
         # Return DTO
         return self._to_dto(updated_session)
@@ -84,15 +65,12 @@ class WaveService:
         if not session:
             raise ValueError(f"Session not found: {dto.session_id}")
         
-        # Check if can progress
-        if session.current_step != 2:
-            raise ValueError("Must complete check-in before acceptance")
-        
         # Update entity
-        session.set_acceptance(dto.acceptance_statement)
+        self.apply_acceptance(session, dto.acceptance_statement)
         
         # Save to database
         updated_session = await self.repository.update(session)
+        self._publish_events(session)
         
         # Return DTO
         return self._to_dto(updated_session)
@@ -104,18 +82,12 @@ class WaveService:
         if not session:
             raise ValueError(f"Session not found: {dto.session_id}")
         
-        # Check if can progress
-        if session.current_step != 3:
-            raise ValueError("Must complete acceptance before choosing action")
-        
         # Update entity
-        session.set_action(
-            action_type=dto.action_type,
-            action_notes=dto.action_notes
-        )
+        self.apply_action(session, dto.action_type, dto.action_notes)
         
         # Save to database
         updated_session = await self.repository.update(session)
+        self._publish_events(session)
         
         # Return DTO
         return self._to_dto(updated_session)
@@ -127,15 +99,12 @@ class WaveService:
         if not session:
             raise ValueError(f"Session not found: {dto.session_id}")
         
-        # Check if action is set
-        if not session.action_type:
-            raise ValueError("No action has been set")
-        
         # Complete action
-        session.complete_action(duration_seconds=dto.duration_seconds)
+        self.apply_complete_action(session, dto.duration_seconds)
         
         # Save to database
         updated_session = await self.repository.update(session)
+        self._publish_events(session)
         
         # Return DTO
         return self._to_dto(updated_session)
@@ -148,10 +117,11 @@ class WaveService:
             raise ValueError(f"Session not found: {session_id}")
         
         # Complete session (entity validates all steps done)
-        session.complete_session()
+        self.apply_complete(session)
         
         # Save to database
         updated_session = await self.repository.update(session)
+        self._publish_events(session)
         
         # Return DTO
         return self._to_dto(updated_session)
@@ -177,6 +147,77 @@ class WaveService:
         sessions, total = await self.repository.get_by_user_id(user_id, limit, offset)
         return [self._to_summary_dto(session) for session in sessions], total
 
+    @staticmethod
+    def new_session(
+        user_id: UUID,
+        session_id: Optional[UUID] = None,
+        created_at: Optional[datetime] = None
+    ) -> WaveSession:
+        """Build a fresh in-progress session (client may supply the ID and start time for offline sync)."""
+        now = datetime.utcnow()
+        created_at = created_at or now
+        session = WaveSession(
+            id=session_id or uuid4(),
+            user_id=user_id,
+            status=SessionStatus.IN_PROGRESS,
+            current_step=1,
+            situation=None,
+            emotion=None,
+            intensity=None,
+            acceptance_statement=None,
+            action_type=None,
+            action_completed=False,
+            actual_duration=None,
+            action_notes=None,
+            created_at=created_at,
+            updated_at=now,
+            completed_at=None,
+        )
+        session.record_event(WaveSessionStarted(session_id=session.id, user_id=user_id, occurred_at=created_at))
+        return session
+
+    @staticmethod
+    def apply_checkin(session: WaveSession, situation: str, emotion: str, intensity: int) -> None:
+        """Apply check-in data (step 1) to a loaded session."""
+        if not session.can_progress_to_step(2):
+            raise ValueError("Cannot update check-in at this stage")
+
+        session.set_checkin_data(situation=situation, emotion=emotion, intensity=intensity)
+
+    @staticmethod
+    def apply_acceptance(session: WaveSession, acceptance_statement: str) -> None:
+        """Apply the acceptance statement (step 2) to a loaded session."""
+        if session.current_step != 2:
+            raise ValueError("Must complete check-in before acceptance")
+
+        session.set_acceptance(acceptance_statement)
+
+    @staticmethod
+    def apply_action(session: WaveSession, action_type: str, action_notes: Optional[str] = None) -> None:
+        """Apply the action choice (step 3) to a loaded session."""
+        if session.current_step != 3:
+            raise ValueError("Must complete acceptance before choosing action")
+
+        session.set_action(action_type=action_type, action_notes=action_notes)
+
+    @staticmethod
+    def apply_complete_action(session: WaveSession, duration_seconds: int) -> None:
+        """Mark the chosen action of a loaded session as completed."""
+        if not session.action_type:
+            raise ValueError("No action has been set")
+
+        session.complete_action(duration_seconds=duration_seconds)
+
+    @staticmethod
+    def apply_complete(session: WaveSession, completed_at: Optional[datetime] = None) -> None:
+        """Complete a loaded session (entity validates all steps done)."""
+        session.complete_session(completed_at)
+
+    def _publish_events(self, session: WaveSession) -> None:
+        """Hand the session's recorded events to the publisher (delivered after commit)."""
+        if self.events:
+            self.events.publish(session.pull_events())
+
     @staticmethod
     def _to_dto(session: WaveSession) -> WaveSessionDTO:
         """Convert entity to full DTO."""
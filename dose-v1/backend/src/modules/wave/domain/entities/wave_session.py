@@ -8,10 +8,12 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from src.core.domain.aggregate_root import AggregateRoot
+from src.modules.wave.domain.events import WaveSessionCompleted, WaveStepCompleted
 from src.modules.wave.domain.value_objects.session_status import SessionStatus
 
-@dataclass
-class WaveSession:
+@dataclass(slots=True)
+class WaveSession(AggregateRoot):
     """
     WaveSession aggregate root.
     Represents a complete emotional grounding session with 4 steps.
@@ -64,6 +66,7 @@ class WaveSession:
         self.intensity = intensity
         self.current_step = 2
         self.updated_at = datetime.utcnow()
+        self.record_event(WaveStepCompleted(session_id=self.id, user_id=self.user_id, step_number=1))
 
     
     def set_acceptance(self, statement: str) -> None:
@@ -71,6 +74,7 @@ class WaveSession:
         self.acceptance_statement = statement
         self.current_step = 3
         self.updated_at = datetime.utcnow()
+        self.record_event(WaveStepCompleted(session_id=self.id, user_id=self.user_id, step_number=2))
 
     def set_action(self, action_type: str, action_notes: Optional[str] = None) -> None:
         """Set action type (step 3)."""
@@ -78,6 +82,7 @@ class WaveSession:
         self.action_notes = action_notes
         self.action_completed = False
         self.updated_at = datetime.utcnow()
+        self.record_event(WaveStepCompleted(session_id=self.id, user_id=self.user_id, step_number=3))
 
     def complete_action(self, duration_seconds: int) -> None:
         """Mark action as completed."""
@@ -88,9 +93,16 @@ class WaveSession:
         self.actual_duration = duration_seconds
         self.current_step = 4
         self.updated_at = datetime.utcnow()
+        self.record_event(WaveStepCompleted(session_id=self.id, user_id=self.user_id, step_number=4))
 
-    def complete_session(self) -> None:
-        """Mark session as completed."""
+    def complete_session(self, completed_at: Optional[datetime] = None) -> None:
+        """
+        Mark session as completed.
+
+        Args:
+            completed_at: When it was completed offline (UTC); clamped to
+                between the session's creation and now. Defaults to now.
+        """
         # Validate all steps completed
         if not all([
             self.situation,
@@ -102,9 +114,16 @@ class WaveSession:
         ]):
             raise ValueError("All steps must be completed before finishing the session")
         
+        now = datetime.utcnow()
+        completed_at = max(min(completed_at or now, now), self.created_at)
+        if not self.is_completed():
+            self.record_event(WaveSessionCompleted(
+                session_id=self.id, user_id=self.user_id, occurred_at=completed_at,
+                intensity=self.intensity, action_type=self.action_type
+            ))
         self.status = SessionStatus.COMPLETED
-        self.completed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.completed_at = completed_at
+        self.updated_at = now
 
     def is_completed(self) -> bool:
         """Check if session is completed."""
@@ -0,0 +1,26 @@
+"""
+WAVE Domain Events
+"""
+
+from dataclasses import dataclass
+from typing import ClassVar, Optional
+
+from src.core.domain.events import SessionCompleted, SessionStarted, StepCompleted
+
+
+@dataclass(frozen=True, slots=True)
+class WaveSessionStarted(SessionStarted):
+    session_type: ClassVar[str] = "wave"
+
+
+@dataclass(frozen=True, slots=True)
+class WaveStepCompleted(StepCompleted):
+    session_type: ClassVar[str] = "wave"
+
+
+@dataclass(frozen=True, slots=True)
+class WaveSessionCompleted(SessionCompleted):
+    session_type: ClassVar[str] = "wave"
+    # Outcome of the session, for activity rollups
+    intensity: Optional[int] = None
+    action_type: Optional[str] = None
@@ -4,7 +4,8 @@ Defines contract for WAVE session data access
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 from src.modules.wave.domain.entities.wave_session import WaveSession
 
@@ -27,7 +28,12 @@ class IWaveSessionRepository(ABC):
 
     @abstractmethod
     async def update(self, session: WaveSession) -> WaveSession:
-        """Update existing session."""
+        """
+        Update existing session.
+
+        Raises SessionArchivedError if the session has been moved to the
+        archive (archived sessions are read-only), ValueError if it does not exist.
+        """
         pass
 
     @abstractmethod
@@ -45,3 +51,18 @@ class IWaveSessionRepository(ABC):
         """Get user's current in-progress session."""
         pass
 
+    @abstractmethod
+    def stream_by_user_id(self, user_id: UUID, batch_size: int = 500) -> AsyncIterator[WaveSession]:
+        """Stream all of the user's sessions without loading them into memory at once."""
+        pass
+
+    @abstractmethod
+    async def get_changed_since(
+        self,
+        user_id: UUID,
+        after: Optional[Tuple[datetime, UUID]],
+        updated_before: datetime,
+        limit: int
+    ) -> List[WaveSession]:
+        """Get sessions updated after a (updated_at, id) position, ordered by that key."""
+        pass
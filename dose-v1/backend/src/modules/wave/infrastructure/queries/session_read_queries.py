@@ -0,0 +1,98 @@
+"""
+WAVE Session Read Queries - Infrastructure Layer
+Fast read path for GET endpoints: Core rows straight to plain dicts, ready
+for orjson, with no ORM instances, entities, DTOs or pydantic models.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.archive import SessionArchive, session_archive, from_record
+from src.modules.wave.infrastructure.persistence.models import WaveSession as WaveSessionModel
+
+# Field order matches wave_schemas.SessionResponse / SessionSummaryResponse
+# (minus the computed progress_percentage); tests/unit/modules/wave/
+# test_session_read_path.py keeps them in sync.
+SESSION_FIELDS = (
+    "id", "user_id", "status", "current_step",
+    "situation", "emotion", "intensity",
+    "acceptance_statement",
+    "action_type", "action_completed", "actual_duration", "action_notes",
+    "created_at", "updated_at", "completed_at",
+)
+SUMMARY_FIELDS = ("id", "status", "current_step", "emotion", "action_type", "created_at", "completed_at")
+
+
+def _columns(fields: Tuple[str, ...]) -> List[Any]:
+    return [getattr(WaveSessionModel, field) for field in fields]
+
+
+def _with_progress(session: Dict[str, Any]) -> Dict[str, Any]:
+    # Same rule as WaveSession.get_progress_percentage
+    completed = session["status"] == "completed"
+    session["progress_percentage"] = 100.0 if completed else (session["current_step"] - 1) * 25.0
+    return session
+
+
+class WaveSessionReadQueries:
+    """Read-only queries returning JSON-ready dicts."""
+
+    def __init__(self, session: AsyncSession, archive: Optional[SessionArchive] = None):
+        self.session = session
+        self.archive = archive or session_archive
+
+    async def get_session(self, session_id: UUID) -> Optional[Dict[str, Any]]:
+        """Get one session as a dict, from the hot table or else the archive."""
+        result = await self.session.execute(
+            select(*_columns(SESSION_FIELDS)).where(WaveSessionModel.id == session_id)
+        )
+        row = result.mappings().first()
+        if row:
+            return _with_progress(dict(row))
+
+        record = await self.archive.get(self.session, "wave", session_id)
+        return _with_progress(self._project(record, SESSION_FIELDS)) if record else None
+
+    async def list_sessions(
+        self,
+        user_id: UUID,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of session summaries (newest first) and the total count."""
+        page = await self.archive.page_for_user(
+            self.session, "wave", WaveSessionModel, user_id, offset=offset, limit=limit
+        )
+        hot_ids = [session_id for session_id, archived in page if not archived]
+        hot = {}
+        if hot_ids:
+            result = await self.session.execute(
+                select(*_columns(SUMMARY_FIELDS))
+                .where(WaveSessionModel.user_id == user_id, WaveSessionModel.id.in_(hot_ids))
+            )
+            hot = {row["id"]: dict(row) for row in result.mappings()}
+        records = await self.archive.get_many(
+            self.session, "wave", [session_id for session_id, archived in page if archived]
+        )
+
+        sessions = []
+        for session_id, archived in page:
+            if archived and str(session_id) in records:
+                sessions.append(_with_progress(self._project(records[str(session_id)], SUMMARY_FIELDS)))
+            elif not archived and session_id in hot:
+                sessions.append(_with_progress(hot[session_id]))
+
+        hot_count = await self.session.scalar(
+            select(func.count(WaveSessionModel.id)).where(WaveSessionModel.user_id == user_id)
+        )
+        archived_count = await self.archive.count_for_user(self.session, "wave", user_id)
+
+        return sessions, hot_count + archived_count
+
+    @staticmethod
+    def _project(record: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+        # Archive records hold strings; rebuild typed values so both tiers serialize alike
+        model = from_record(WaveSessionModel, record)
+        return {field: getattr(model, field) for field in fields}
@@ -2,24 +2,36 @@
 WaveSession Repository Implementation - Infrastructure Layer
 """
 
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.wave.domain.entities.wave_session import WaveSession as WaveSessionEntity
 from src.modules.wave.domain.repositories.wave_session_repository import IWaveSessionRepository
 from src.modules.wave.domain.value_objects.session_status import SessionStatus
 from src.modules.wave.infrastructure.persistence.models import WaveSession as WaveSessionModel
+from src.modules.sync.infrastructure.persistence.models import SessionTombstone
+from src.core.domain.exceptions import SessionArchivedError
+from src.infrastructure.archive import SessionArchive, session_archive, from_record
+from src.infrastructure.database.session_ids import claim_session_id
+from src.infrastructure.drafts import DraftBuffer, draft_buffer
 
 class WaveSessionRepository(IWaveSessionRepository):
     """SQLAlchemy implementation of WAVE session repository."""
     
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, archive: Optional[SessionArchive] = None, drafts: Optional[DraftBuffer] = None):
         self.session = session
+        # Old completed sessions live in cold storage; reads fall through to it
+        self.archive = archive or session_archive
+        self.drafts = drafts or draft_buffer
 
     async def create(self, session: WaveSessionEntity) -> WaveSessionEntity:
         """Create a new WAVE session."""
+        # The partitioned table cannot enforce a unique id on its own
+        if not await claim_session_id(self.session, "wave", session.id, session.user_id):
+            raise ValueError(f"Session already exists: {session.id}")
         db_session = WaveSessionModel(
             id=session.id,
             user_id=session.user_id,
@@ -43,12 +55,16 @@ class WaveSessionRepository(IWaveSessionRepository):
         return self._to_entity(db_session)
 
     async def get_by_id(self, session_id: UUID) -> Optional[WaveSessionEntity]:
-        """Get session by ID."""
+        """Get session by ID, from the hot table or else the archive."""
         result = await self.session.execute(
             select(WaveSessionModel).where(WaveSessionModel.id == session_id)
         )
         db_session = result.scalar_one_or_none()
-        return self._to_entity(db_session) if db_session else None
+        if db_session:
+            return self._to_entity(db_session)
+
+        record = await self.archive.get(self.session, "wave", session_id)
+        return self._to_entity(from_record(WaveSessionModel, record)) if record else None
 
     async def get_by_user_id(
         self,
@@ -60,32 +76,51 @@ class WaveSessionRepository(IWaveSessionRepository):
         Get sessions for a user with pagination.
         Returns tuple of (sessions list, total count).
         """
-        # Get paginated results
-        result = await self.session.execute(
-            select(WaveSessionModel)
-            .where(WaveSessionModel.user_id == user_id)
-            .order_by(WaveSessionModel.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+        # One page across both tiers; archiving goes by completion date, so
+        # archived sessions can be newer than hot ones
+        page = await self.archive.page_for_user(
+            self.session, "wave", WaveSessionModel, user_id, offset=offset, limit=limit
+        )
+        hot_ids = [session_id for session_id, archived in page if not archived]
+        hot = {}
+        if hot_ids:
+            result = await self.session.execute(
+                select(WaveSessionModel)
+                .where(WaveSessionModel.user_id == user_id, WaveSessionModel.id.in_(hot_ids))
+            )
+            hot = {db_session.id: db_session for db_session in result.scalars().all()}
+        records = await self.archive.get_many(
+            self.session, "wave", [session_id for session_id, archived in page if archived]
         )
-        db_sessions = result.scalars().all()
+
+        sessions = []
+        for session_id, archived in page:
+            # A row moved between the two queries is left out of this page
+            if archived and str(session_id) in records:
+                sessions.append(self._to_entity(from_record(WaveSessionModel, records[str(session_id)])))
+            elif not archived and session_id in hot:
+                sessions.append(self._to_entity(hot[session_id]))
 
         # Get total count
         count_result = await self.session.execute(
             select(func.count(WaveSessionModel.id))
             .where(WaveSessionModel.user_id == user_id)
         )
-        total_count = count_result.scalar()
+        hot_count = count_result.scalar()
+        archived_count = await self.archive.count_for_user(self.session, "wave", user_id)
 
-        return [self._to_entity(db_session) for db_session in db_sessions], total_count
+        return sessions, hot_count + archived_count
 
     async def update(self, session: WaveSessionEntity) -> WaveSessionEntity:
-        """Update existing session."""
+        """Update existing session. Raises SessionArchivedError for archived sessions."""
         result = await self.session.execute(
             select(WaveSessionModel).where(WaveSessionModel.id == session.id)
         )
         db_session = result.scalar_one_or_none()
         if not db_session:
+            # Archived sessions are read-only; they are completed, so no entity change applies anyway
+            if await self.archive.get(self.session, "wave", session.id):
+                raise SessionArchivedError(f"Session is archived and read-only: {session.id}")
             raise ValueError(f"Session not found: {session.id}")
         
         # Update all fields
@@ -114,6 +149,23 @@ class WaveSessionRepository(IWaveSessionRepository):
         db_session = result.scalar_one_or_none()
         if db_session:
             await self.session.delete(db_session)
+            await self.drafts.discard(self.session, [session_id])
+            # Leave a tombstone so other devices pick up the deletion
+            self.session.add(SessionTombstone(
+                user_id=db_session.user_id,
+                session_type="wave",
+                session_id=db_session.id,
+            ))
+            return True
+
+        archived = await self.archive.get(self.session, "wave", session_id)
+        if archived and await self.archive.remove(self.session, "wave", session_id):
+            await self.drafts.discard(self.session, [session_id])
+            self.session.add(SessionTombstone(
+                user_id=UUID(archived["user_id"]),
+                session_type="wave",
+                session_id=session_id,
+            ))
             return True
         return False
 
@@ -142,6 +194,54 @@ class WaveSessionRepository(IWaveSessionRepository):
         db_session = result.scalar_one_or_none()
         return self._to_entity(db_session) if db_session else None
 
+    async def get_changed_since(
+        self,
+        user_id: UUID,
+        after: Optional[Tuple[datetime, UUID]],
+        updated_before: datetime,
+        limit: int
+    ) -> List[WaveSessionEntity]:
+        """
+        Get sessions changed after a (updated_at, id) keyset position, oldest first.
+
+        Served by the (user_id, updated_at, id) index, so cost is proportional
+        to the number of changes rather than the size of the history.
+        """
+        query = select(WaveSessionModel).where(
+            WaveSessionModel.user_id == user_id,
+            WaveSessionModel.updated_at < updated_before
+        )
+        if after:
+            query = query.where(tuple_(WaveSessionModel.updated_at, WaveSessionModel.id) > tuple_(*after))
+        result = await self.session.execute(
+            query.order_by(WaveSessionModel.updated_at, WaveSessionModel.id).limit(limit)
+        )
+        return [self._to_entity(db_session) for db_session in result.scalars().all()]
+
+    async def stream_by_user_id(
+        self,
+        user_id: UUID,
+        batch_size: int = 500
+    ) -> AsyncIterator[WaveSessionEntity]:
+        """
+        Stream every session for a user, oldest first, over a server-side cursor.
+
+        Rows are fetched `batch_size` at a time, so memory stays flat no
+        matter how long the user's history is. Archived sessions come first,
+        one segment at a time.
+        """
+        async for record in self.archive.stream_for_user(self.session, "wave", user_id):
+            yield self._to_entity(from_record(WaveSessionModel, record))
+
+        result = await self.session.stream(
+            select(WaveSessionModel)
+            .where(WaveSessionModel.user_id == user_id)
+            .order_by(WaveSessionModel.created_at.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for db_session in result.scalars():
+            yield self._to_entity(db_session)
+
     @staticmethod
     def _to_entity(model: WaveSessionModel) -> WaveSessionEntity:
         """Convert SQLAlchemy model to domain entity."""
@@ -0,0 +1,107 @@
+"""
+Integration tests for change feed cursor expiry and tombstone purging
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.utils.cursor import encode_cursor
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.session import get_db
+from src.modules.spark.infrastructure.persistence.models import SparkSession
+from src.modules.sync.api.endpoints import router, get_current_user_id
+from src.modules.sync.application.services.tombstone_purger import TombstonePurger
+from src.modules.sync.infrastructure.persistence.models import SessionTombstone
+from src.modules.wave.infrastructure.persistence.models import WaveSession
+# Mapped so the User <-> session relationships resolve
+import src.modules.auth.infrastructure.persistence.models  # noqa: F401
+
+
+async def make_engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        for model in (SparkSession, WaveSession, SessionTombstone):
+            await conn.run_sync(lambda c, table=model.__table__: table.create(c))
+    return engine
+
+
+def make_app(session_factory, user_id) -> FastAPI:
+    async def db():
+        async with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(router, prefix="/sync")
+    app.dependency_overrides[get_db] = db
+    app.dependency_overrides[get_current_user_id] = lambda: user_id
+    return app
+
+
+def tombstone(user_id, age):
+    return SessionTombstone(
+        user_id=user_id, session_type="spark", session_id=uuid4(), deleted_at=datetime.utcnow() - age,
+    )
+
+
+def cursor_issued(age):
+    return encode_cursor({
+        "v": 1,
+        "issued_at": (datetime.utcnow() - age).isoformat(),
+        "spark": None, "wave": None, "deleted": None,
+    })
+
+
+class TestCursorExpiry:
+    """A cursor outliving tombstone retention is refused before deletions could be missed."""
+
+    @pytest.mark.asyncio
+    async def test_purged_history_expires_cursors_with_410(self, user_id):
+        """Tombstones past retention are purged, and cursors that could have needed them get 410."""
+        retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        engine = await make_engine()
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with session_factory() as db:
+            expired = tombstone(user_id, retention + timedelta(days=1))
+            recent = tombstone(user_id, timedelta(days=1))
+            db.add_all([expired, recent])
+            await db.commit()
+
+        purged = await TombstonePurger(
+            session_factory, retention_days=settings.SYNC_TOMBSTONE_RETENTION_DAYS, batch_size=1,
+        ).run()
+
+        async with AsyncClient(transport=ASGITransport(app=make_app(session_factory, user_id)), base_url="http://test") as client:
+            full = await client.get("/sync/changes")
+            stale = await client.get("/sync/changes", params={"cursor": cursor_issued(retention + timedelta(hours=1))})
+            fresh = await client.get("/sync/changes", params={"cursor": cursor_issued(retention - timedelta(hours=1))})
+            resumed = await client.get("/sync/changes", params={"cursor": full.json()["cursor"]})
+        await engine.dispose()
+
+        assert purged == 1
+        assert full.status_code == 200
+        assert [d["session_id"] for d in full.json()["deleted"]] == [str(recent.session_id)]
+        assert stale.status_code == 410
+        assert fresh.status_code == 200
+        assert resumed.status_code == 200 and resumed.json()["deleted"] == []
+
+    @pytest.mark.asyncio
+    async def test_tombstones_outlive_retention_by_the_settle_window(self, user_id):
+        """A cursor issued just inside retention can still see deletions from its settle window."""
+        engine = await make_engine()
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with session_factory() as db:
+            db.add(tombstone(user_id, timedelta(days=30, seconds=2)))
+            await db.commit()
+
+        purged = await TombstonePurger(session_factory, retention_days=30, settle_seconds=5).run()
+        async with session_factory() as db:
+            remaining = (await db.execute(select(SessionTombstone))).scalars().all()
+        await engine.dispose()
+
+        assert purged == 0
+        assert len(remaining) == 1
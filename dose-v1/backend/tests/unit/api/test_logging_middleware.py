@@ -0,0 +1,123 @@
+"""
+Unit tests for the request logging middleware
+"""
+
+import asyncio
+import logging
+
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from src.api.middleware.logging_middleware import LoggingMiddleware
+from src.api.middleware.request_log_sampler import RequestLogSampler
+
+sent_before_last_chunk = []
+
+
+async def echo_request_id(request):
+    return JSONResponse({"request_id": request.state.request_id})
+
+
+async def stream(request):
+    async def chunks():
+        yield b"first"
+        # The first chunk must reach the client before the stream ends
+        sent_before_last_chunk.append(len(request.scope["sent"]))
+        yield b"second"
+    return StreamingResponse(chunks())
+
+
+async def broken(request):
+    raise RuntimeError("boom")
+
+
+async def unavailable(request):
+    return JSONResponse({}, status_code=503)
+
+
+app = Starlette(
+    routes=[Route("/echo", echo_request_id), Route("/stream", stream), Route("/broken", broken)],
+    middleware=[Middleware(LoggingMiddleware)],
+)
+
+# Samples nothing: only failures are logged
+unsampled_app = Starlette(
+    routes=[Route("/echo", echo_request_id), Route("/unavailable", unavailable)],
+    middleware=[Middleware(LoggingMiddleware, sampler=RequestLogSampler(default_rate=0.0))],
+)
+
+
+async def call(path, app=app):
+    sent = []
+    scope = {
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"limit=5", "headers": [(b"user-agent", b"pytest")],
+        "client": ("10.0.0.1", 1234), "server": ("test", 80), "scheme": "http", "sent": sent,
+    }
+
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.Event().wait()  # client stays connected
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+class TestLoggingMiddleware:
+    """Test cases for request IDs, timing headers and logs."""
+
+    @pytest.mark.asyncio
+    async def test_headers_and_request_state(self, caplog):
+        """The request ID is on request.state and in the headers; both requests are logged."""
+        with caplog.at_level(logging.INFO, logger="src.api.middleware.logging_middleware"):
+            start, body = await call("/echo")
+
+        headers = {name.decode(): value.decode() for name, value in start["headers"]}
+        assert headers["x-request-id"] in body["body"].decode()
+        assert headers["x-process-time"].endswith("ms")
+        started, completed = caplog.records
+        assert (started.method, started.path, started.query_params, started.user_agent) == (
+            "GET", "/echo", "limit=5", "pytest"
+        )
+        assert (completed.status_code, completed.client_host) == (200, "10.0.0.1")
+        assert completed.request_id == headers["x-request-id"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_is_not_buffered(self):
+        """Chunks are passed on as the app sends them."""
+        sent = await call("/stream")
+
+        assert sent_before_last_chunk == [2]  # response start and the first chunk
+        assert b"".join(message.get("body", b"") for message in sent[1:]) == b"firstsecond"
+
+    @pytest.mark.asyncio
+    async def test_unhandled_error_is_logged_and_raised(self, caplog):
+        """Exceptions propagate after a 'Request failed' log with the error type."""
+        with pytest.raises(RuntimeError):
+            await call("/broken")
+
+        failed = [record for record in caplog.records if record.levelno == logging.ERROR]
+        assert failed[-1].error_type == "RuntimeError"
+
+    @pytest.mark.asyncio
+    async def test_unsampled_requests_log_only_failures(self, caplog):
+        """An unsampled success writes nothing; an unsampled failure writes both lines."""
+        with caplog.at_level(logging.INFO, logger="src.api.middleware.logging_middleware"):
+            sent = await call("/echo", unsampled_app)
+            await call("/unavailable", unsampled_app)
+
+        assert sent[0]["status"] == 200
+        assert [record.getMessage() for record in caplog.records] == [
+            "Request started: GET /unavailable",
+            "Request completed: GET /unavailable - 503",
+        ]
+        assert caplog.records[1].sample_rate == 0.0
@@ -0,0 +1,63 @@
+"""
+Unit tests for request log sampling
+"""
+
+from uuid import uuid4
+
+from src.api.middleware import request_log_sampler as sampler_module
+from src.api.middleware.request_log_sampler import RequestLogSampler
+
+LOW_ID = "00000000-0000-4000-8000-000000000000"
+HIGH_ID = "ffffffff-0000-4000-8000-000000000000"
+
+
+class TestRequestLogSampler:
+    """Test cases for rates, forced keeps and the adaptive factor."""
+
+    def test_decision_follows_request_id_and_longest_prefix(self):
+        """The same request ID always gets the same decision; the longest prefix sets the rate."""
+        sampler = RequestLogSampler(
+            default_rate=1.0,
+            route_rates={"/api/v1/spark": 0.5, "/api/v1/spark/sessions": 0.0},
+        )
+
+        assert sampler.sample(HIGH_ID, "/api/v1/spark/progress") == (False, 0.5)
+        assert sampler.sample(LOW_ID, "/api/v1/spark/progress") == (True, 0.5)
+        assert sampler.sample(LOW_ID, "/api/v1/spark/sessions/1") == (False, 0.0)
+        assert sampler.sample(HIGH_ID, "/api/v1/wave/sessions") == (True, 1.0)
+
+    def test_rate_is_roughly_honoured(self):
+        """About `rate` of random request IDs are sampled."""
+        sampler = RequestLogSampler(default_rate=0.2)
+
+        sampled = sum(sampler.sample(str(uuid4()), "/x")[0] for _ in range(5000))
+
+        assert 800 < sampled < 1200
+
+    def test_failed_and_slow_requests_are_kept(self):
+        """Unsampled requests are logged on server errors or when slow."""
+        sampler = RequestLogSampler(slow_ms=500)
+
+        assert sampler.keep(503, 10.0) is True
+        assert sampler.keep(200, 750.0) is True
+        assert sampler.keep(404, 10.0) is False
+        assert sampler.metrics() == {**sampler.metrics(), "kept": 2, "dropped": 1}
+
+    def test_adaptive_factor_tracks_the_budget(self, monkeypatch):
+        """Over budget the factor falls toward budget/demand; it recovers when traffic drops."""
+        clock = [0.0]
+        monkeypatch.setattr(sampler_module.time, "monotonic", lambda: clock[0])
+        sampler = RequestLogSampler(budget_per_second=100)
+
+        for _ in range(6):  # 500 requests/s = 1000 lines/s, ten times the budget
+            for _ in range(500):
+                sampler.sample(str(uuid4()), "/x")
+            clock[0] += 1.0
+        throttled = sampler.factor
+        for _ in range(6):  # 10 requests/s, under budget
+            for _ in range(10):
+                sampler.sample(str(uuid4()), "/x")
+            clock[0] += 1.0
+
+        assert 0.1 <= throttled < 0.15
+        assert sampler.factor > 0.95
@@ -0,0 +1,30 @@
+"""
+Smoke tests for the entity memory benchmark
+"""
+
+import dataclasses
+
+from benchmarks.bench_entity_memory import bytes_per_object, cases, unslotted
+
+
+class TestEntityMemoryBenchmark:
+    """The benchmark's builders keep working as the entities change."""
+
+    def test_every_case_builds_in_both_layouts(self):
+        """Each class and its unslotted copy accept the benchmark's arguments and agree on them."""
+        for label, cls, make in cases():
+            plain = unslotted(cls)
+            kwargs = make()
+
+            slotted, unslotted_object = cls(**kwargs), plain(**kwargs)
+
+            assert not hasattr(slotted, "__dict__"), label
+            assert hasattr(unslotted_object, "__dict__"), label
+            assert dataclasses.asdict(slotted) == dataclasses.asdict(unslotted_object), label
+            assert [f.name for f in dataclasses.fields(plain)] == [f.name for f in dataclasses.fields(cls)], label
+
+    def test_measures_a_few_objects(self):
+        """The measurement runs end to end on a small sample."""
+        label, cls, make = cases()[0]
+
+        assert bytes_per_object(unslotted(cls), [make() for _ in range(10)]) > 0
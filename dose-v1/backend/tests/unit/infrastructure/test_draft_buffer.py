@@ -0,0 +1,172 @@
+"""
+Unit tests for the write-behind draft buffer
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.infrastructure.drafts import DraftBuffer, SessionDraft
+
+
+class RecordingBuffer(DraftBuffer):
+    """Buffer whose batches are recorded instead of written to the database."""
+
+    def __init__(self, batch_size: int = 500, fail: bool = False):
+        super().__init__(session_factory=None, batch_size=batch_size)
+        self.batches = []
+        self.fail = fail
+
+    async def _write(self, rows):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append(rows)
+
+
+class TestDraftBuffer:
+    """Test cases for coalescing and flushing drafts."""
+
+    @pytest.mark.asyncio
+    async def test_drafts_of_a_step_are_coalesced(self, user_id, session_id):
+        """A burst of autosaves for one step stores only the last text."""
+        buffer = RecordingBuffer()
+        for text in ("I", "I felt", "I felt rushed"):
+            await buffer.put("spark", session_id, user_id, 1, text)
+        await buffer.put("spark", session_id, user_id, 2, "They")
+
+        assert await buffer.flush() == 2
+        assert sorted((row["step"], row["text"]) for row in buffer.batches[0]) == [(1, "I felt rushed"), (2, "They")]
+        metrics = buffer.metrics()
+        assert (metrics["received"], metrics["stored"], metrics["coalesced"], metrics["pending"]) == (4, 2, 2, 0)
+
+    @pytest.mark.asyncio
+    async def test_full_batch_wakes_the_worker(self, user_id):
+        """Reaching batch_size pending steps flushes without waiting for the timer, outside the request."""
+        buffer = RecordingBuffer(batch_size=2)
+        buffer.flush_seconds = 60
+        stop = asyncio.Event()
+        worker = asyncio.create_task(buffer.run_forever(stop))
+        await asyncio.sleep(0)
+
+        await buffer.put("wave", uuid4(), user_id, 1, "a")
+        await buffer.put("wave", uuid4(), user_id, 1, "b")
+        assert buffer.batches == []
+        await asyncio.sleep(0.01)
+
+        assert len(buffer.batches) == 1
+        assert buffer.metrics()["last_flush_lag_seconds"] >= 0
+        stop.set()
+        await asyncio.wait_for(worker, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_oldest_drafts_are_dropped_past_the_cap(self, user_id):
+        """While writes fail the buffer stays bounded, dropping and counting its oldest drafts."""
+        buffer = RecordingBuffer(batch_size=2, fail=True)
+        buffer.max_pending = 3
+        sessions = [uuid4() for _ in range(5)]
+        for text, session in zip("abc", sessions):
+            await buffer.put("spark", session, user_id, 1, text)
+        await buffer.flush()
+        for text, session in zip("de", sessions[3:]):
+            await buffer.put("spark", session, user_id, 1, text)
+
+        buffer.fail = False
+        await buffer.flush()
+
+        assert [row["text"] for batch in buffer.batches for row in batch] == ["c", "d", "e"]
+        metrics = buffer.metrics()
+        assert (metrics["dropped"], metrics["stored"], metrics["coalesced"]) == (2, 3, 0)
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried_behind_newer_drafts(self, user_id, session_id):
+        """A failed batch goes back into the buffer, but never over newer text."""
+        buffer = RecordingBuffer(fail=True)
+        await buffer.put("spark", session_id, user_id, 1, "old")
+        await buffer.put("spark", session_id, user_id, 2, "kept")
+
+        assert await buffer.flush() == 0
+        await buffer.put("spark", session_id, user_id, 1, "new")
+        buffer.fail = False
+        await buffer.flush()
+
+        assert sorted((row["step"], row["text"]) for row in buffer.batches[0]) == [(1, "new"), (2, "kept")]
+        assert buffer.metrics()["failed_flushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reads_overlay_pending_drafts(self, user_id, session_id):
+        """Reading drafts shows stored ones, replaced by newer ones still in memory."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda c: SessionDraft.__table__.create(c))
+        buffer = RecordingBuffer()
+        async with AsyncSession(engine) as db:
+            for step, text in ((1, "stored"), (2, "stale")):
+                db.add(SessionDraft(
+                    session_id=session_id, step=step, session_type="wave",
+                    user_id=user_id, text=text, updated_at=datetime(2026, 3, 2),
+                ))
+            await db.commit()
+            await buffer.put("wave", session_id, user_id, 2, "fresh")
+            await buffer.put("wave", uuid4(), user_id, 1, "other session")
+
+            drafts = await buffer.drafts(db, session_id)
+        await engine.dispose()
+
+        assert [(d["step"], d["text"]) for d in drafts] == [(1, "stored"), (2, "fresh")]
+
+    def test_owner_cache_is_bounded(self, user_id):
+        """Only the most recently drafted sessions' owners are remembered."""
+        buffer = RecordingBuffer()
+        buffer.max_sessions = 2
+        first, second, third = uuid4(), uuid4(), uuid4()
+
+        buffer.remember_owner(first, user_id)
+        buffer.remember_owner(second, user_id)
+        buffer.owner(first)
+        buffer.remember_owner(third, user_id)
+
+        assert (buffer.owner(first), buffer.owner(second), buffer.owner(third)) == (user_id, None, user_id)
+
+    @pytest.mark.asyncio
+    async def test_erased_user_drafts_are_never_flushed(self, user_id, session_id):
+        """Forgetting a user drops their buffered drafts and cached session owners."""
+        buffer = RecordingBuffer()
+        other_user, other_session = uuid4(), uuid4()
+        await buffer.put("spark", session_id, user_id, 1, "mine")
+        await buffer.put("spark", other_session, other_user, 1, "theirs")
+        buffer.remember_owner(session_id, user_id)
+        buffer.remember_owner(other_session, other_user)
+
+        buffer.forget_user(user_id)
+        await buffer.flush()
+
+        assert [row["text"] for row in buffer.batches[0]] == ["theirs"]
+        assert (buffer.owner(session_id), buffer.owner(other_session)) == (None, other_user)
+
+    @pytest.mark.asyncio
+    async def test_discard_deletes_drafts_when_the_transaction_commits(self, user_id, session_id):
+        """Stored drafts go in the caller's transaction, buffered ones only once it commits."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda c: SessionDraft.__table__.create(c))
+        buffer = RecordingBuffer()
+        async with AsyncSession(engine) as db:
+            db.add(SessionDraft(
+                session_id=session_id, step=1, session_type="wave",
+                user_id=user_id, text="stored", updated_at=datetime(2026, 3, 2),
+            ))
+            await db.commit()
+            await buffer.put("wave", session_id, user_id, 2, "pending")
+
+            await buffer.discard(db, [session_id])
+            await db.rollback()
+            assert [d["text"] for d in await buffer.drafts(db, session_id)] == ["stored", "pending"]
+
+            await buffer.discard(db, [session_id])
+            await db.commit()
+            assert await buffer.drafts(db, session_id) == []
+        await engine.dispose()
+
+        assert buffer.metrics()["pending"] == 0
@@ -0,0 +1,122 @@
+"""
+Unit tests for the in-process domain event bus
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.core.domain.events import SessionCompleted
+from src.infrastructure.event_bus import AfterCommitPublisher, EventBus
+from src.modules.spark.domain.events import SparkSessionCompleted, SparkStepCompleted
+from src.modules.wave.domain.events import WaveSessionCompleted
+
+
+async def run_until_drained(bus: EventBus) -> None:
+    stop = asyncio.Event()
+    worker = asyncio.create_task(bus.run_forever(stop))
+    await bus.drain()
+    stop.set()
+    await worker
+
+
+class TestEventBus:
+    """Test cases for dispatch, metrics and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_subclasses(self, user_id, session_id):
+        """A SessionCompleted subscriber sees SPARK and WAVE completions, not steps."""
+        bus = EventBus()
+        received = []
+
+        async def on_completed(event):
+            received.append(event)
+
+        bus.subscribe(SessionCompleted, on_completed)
+        bus.publish_nowait(SparkSessionCompleted(session_id=session_id, user_id=user_id))
+        bus.publish_nowait(SparkStepCompleted(session_id=session_id, user_id=user_id, step_number=2))
+        bus.publish_nowait(WaveSessionCompleted(session_id=session_id, user_id=user_id))
+        await run_until_drained(bus)
+
+        assert [event.session_type for event in received] == ["spark", "wave"]
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_is_isolated_and_counted(self, user_id, session_id):
+        """One subscriber raising does not stop the others; metrics record the failure."""
+        bus = EventBus()
+        received = []
+
+        async def broken(event):
+            raise RuntimeError("boom")
+
+        async def healthy(event):
+            received.append(event)
+
+        bus.subscribe(SessionCompleted, broken, name="broken")
+        bus.subscribe(SessionCompleted, healthy, name="healthy")
+        bus.publish_nowait(SparkSessionCompleted(session_id=session_id, user_id=user_id))
+        await run_until_drained(bus)
+
+        subscribers = bus.metrics()["subscribers"]
+        assert len(received) == 1
+        assert subscribers["broken"] == {**subscribers["broken"], "calls": 1, "errors": 1}
+        assert subscribers["healthy"]["errors"] == 0
+
+    def test_full_queue_rejects_instead_of_blocking(self, user_id, session_id):
+        """publish_nowait drops events once the queue is full."""
+        bus = EventBus(queue_size=1)
+
+        async def handler(event):
+            pass
+
+        bus.subscribe(SessionCompleted, handler)
+        event = SparkSessionCompleted(session_id=session_id, user_id=user_id)
+
+        assert bus.publish_nowait(event) is True
+        assert bus.publish_nowait(event) is False
+        assert bus.metrics()["rejected"] == 1
+
+    def test_inline_subscribers_run_on_publish(self, user_id, session_id):
+        """Inline subscribers run before queueing, even when the queue rejects the event."""
+        bus = EventBus(queue_size=1)
+        received = []
+
+        async def handler(event):
+            pass
+
+        bus.subscribe(SessionCompleted, handler)
+        bus.subscribe_inline(SessionCompleted, received.append, name="inline")
+        event = SparkSessionCompleted(session_id=session_id, user_id=user_id)
+        bus.publish_nowait(event)
+        bus.publish_nowait(event)
+        bus.publish_nowait(SparkStepCompleted(session_id=session_id, user_id=user_id, step_number=1))
+
+        assert received == [event, event]
+        assert bus.metrics()["subscribers"]["inline"]["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_events_are_published_only_after_commit(self, user_id, session_id):
+        """Staged events reach the bus on commit and are discarded on rollback."""
+        bus = EventBus()
+
+        async def handler(event):
+            pass
+
+        bus.subscribe(SessionCompleted, handler)
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with AsyncSession(engine) as db:
+            publisher = AfterCommitPublisher(db, bus)
+
+            await db.execute(text("SELECT 1"))
+            publisher.publish([SparkSessionCompleted(session_id=session_id, user_id=user_id)])
+            await db.rollback()
+            assert bus.metrics()["queued"] == 0
+
+            await db.execute(text("SELECT 1"))
+            publisher.publish([SparkSessionCompleted(session_id=session_id, user_id=user_id)])
+            assert bus.metrics()["queued"] == 0
+            await db.commit()
+            assert bus.metrics()["queued"] == 1
+        await engine.dispose()
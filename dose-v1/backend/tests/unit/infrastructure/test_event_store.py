@@ -0,0 +1,100 @@
+"""
+Unit tests for the event store outbox and batched writer
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.infrastructure.event_bus import EventBus
+from src.infrastructure.event_store import EventStoreWriter, OutboxEvent, OutboxPublisher, event_row
+from src.modules.spark.domain.events import SparkStepCompleted
+from src.modules.wave.domain.events import WaveSessionStarted
+
+
+class RecordingWriter(EventStoreWriter):
+    """Writer whose batches are recorded instead of written to the database."""
+
+    def __init__(self, batch_size: int, fail: bool = False):
+        super().__init__(session_factory=None, batch_size=batch_size)
+        self.batches = []
+        self.fail = fail
+
+    async def _write(self, rows):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append(rows)
+
+
+def step_event(user_id, session_id, step_number=2):
+    return SparkStepCompleted(session_id=session_id, user_id=user_id, step_number=step_number)
+
+
+class TestEventRows:
+    """Test cases for flattening events into rows."""
+
+    def test_event_row_columns_and_payload(self, user_id, session_id):
+        """Identity fields become columns; the rest goes into the payload."""
+        event = step_event(user_id, session_id)
+
+        row = event_row(event)
+
+        assert row["id"] == event.event_id
+        assert row["event_type"] == "SparkStepCompleted"
+        assert row["aggregate_type"] == "spark"
+        assert row["aggregate_id"] == session_id
+        assert row["user_id"] == user_id
+        assert row["created_at"] == event.occurred_at
+        assert row["payload"] == {"step_number": 2}
+
+
+class TestEventStoreWriter:
+    """Test cases for buffering and group commit."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_is_full(self, user_id, session_id):
+        """Events are written together once batch_size is reached, not one by one."""
+        writer = RecordingWriter(batch_size=3)
+
+        for step in (1, 2):
+            await writer.append(step_event(user_id, session_id, step))
+        assert writer.batches == []
+
+        await writer.append(step_event(user_id, session_id, 3))
+        assert [len(batch) for batch in writer.batches] == [3]
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_partial_batch(self, user_id, session_id):
+        """A timed flush writes whatever is buffered."""
+        writer = RecordingWriter(batch_size=100)
+        await writer.append(step_event(user_id, session_id))
+
+        assert await writer.flush() == 1
+        assert await writer.flush() == 0
+        assert len(writer.batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_leaves_recovery_to_outbox(self, user_id, session_id):
+        """A failed batch is not retried from memory, so the buffer stays bounded."""
+        writer = RecordingWriter(batch_size=100, fail=True)
+        await writer.append(step_event(user_id, session_id))
+
+        assert await writer.flush() == 0
+        assert writer._buffer == []
+
+
+class TestOutboxPublisher:
+    """Test cases for the transactional outbox."""
+
+    @pytest.mark.asyncio
+    async def test_publish_adds_outbox_rows_to_unit_of_work(self, user_id, session_id):
+        """Each event becomes an outbox row in the caller's session."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with AsyncSession(engine) as db:
+            event = WaveSessionStarted(session_id=session_id, user_id=user_id)
+
+            OutboxPublisher(db, EventBus()).publish([event])
+
+            rows = [obj for obj in db.new if isinstance(obj, OutboxEvent)]
+            assert [row.id for row in rows] == [event.event_id]
+            assert rows[0].aggregate_type == "wave"
+        await engine.dispose()
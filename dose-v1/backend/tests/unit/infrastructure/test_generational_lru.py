@@ -0,0 +1,56 @@
+"""
+Unit tests for the generational per-user LRU
+"""
+
+from uuid import uuid4
+
+from src.infrastructure.cache import GenerationalLRU
+
+
+class TestGenerationalLRU:
+    """Test cases for eviction, expiry and loads racing writes."""
+
+    def test_least_recently_used_user_is_evicted(self):
+        """Past max_users, the user read longest ago goes first."""
+        cache = GenerationalLRU(max_users=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        for user in (first, second):
+            cache.put(user, str(user), cache.generation(user))
+
+        cache.get(first)
+        cache.put(third, "third", cache.generation(third))
+
+        assert cache.get(second) is None
+        assert cache.get(first) == str(first) and cache.get(third) == "third"
+
+    def test_expired_entries_are_misses(self, user_id):
+        """Entries older than ttl_seconds are not served."""
+        cache = GenerationalLRU(ttl_seconds=0.0)
+        cache.put(user_id, "value", cache.generation(user_id))
+
+        assert cache.get(user_id) is None
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_load_racing_a_write_is_not_kept(self, user_id):
+        """A value loaded before a bump is dropped; the entry already cached stays."""
+        cache = GenerationalLRU()
+        cache.put(user_id, "cached", cache.generation(user_id))
+        generation = cache.generation(user_id)
+
+        cache.bump(user_id)
+
+        assert not cache.put(user_id, "stale", generation)
+        assert cache.get(user_id) == "cached"
+
+    def test_load_across_a_prune_is_not_kept(self, user_id):
+        """Pruning forgotten generations never lets an older load match again."""
+        cache = GenerationalLRU(max_users=1)
+        generation = cache.generation(user_id)
+        cache.bump(user_id)
+
+        for _ in range(3):
+            cache.bump(uuid4())
+
+        assert user_id not in cache._generations
+        assert not cache.put(user_id, "stale", generation)
+        assert cache.put(user_id, "fresh", cache.generation(user_id))
@@ -0,0 +1,90 @@
+"""
+Unit tests for the log context and the JSON formatter
+"""
+
+import asyncio
+import json
+import logging
+import sys
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.logging import (
+    JSONFormatter,
+    LogContextFilter,
+    bind_log_context,
+    close_log_context,
+    get_log_context,
+    open_log_context,
+)
+
+
+def record(msg="hello %s", args=("world",), exc_info=None, **extra):
+    log_record = logging.LogRecord("src.test", logging.INFO, __file__, 7, msg, args, exc_info, func="handler")
+    log_record.__dict__.update(extra)
+    return log_record
+
+
+class TestLogContext:
+    """Test cases for binding and injecting request fields."""
+
+    def test_filter_injects_context_without_overriding_extra(self):
+        """Context fields are added to records; explicit extra= values win."""
+        token = open_log_context(request_id="req-1")
+        try:
+            bind_log_context(user_id="user-1", route="/sessions/{session_id}")
+            log_record = record(user_id="explicit")
+            LogContextFilter().filter(log_record)
+        finally:
+            close_log_context(token)
+
+        assert (log_record.request_id, log_record.user_id, log_record.route) == (
+            "req-1", "explicit", "/sessions/{session_id}"
+        )
+        assert get_log_context() == {}
+
+    @pytest.mark.asyncio
+    async def test_fields_bound_in_a_child_task_reach_the_request(self):
+        """A child task's copied context shares the request's fields."""
+        token = open_log_context(request_id="req-2")
+        try:
+            await asyncio.create_task(asyncio.to_thread(bind_log_context, user_id="user-2"))
+            context = get_log_context()
+        finally:
+            close_log_context(token)
+
+        assert context == {"request_id": "req-2", "user_id": "user-2"}
+
+
+class TestJSONFormatter:
+    """Test cases for the orjson encoder."""
+
+    def test_fields_and_cached_call_site(self):
+        """Output has the documented fields; repeated call sites reuse the cached part."""
+        formatter = JSONFormatter()
+        user_id = uuid4()
+
+        first = json.loads(formatter.format(record(request_id="req-3", user_id=user_id)))
+        second = json.loads(formatter.format(record(msg="again", args=None)))
+
+        assert {key: first[key] for key in ("level", "logger", "message", "module", "function", "line")} == {
+            "level": "INFO", "logger": "src.test", "message": "hello world",
+            "module": "test_log_context", "function": "handler", "line": 7,
+        }
+        assert (first["request_id"], first["user_id"]) == ("req-3", str(user_id))
+        assert second["message"] == "again" and "request_id" not in second
+        assert len(formatter._call_sites) == 1
+
+    def test_timestamp_and_exception(self):
+        """The timestamp is the record's creation time; tracebacks are included."""
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            log_record = record(exc_info=sys.exc_info())
+        log_record.created = 1790000000.25
+
+        data = json.loads(JSONFormatter().format(log_record))
+
+        assert data["timestamp"] == "2026-09-21T14:13:20.250000"
+        assert "ValueError: bad" in data["exception"]
@@ -0,0 +1,74 @@
+"""
+Unit tests for the queued logging pipeline
+"""
+
+import logging
+import queue
+import sys
+
+import pytest
+
+from src.infrastructure.logging import BoundedQueueHandler, logging_metrics, setup_logging, shutdown_logging
+
+
+def record(level, msg="message %s", args=("arg",), exc_info=None):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, exc_info)
+
+
+@pytest.fixture
+def restore_logging():
+    """setup_logging reconfigures the root logger; put pytest's handlers back."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    shutdown_logging()
+    for handler in root.handlers:
+        handler.close()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestBoundedQueueHandler:
+    """Test cases for the overflow policy and record preparation."""
+
+    def test_overflow_drops_debug_first_and_never_errors(self):
+        """DEBUG stops at half capacity, INFO at capacity; ERROR is always queued."""
+        handler = BoundedQueueHandler(queue.Queue(), capacity=4, debug_fill=0.5)
+
+        for level in (logging.DEBUG, logging.DEBUG, logging.DEBUG, logging.INFO, logging.INFO, logging.INFO):
+            handler.handle(record(level))
+        handler.handle(record(logging.ERROR))
+
+        assert handler.metrics() == {"queued": 5, "capacity": 4, "dropped": {"DEBUG": 1, "INFO": 1}}
+
+    def test_prepare_renders_message_and_traceback(self):
+        """Arguments and exceptions are rendered on the caller's thread."""
+        handler = BoundedQueueHandler(queue.Queue())
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            handler.handle(record(logging.ERROR, exc_info=sys.exc_info()))
+
+        queued = handler.queue.get_nowait()
+        assert (queued.msg, queued.args, queued.exc_info) == ("message arg", None, None)
+        assert "ValueError: bad" in queued.exc_text
+
+
+class TestSetupLogging:
+    """Test cases for the listener thread and shutdown."""
+
+    def test_shutdown_writes_queued_records(self, tmp_path, restore_logging):
+        """Records are written by the listener; shutdown flushes the rest and stops the queue."""
+        setup_logging(log_dir=str(tmp_path), queue_size=100)
+        logger = logging.getLogger("src.test_logging_queue")
+        for number in range(50):
+            logger.info(f"record {number}")
+        assert logging_metrics()["capacity"] == 100
+
+        shutdown_logging()
+        logger.info("after shutdown")
+
+        written = (tmp_path / "app.log").read_text()
+        assert "record 49" in written
+        assert "after shutdown" in written
+        assert logging_metrics() == {}
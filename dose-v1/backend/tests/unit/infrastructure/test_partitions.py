@@ -0,0 +1,109 @@
+"""
+Unit tests for session partition helpers
+"""
+
+import pytest
+from datetime import date
+
+from src.infrastructure.database.partitions import (
+    PartitionManager,
+    add_months,
+    create_partition_sql,
+    partition_month,
+    partition_name,
+)
+
+
+class FakeResult:
+    def __init__(self, value=None):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class FakeConnection:
+    """Records the SQL run; partitions in `occupied` have rows."""
+
+    def __init__(self, occupied=()):
+        self.occupied = set(occupied)
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if sql.startswith("SELECT EXISTS"):
+            return FakeResult(any(f"FROM {name})" in sql for name in self.occupied))
+        return FakeResult()
+
+
+class TestPartitionHelpers:
+    """Test cases for monthly partition naming and bounds."""
+
+    def test_add_months_crosses_year_boundaries(self):
+        """Month arithmetic wraps correctly in both directions."""
+        assert add_months(date(2026, 11, 15), 2) == date(2027, 1, 1)
+        assert add_months(date(2026, 1, 31), -1) == date(2025, 12, 1)
+
+    def test_partition_name_round_trips(self):
+        """Partition names encode their month and can be parsed back."""
+        name = partition_name("spark_sessions", date(2026, 3, 1))
+
+        assert name == "spark_sessions_y2026m03"
+        assert partition_month("spark_sessions", name) == date(2026, 3, 1)
+        assert partition_month("wave_sessions", name) is None
+
+    def test_partition_covers_exactly_one_month(self):
+        """Bounds run from the first of the month to the first of the next."""
+        sql = create_partition_sql("wave_sessions", date(2026, 12, 1))
+
+        assert "PARTITION OF wave_sessions" in sql
+        assert "FROM ('2026-12-01') TO ('2027-01-01')" in sql
+
+
+class TestPartitionManager:
+    """Test cases for creating and detaching partitions."""
+
+    TODAY = date(2026, 11, 20)
+
+    @pytest.mark.asyncio
+    async def test_creates_this_month_and_the_months_ahead(self):
+        """Missing partitions are created through months_ahead; existing ones are left alone."""
+        conn = FakeConnection()
+        manager = PartitionManager(engine=None, months_ahead=2)
+        existing = ["spark_sessions_y2026m11"]
+
+        created = await manager._create_ahead(conn, "spark_sessions", existing, self.TODAY)
+
+        assert created == ["spark_sessions_y2026m12", "spark_sessions_y2027m01"]
+        assert conn.statements == [
+            create_partition_sql("spark_sessions", date(2026, 12, 1)),
+            create_partition_sql("spark_sessions", date(2027, 1, 1)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_only_emptied_months_past_retention_are_detached(self):
+        """Months before the cutoff go once the archiver has emptied them; later and occupied months stay."""
+        existing = [partition_name("wave_sessions", date(2026, month, 1)) for month in range(5, 12)]
+        existing.append("wave_sessions_legacy")
+        conn = FakeConnection(occupied=["wave_sessions_y2026m06"])
+        manager = PartitionManager(engine=None, retention_months=3)
+
+        detached = await manager._detach_expired(conn, "wave_sessions", existing, self.TODAY)
+
+        # Cutoff is 2026-08-01: May and July are empty, June still holds sessions
+        assert detached == ["wave_sessions_y2026m05", "wave_sessions_y2026m07"]
+        assert "ALTER TABLE wave_sessions DETACH PARTITION wave_sessions_y2026m05" in conn.statements
+        assert "DROP TABLE wave_sessions_y2026m07" in conn.statements
+        assert not any("y2026m06" in sql and "DETACH" in sql for sql in conn.statements)
+        assert not any("y2026m08" in sql or "legacy" in sql for sql in conn.statements)
+
+    @pytest.mark.asyncio
+    async def test_zero_retention_detaches_nothing(self):
+        """retention_months=0 keeps every partition without touching the database."""
+        conn = FakeConnection()
+        existing = [partition_name("spark_sessions", date(2020, 1, 1))]
+
+        detached = await PartitionManager(engine=None)._detach_expired(conn, "spark_sessions", existing, self.TODAY)
+
+        assert detached == [] and conn.statements == []
@@ -0,0 +1,193 @@
+"""
+Unit tests for projection history replay
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.domain.events import SessionCompleted
+from src.infrastructure.event_store.models import StoredEvent
+from src.infrastructure.event_store.records import event_row
+from src.infrastructure.projections import Projection, ProjectionRunner, load_projection
+from src.infrastructure.projections.history import load_history, session_events
+from src.infrastructure.projections.models import ProjectionDeadLetter, ProjectionPosition
+from src.infrastructure.projections.rebuild import ProjectionRebuilder
+from src.modules.spark.domain.events import SparkSessionStarted, SparkStepCompleted
+from src.modules.spark.infrastructure.persistence.models import SparkSession
+from src.modules.wave.domain.events import WaveSessionCompleted, WaveStepCompleted
+from src.modules.wave.infrastructure.persistence.models import WaveSession
+# Mapped so the User <-> session relationships resolve
+import src.modules.auth.infrastructure.persistence.models  # noqa: F401
+
+START = datetime(2026, 3, 2, 9, 0)
+
+
+def spark_row(user_id, created_at=START, steps=3):
+    responses = {
+        column: "answer" if index < steps else None
+        for index, column in enumerate(
+            ("situation_response", "perception_response", "affect_response", "response_response", "key_result_response")
+        )
+    }
+    return SparkSession(
+        id=uuid4(), user_id=user_id, status="in_progress", current_step=steps,
+        created_at=created_at, updated_at=created_at + timedelta(minutes=5), completed_at=None,
+        **responses,
+    )
+
+
+def completed_wave_row(user_id, created_at=START):
+    return WaveSession(
+        id=uuid4(), user_id=user_id, status="completed", current_step=4,
+        situation="Deadline", emotion="anxious", intensity=7, acceptance_statement="It is ok",
+        action_type="breathing", action_completed=True, actual_duration=120,
+        created_at=created_at, updated_at=created_at + timedelta(minutes=10),
+        completed_at=created_at + timedelta(minutes=10),
+    )
+
+
+class CompletionCount(Projection):
+    """Minimal projection: completed sessions per user."""
+    name = "completion_count"
+    table = "completion_counts"
+    columns = ("user_id", "completed")
+    event_types = (SessionCompleted,)
+
+    def apply(self, rows, event, context=None):
+        row = rows.setdefault((event.user_id,), {"user_id": event.user_id, "completed": 0})
+        row["completed"] += 1
+
+
+class InMemoryCompletionCount(CompletionCount):
+    """CompletionCount stored in a dict; apply fails on the sessions in `poison`."""
+
+    def __init__(self, poison=()):
+        self.poison = set(poison)
+        self.stored = {}
+
+    def apply(self, rows, event, context=None):
+        super().apply(rows, event, context)
+        if event.session_id in self.poison:
+            raise KeyError("unexpected payload")
+
+    async def load(self, db, user_ids, table=None, for_update=False, keys=None):
+        return {u: {(u,): dict(self.stored[u])} for u in user_ids if u in self.stored}
+
+    async def save(self, db, rows, table=None):
+        for row in rows:
+            self.stored[row["user_id"]] = row
+
+
+class TestSessionHistory:
+    """Test cases for turning session rows into events."""
+
+    def test_in_progress_spark_session(self, user_id):
+        """Answered steps are replayed; no completion for an open session."""
+        events = session_events("spark", spark_row(user_id, steps=3))
+
+        assert [type(event) for event in events] == [SparkSessionStarted] + [SparkStepCompleted] * 3
+        assert [event.step_number for event in events[1:]] == [1, 2, 3]
+        assert events[0].occurred_at == START
+
+    def test_completed_wave_session(self, user_id):
+        """A completed WAVE session replays four steps and its completion."""
+        row = completed_wave_row(user_id)
+
+        events = session_events("wave", row)
+
+        assert [event.step_number for event in events if isinstance(event, WaveStepCompleted)] == [1, 2, 3, 4]
+        assert isinstance(events[-1], WaveSessionCompleted)
+        assert events[-1].occurred_at == row.completed_at
+        assert (events[-1].intensity, events[-1].action_type) == (7, "breathing")
+
+    @pytest.mark.asyncio
+    async def test_load_history_orders_and_cuts_at_watermark(self, user_id):
+        """History merges both session types in time order and stops at `until`."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda c: SparkSession.__table__.create(c))
+            await conn.run_sync(lambda c: WaveSession.__table__.create(c))
+        async with AsyncSession(engine) as db:
+            db.add_all([
+                completed_wave_row(user_id, START),
+                spark_row(user_id, START + timedelta(hours=1), steps=1),
+                completed_wave_row(uuid4(), START),
+            ])
+            await db.commit()
+
+            history = await load_history(db, [user_id], until=START + timedelta(minutes=30))
+        await engine.dispose()
+
+        events = history[user_id]
+        assert len(events) == 6  # wave start, 4 steps, completion; spark is after `until`
+        assert [e.occurred_at for e in events] == sorted(e.occurred_at for e in events)
+
+    def test_catch_up_skips_only_events_the_build_saw(self, user_id):
+        """Catch-up goes by stored_at and the outbox at load time, never occurred_at."""
+        loaded_at = START + timedelta(hours=1)
+        in_outbox = uuid4()
+        batches = {user_id: (loaded_at, {str(in_outbox)})}
+
+        def row(stored_at, event_id=None, owner=user_id):
+            # Every event occurred long before the rebuild (backdated offline sessions)
+            return {"id": event_id or uuid4(), "user_id": owner, "stored_at": stored_at,
+                    "created_at": START - timedelta(days=3)}
+
+        assert ProjectionRebuilder._built(row(loaded_at - timedelta(seconds=1)), batches)
+        assert ProjectionRebuilder._built(row(loaded_at + timedelta(seconds=1), in_outbox), batches)
+        assert not ProjectionRebuilder._built(row(loaded_at + timedelta(seconds=1)), batches)
+        assert not ProjectionRebuilder._built(row(loaded_at - timedelta(seconds=1), owner=uuid4()), batches)
+
+    def test_projection_folds_only_declared_events(self, user_id):
+        """A projection ignores events outside its event_types."""
+        projection = CompletionCount()
+        rows = {}
+
+        for event in session_events("wave", completed_wave_row(user_id)) + session_events("spark", spark_row(user_id)):
+            if projection.handles(event):
+                projection.apply(rows, event)
+
+        assert rows == {(user_id,): {"user_id": user_id, "completed": 1}}
+
+    def test_unknown_projection(self):
+        """Rebuilding an unregistered projection is rejected."""
+        with pytest.raises(ValueError, match="Unknown projection"):
+            load_projection("missing")
+
+
+class TestProjectionRunner:
+    """Test cases for tailing event_store into a live projection."""
+
+    @pytest.mark.asyncio
+    async def test_poison_event_is_set_aside(self, user_id):
+        """An event the projection cannot apply is recorded and skipped; the rest of its batch applies."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            for model in (StoredEvent, ProjectionPosition, ProjectionDeadLetter):
+                await conn.run_sync(lambda c, table=model.__table__: table.create(c))
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        sessions = [completed_wave_row(user_id, START + timedelta(hours=i)) for i in range(3)]
+        stored_at = datetime.utcnow() - timedelta(minutes=5)
+        async with session_factory() as db:
+            db.add(ProjectionPosition(projection="completion_count", stored_at=datetime.min, event_id=uuid4()))
+            for i, session in enumerate(sessions):
+                for event in session_events("wave", session):
+                    db.add(StoredEvent(**event_row(event), stored_at=stored_at + timedelta(seconds=i)))
+            await db.commit()
+        projection = InMemoryCompletionCount(poison=[sessions[1].id])
+
+        consumed = await ProjectionRunner(projection, session_factory, settle_seconds=1).run_once()
+
+        async with session_factory() as db:
+            dead = (await db.execute(select(ProjectionDeadLetter))).scalars().all()
+            position = await db.get(ProjectionPosition, "completion_count")
+        await engine.dispose()
+
+        assert consumed == 18
+        assert projection.stored[user_id]["completed"] == 2
+        assert [d.user_id for d in dead] == [user_id] and "KeyError" in dead[0].error
+        assert position.stored_at == stored_at + timedelta(seconds=2)
@@ -0,0 +1,103 @@
+"""
+Unit tests for the per-user GET response cache
+"""
+
+import asyncio
+from uuid import uuid4
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from src.infrastructure.cache import ResponseCache
+from src.modules.spark.domain.events import SparkStepCompleted
+
+
+def loader(payload, calls):
+    async def load():
+        calls.append(1)
+        return payload
+    return load
+
+
+class TestResponseCache:
+    """Test cases for versioned keys, ETags and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_hit_and_not_modified(self, user_id, session_id):
+        """The second request is served from the cache; a matching ETag gets 304."""
+        cache = ResponseCache()
+        calls = []
+        load = loader({"id": session_id}, calls)
+
+        first = await cache.respond(user_id, ("spark.session", session_id), None, load)
+        second = await cache.respond(user_id, ("spark.session", session_id), None, load)
+        conditional = await cache.respond(user_id, ("spark.session", session_id), first.headers["etag"], load)
+
+        assert len(calls) == 1
+        assert orjson.loads(second.body) == {"id": str(session_id)}
+        assert second.headers["etag"] == first.headers["etag"]
+        assert conditional.status_code == 304
+        assert cache.metrics() == {**cache.metrics(), "hits": 1, "not_modified": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_user_event_invalidates_only_that_user(self, user_id, session_id):
+        """A session event of the user makes their entries stale and changes the ETag."""
+        cache = ResponseCache()
+        other = uuid4()
+        calls = []
+        load = loader({"sessions": []}, calls)
+
+        first = await cache.respond(user_id, ("spark.sessions", 50, 0), None, load)
+        await cache.respond(other, ("spark.sessions", 50, 0), None, load)
+        cache.on_session_event(SparkStepCompleted(session_id=session_id, user_id=user_id, step_number=1))
+        refreshed = await cache.respond(user_id, ("spark.sessions", 50, 0), first.headers["etag"], load)
+        await cache.respond(other, ("spark.sessions", 50, 0), None, load)
+
+        assert refreshed.status_code == 200
+        assert refreshed.headers["etag"] != first.headers["etag"]
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_load_racing_a_write_is_not_cached(self, user_id):
+        """A body read before a write commits is returned but not served again."""
+        cache = ResponseCache()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            if len(calls) == 1:
+                cache.bump(user_id)  # write commits while the read is in flight
+            return {"n": len(calls)}
+
+        await cache.respond(user_id, ("wave.sessions", 50, 0), None, load)
+        second = await cache.respond(user_id, ("wave.sessions", 50, 0), None, load)
+
+        assert orjson.loads(second.body) == {"n": 2}
+
+    @pytest.mark.asyncio
+    async def test_errors_and_expired_entries_are_not_served(self, user_id, session_id):
+        """HTTPExceptions from the loader are not cached; entries expire after the TTL."""
+        cache = ResponseCache(ttl_seconds=0.01)
+        calls = []
+
+        async def missing():
+            raise HTTPException(status_code=404)
+
+        with pytest.raises(HTTPException):
+            await cache.respond(user_id, ("wave.session", session_id), None, missing)
+        await cache.respond(user_id, ("wave.session", session_id), None, loader({}, calls))
+        await asyncio.sleep(0.02)
+        await cache.respond(user_id, ("wave.session", session_id), None, loader({}, calls))
+
+        assert len(calls) == 2
+
+    def test_lru_bound(self, user_id):
+        """The least recently used entries are evicted past max_entries."""
+        cache = ResponseCache(max_entries=2)
+        version = cache.version(user_id)
+        for key in ("a", "b", "c"):
+            cache.put(user_id, key, version, b"{}")
+
+        assert cache.get(user_id, "a") is None
+        assert cache.get(user_id, "c") is not None
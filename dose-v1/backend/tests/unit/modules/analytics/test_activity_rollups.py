@@ -0,0 +1,130 @@
+"""
+Unit tests for the activity rollups read model
+"""
+
+import pytest
+from datetime import date, datetime
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.modules.analytics.application.services.analytics_service import AnalyticsService
+from src.modules.analytics.infrastructure.persistence.models import ActivityRollup
+from src.modules.analytics.infrastructure.projections.activity_rollup_projection import activity_rollup_projection
+from src.modules.auth.domain.entities.user import User as UserEntity
+from src.modules.auth.infrastructure.persistence.models import User
+from src.modules.spark.domain.events import SparkSessionStarted
+from src.modules.wave.domain.events import WaveSessionCompleted
+# Mapped so the User <-> session relationships resolve
+import src.modules.spark.infrastructure.persistence.models  # noqa: F401
+import src.modules.wave.infrastructure.persistence.models  # noqa: F401
+
+BERLIN = ZoneInfo("Europe/Berlin")
+SUNDAY_2330_UTC = datetime(2026, 3, 1, 23, 30)  # Monday 00:30 in Berlin
+MONDAY = datetime(2026, 3, 2)
+
+
+class InMemoryRollups:
+    """Double for ActivityRollupRepository."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.ranges = []
+
+    async def get_range(self, user_id, granularity, start, end):
+        self.ranges.append((granularity, start, end))
+        return [r for r in self.rows if r.granularity == granularity and start <= r.bucket_start < end]
+
+    async def get_timezone(self, user_id):
+        return "Europe/Berlin"
+
+
+class TestActivityRollupProjection:
+    """Test cases for bucketing events in local time."""
+
+    def test_buckets_are_local(self, user_id, session_id):
+        """An event late on Sunday UTC lands in Monday's buckets in Berlin."""
+        rows = {}
+        event = WaveSessionCompleted(
+            session_id=session_id, user_id=user_id, occurred_at=SUNDAY_2330_UTC, intensity=6, action_type="breathing",
+        )
+
+        activity_rollup_projection.apply(rows, event, BERLIN)
+        activity_rollup_projection.apply(rows, SparkSessionStarted(
+            session_id=uuid4(), user_id=user_id, occurred_at=SUNDAY_2330_UTC,
+        ), BERLIN)
+
+        assert set(rows) == {
+            (user_id, "hour", MONDAY),
+            (user_id, "day", MONDAY),
+            (user_id, "week", MONDAY),
+        }
+        day = rows[(user_id, "day", MONDAY)]
+        assert (day["wave_completed"], day["spark_started"]) == (1, 1)
+        assert (day["intensity_sum"], day["intensity_max"]) == (6, 6)
+        assert day["action_counts"] == {"breathing": 1}
+
+    @pytest.mark.asyncio
+    async def test_loads_only_touched_buckets(self, user_id, session_id):
+        """A batch loads the three buckets its events touch, in the user's zone."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            for model in (User, ActivityRollup):
+                await conn.run_sync(lambda c, table=model.__table__: table.create(c))
+        async with AsyncSession(engine) as db:
+            db.add(User(id=user_id, email="a@example.com", hashed_password="x", timezone="Europe/Berlin"))
+            for granularity, start in (("day", MONDAY), ("day", datetime(2026, 3, 1)), ("hour", MONDAY)):
+                db.add(ActivityRollup(
+                    user_id=user_id, granularity=granularity, bucket_start=start, spark_started=1,
+                    spark_completed=0, wave_started=0, wave_completed=0, intensity_sum=0, intensity_count=0,
+                    action_counts={}, updated_at=MONDAY,
+                ))
+            await db.commit()
+
+            events = {user_id: [SparkSessionStarted(session_id=session_id, user_id=user_id, occurred_at=SUNDAY_2330_UTC)]}
+            context = await activity_rollup_projection.load_context(db, [user_id])
+            keys = activity_rollup_projection.touched_keys(events, context)
+            loaded = await activity_rollup_projection.load(db, [user_id], keys=keys)
+        await engine.dispose()
+
+        assert len(keys) == 3
+        assert set(loaded[user_id]) == {(user_id, "day", MONDAY), (user_id, "hour", MONDAY)}
+
+
+class TestActivityService:
+    """Test cases for the chart endpoint's service."""
+
+    @pytest.mark.asyncio
+    async def test_week_range_includes_the_week_start_falls_in(self, user_id):
+        """Weekly ranges start on the Monday of the first date's week."""
+        row = ActivityRollup(
+            user_id=user_id, granularity="week", bucket_start=MONDAY, spark_started=0, spark_completed=2,
+            wave_started=3, wave_completed=3, intensity_sum=15, intensity_count=3, intensity_max=8,
+            action_counts={"walk": 3},
+        )
+        rollups = InMemoryRollups([row])
+
+        activity = await AnalyticsService(None, rollups).get_activity(user_id, "week", date(2026, 3, 4), date(2026, 3, 31))
+
+        assert rollups.ranges == [("week", MONDAY, datetime(2026, 4, 1))]
+        assert activity.timezone == "Europe/Berlin"
+        assert activity.buckets[0].wave_intensity_mean == 5.0
+
+    @pytest.mark.asyncio
+    async def test_rejects_ranges_beyond_the_bucket_limit(self, user_id):
+        """Hourly charts over a whole year are refused."""
+        with pytest.raises(ValueError, match="more than"):
+            await AnalyticsService(None, InMemoryRollups()).get_activity(user_id, "hour", date(2026, 1, 1), date(2026, 12, 31))
+
+    def test_unknown_time_zone_is_rejected(self, user_id):
+        """Users can only set IANA time zones."""
+        user = UserEntity(
+            id=user_id, email="a@example.com", hashed_password="x", full_name=None,
+            is_active=True, is_verified=False, created_at=MONDAY, updated_at=MONDAY,
+        )
+
+        with pytest.raises(ValueError, match="Unknown time zone"):
+            user.set_timezone("Mars/Olympus")
+        user.set_timezone("Asia/Kolkata")
+        assert user.timezone == "Asia/Kolkata"
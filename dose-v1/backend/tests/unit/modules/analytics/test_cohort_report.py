@@ -0,0 +1,160 @@
+"""
+Unit tests for the cohort analytics batch job
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.infrastructure.archive import SessionArchive, to_record
+from src.infrastructure.archive.models import ArchivedSession
+from src.modules.analytics.application.services import cohort_aggregate
+from src.modules.analytics.application.services.cohort_aggregate import CohortAggregate
+from src.modules.analytics.application.services.cohort_report_job import CohortReportJob, key_ranges
+from src.modules.analytics.infrastructure.persistence.models import CohortReport
+from src.modules.spark.infrastructure.persistence.models import SparkSession
+from src.modules.wave.infrastructure.persistence.models import WaveSession
+# Mapped so the User <-> session relationships resolve
+import src.modules.auth.infrastructure.persistence.models  # noqa: F401
+
+START = datetime(2026, 3, 2, 9, 0)
+
+
+def wave_batch(intensity, emotion, action_type, completed, duration):
+    n = len(intensity)
+    return dict(
+        status=np.array(["completed" if c else "in_progress" for c in completed]),
+        steps=np.ones((n, 4), dtype=bool),
+        intensity=np.array(intensity, dtype=np.float64),
+        emotion=np.array(emotion, dtype=object),
+        action_type=np.array(action_type, dtype=object),
+        action_completed=np.array(completed, dtype=bool),
+        actual_duration=np.array(duration, dtype=np.float64),
+    )
+
+
+class TestCohortAggregate:
+    """Test cases for partial aggregation and merging."""
+
+    def test_key_ranges_cover_the_uuid_space(self):
+        """Ranges are contiguous, open at both ends."""
+        ranges = key_ranges(4)
+
+        assert ranges[0][0] is None and ranges[-1][1] is None
+        assert [high for _, high in ranges[:-1]] == [low for low, _ in ranges[1:]]
+        assert ranges[1][0] == UUID(int=1 << 126)
+
+    def test_merged_chunks_equal_one_pass(self):
+        """Aggregating chunks separately and merging gives the single-pass result."""
+        first = wave_batch([7, 3], ["anxious", None], ["breathing", None], [True, False], [60, None])
+        second = wave_batch([7, 10], ["anxious", "angry"], ["breathing", "walk"], [True, True], [None, 300])
+        combined = {key: np.concatenate([first[key], second[key]]) for key in first}
+
+        merged, left, right = CohortAggregate(), CohortAggregate(), CohortAggregate()
+        left.add_wave(**first)
+        right.add_wave(**second)
+        merged.merge(left)
+        merged.merge(right)
+        single = CohortAggregate()
+        single.add_wave(**combined)
+
+        assert merged.as_report() == single.as_report()
+        wave = merged.as_report()["wave"]
+        assert wave["intensity"]["distribution"]["7"] == 2
+        assert wave["emotions"][0] == {"emotion": "anxious", "sessions": 2}
+        assert wave["actions"][0] == {
+            "action_type": "breathing", "chosen": 2, "completed": 2, "completion_rate": 1.0, "average_duration": 60.0,
+        }
+
+    def test_free_text_emotions_are_capped(self, monkeypatch):
+        """Past MAX_EMOTIONS distinct emotions, the rarest are folded into other_emotions."""
+        monkeypatch.setattr(cohort_aggregate, "MAX_EMOTIONS", 2)
+        emotions = ["anxious", "anxious", "anxious", "angry", "angry", "sad", "a typo", "a long story"]
+        left, right = CohortAggregate(), CohortAggregate()
+        left.add_wave(**wave_batch([5] * 8, emotions, [None] * 8, [False] * 8, [None] * 8))
+        right.add_wave(**wave_batch([5], ["sad"], [None], [False], [None]))
+        left.merge(right)
+
+        wave = left.as_report()["wave"]
+        assert len(left.emotions) == 2
+        assert wave["emotions"] == [{"emotion": "anxious", "sessions": 3}, {"emotion": "angry", "sessions": 2}]
+        assert wave["other_emotions"] == 4
+
+
+class TestCohortReportJob:
+    """Test cases for the chunked, multi-process job."""
+
+    @pytest.mark.asyncio
+    async def test_report_covers_every_chunk(self, tmp_path):
+        """Rows spread over many id ranges are all counted once."""
+        url = f"sqlite+aiosqlite:///{tmp_path / 'cohort.db'}"
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            for model in (SparkSession, WaveSession, CohortReport):
+                await conn.run_sync(lambda c, table=model.__table__: table.create(c))
+        async with AsyncSession(engine) as db:
+            for i in range(40):
+                db.add(SparkSession(
+                    id=uuid4(), user_id=uuid4(), status="completed" if i % 4 == 0 else "in_progress",
+                    current_step=2, situation_response="s", perception_response="p" if i % 2 else None,
+                    created_at=START + timedelta(minutes=i), updated_at=START,
+                ))
+                db.add(WaveSession(
+                    id=uuid4(), user_id=uuid4(), status="in_progress", current_step=2,
+                    situation="s", emotion="Anxious", intensity=i % 10 + 1, action_completed=False,
+                    created_at=START + timedelta(minutes=i), updated_at=START,
+                ))
+            await db.commit()
+
+        report = await CohortReportJob(url, workers=2, chunks=8, fetch_size=3).run()
+
+        async with AsyncSession(engine) as db:
+            stored = await db.get(CohortReport, report.id)
+        await engine.dispose()
+
+        assert stored.rows_scanned == 80
+        spark = stored.report["spark"]
+        assert (spark["sessions"], spark["completed"]) == (40, 10)
+        assert [step["answered"] for step in spark["steps"]] == [40, 20, 0, 0, 0]
+        wave = stored.report["wave"]
+        assert wave["intensity"]["distribution"] == {str(level): 4 for level in range(1, 11)}
+        assert wave["emotions"] == [{"emotion": "anxious", "sessions": 40}]
+
+    @pytest.mark.asyncio
+    async def test_archived_sessions_are_counted_once(self, tmp_path):
+        """Archived sessions are read from their segments, alongside the hot rows."""
+        url = f"sqlite+aiosqlite:///{tmp_path / 'cohort.db'}"
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            for model in (SparkSession, WaveSession, CohortReport, ArchivedSession):
+                await conn.run_sync(lambda c, table=model.__table__: table.create(c))
+        archive = SessionArchive(str(tmp_path / "archive"))
+        users = [uuid4() for _ in range(5)]
+        async with AsyncSession(engine) as db:
+            db.add(WaveSession(
+                id=uuid4(), user_id=users[0], status="in_progress", current_step=2,
+                situation="s", emotion="calm", intensity=2, created_at=START, updated_at=START,
+            ))
+            archived = [
+                WaveSession(
+                    id=uuid4(), user_id=users[i % 5], status="completed", current_step=4,
+                    situation="s", emotion=" Anxious ", intensity=8, action_type="breathing",
+                    action_completed=True, actual_duration=60,
+                    created_at=START + timedelta(days=i * 20), updated_at=START, completed_at=START,
+                )
+                for i in range(10)
+            ]
+            await archive.append(db, "wave", [to_record(session) for session in archived])
+            await db.commit()
+
+        report = await CohortReportJob(url, workers=2, chunks=4, fetch_size=3, archive_dir=str(tmp_path / "archive")).run()
+        await engine.dispose()
+
+        assert report.rows_scanned == 11
+        wave = report.report["wave"]
+        assert (wave["sessions"], wave["completed"]) == (11, 10)
+        assert wave["emotions"] == [{"emotion": "anxious", "sessions": 10}, {"emotion": "calm", "sessions": 1}]
+        assert wave["actions"][0]["average_duration"] == 60.0
@@ -0,0 +1,143 @@
+"""
+Unit tests for WAVE pattern analytics
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.modules.analytics.application.services.pattern_service import PatternService, compute_patterns, rolling_means
+from src.modules.analytics.infrastructure.cache import PatternCache
+from src.modules.analytics.infrastructure.queries.wave_pattern_query import WaveColumns, WavePatternQuery
+from src.modules.wave.domain.events import WaveSessionStarted
+from src.modules.wave.infrastructure.persistence.models import WaveSession
+# Mapped so the User <-> session relationships resolve
+import src.modules.auth.infrastructure.persistence.models  # noqa: F401
+import src.modules.spark.infrastructure.persistence.models  # noqa: F401
+
+MONDAY_9AM = datetime(2026, 3, 2, 9, 0)
+
+
+def wave_row(user_id, created_at, intensity, emotion="Anxious", action_type="breathing", completed=True, duration=120):
+    return WaveSession(
+        id=uuid4(), user_id=user_id, status="completed" if completed else "in_progress", current_step=4,
+        situation="Deadline", emotion=emotion, intensity=intensity,
+        action_type=action_type, action_completed=completed, actual_duration=duration,
+        created_at=created_at, updated_at=created_at, completed_at=created_at if completed else None,
+    )
+
+
+async def load_columns(rows, user_id):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: WaveSession.__table__.create(c))
+    async with AsyncSession(engine) as db:
+        db.add_all(rows)
+        await db.commit()
+        columns = await WavePatternQuery(db).load(user_id)
+    await engine.dispose()
+    return columns
+
+
+def empty_columns():
+    return WaveColumns(
+        created_at=np.array([], dtype="datetime64[s]"),
+        intensity=np.array([], dtype=np.float64),
+        emotion=np.array([], dtype=str),
+        action_type=np.array([], dtype=object),
+        action_completed=np.array([], dtype=bool),
+        actual_duration=np.array([], dtype=np.float64),
+    )
+
+
+class CountingQuery:
+    """Double for WavePatternQuery that counts loads."""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.loads = 0
+
+    async def load(self, user_id):
+        self.loads += 1
+        return self.columns
+
+
+class TestComputePatterns:
+    """Test cases for the vectorized pattern computation."""
+
+    def test_rolling_means_use_available_history_at_start(self):
+        """The first means average fewer than `window` values."""
+        means = rolling_means(np.array([2.0, 4.0, 6.0, 8.0]), window=2)
+
+        assert means.tolist() == [2.0, 3.0, 5.0, 7.0]
+
+    @pytest.mark.asyncio
+    async def test_patterns_from_loaded_columns(self, user_id):
+        """Distributions, emotions and action effectiveness come out of one load."""
+        rows = [
+            wave_row(user_id, MONDAY_9AM, 8, action_type="breathing"),
+            wave_row(user_id, MONDAY_9AM + timedelta(days=1), 6, emotion="sad", action_type="walk"),
+            wave_row(user_id, MONDAY_9AM + timedelta(days=1, hours=5), 5, action_type="breathing", duration=None),
+            wave_row(user_id, MONDAY_9AM + timedelta(days=7), 2, action_type=None, completed=False),
+            wave_row(uuid4(), MONDAY_9AM, 10),
+        ]
+
+        columns = await load_columns(rows, user_id)
+        patterns = compute_patterns(user_id, columns)
+
+        assert patterns.sessions == 4
+        assert patterns.average_intensity == 5.25
+        assert patterns.intensity_trend_per_week < 0
+        assert patterns.by_hour[9].sessions == 3
+        assert patterns.by_hour[14].average_intensity == 5.0
+        assert [b.sessions for b in patterns.by_weekday] == [2, 2, 0, 0, 0, 0, 0]
+        assert patterns.by_weekday[6].average_intensity is None
+        assert [(e.emotion, e.sessions) for e in patterns.emotions] == [("anxious", 3), ("sad", 1)]
+
+        breathing, walk = patterns.actions
+        assert breathing.action_type == "breathing"
+        assert breathing.average_intensity_change == -2.5  # 8 -> 6 and 5 -> 2
+        assert breathing.average_duration == 120.0  # The untimed one is left out
+        assert walk.average_intensity_change == -1.0
+
+    def test_no_check_ins(self, user_id):
+        """A user without WAVE check-ins gets empty patterns."""
+        patterns = compute_patterns(user_id, empty_columns())
+
+        assert patterns.sessions == 0
+        assert patterns.average_intensity is None
+        assert patterns.intensity_trend_per_week is None
+        assert len(patterns.by_hour) == 24
+        assert patterns.actions == []
+
+
+class TestPatternCache:
+    """Test cases for caching and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_cached_until_wave_session_event(self, user_id):
+        """Patterns are computed once per user until a WAVE event invalidates them."""
+        cache = PatternCache()
+        query = CountingQuery(empty_columns())
+        service = PatternService(query, cache)
+
+        await service.get_patterns(user_id)
+        await service.get_patterns(user_id)
+        assert query.loads == 1
+
+        await cache.on_session_event(WaveSessionStarted(session_id=uuid4(), user_id=user_id))
+        await service.get_patterns(user_id)
+        assert query.loads == 2
+
+    def test_result_computed_across_an_invalidation_is_not_stored(self, user_id):
+        """A load that raced an invalidation does not repopulate the cache."""
+        cache = PatternCache()
+        generation = cache.generation(user_id)
+
+        cache.invalidate(user_id)
+        cache.put(user_id, "stale", generation)
+
+        assert cache.get(user_id) is None
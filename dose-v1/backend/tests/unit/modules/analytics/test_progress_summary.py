@@ -0,0 +1,135 @@
+"""
+Unit tests for the user progress summary read model
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.infrastructure.event_store.models import OutboxEvent, StoredEvent
+from src.modules.analytics.application.services.analytics_service import AnalyticsService
+from src.modules.analytics.application.services.progress_summary_checker import ProgressSummaryChecker
+from src.modules.analytics.infrastructure.persistence.models import UserProgressSummary
+from src.modules.analytics.infrastructure.projections.progress_summary_projection import progress_summary_projection
+from src.modules.auth.infrastructure.persistence.models import User
+from src.modules.spark.domain.events import SparkSessionCompleted, SparkSessionStarted, SparkStepCompleted
+from src.modules.spark.infrastructure.persistence.models import SparkSession
+from src.modules.wave.domain.events import WaveSessionStarted
+from src.modules.wave.infrastructure.persistence.models import WaveSession
+
+NOW = datetime(2026, 5, 4, 12, 0)
+
+
+class InMemorySummaries:
+    """Double for ProgressSummaryRepository.get."""
+
+    def __init__(self, rows=None):
+        self.rows = rows or {}
+
+    async def get(self, user_id):
+        return self.rows.get(user_id)
+
+
+def stored_completion(row, stored_at):
+    return StoredEvent(
+        id=uuid4(), event_type="SparkSessionCompleted", aggregate_type="spark", aggregate_id=row.id,
+        user_id=row.user_id, payload={}, created_at=row.completed_at, stored_at=stored_at,
+    )
+
+
+def completed_spark_row(user_id, completed_at):
+    return SparkSession(
+        id=uuid4(), user_id=user_id, status="completed", current_step=5,
+        created_at=completed_at - timedelta(minutes=10), updated_at=completed_at, completed_at=completed_at,
+    )
+
+
+class TestProgressSummaryProjection:
+    """Test cases for folding events into the summary row."""
+
+    def test_counts_starts_and_completions_per_type(self, user_id, session_id):
+        """Starts and completions are counted per type; steps are ignored."""
+        rows = {}
+        events = [
+            SparkSessionStarted(session_id=session_id, user_id=user_id),
+            SparkStepCompleted(session_id=session_id, user_id=user_id, step_number=1),
+            SparkSessionCompleted(session_id=session_id, user_id=user_id, occurred_at=NOW),
+            SparkSessionCompleted(session_id=uuid4(), user_id=user_id, occurred_at=NOW - timedelta(days=1)),
+            WaveSessionStarted(session_id=uuid4(), user_id=user_id),
+        ]
+
+        for event in events:
+            if progress_summary_projection.handles(event):
+                progress_summary_projection.apply(rows, event)
+
+        row = rows[(user_id,)]
+        assert (row["spark_started"], row["spark_completed"]) == (1, 2)
+        assert row["spark_last_completed_at"] == NOW  # Out-of-order events keep the latest
+        assert (row["wave_started"], row["wave_completed"]) == (1, 0)
+
+
+class TestAnalyticsService:
+    """Test cases for the summary endpoint's service."""
+
+    @pytest.mark.asyncio
+    async def test_summary_without_sessions_is_zero(self, user_id):
+        """A user without a summary row gets zero counts."""
+        summary = await AnalyticsService(InMemorySummaries()).get_summary(user_id)
+
+        assert summary.total_completed == 0
+        assert summary.updated_at is None
+
+    @pytest.mark.asyncio
+    async def test_summary_totals(self, user_id):
+        """total_completed adds both session types."""
+        row = UserProgressSummary(
+            user_id=user_id, spark_started=4, spark_completed=3, wave_started=2, wave_completed=1,
+            updated_at=NOW,
+        )
+
+        summary = await AnalyticsService(InMemorySummaries({user_id: row})).get_summary(user_id)
+
+        assert summary.total_completed == 4
+        assert summary.spark_started == 4
+
+
+class TestProgressSummaryChecker:
+    """Test cases for the consistency checker."""
+
+    @pytest.mark.asyncio
+    async def test_reports_stale_summaries_and_skips_active_users(self):
+        """Summaries disagreeing with history are reported; users with recently stored events are skipped."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            for model in (User, SparkSession, WaveSession, UserProgressSummary, StoredEvent, OutboxEvent):
+                await conn.run_sync(lambda c, table=model.__table__: table.create(c))
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        consistent, stale, active, synced_late = uuid4(), uuid4(), uuid4(), uuid4()
+        async with session_factory() as db:
+            for user_id in (consistent, stale, active, synced_late):
+                db.add(User(id=user_id, email=f"{user_id}@example.com", hashed_password="x"))
+            active_row = completed_spark_row(active, NOW - timedelta(seconds=30))
+            # Done offline two days ago, stored a moment ago
+            late_row = completed_spark_row(synced_late, NOW - timedelta(days=2))
+            db.add_all([
+                completed_spark_row(consistent, NOW - timedelta(days=2)),
+                completed_spark_row(stale, NOW - timedelta(days=2)),
+                active_row,
+                late_row,
+                stored_completion(active_row, NOW - timedelta(seconds=30)),
+                stored_completion(late_row, NOW - timedelta(seconds=10)),
+                UserProgressSummary(
+                    user_id=consistent, spark_started=1, spark_completed=1,
+                    spark_last_completed_at=NOW - timedelta(days=2), wave_started=0, wave_completed=0,
+                    updated_at=NOW,
+                ),
+            ])
+            await db.commit()
+
+        report = await ProgressSummaryChecker(session_factory).run(now=NOW)
+        await engine.dispose()
+
+        assert report == {"checked": 2, "skipped": 2, "mismatched": 1, "repaired": 0}
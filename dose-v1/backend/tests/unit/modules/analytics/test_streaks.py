@@ -0,0 +1,116 @@
+"""
+Unit tests for the daily streak read model
+"""
+
+import pytest
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+from src.modules.analytics.application.services.analytics_service import AnalyticsService
+from src.modules.analytics.infrastructure.projections.streak_projection import (
+    WINDOW,
+    add_active_day,
+    streak_projection,
+)
+from src.modules.wave.domain.events import WaveSessionCompleted
+
+DAY = date(2026, 3, 10)
+
+
+def fold(user_id, days):
+    row = streak_projection.empty_row(user_id)
+    for day in days:
+        add_active_day(row, day)
+    return row
+
+
+class InMemoryStreaks:
+    """Double for StreakRepository."""
+
+    def __init__(self, row=None, timezone="UTC"):
+        self.row = row
+        self.timezone = timezone
+
+    async def get_with_timezone(self, user_id):
+        return self.row, self.timezone
+
+
+class TestStreakProjection:
+    """Test cases for the O(1) streak update."""
+
+    def test_consecutive_days_and_gaps(self, user_id):
+        """Runs grow day by day, restart after a gap and keep the longest."""
+        row = fold(user_id, [DAY, DAY, DAY + timedelta(days=1), DAY + timedelta(days=2), DAY + timedelta(days=5)])
+
+        assert (row["current_streak"], row["longest_streak"]) == (1, 3)
+        assert row["last_active_date"] == DAY + timedelta(days=5)
+
+    def test_late_sync_bridges_gap(self, user_id):
+        """A day synced late that closes a gap joins both runs."""
+        row = fold(user_id, [DAY, DAY + timedelta(days=1), DAY + timedelta(days=3), DAY + timedelta(days=4)])
+        assert (row["current_streak"], row["longest_streak"]) == (2, 2)
+
+        add_active_day(row, DAY + timedelta(days=2))
+
+        assert (row["current_streak"], row["longest_streak"]) == (5, 5)
+
+    def test_late_sync_inside_an_older_run(self, user_id):
+        """Backfilling an older gap only changes the longest streak."""
+        days = [DAY, DAY + timedelta(days=2), DAY + timedelta(days=3), DAY + timedelta(days=6)]
+        row = fold(user_id, days)
+
+        add_active_day(row, DAY + timedelta(days=1))
+
+        assert (row["current_streak"], row["longest_streak"]) == (1, 4)
+
+    def test_matches_full_recount(self, user_id):
+        """Any arrival order gives the streak of the sorted days."""
+        days = [DAY + timedelta(days=d) for d in (0, 1, 2, 4, 5, 6, 7, 9, 10)]
+        in_order = fold(user_id, days)
+        shuffled = fold(user_id, days[::3] + days[1::3] + days[2::3])
+
+        assert (shuffled["current_streak"], shuffled["longest_streak"]) == (2, 4)
+        assert (in_order["current_streak"], in_order["longest_streak"]) == (2, 4)
+        assert shuffled["active_days"] == in_order["active_days"]
+
+    def test_days_before_window_are_ignored(self, user_id):
+        """The bitmask only remembers WINDOW days."""
+        row = fold(user_id, [DAY])
+
+        add_active_day(row, DAY - timedelta(days=WINDOW))
+
+        assert row["active_days"] == 1 and row["longest_streak"] == 1
+
+    def test_days_are_local(self, user_id, session_id):
+        """A completion after midnight in the user's zone counts for their next day."""
+        rows = {}
+        event = WaveSessionCompleted(session_id=session_id, user_id=user_id, occurred_at=datetime(2026, 3, 10, 19, 0))
+
+        streak_projection.apply(rows, event, ZoneInfo("Asia/Tokyo"))
+
+        assert rows[(user_id,)]["last_active_date"] == date(2026, 3, 11)
+
+
+class TestStreakService:
+    """Test cases for reading the streak."""
+
+    @pytest.mark.asyncio
+    async def test_streak_survives_until_a_full_day_is_missed(self, user_id):
+        """Yesterday's run still counts today; it is broken the day after."""
+        row = SimpleNamespace(current_streak=4, longest_streak=6, last_active_date=DAY)
+        service = AnalyticsService(None, streak_repository=InMemoryStreaks(row, "America/New_York"))
+
+        # 02:00 UTC on the 12th is still the 11th in New York
+        ongoing = await service.get_streak(user_id, now=datetime(2026, 3, 12, 2, 0))
+        broken = await service.get_streak(user_id, now=datetime(2026, 3, 12, 12, 0))
+
+        assert (ongoing.current_streak, ongoing.active_today) == (4, False)
+        assert (broken.current_streak, broken.longest_streak) == (0, 6)
+
+    @pytest.mark.asyncio
+    async def test_user_without_sessions(self, user_id):
+        """Users with no completed session have an empty streak."""
+        streak = await AnalyticsService(None, streak_repository=InMemoryStreaks()).get_streak(user_id)
+
+        assert (streak.current_streak, streak.longest_streak, streak.last_active_date) == (0, 0, None)
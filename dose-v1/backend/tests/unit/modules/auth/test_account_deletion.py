@@ -0,0 +1,79 @@
+"""
+Unit tests for account deletion in AuthServiceEnhanced
+"""
+
+import pytest
+from datetime import datetime
+from uuid import uuid4
+
+from src.core.utils.security.password import hash_password
+from src.modules.auth.application.services.auth_service_enhanced import AuthServiceEnhanced
+from src.modules.auth.domain.entities.user import User
+
+
+class InMemoryUserRepository:
+    """Minimal user repository double."""
+
+    def __init__(self, user):
+        self.users = {str(user.id): user}
+
+    async def get_by_id(self, user_id):
+        return self.users.get(str(user_id))
+
+    async def update(self, user):
+        self.users[str(user.id)] = user
+        return user
+
+
+class RecordingErasureRepository:
+    """Records which users were queued for erasure."""
+
+    def __init__(self):
+        self.pending = []
+
+    async def create(self, user_id):
+        self.pending.append(user_id)
+
+
+class NoBlacklist:
+    async def is_blacklisted(self, token_jti):
+        return False
+
+
+@pytest.fixture
+def user():
+    now = datetime.utcnow()
+    return User(
+        id=uuid4(), email="user@example.com", hashed_password=hash_password("Password1!"),
+        full_name=None, is_active=True, is_verified=True, created_at=now, updated_at=now,
+    )
+
+
+@pytest.fixture
+def auth_service(user):
+    return AuthServiceEnhanced(InMemoryUserRepository(user), NoBlacklist(), None, None, RecordingErasureRepository())
+
+
+class TestAccountDeletion:
+    """Test cases for delete_account."""
+
+    @pytest.mark.asyncio
+    async def test_delete_revokes_tokens_and_queues_erasure(self, auth_service, user):
+        """Existing tokens stop working at once and the data is queued for background erasure."""
+        token = auth_service.token_service.create_access_token(user_id=str(user.id), email=user.email)
+        assert await auth_service.get_current_user(token) is not None
+
+        await auth_service.delete_account(user.id, "Password1!")
+
+        assert await auth_service.get_current_user(token) is None
+        assert user.is_deleted() and not user.is_active
+        assert auth_service.erasure_repo.pending == [user.id]
+
+    @pytest.mark.asyncio
+    async def test_wrong_password_keeps_account(self, auth_service, user):
+        """A wrong password confirmation leaves the account untouched."""
+        with pytest.raises(ValueError):
+            await auth_service.delete_account(user.id, "wrong")
+
+        assert not user.is_deleted()
+        assert auth_service.erasure_repo.pending == []
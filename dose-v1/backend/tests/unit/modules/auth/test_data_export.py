@@ -0,0 +1,255 @@
+"""
+Unit tests for the personal-data export (DataExportService and GET /auth/me/export)
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.infrastructure.drafts import SessionDraft
+from src.modules.auth.api.endpoints import auth_endpoints_enhanced
+from src.modules.auth.application.services import data_export_service
+from src.modules.auth.application.services.data_export_service import CSV_HEADER, DataExportService, ExportFormat
+from src.modules.auth.domain.entities.user import User
+from src.modules.auth.infrastructure.persistence.oauth_account_model import OAuthAccount
+from src.modules.popcorn.domain.entities.idea import Idea
+from src.modules.spark.domain.entities.spark_session import SparkSession
+from src.modules.spark.domain.value_objects.session_status import SessionStatus as SparkStatus
+from src.modules.wave.domain.entities.wave_session import WaveSession
+from src.modules.wave.domain.value_objects.session_status import SessionStatus as WaveStatus
+# Mapped so the User <-> session relationships resolve
+import src.modules.auth.infrastructure.persistence.models  # noqa: F401
+import src.modules.spark.infrastructure.persistence.models  # noqa: F401
+import src.modules.wave.infrastructure.persistence.models  # noqa: F401
+
+START = datetime(2026, 3, 2, 9, 0)
+SECRETS = ("$2b$12$password-hash", "oauth-access-token", "oauth-refresh-token")
+
+
+class SessionFactory:
+    """Stands in for async_sessionmaker; counts sessions opened and closed."""
+
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        self.opened += 1
+        return object()
+
+    async def __aexit__(self, *exc_info):
+        self.closed += 1
+
+
+class UserData:
+    """Everything stored for one user, served by the repository doubles below."""
+
+    def __init__(self, spark_sessions=2):
+        self.user = User(
+            id=uuid4(), email="user@example.com", hashed_password=SECRETS[0], full_name="Sam",
+            is_active=True, is_verified=True, created_at=START, updated_at=START,
+        )
+        self.oauth = [OAuthAccount(
+            id=uuid4(), user_id=self.user.id, provider="google", provider_user_id="g-1",
+            provider_email="user@example.com", access_token=SECRETS[1], refresh_token=SECRETS[2],
+            provider_data={"token": SECRETS[1]}, created_at=START, updated_at=START,
+        )]
+        self.spark = [
+            SparkSession(
+                id=uuid4(), user_id=self.user.id, status=SparkStatus.IN_PROGRESS, current_step=1,
+                situation_response="Missed a deadline", created_at=START + timedelta(minutes=i), updated_at=START,
+            )
+            for i in range(spark_sessions)
+        ]
+        self.wave = [WaveSession(
+            id=uuid4(), user_id=self.user.id, status=WaveStatus.COMPLETED, current_step=4,
+            situation="Crowded train", emotion="anxious", intensity=6, acceptance_statement="It will pass",
+            action_type="breathing", action_completed=True, actual_duration=300, action_notes=None,
+            created_at=START, updated_at=START, completed_at=START,
+        )]
+        self.ideas = [Idea(
+            id=uuid4(), user_id=self.user.id, content="Write it down", created_at=START, updated_at=START,
+            tags=["work", "writing"],
+        )]
+        self.drafts = [SessionDraft(
+            session_id=self.spark[0].id, step=2, session_type="spark", user_id=self.user.id,
+            text="I thought", updated_at=START,
+        )]
+        self.streamed = []  # (repository, batch_size) per stream opened
+        self.yielded = 0  # Sessions handed out so far
+
+
+def install(monkeypatch, data):
+    """Swap the export's repositories (and draft buffer) for doubles over `data`."""
+
+    class Users:
+        def __init__(self, db):
+            pass
+
+        async def get_by_id(self, user_id):
+            return data.user if user_id == data.user.id else None
+
+    class OAuthAccounts:
+        def __init__(self, db):
+            pass
+
+        async def stream_by_user(self, user_id):
+            for account in data.oauth:
+                yield account
+
+    def streaming(name, items):
+        class Repository:
+            def __init__(self, db):
+                pass
+
+            async def stream_by_user_id(self, user_id, batch_size=500):
+                data.streamed.append((name, batch_size))
+                for item in items:
+                    data.yielded += 1
+                    yield item
+        return Repository
+
+    class Drafts:
+        async def stream_for_user(self, db, user_id, batch_size=500):
+            data.streamed.append(("drafts", batch_size))
+            for draft in data.drafts:
+                yield draft
+
+    monkeypatch.setattr(data_export_service, "UserRepository", Users)
+    monkeypatch.setattr(data_export_service, "OAuthAccountRepository", OAuthAccounts)
+    monkeypatch.setattr(data_export_service, "SparkSessionRepository", streaming("spark", data.spark))
+    monkeypatch.setattr(data_export_service, "WaveSessionRepository", streaming("wave", data.wave))
+    monkeypatch.setattr(data_export_service, "IdeaRepository", streaming("ideas", data.ideas))
+    monkeypatch.setattr(data_export_service, "draft_buffer", Drafts())
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestDataExportService:
+    """Test cases for streaming a user's data."""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_has_every_record_and_no_secrets(self, monkeypatch):
+        """Each record type is exported once per row; password hash and OAuth tokens never are."""
+        data = UserData()
+        install(monkeypatch, data)
+        sessions = SessionFactory()
+
+        body = b"".join(await collect(DataExportService(sessions, batch_size=7).stream(data.user.id, ExportFormat.NDJSON)))
+
+        records = [json.loads(line) for line in body.decode().splitlines()]
+        assert [r["record_type"] for r in records] == [
+            "account", "oauth_account", "spark_session", "spark_session", "wave_session", "session_draft",
+            "popcorn_idea",
+        ]
+        assert records[0]["email"] == "user@example.com" and records[-1]["tags"] == ["work", "writing"]
+        assert records[5] == {
+            "record_type": "session_draft", "session_id": str(data.spark[0].id), "session_type": "spark",
+            "step": 2, "text": "I thought", "updated_at": START.isoformat(),
+        }
+        for secret in SECRETS:
+            assert secret.encode() not in body
+        assert not any({"hashed_password", "access_token", "refresh_token", "provider_data"} & r.keys() for r in records)
+        # Sessions, drafts and ideas go through the repositories' streams, batch_size rows at a time
+        assert data.streamed == [("spark", 7), ("wave", 7), ("drafts", 7), ("ideas", 7)]
+        assert (sessions.opened, sessions.closed) == (1, 1)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("export_format", list(ExportFormat))
+    async def test_output_is_chunked_as_it_streams(self, monkeypatch, export_format):
+        """Chunks are about chunk_size bytes, and the first leaves before the history is read."""
+        data = UserData(spark_sessions=60)
+        install(monkeypatch, data)
+        stream = DataExportService(SessionFactory(), chunk_size=1024).stream(data.user.id, export_format)
+
+        first = await stream.__anext__()
+        yielded_at_first_chunk = data.yielded
+        chunks = [first] + await collect(stream)
+
+        assert yielded_at_first_chunk < len(data.spark)
+        assert len(chunks) > 2
+        assert all(1024 <= len(chunk) < 2048 for chunk in chunks[:-1])
+        assert 0 < len(chunks[-1]) < 2048
+        lines = b"".join(chunks).decode().splitlines()
+        header = 1 if export_format is ExportFormat.CSV else 0
+        assert len(lines) == header + 1 + len(data.oauth) + 60 + len(data.wave) + len(data.drafts) + len(data.ideas)
+
+    @pytest.mark.asyncio
+    async def test_csv_shares_one_header(self, monkeypatch):
+        """CSV rows use the union header, blank where a field is not theirs; secrets stay out."""
+        data = UserData()
+        install(monkeypatch, data)
+
+        body = b"".join(await collect(DataExportService(SessionFactory()).stream(data.user.id, ExportFormat.CSV)))
+
+        rows = list(csv.DictReader(io.StringIO(body.decode())))
+        assert list(rows[0].keys()) == CSV_HEADER
+        assert not {"hashed_password", "access_token", "refresh_token"} & set(CSV_HEADER)
+        wave = next(row for row in rows if row["record_type"] == "wave_session")
+        assert (wave["emotion"], wave["intensity"], wave["email"]) == ("anxious", "6", "")
+        idea = next(row for row in rows if row["record_type"] == "popcorn_idea")
+        assert (idea["tags"], idea["email"]) == ("work;writing", "")  # List fields share a cell
+        for secret in SECRETS:
+            assert secret.encode() not in body
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_exports_nothing(self, monkeypatch):
+        """No account, no records (and no repository is streamed)."""
+        data = UserData()
+        install(monkeypatch, data)
+
+        chunks = await collect(DataExportService(SessionFactory()).stream(uuid4(), ExportFormat.NDJSON))
+
+        assert chunks == [] and data.streamed == []
+
+
+class TestExportEndpoint:
+    """Test cases for GET /auth/me/export."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("export_format", list(ExportFormat))
+    async def test_streams_the_current_users_export(self, monkeypatch, export_format):
+        """The endpoint streams the service's output as an attachment of the requested type."""
+        data = UserData()
+        install(monkeypatch, data)
+        sessions = SessionFactory()
+        monkeypatch.setattr(auth_endpoints_enhanced, "AsyncSessionLocal", sessions)
+        app = FastAPI()
+        app.include_router(auth_endpoints_enhanced.router, prefix="/auth")
+        app.dependency_overrides[auth_endpoints_enhanced.get_current_user_id] = lambda: data.user.id
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/auth/me/export", params={"format": export_format.value})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(export_format.media_type)
+        assert response.headers["content-disposition"] == (
+            f'attachment; filename="dose-export-{data.user.id}.{export_format.value}"'
+        )
+        assert "record_type" in response.text.splitlines()[0]
+        assert "spark_session" in response.text
+        for secret in SECRETS:
+            assert secret not in response.text
+        assert (sessions.opened, sessions.closed) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_requires_authentication(self):
+        """Without a bearer token there is no export."""
+        app = FastAPI()
+        app.include_router(auth_endpoints_enhanced.router, prefix="/auth")
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/auth/me/export")
+
+        assert response.status_code in (401, 403)
@@ -0,0 +1,104 @@
+"""
+Unit tests for IdeaRepository's tag counts
+"""
+
+import json
+import sqlite3
+import pytest
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from src.modules.popcorn.domain.entities.idea import Idea
+from src.modules.popcorn.infrastructure.persistence.models import PopcornIdea, PopcornTag
+from src.modules.popcorn.infrastructure.repositories.idea_repository import IdeaRepository
+# Mapped so the User <-> session relationships resolve
+import src.modules.auth.infrastructure.persistence.models  # noqa: F401
+import src.modules.spark.infrastructure.persistence.models  # noqa: F401
+import src.modules.wave.infrastructure.persistence.models  # noqa: F401
+
+START = datetime(2026, 3, 2, 9, 0)
+
+# popcorn_ideas.tags is a Postgres ARRAY; store it as JSON text on sqlite
+sqlite3.register_adapter(list, json.dumps)
+sqlite3.register_converter("JSON", json.loads)
+
+
+@compiles(ARRAY, "sqlite")
+def _array_as_json(type_, compiler, **kw):
+    return "JSON"
+
+
+async def make_engine(tmp_path):
+    # A file, so that two sessions see each other's commits
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'popcorn.db'}",
+        connect_args={"detect_types": sqlite3.PARSE_DECLTYPES},
+    )
+    async with engine.begin() as conn:
+        for model in (PopcornIdea, PopcornTag):
+            await conn.run_sync(lambda c, table=model.__table__: table.create(c))
+    return engine
+
+
+class TestIdeaRepository:
+    """Test cases for keeping popcorn_tags in step with concurrent edits."""
+
+    @pytest.mark.asyncio
+    async def test_update_counts_from_the_committed_tags(self, tmp_path, user_id):
+        """An idea loaded before a concurrent edit committed is reloaded before its tags are diffed."""
+        engine = await make_engine(tmp_path)
+        idea = Idea(id=uuid4(), user_id=user_id, content="a", created_at=START, updated_at=START, tags=["work", "home"])
+        async with AsyncSession(engine) as db:
+            await IdeaRepository(db).create(idea)
+            await db.commit()
+
+        async with AsyncSession(engine) as db:
+            repository = IdeaRepository(db)
+            loaded = await repository.get_by_id(idea.id)  # The endpoint's ownership check
+            row = await db.get(PopcornIdea, idea.id)  # noqa: F841 - held, so it stays in the identity map
+
+            async with AsyncSession(engine) as other:
+                concurrent = await IdeaRepository(other).get_by_id(idea.id)
+                concurrent.edit("a", ["focus"])
+                await IdeaRepository(other).update(concurrent)
+                await other.commit()
+
+            loaded.edit("a", ["work", "writing"])
+            _, previous = await repository.update(loaded)
+            await db.commit()
+            counts = sorted(await repository.get_tag_counts(user_id))
+        await engine.dispose()
+
+        assert previous == ["focus"]
+        assert counts == [("work", 1), ("writing", 1)]
+
+    @pytest.mark.asyncio
+    async def test_delete_uncounts_the_committed_tags(self, tmp_path, user_id):
+        """A delete racing an edit removes the edited tags, not the ones it first saw."""
+        engine = await make_engine(tmp_path)
+        idea = Idea(id=uuid4(), user_id=user_id, content="a", created_at=START, updated_at=START, tags=["work"])
+        async with AsyncSession(engine) as db:
+            await IdeaRepository(db).create(idea)
+            await db.commit()
+
+        async with AsyncSession(engine) as db:
+            repository = IdeaRepository(db)
+            row = await db.get(PopcornIdea, idea.id)  # noqa: F841 - held, so it stays in the identity map
+
+            async with AsyncSession(engine) as other:
+                concurrent = await IdeaRepository(other).get_by_id(idea.id)
+                concurrent.edit("a", ["home"])
+                await IdeaRepository(other).update(concurrent)
+                await other.commit()
+
+            deleted = await repository.delete(idea.id)
+            await db.commit()
+            counts = await repository.get_tag_counts(user_id)
+        await engine.dispose()
+
+        assert deleted.tags == ["home"]
+        assert counts == []
@@ -0,0 +1,151 @@
+"""
+Unit tests for PopcornService and the tag index
+"""
+
+import copy
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.infrastructure.database.session import after_commit
+from src.modules.popcorn.application.dto.popcorn_dto import CreateIdeaDTO, UpdateIdeaDTO
+from src.modules.popcorn.application.services.popcorn_service import PopcornService
+from src.modules.popcorn.domain.entities.idea import normalize_tags
+from src.modules.popcorn.infrastructure.cache import TagIndex, UserTags
+
+
+class InMemoryIdeas:
+    """Double for IdeaRepository; hands out copies like a fresh load would."""
+
+    def __init__(self):
+        self.ideas = {}
+        self.count_reads = 0
+
+    async def create(self, idea):
+        self.ideas[idea.id] = idea
+        return idea
+
+    async def get_by_id(self, idea_id):
+        return copy.copy(self.ideas.get(idea_id))
+
+    async def update(self, idea):
+        previous = self.ideas[idea.id].tags
+        self.ideas[idea.id] = idea
+        return idea, previous
+
+    async def delete(self, idea_id):
+        return self.ideas.pop(idea_id, None)
+
+    async def list_by_user(self, user_id, tags, after, limit):
+        ideas = sorted(
+            (i for i in self.ideas.values() if i.user_id == user_id and set(tags) <= set(i.tags)),
+            key=lambda i: (i.created_at, i.id), reverse=True,
+        )
+        if after:
+            ideas = [i for i in ideas if (i.created_at, i.id) < after]
+        return ideas[:limit]
+
+    async def get_tag_counts(self, user_id):
+        self.count_reads += 1
+        counts = {}
+        for idea in self.ideas.values():
+            if idea.user_id == user_id:
+                for tag in idea.tags:
+                    counts[tag] = counts.get(tag, 0) + 1
+        return list(counts.items())
+
+
+@pytest.fixture
+def service():
+    return PopcornService(InMemoryIdeas(), TagIndex())
+
+
+class TestPopcornService:
+    """Test cases for idea capture and listing."""
+
+    def test_tags_are_normalized(self):
+        """Tags are trimmed, lower-cased and de-duplicated."""
+        assert normalize_tags([" Work ", "work", "Deep  Focus", ""]) == ["work", "deep focus"]
+        with pytest.raises(ValueError, match="at most"):
+            normalize_tags([f"tag{n}" for n in range(11)])
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_with_tag_filter(self, service, user_id):
+        """Pages follow the cursor, newest first, and keep the tag filter."""
+        start = datetime(2026, 3, 2)
+        for n in range(5):
+            idea = await service.create_idea(CreateIdeaDTO(user_id=user_id, content=f"idea {n}", tags=["Work"]))
+            service.repository.ideas[idea.id].created_at = start + timedelta(minutes=n)
+        await service.create_idea(CreateIdeaDTO(user_id=user_id, content="other", tags=["home"]))
+
+        first = await service.list_ideas(user_id, ["work"], limit=3)
+        second = await service.list_ideas(user_id, ["WORK"], cursor=first.cursor, limit=3)
+
+        assert [i.content for i in first.ideas + second.ideas] == [f"idea {n}" for n in range(4, -1, -1)]
+        assert second.cursor is None
+        with pytest.raises(ValueError, match="does not belong"):
+            await service.list_ideas(user_id, ["home"], cursor=first.cursor)
+
+
+class TestTagIndex:
+    """Test cases for tag autocomplete."""
+
+    @pytest.mark.asyncio
+    async def test_autocomplete_follows_writes_without_reloading(self, service, user_id):
+        """After the first load, creates, edits and deletes update the index in place."""
+        work = await service.create_idea(CreateIdeaDTO(user_id=user_id, content="a", tags=["work", "writing"]))
+        assert [t.tag for t in await service.get_tags(user_id, "w")] == ["work", "writing"]
+
+        await service.create_idea(CreateIdeaDTO(user_id=user_id, content="b", tags=["writing"]))
+        await service.update_idea(UpdateIdeaDTO(idea_id=work.id, content="a", tags=["workout", "writing"]))
+        tags = await service.get_tags(user_id, "W")
+
+        assert [(t.tag, t.idea_count) for t in tags] == [("writing", 2), ("workout", 1)]
+        await service.delete_idea(work.id)
+        assert [t.tag for t in await service.get_tags(user_id, "wo")] == []
+        assert service.repository.count_reads == 1
+
+    @pytest.mark.asyncio
+    async def test_index_changes_only_when_the_write_commits(self, user_id):
+        """A rolled back create never reaches the index; a committed one does, at commit."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with AsyncSession(engine) as db:
+            repository = InMemoryIdeas()
+            index = TagIndex()
+            service = PopcornService(repository, index, after_commit=lambda callback: after_commit(db, callback))
+            index.put(user_id, [], index.generation(user_id))
+
+            await db.execute(text("SELECT 1"))
+            await service.create_idea(CreateIdeaDTO(user_id=user_id, content="a", tags=["rolled-back"]))
+            await db.rollback()
+            assert len(index.get(user_id)) == 0
+
+            await db.execute(text("SELECT 1"))
+            await service.create_idea(CreateIdeaDTO(user_id=user_id, content="b", tags=["kept"]))
+            assert len(index.get(user_id)) == 0
+            await db.commit()
+            assert index.get(user_id).complete("", 5) == [("kept", 1)]
+        await engine.dispose()
+
+    def test_load_racing_a_write_is_not_kept(self, user_id):
+        """Counts loaded before a concurrent write are served once but not cached."""
+        index = TagIndex()
+        generation = index.generation(user_id)
+
+        index.apply(user_id, added=["new"])
+        index.put(user_id, [("old", 1)], generation)
+
+        assert index.get(user_id) is None
+
+    def test_prefix_matches_are_ranked_by_use(self):
+        """Only tags with the prefix are returned, most used first, then alphabetically."""
+        tags = UserTags([("focus", 1), ("family", 3), ("fun", 3), ("health", 9)])
+
+        assert tags.complete("f", 2) == [("family", 3), ("fun", 3)]
+        tags.remove("family")
+        assert tags.complete("fa", 5) == [("family", 2)]
+        tags.remove("focus")
+        assert tags.complete("fo", 5) == []
@@ -0,0 +1,76 @@
+"""
+Unit tests for SearchService
+"""
+
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from src.modules.search.application.services.search_service import SearchService
+
+
+class FakeSearchRepository:
+    """Returns pre-ranked rows honouring the (rank, session_id) keyset."""
+
+    def __init__(self, rows):
+        self.rows = sorted(rows, key=lambda r: (r.rank, r.session_id), reverse=True)
+        self.calls = []
+
+    async def search(self, user_id, query, session_types, after, limit):
+        self.calls.append((user_id, query, session_types))
+        rows = [r for r in self.rows if r.session_type in session_types]
+        if after:
+            rows = [r for r in rows if (r.rank, r.session_id) < after]
+        return rows[:limit]
+
+
+def make_rows(count):
+    return [
+        SimpleNamespace(
+            session_type="spark" if i % 2 else "wave",
+            session_id=uuid4(),
+            status="completed",
+            created_at=datetime.utcnow(),
+            rank=1.0 / (i + 1),
+            snippet="my <mark>manager</mark> asked for the <mark>report</mark>",
+        )
+        for i in range(count)
+    ]
+
+
+class TestSearchService:
+    """Test cases for ranked, keyset-paginated search."""
+
+    @pytest.mark.asyncio
+    async def test_pages_in_rank_order(self, user_id):
+        """Following cursors walks every hit once, best first."""
+        repository = FakeSearchRepository(make_rows(5))
+        service = SearchService(repository)
+
+        first = await service.search(user_id, "manager report", limit=3)
+        second = await service.search(user_id, "manager report", cursor=first.cursor, limit=3)
+
+        ranks = [h.rank for h in first.hits + second.hits]
+        assert ranks == sorted(ranks, reverse=True) and len(ranks) == 5
+        assert first.cursor and second.cursor is None
+        assert all(call[0] == user_id for call in repository.calls)
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_bound_to_its_query(self, user_id):
+        """A cursor cannot be replayed against a different search."""
+        service = SearchService(FakeSearchRepository(make_rows(5)))
+        first = await service.search(user_id, "manager", limit=2)
+
+        with pytest.raises(ValueError):
+            await service.search(user_id, "deadline", cursor=first.cursor, limit=2)
+
+    @pytest.mark.asyncio
+    async def test_rejects_blank_query_and_unknown_type(self, user_id):
+        """Blank queries and unknown session types are rejected."""
+        service = SearchService(FakeSearchRepository([]))
+
+        with pytest.raises(ValueError):
+            await service.search(user_id, "   ")
+        with pytest.raises(ValueError):
+            await service.search(user_id, "report", session_types=["popcorn"])
@@ -0,0 +1,71 @@
+"""
+Conformance tests for the direct SPARK read path
+
+GET endpoints serialize Core rows with orjson instead of validating through
+SessionResponse; these tests hold both paths to identical JSON.
+"""
+
+import json
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from fastapi.responses import ORJSONResponse
+
+from src.modules.spark.api.schemas.spark_schemas import SessionResponse, SessionSummaryResponse
+from src.modules.spark.application.services.spark_service import SparkService
+from src.modules.spark.infrastructure.persistence.models import SparkSession as SparkSessionModel
+from src.modules.spark.infrastructure.queries.session_read_queries import SESSION_FIELDS, SUMMARY_FIELDS
+from src.modules.spark.infrastructure.repositories.spark_session_repository import SparkSessionRepository
+# Mapped so the User <-> session relationships resolve
+import src.modules.auth.infrastructure.persistence.models  # noqa: F401
+import src.modules.wave.infrastructure.persistence.models  # noqa: F401
+
+
+def make_row(**overrides):
+    values = dict(
+        id=uuid4(), user_id=uuid4(), status="in_progress", current_step=3,
+        situation_response="Manager asked for the report", perception_response="I'm failing",
+        affect_response=None, response_response=None, key_result_response=None,
+        created_at=datetime(2026, 1, 2, 3, 4, 5, 678901), updated_at=datetime(2026, 1, 2, 3, 4, 5),
+        completed_at=None,
+    )
+    values.update(overrides)
+    return SparkSessionModel(**values)
+
+
+def direct_json(row, fields):
+    """What the read path sends: the selected columns, serialized by orjson."""
+    return json.loads(ORJSONResponse({f: getattr(row, f) for f in fields}).body)
+
+
+def validated_json(row, schema, to_dto):
+    """What the ORM -> entity -> DTO -> pydantic path sends."""
+    dto = to_dto(SparkSessionRepository._to_entity(row))
+    return schema.model_validate(dto, from_attributes=True).model_dump(mode="json")
+
+
+class TestSparkReadPathConformance:
+    """The direct read path must emit exactly what the schemas describe."""
+
+    def test_fields_match_schemas(self):
+        """Selected columns are exactly the response fields, in order."""
+        assert SESSION_FIELDS == tuple(SessionResponse.model_fields)
+        assert SUMMARY_FIELDS == tuple(SessionSummaryResponse.model_fields)
+
+    @pytest.mark.parametrize("overrides", [
+        {},
+        {"status": "completed", "current_step": 5, "completed_at": datetime(2026, 1, 3)},
+    ])
+    def test_session_json_matches_validated_path(self, overrides):
+        """Full session JSON is identical on both paths."""
+        row = make_row(**overrides)
+
+        assert direct_json(row, SESSION_FIELDS) == validated_json(row, SessionResponse, SparkService._to_dto)
+
+    def test_summary_json_matches_validated_path(self):
+        """List item JSON is identical on both paths."""
+        row = make_row()
+
+        assert direct_json(row, SUMMARY_FIELDS) == validated_json(
+            row, SessionSummaryResponse, SparkService._to_summary_dto
+        )
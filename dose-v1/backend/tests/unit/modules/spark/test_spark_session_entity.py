@@ -7,6 +7,7 @@ from datetime import datetime
 from uuid import uuid4
 
 from src.modules.spark.domain.entities.spark_session import SparkSession, SparkStep
+from src.modules.spark.domain.events import SparkSessionCompleted, SparkStepCompleted
 from src.modules.spark.domain.value_objects.session_status import SessionStatus
 
 
@@ -277,3 +278,22 @@ class TestSparkSessionEntity:
         session.set_step_response(1, "  Response with spaces  ")
 
         assert session.situation_response == "Response with spaces"
+
+    def test_records_lifecycle_events(self, sample_spark_responses):
+        """Each answered step and the completion are recorded once, then pulled."""
+        session = SparkSession(
+            id=uuid4(),
+            user_id=uuid4(),
+            status=SessionStatus.IN_PROGRESS,
+            current_step=1
+        )
+
+        for step, response in enumerate(sample_spark_responses.values(), start=1):
+            session.set_step_response(step, response)
+        session.complete_session()
+
+        events = session.pull_events()
+        assert [type(event) for event in events] == [SparkStepCompleted] * 5 + [SparkSessionCompleted]
+        assert [event.step_number for event in events[:5]] == [1, 2, 3, 4, 5]
+        assert all(event.session_id == session.id for event in events)
+        assert session.pull_events() == []
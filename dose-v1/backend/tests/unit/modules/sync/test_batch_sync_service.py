@@ -0,0 +1,195 @@
+"""
+Unit tests for BatchSyncService
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from src.core.domain.exceptions import SessionArchivedError
+from src.modules.sync.application.dto.sync_dto import BatchOperationDTO
+from src.modules.sync.application.services.batch_sync_service import BatchSyncService
+
+
+class InMemoryRepository:
+    """Minimal repository double that counts loads and writes."""
+
+    def __init__(self):
+        self.sessions = {}
+        self.loads = 0
+        self.writes = 0
+        # Ids claimed elsewhere (e.g. by a deleted session); create rejects them
+        self.taken = set()
+        # Sessions moved to the archive; update rejects them
+        self.archived = set()
+
+    async def get_by_id(self, session_id):
+        self.loads += 1
+        return self.sessions.get(session_id)
+
+    async def create(self, session):
+        if session.id in self.taken:
+            raise ValueError(f"Session already exists: {session.id}")
+        self.writes += 1
+        self.sessions[session.id] = session
+        return session
+
+    async def update(self, session):
+        if session.id in self.archived:
+            raise SessionArchivedError(f"Session is archived and read-only: {session.id}")
+        self.writes += 1
+        self.sessions[session.id] = session
+        return session
+
+
+@pytest.fixture
+def repositories():
+    return InMemoryRepository(), InMemoryRepository()
+
+
+class TestBatchSyncService:
+    """Test cases for offline batch replay."""
+
+    @pytest.mark.asyncio
+    async def test_full_wave_session_in_one_batch(self, repositories, user_id):
+        """A whole offline WAVE session is created, filled and completed with a single write."""
+        spark_repo, wave_repo = repositories
+        session_id = uuid4()
+        operations = [
+            BatchOperationDTO(op="wave.create", session_id=session_id),
+            BatchOperationDTO(op="wave.checkin", session_id=session_id,
+                              params={"situation": "Deadline", "emotion": "anxious", "intensity": 7}),
+            BatchOperationDTO(op="wave.acceptance", session_id=session_id,
+                              params={"acceptance_statement": "It is okay to feel this"}),
+            BatchOperationDTO(op="wave.action", session_id=session_id,
+                              params={"action_type": "breathing_exercise"}),
+            BatchOperationDTO(op="wave.complete_action", session_id=session_id,
+                              params={"duration_seconds": 60}),
+            BatchOperationDTO(op="wave.complete", session_id=session_id),
+        ]
+
+        result = await BatchSyncService(spark_repo, wave_repo).apply(user_id, operations)
+
+        assert [r.status for r in result.results] == ["applied"] * 6
+        assert wave_repo.writes == 1
+        assert wave_repo.sessions[session_id].is_completed()
+        assert result.wave_sessions[0].status.value == "completed"
+
+    @pytest.mark.asyncio
+    async def test_failed_operation_leaves_session_untouched(self, repositories, user_id):
+        """A rejected step does not stop the batch or leak partial changes."""
+        spark_repo, wave_repo = repositories
+        session_id = uuid4()
+        operations = [
+            BatchOperationDTO(op="spark.create", session_id=session_id),
+            BatchOperationDTO(op="spark.update_step", session_id=session_id,
+                              params={"step_number": 3, "response": "Skipping ahead"}),
+            BatchOperationDTO(op="spark.update_step", session_id=session_id,
+                              params={"step_number": 1, "response": "Situation"}),
+        ]
+
+        result = await BatchSyncService(spark_repo, wave_repo).apply(user_id, operations)
+
+        assert [r.status for r in result.results] == ["applied", "failed", "applied"]
+        assert result.results[1].status_code == 400
+        session = spark_repo.sessions[session_id]
+        assert session.situation_response == "Situation"
+        assert session.affect_response is None
+
+    @pytest.mark.asyncio
+    async def test_other_users_session_is_forbidden(self, repositories, user_id):
+        """Operations on someone else's session fail with 403."""
+        spark_repo, wave_repo = repositories
+        session_id = uuid4()
+        await BatchSyncService(spark_repo, wave_repo).apply(
+            uuid4(), [BatchOperationDTO(op="spark.create", session_id=session_id)]
+        )
+
+        result = await BatchSyncService(spark_repo, wave_repo).apply(
+            user_id,
+            [BatchOperationDTO(op="spark.update_step", session_id=session_id,
+                               params={"step_number": 1, "response": "Mine now"})],
+        )
+
+        assert result.results[0].status_code == 403
+        assert spark_repo.sessions[session_id].situation_response is None
+
+    @pytest.mark.asyncio
+    async def test_replayed_create_is_idempotent(self, repositories, user_id):
+        """Retrying a create for an existing session of the same user is a no-op."""
+        spark_repo, wave_repo = repositories
+        session_id = uuid4()
+        create = [BatchOperationDTO(op="spark.create", session_id=session_id)]
+        service = BatchSyncService(spark_repo, wave_repo)
+
+        await service.apply(user_id, create)
+        result = await service.apply(user_id, create)
+
+        assert result.results[0].status == "applied"
+        assert spark_repo.writes == 1
+
+    @pytest.mark.asyncio
+    async def test_create_of_taken_id_fails_all_its_operations(self, repositories, user_id):
+        """A create rejected at write time fails with 409, along with the ops that followed it."""
+        spark_repo, wave_repo = repositories
+        taken_id, other_id = uuid4(), uuid4()
+        spark_repo.taken.add(taken_id)
+        operations = [
+            BatchOperationDTO(op="spark.create", session_id=taken_id),
+            BatchOperationDTO(op="spark.update_step", session_id=taken_id,
+                              params={"step_number": 1, "response": "Situation"}),
+            BatchOperationDTO(op="spark.create", session_id=other_id),
+        ]
+
+        result = await BatchSyncService(spark_repo, wave_repo).apply(user_id, operations)
+
+        assert [r.status for r in result.results] == ["failed", "failed", "applied"]
+        assert [r.status_code for r in result.results] == [409, 409, 200]
+        assert [s.id for s in result.spark_sessions] == [other_id]
+
+    @pytest.mark.asyncio
+    async def test_update_of_archived_session_fails_with_410(self, repositories, user_id):
+        """An update rejected because the session was archived is reported per op, not raised."""
+        spark_repo, wave_repo = repositories
+        archived_id, other_id = uuid4(), uuid4()
+        service = BatchSyncService(spark_repo, wave_repo)
+        await service.apply(user_id, [
+            BatchOperationDTO(op="spark.create", session_id=archived_id),
+            BatchOperationDTO(op="spark.create", session_id=other_id),
+        ])
+        spark_repo.archived.add(archived_id)
+        step = {"step_number": 1, "response": "Situation"}
+
+        result = await service.apply(user_id, [
+            BatchOperationDTO(op="spark.update_step", session_id=archived_id, params=step),
+            BatchOperationDTO(op="spark.update_step", session_id=other_id, params=step),
+        ])
+
+        assert [r.status_code for r in result.results] == [410, 200]
+        assert result.results[0].status == "failed"
+        assert [s.id for s in result.spark_sessions] == [other_id]
+        assert spark_repo.sessions[archived_id].situation_response is None
+
+    @pytest.mark.asyncio
+    async def test_offline_session_keeps_device_times_within_backfill(self, repositories, user_id):
+        """Device times date the session; times beyond the backfill window are clamped."""
+        spark_repo, wave_repo = repositories
+        session_id = uuid4()
+        now = datetime.utcnow()
+        operations = [
+            BatchOperationDTO(op="spark.create", session_id=session_id,
+                              params={"created_at": now - timedelta(days=30)}),
+            BatchOperationDTO(op="spark.complete", session_id=session_id,
+                              params={"completed_at": (now - timedelta(days=2)).replace(tzinfo=timezone.utc)}),
+        ]
+        for step in range(1, 6):
+            operations.insert(step, BatchOperationDTO(
+                op="spark.update_step", session_id=session_id, params={"step_number": step, "response": "answer"},
+            ))
+
+        result = await BatchSyncService(spark_repo, wave_repo, max_backfill_days=14).apply(user_id, operations)
+
+        session = spark_repo.sessions[session_id]
+        assert [r.status for r in result.results] == ["applied"] * 7
+        assert abs(session.created_at - (now - timedelta(days=14))) < timedelta(seconds=5)
+        assert abs(session.completed_at - (now - timedelta(days=2))) < timedelta(seconds=5)
@@ -0,0 +1,91 @@
+"""
+Unit tests for ChangeFeedService
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from src.core.utils.cursor import encode_cursor
+from src.modules.spark.application.services.spark_service import SparkService
+from src.modules.sync.application.services.change_feed_service import ChangeFeedService, CursorExpiredError
+
+
+class InMemoryChangeLog:
+    """Keyset-ordered double for get_changed_since / get_since."""
+
+    def __init__(self, items=None, timestamp="updated_at"):
+        self.items = items or []
+        self.timestamp = timestamp
+
+    async def _page(self, user_id, after, before, limit):
+        rows = sorted(
+            (i for i in self.items if i.user_id == user_id and getattr(i, self.timestamp) <= before),
+            key=lambda i: (getattr(i, self.timestamp), i.id),
+        )
+        if after:
+            rows = [i for i in rows if (getattr(i, self.timestamp), i.id) > after]
+        return rows[:limit]
+
+    get_changed_since = _page
+    get_since = _page
+
+
+def make_sessions(user_id, count, age_seconds=60):
+    sessions = []
+    for i in range(count):
+        session = SparkService.new_session(user_id)
+        session.updated_at = datetime.utcnow() - timedelta(seconds=age_seconds - i)
+        sessions.append(session)
+    return sessions
+
+
+class TestChangeFeedService:
+    """Test cases for the delta sync feed."""
+
+    @pytest.mark.asyncio
+    async def test_pages_through_all_changes(self, user_id):
+        """Following the cursor returns every change exactly once."""
+        sessions = make_sessions(user_id, 5)
+        service = ChangeFeedService(InMemoryChangeLog(sessions), InMemoryChangeLog(), InMemoryChangeLog())
+
+        first = await service.get_changes(user_id, limit=3)
+        second = await service.get_changes(user_id, first.cursor, limit=3)
+        third = await service.get_changes(user_id, second.cursor, limit=3)
+
+        assert first.has_more and not second.has_more
+        seen = [s.id for s in first.spark_sessions + second.spark_sessions]
+        assert seen == [s.id for s in sessions]
+        assert third.spark_sessions == []
+
+    @pytest.mark.asyncio
+    async def test_recent_changes_wait_for_settle_window(self, user_id):
+        """Changes newer than the settle window are held back until the next poll."""
+        sessions = make_sessions(user_id, 1, age_seconds=0)
+        service = ChangeFeedService(InMemoryChangeLog(sessions), InMemoryChangeLog(), InMemoryChangeLog(),
+                                    settle_seconds=30)
+
+        page = await service.get_changes(user_id)
+
+        assert page.spark_sessions == []
+
+    @pytest.mark.asyncio
+    async def test_expired_cursor_is_rejected(self, user_id):
+        """A cursor older than tombstone retention forces a full resync."""
+        service = ChangeFeedService(InMemoryChangeLog(), InMemoryChangeLog(), InMemoryChangeLog(), retention_days=30)
+        stale = encode_cursor({
+            "v": 1,
+            "issued_at": (datetime.utcnow() - timedelta(days=31)).isoformat(),
+            "spark": None, "wave": None, "deleted": None,
+        })
+
+        with pytest.raises(CursorExpiredError):
+            await service.get_changes(user_id, stale)
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_is_rejected(self, user_id):
+        """Garbage cursors raise ValueError."""
+        service = ChangeFeedService(InMemoryChangeLog(), InMemoryChangeLog(), InMemoryChangeLog())
+
+        with pytest.raises(ValueError):
+            await service.get_changes(user_id, "not-a-cursor")
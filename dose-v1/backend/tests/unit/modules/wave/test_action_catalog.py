@@ -0,0 +1,74 @@
+"""
+Unit tests for the precomputed WAVE action catalog
+"""
+
+import json
+import pytest
+from pydantic import ValidationError
+
+from src.modules.wave.api.endpoints import get_available_actions
+from src.modules.wave.api.schemas.wave_schemas import UpdateActionRequest
+from src.modules.wave.application.queries.action_catalog import action_catalog
+from src.modules.wave.domain.value_objects.action_type import ActionType
+
+
+class TestActionType:
+    """Test cases for action lookups."""
+
+    def test_every_action_has_metadata(self):
+        """The catalog lists every action once, in declaration order."""
+        assert [entry["value"] for entry in ActionType.all_actions()] == [action.value for action in ActionType]
+        assert all(ActionType(action.value).get_metadata()["name"] for action in ActionType)
+
+    def test_metadata_is_read_only(self):
+        """Shared metadata cannot be changed by a caller."""
+        metadata = ActionType.TIDY_SPACE.get_metadata()
+
+        with pytest.raises(TypeError):
+            metadata["name"] = "changed"
+        assert isinstance(metadata["input_options"], tuple)
+
+    def test_from_string(self):
+        """Values map straight to members; unknown values are rejected."""
+        assert ActionType.from_string("grounding_5_4_3_2_1") is ActionType.GROUNDING_5_4_3_2_1
+        with pytest.raises(ValueError, match="Invalid action type"):
+            ActionType.from_string("nap")
+
+    def test_request_validation(self):
+        """Only known action values are accepted."""
+        assert UpdateActionRequest(action_type="stretching").action_type == "stretching"
+        with pytest.raises(ValidationError, match="Must be one of"):
+            UpdateActionRequest(action_type="nap")
+
+
+class TestActionCatalogEndpoint:
+    """Test cases for GET /wave/actions."""
+
+    @pytest.mark.asyncio
+    async def test_serves_precomputed_body_with_etag(self):
+        """The body matches the catalog and carries caching headers."""
+        response = await get_available_actions(if_none_match=None)
+
+        body = json.loads(response.body)
+        assert response.status_code == 200
+        assert body["total"] == len(ActionType) == len(body["actions"])
+        assert body["actions"][10]["input_structure"]["see"]["count"] == 5
+        assert response.headers["etag"] == action_catalog.etag
+        assert "max-age" in response.headers["cache-control"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("header", ["{etag}", 'W/{etag}', '"stale", {etag}', "*"])
+    async def test_matching_etag_is_not_modified(self, header):
+        """Any If-None-Match naming the current ETag gets an empty 304."""
+        response = await get_available_actions(if_none_match=header.format(etag=action_catalog.etag))
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == action_catalog.etag
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_gets_full_body(self):
+        """An outdated ETag gets the catalog again."""
+        response = await get_available_actions(if_none_match='"stale"')
+
+        assert response.status_code == 200 and response.body == action_catalog.body
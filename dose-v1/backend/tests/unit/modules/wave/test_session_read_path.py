@@ -0,0 +1,79 @@
+"""
+Conformance tests for the direct WAVE read path
+
+GET endpoints serialize Core rows with orjson instead of validating through
+SessionResponse; these tests hold both paths to identical JSON.
+"""
+
+import json
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from fastapi.responses import ORJSONResponse
+
+from src.modules.wave.api.schemas.wave_schemas import SessionResponse, SessionSummaryResponse
+from src.modules.wave.application.services.wave_service import WaveService
+from src.modules.wave.infrastructure.persistence.models import WaveSession as WaveSessionModel
+from src.modules.wave.infrastructure.queries.session_read_queries import (
+    SESSION_FIELDS,
+    SUMMARY_FIELDS,
+    _with_progress,
+)
+from src.modules.wave.infrastructure.repositories.wave_session_repository import WaveSessionRepository
+# Mapped so the User <-> session relationships resolve
+import src.modules.auth.infrastructure.persistence.models  # noqa: F401
+import src.modules.spark.infrastructure.persistence.models  # noqa: F401
+
+
+def make_row(**overrides):
+    values = dict(
+        id=uuid4(), user_id=uuid4(), status="in_progress", current_step=3,
+        situation="Deadline tomorrow", emotion="anxious", intensity=7,
+        acceptance_statement="It is okay to feel this", action_type="breathing_exercise",
+        action_completed=False, actual_duration=None, action_notes='{"note": "box breathing"}',
+        created_at=datetime(2026, 1, 2, 3, 4, 5, 678901), updated_at=datetime(2026, 1, 2, 3, 4, 5),
+        completed_at=None,
+    )
+    values.update(overrides)
+    return WaveSessionModel(**values)
+
+
+def direct_json(row, fields):
+    """What the read path sends: the selected columns plus progress, serialized by orjson."""
+    return json.loads(ORJSONResponse(_with_progress({f: getattr(row, f) for f in fields})).body)
+
+
+def validated_json(row, schema, to_dto):
+    """What the ORM -> entity -> DTO -> pydantic path sends."""
+    dto = to_dto(WaveSessionRepository._to_entity(row))
+    return schema.model_validate(dto, from_attributes=True).model_dump(mode="json")
+
+
+class TestWaveReadPathConformance:
+    """The direct read path must emit exactly what the schemas describe."""
+
+    def test_fields_match_schemas(self):
+        """Selected columns plus progress_percentage are exactly the response fields, in order."""
+        assert SESSION_FIELDS + ("progress_percentage",) == tuple(SessionResponse.model_fields)
+        assert SUMMARY_FIELDS + ("progress_percentage",) == tuple(SessionSummaryResponse.model_fields)
+
+    @pytest.mark.parametrize("overrides", [
+        {"current_step": 1, "situation": None, "emotion": None, "intensity": None,
+         "acceptance_statement": None, "action_type": None, "action_notes": None},
+        {},
+        {"status": "completed", "current_step": 4, "action_completed": True,
+         "actual_duration": 60, "completed_at": datetime(2026, 1, 3)},
+    ])
+    def test_session_json_matches_validated_path(self, overrides):
+        """Full session JSON, including progress_percentage, is identical on both paths."""
+        row = make_row(**overrides)
+
+        assert direct_json(row, SESSION_FIELDS) == validated_json(row, SessionResponse, WaveService._to_dto)
+
+    def test_summary_json_matches_validated_path(self):
+        """List item JSON is identical on both paths."""
+        row = make_row()
+
+        assert direct_json(row, SUMMARY_FIELDS) == validated_json(
+            row, SessionSummaryResponse, WaveService._to_summary_dto
+        )